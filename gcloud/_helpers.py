@@ -20,6 +20,8 @@ import calendar
 import datetime
 import os
 import socket
+import sys
+import threading
 
 try:
     from threading import local as Local
@@ -27,6 +29,8 @@ except ImportError:     # pragma: NO COVER (who doesn't have it?)
     class Local(object):
         """Placeholder for non-threaded applications."""
 
+import six
+from six.moves import queue  # pylint: disable=F0401
 from six.moves.http_client import HTTPConnection  # pylint: disable=F0401
 
 try:
@@ -79,6 +83,89 @@ class _LocalStack(Local):
             return self._stack[-1]
 
 
+_STOP_WORKER = object()  # Tells ``_imap_unordered`` workers to exit.
+
+
+def _imap_unordered(func, iterable, max_workers):
+    """Apply ``func`` to each item of ``iterable`` using worker threads.
+
+    ``iterable`` is consumed lazily, in the calling thread, keeping at most
+    ``2 * max_workers`` items in flight, so that producing new items
+    overlaps with processing earlier ones.  Results are yielded as they
+    complete, which need not be the order of ``iterable``.
+
+    If ``max_workers`` is 1 or less, items are processed serially in the
+    calling thread.
+
+    :type func: callable
+    :param func: Function taking a single item and returning a result.
+
+    :type iterable: iterable
+    :param iterable: The items to be processed.
+
+    :type max_workers: integer
+    :param max_workers: Maximum number of concurrent worker threads.
+
+    :rtype: generator
+    :returns: The results of ``func``, in order of completion.
+    :raises: The first exception raised by ``func``;  items not yet
+             started are abandoned.
+    """
+    if max_workers <= 1:
+        for item in iterable:
+            yield func(item)
+        return
+
+    tasks = queue.Queue()
+    results = queue.Queue()
+
+    def _worker():
+        """Process tasks until told to stop."""
+        while True:
+            item = tasks.get()
+            if item is _STOP_WORKER:
+                return
+            try:
+                results.put((True, func(item)))
+            except Exception:  # pylint: disable=broad-except
+                results.put((False, sys.exc_info()))
+
+    workers = [threading.Thread(target=_worker) for _ in range(max_workers)]
+    for worker in workers:
+        worker.daemon = True
+        worker.start()
+
+    items = iter(iterable)
+    exhausted = False
+    pending = 0
+    try:
+        while True:
+            while not exhausted and pending < 2 * max_workers:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                else:
+                    tasks.put(item)
+                    pending += 1
+            if pending == 0:
+                break
+            succeeded, result = results.get()
+            pending -= 1
+            if not succeeded:
+                six.reraise(*result)
+            yield result
+    finally:
+        # Drop queued items which have not been started, then stop workers.
+        while True:
+            try:
+                tasks.get_nowait()
+            except queue.Empty:
+                break
+        for _ in workers:
+            tasks.put(_STOP_WORKER)
+
+
 class _UTC(datetime.tzinfo):
     """Basic UTC implementation.
 
@@ -15,6 +15,7 @@
 """Shared implementation of connections to API servers."""
 
 import json
+import threading
 from pkg_resources import get_distribution
 import six
 from six.moves.urllib.parse import urlencode  # pylint: disable=F0401
@@ -39,7 +40,10 @@ class Connection(object):
 
     If no value is passed in for ``http``, a :class:`httplib2.Http` object
     will be created and authorized with the ``credentials``. If not, the
-    ``credentials`` and ``http`` need not be related.
+    ``credentials`` and ``http`` need not be related.  Because
+    :class:`httplib2.Http` is not thread-safe, the created object is
+    specific to the calling thread, so the connection may be shared
+    between threads;  an ``http`` object passed in is always used as-is.
 
     Subclasses may seek to use the private key from ``credentials`` to sign
     data.
@@ -72,6 +76,7 @@ class Connection(object):
     def __init__(self, credentials=None, http=None):
         self._http = http
         self._credentials = credentials
+        self._thread_local = threading.local()
 
     @property
     def credentials(self):
@@ -90,11 +95,15 @@ class Connection(object):
         :rtype: :class:`httplib2.Http`
         :returns: A Http object used to transport data.
         """
-        if self._http is None:
-            self._http = httplib2.Http()
+        if self._http is not None:
+            return self._http
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = httplib2.Http()
             if self._credentials:
-                self._http = self._credentials.authorize(self._http)
-        return self._http
+                http = self._credentials.authorize(http)
+            self._thread_local.http = http
+        return http
 
     @staticmethod
     def _create_scoped_credentials(credentials, scope):
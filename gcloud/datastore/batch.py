@@ -64,8 +64,12 @@ class Batch(object):
 
     def __init__(self, client):
         self._client = client
-        self._mutation = datastore_pb.Mutation()
+        # The mutation is built directly inside the request which will be
+        # sent, so that committing does not copy it.
+        self._commit_request = datastore_pb.CommitRequest()
+        self._mutation = self._commit_request.mutation
         self._auto_id_entities = []
+        self._put_entities = []
 
     def current(self):
         """Return the topmost batch / transaction, or None."""
@@ -138,7 +142,7 @@ class Batch(object):
 
         self._auto_id_entities.append(entity)
 
-    def put(self, entity):
+    def put(self, entity, force=False):
         """Remember an entity's state to be saved during ``commit``.
 
         .. note::
@@ -152,9 +156,17 @@ class Batch(object):
            Python3) map to 'string_value' in the datastore;  values which are
            "bytes" ('str' in Python2, 'bytes' in Python3) map to 'blob_value'.
 
+        .. note::
+           Entities which have not changed since they were loaded (or last
+           saved) are skipped, unless ``force`` is True.  See
+           :attr:`gcloud.datastore.entity.Entity.is_dirty`.
+
         :type entity: :class:`gcloud.datastore.entity.Entity`
         :param entity: the entity to be saved.
 
+        :type force: boolean
+        :param force: If True, save the entity even if it is unchanged.
+
         :raises: ValueError if entity has no key assigned, or if the key's
                  ``dataset_id`` does not match ours.
         """
@@ -164,8 +176,12 @@ class Batch(object):
         if not _dataset_ids_equal(self.dataset_id, entity.key.dataset_id):
             raise ValueError("Key must be from same dataset as batch")
 
+        if not force and not entity.is_dirty:
+            return
+
         _assign_entity_to_mutation(
             self.mutation, entity, self._auto_id_entities)
+        self._put_entities.append(entity)
 
     def delete(self, key):
         """Remember a key to be deleted durring ``commit``.
@@ -182,8 +198,7 @@ class Batch(object):
         if not _dataset_ids_equal(self.dataset_id, key.dataset_id):
             raise ValueError("Key must be from same dataset as batch")
 
-        key_pb = helpers._prepare_key_for_request(key.to_protobuf())
-        self.mutation.delete.add().CopyFrom(key_pb)
+        key._set_protobuf(self.mutation.delete.add(), for_request=True)
 
     def begin(self):
         """No-op
@@ -200,7 +215,7 @@ class Batch(object):
         context manager.
         """
         response = self.connection.commit(
-            self.dataset_id, self.mutation, self._id)
+            self.dataset_id, self._commit_request, self._id)
         # If the back-end returns without error, we are guaranteed that
         # the response's 'insert_auto_id_key' will match (length and order)
         # the request's 'insert_auto_id` entities, which are derived from
@@ -209,6 +224,9 @@ class Batch(object):
                                       self._auto_id_entities):
             new_id = new_key_pb.path_element[-1].id
             entity.key = entity.key.completed_key(new_id)
+        # The saved entities now match their stored state.
+        for entity in self._put_entities:
+            entity._mark_clean()
 
     def rollback(self):
         """No-op
@@ -252,9 +270,6 @@ def _assign_entity_to_mutation(mutation_pb, entity, auto_id_entities):
     """
     auto_id = entity.key.is_partial
 
-    key_pb = entity.key.to_protobuf()
-    key_pb = helpers._prepare_key_for_request(key_pb)
-
     if auto_id:
         insert = mutation_pb.insert_auto_id.add()
         auto_id_entities.append(entity)
@@ -264,7 +279,9 @@ def _assign_entity_to_mutation(mutation_pb, entity, auto_id_entities):
         # based on prior existence / removal of the entity.
         insert = mutation_pb.upsert.add()
 
-    insert.key.CopyFrom(key_pb)
+    # Build the key and properties directly in the mutation, avoiding
+    # intermediate protobufs which would need to be copied in.
+    entity.key._set_protobuf(insert.key, for_request=True)
 
     for name, value in entity.items():
 
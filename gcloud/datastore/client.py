@@ -18,20 +18,26 @@ import os
 from gcloud._helpers import _LocalStack
 from gcloud._helpers import _app_engine_id
 from gcloud._helpers import _compute_engine_id
+from gcloud._helpers import _imap_unordered
 from gcloud.client import Client as _BaseClient
 from gcloud.datastore import helpers
 from gcloud.datastore.connection import Connection
 from gcloud.datastore.batch import Batch
 from gcloud.datastore.entity import Entity
 from gcloud.datastore.key import Key
+from gcloud.datastore.query import Iterator
 from gcloud.datastore.query import Query
+from gcloud.datastore.query import _scan_query
 from gcloud.datastore.transaction import Transaction
 from gcloud.environment_vars import DATASET
 from gcloud.environment_vars import GCD_DATASET
 
 
-_MAX_LOOPS = 128
-"""Maximum number of iterations to wait for deferred keys."""
+_DELETE_BATCH_SIZE = 500
+"""Default number of keys deleted per commit by ``delete_by_query``."""
+
+_DELETE_MAX_WORKERS = 4
+"""Default number of concurrent commits made by ``delete_by_query``."""
 
 
 def _get_production_dataset_id():
@@ -76,85 +82,6 @@ def _determine_default_dataset_id(dataset_id=None):
     return dataset_id
 
 
-def _extended_lookup(connection, dataset_id, key_pbs,
-                     missing=None, deferred=None,
-                     eventual=False, transaction_id=None):
-    """Repeat lookup until all keys found (unless stop requested).
-
-    Helper function for :meth:`Client.get_multi`.
-
-    :type connection: :class:`gcloud.datastore.connection.Connection`
-    :param connection: The connection used to connect to datastore.
-
-    :type dataset_id: string
-    :param dataset_id: The ID of the dataset of which to make the request.
-
-    :type key_pbs: list of :class:`gcloud.datastore._datastore_v1_pb2.Key`
-    :param key_pbs: The keys to retrieve from the datastore.
-
-    :type missing: an empty list or None.
-    :param missing: If a list is passed, the key-only entity protobufs
-                    returned by the backend as "missing" will be copied
-                    into it.  Use only as a keyword param.
-
-    :type deferred: an empty list or None.
-    :param deferred: If a list is passed, the key protobufs returned
-                     by the backend as "deferred" will be copied into it.
-                     Use only as a keyword param.
-
-    :type eventual: boolean
-    :param eventual: If False (the default), request ``STRONG`` read
-                     consistency.  If True, request ``EVENTUAL`` read
-                     consistency.
-
-    :type transaction_id: string
-    :param transaction_id: If passed, make the request in the scope of
-                           the given transaction.  Incompatible with
-                           ``eventual==True``.
-
-    :rtype: list of :class:`gcloud.datastore._datastore_v1_pb2.Entity`
-    :returns: The requested entities.
-    :raises: :class:`ValueError` if missing / deferred are not null or
-             empty list.
-    """
-    if missing is not None and missing != []:
-        raise ValueError('missing must be None or an empty list')
-
-    if deferred is not None and deferred != []:
-        raise ValueError('deferred must be None or an empty list')
-
-    results = []
-
-    loop_num = 0
-    while loop_num < _MAX_LOOPS:  # loop against possible deferred.
-        loop_num += 1
-
-        results_found, missing_found, deferred_found = connection.lookup(
-            dataset_id=dataset_id,
-            key_pbs=key_pbs,
-            eventual=eventual,
-            transaction_id=transaction_id,
-        )
-
-        results.extend(results_found)
-
-        if missing is not None:
-            missing.extend(missing_found)
-
-        if deferred is not None:
-            deferred.extend(deferred_found)
-            break
-
-        if len(deferred_found) == 0:
-            break
-
-        # We have deferred keys, and the user didn't ask to know about
-        # them, so retry (but only with the deferred ones).
-        key_pbs = deferred_found
-
-    return results
-
-
 class Client(_BaseClient):
     """Convenience wrapper for invoking APIs/factories w/ a dataset ID.
 
@@ -294,7 +221,7 @@ class Client(_BaseClient):
 
         transaction = self.current_transaction
 
-        entity_pbs = _extended_lookup(
+        entity_pbs = helpers._extended_lookup(
             connection=self.connection,
             dataset_id=self.dataset_id,
             key_pbs=[k.to_protobuf() for k in keys],
@@ -316,7 +243,7 @@ class Client(_BaseClient):
         return [helpers.entity_from_protobuf(entity_pb)
                 for entity_pb in entity_pbs]
 
-    def put(self, entity):
+    def put(self, entity, force=False):
         """Save an entity in the Cloud Datastore.
 
         .. note::
@@ -327,15 +254,25 @@ class Client(_BaseClient):
 
         :type entity: :class:`gcloud.datastore.entity.Entity`
         :param entity: The entity to be saved to the datastore.
+
+        :type force: boolean
+        :param force: If True, save the entity even if it is unchanged
+                      since it was loaded.
         """
-        self.put_multi(entities=[entity])
+        self.put_multi(entities=[entity], force=force)
 
-    def put_multi(self, entities):
+    def put_multi(self, entities, force=False):
         """Save entities in the Cloud Datastore.
 
+        Entities which are unchanged since they were loaded (or last saved)
+        are skipped;  if none of them changed, no request is sent.
+
         :type entities: list of :class:`gcloud.datastore.entity.Entity`
         :param entities: The entities to be saved to the datastore.
 
+        :type force: boolean
+        :param force: If True, save all entities, even unchanged ones.
+
         :raises: ValueError if ``entities`` is a single entity.
         """
         if isinstance(entities, Entity):
@@ -351,9 +288,9 @@ class Client(_BaseClient):
             current = self.batch()
 
         for entity in entities:
-            current.put(entity)
+            current.put(entity, force=force)
 
-        if not in_batch:
+        if not in_batch and current.mutation.ByteSize():
             current.commit()
 
     def delete(self, key):
@@ -392,6 +329,106 @@ class Client(_BaseClient):
         if not in_batch:
             current.commit()
 
+    def delete_by_query(self, query, start_cursor=None,
+                        batch_size=_DELETE_BATCH_SIZE,
+                        max_workers=_DELETE_MAX_WORKERS, progress=None):
+        """Delete all entities matching a query.
+
+        Streams keys from a keys-only version of ``query`` into batches of
+        at most ``batch_size`` deletes, committing up to ``max_workers``
+        batches concurrently.  Unlike :meth:`delete_multi`, the keys are
+        never all held in memory, nor sent in a single commit.
+
+        If ``progress`` is passed, it is called after each commit with the
+        number of entities deleted so far and a cursor before which all
+        matching entities have been deleted.  After a failure, pass the
+        last such cursor as ``start_cursor`` to resume::
+
+          >>> query = client.query(kind='LogEntry')
+          >>> query.add_filter('created', '<', cutoff)
+          >>> def report(deleted, cursor):
+          ...     save_checkpoint(cursor)
+          >>> client.delete_by_query(query, progress=report)
+          12345
+
+        .. note::
+
+           The deletes are not transactional:  each batch is committed
+           on its own.
+
+        :type query: :class:`gcloud.datastore.query.Query`
+        :param query: The query matching the entities to delete.  It must
+                      not have a projection or grouping.
+
+        :type start_cursor: bytes
+        :param start_cursor: An optional cursor from which to start the scan.
+
+        :type batch_size: integer
+        :param batch_size: Maximum number of keys deleted in each commit.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent commits.
+
+        :type progress: callable
+        :param progress: Optional function called with ``(deleted, cursor)``
+                         after each commit.
+
+        :rtype: integer
+        :returns: The number of entities deleted.
+        :raises: ValueError if called within a batch or transaction, or if
+                 ``query`` has a projection or grouping.
+        """
+        if self.current_batch is not None:
+            raise ValueError('Cannot delete by query within a batch')
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive')
+
+        keys_query = _scan_query(query, self, ['__key__'])
+        iterator = Iterator(keys_query, self, start_cursor=start_cursor)
+        # For each page of keys:  [number of pending batches, end cursor].
+        pages = []
+
+        def _key_batches():
+            """Split each page of keys into batches tagged with the page."""
+            while True:
+                keys = [helpers.key_from_protobuf(entity_pb.key)
+                        for entity_pb in iterator._next_page_pbs()]
+                batches = [keys[start:start + batch_size]
+                           for start in range(0, len(keys), batch_size)]
+                batches = batches or [[]]
+                page_num = len(pages)
+                pages.append([len(batches), iterator._start_cursor])
+                for batch_keys in batches:
+                    yield page_num, batch_keys
+                if not iterator._more_results:
+                    break
+
+        def _delete(page_keys):
+            """Commit the deletes of one batch;  run in a worker thread."""
+            page_num, keys = page_keys
+            if keys:
+                batch = self.batch()
+                for key in keys:
+                    batch.delete(key)
+                batch.commit()
+            return page_num, len(keys)
+
+        deleted = 0
+        cursor = start_cursor
+        pages_done = 0
+        for page_num, num_deleted in _imap_unordered(
+                _delete, _key_batches(), max_workers):
+            deleted += num_deleted
+            pages[page_num][0] -= 1
+            # Only advance the cursor past pages whose batches, and all
+            # earlier ones, have been committed.
+            while pages_done < len(pages) and pages[pages_done][0] == 0:
+                cursor = pages[pages_done][1]
+                pages_done += 1
+            if progress is not None:
+                progress(deleted, cursor)
+        return deleted
+
     def allocate_ids(self, incomplete_key, num_ids):
         """Allocate a list of IDs from a partial key.
 
@@ -198,13 +198,13 @@ class Connection(connection.Connection):
 
         return results, missing, list(lookup_response.deferred)
 
-    def run_query(self, dataset_id, query_pb, namespace=None,
+    def run_query(self, dataset_id, request_pb, namespace=None,
                   eventual=False, transaction_id=None):
         """Run a query on the Cloud Datastore.
 
         Maps the ``DatastoreService.RunQuery`` protobuf RPC.
 
-        Given a Query protobuf, sends a ``runQuery`` request to the
+        Given a RunQueryRequest protobuf, sends it to the
         Cloud Datastore API and returns a list of entity protobufs
         matching the query.
 
@@ -231,14 +231,20 @@ class Connection(connection.Connection):
 
         Under the hood this is doing...
 
-        >>> connection.run_query('dataset-id', query.to_protobuf())
+        >>> request = datastore_pb.RunQueryRequest()
+        >>> _pb_from_query(query, request.query)
+        >>> connection.run_query('dataset-id', request)
         [<list of Entity Protobufs>], cursor, more_results, skipped_results
 
         :type dataset_id: string
         :param dataset_id: The ID of the dataset over which to run the query.
 
-        :type query_pb: :class:`gcloud.datastore._datastore_v1_pb2.Query`
-        :param query_pb: The Protobuf representing the query to run.
+        :type request_pb:
+            :class:`gcloud.datastore._datastore_v1_pb2.RunQueryRequest`
+        :param request_pb: The request, with the query to run already built
+                           in its ``query`` field.  It is sent as is (the
+                           read options and namespace are set on it),
+                           rather than copying the query into a new request.
 
         :type namespace: string
         :param namespace: The namespace over which to run the query.
@@ -253,14 +259,12 @@ class Connection(connection.Connection):
                                the given transaction.  Incompatible with
                                ``eventual==True``.
         """
-        request = datastore_pb.RunQueryRequest()
-        _set_read_options(request, eventual, transaction_id)
+        _set_read_options(request_pb, eventual, transaction_id)
 
         if namespace:
-            request.partition_id.namespace = namespace
+            request_pb.partition_id.namespace = namespace
 
-        request.query.CopyFrom(query_pb)
-        response = self._rpc(dataset_id, 'runQuery', request,
+        response = self._rpc(dataset_id, 'runQuery', request_pb,
                              datastore_pb.RunQueryResponse)
         return (
             [e.entity for e in response.batch.entity_result],
@@ -299,7 +303,7 @@ class Connection(connection.Connection):
 
         return response.transaction
 
-    def commit(self, dataset_id, mutation_pb, transaction_id):
+    def commit(self, dataset_id, request_pb, transaction_id):
         """Commit dataset mutations in context of current transation (if any).
 
         Maps the ``DatastoreService.Commit`` protobuf RPC.
@@ -307,8 +311,12 @@ class Connection(connection.Connection):
         :type dataset_id: string
         :param dataset_id: The ID dataset to which the transaction applies.
 
-        :type mutation_pb: :class:`datastore_pb.Mutation`.
-        :param mutation_pb: The protobuf for the mutations being saved.
+        :type request_pb: :class:`datastore_pb.CommitRequest`.
+        :param request_pb: The request, with the mutations being saved
+                           already built in its ``mutation`` field.  It is
+                           sent as is (the mode and transaction are set on
+                           it), rather than copying the mutation into a new
+                           request.
 
         :type transaction_id: string or None
         :param transaction_id: The transaction ID returned from
@@ -318,16 +326,13 @@ class Connection(connection.Connection):
         :rtype: :class:`gcloud.datastore._datastore_v1_pb2.MutationResult`.
         :returns': the result protobuf for the mutation.
         """
-        request = datastore_pb.CommitRequest()
-
         if transaction_id:
-            request.mode = datastore_pb.CommitRequest.TRANSACTIONAL
-            request.transaction = transaction_id
+            request_pb.mode = datastore_pb.CommitRequest.TRANSACTIONAL
+            request_pb.transaction = transaction_id
         else:
-            request.mode = datastore_pb.CommitRequest.NON_TRANSACTIONAL
+            request_pb.mode = datastore_pb.CommitRequest.NON_TRANSACTIONAL
 
-        request.mutation.CopyFrom(mutation_pb)
-        response = self._rpc(dataset_id, 'commit', request,
+        response = self._rpc(dataset_id, 'commit', request_pb,
                              datastore_pb.CommitResponse)
         return response.mutation_result
 
@@ -391,31 +396,13 @@ def _set_read_options(request, eventual, transaction_id):
         opts.transaction = transaction_id
 
 
-def _prepare_key_for_request(key_pb):  # pragma: NO COVER copied from helpers
-    """Add protobuf keys to a request object.
-
-    .. note::
-      This is copied from `helpers` to avoid a cycle:
-      _implicit_environ -> connection -> helpers -> key -> _implicit_environ
-
-    :type key_pb: :class:`gcloud.datastore._datastore_v1_pb2.Key`
-    :param key_pb: A key to be added to a request.
-
-    :rtype: :class:`gcloud.datastore._datastore_v1_pb2.Key`
-    :returns: A key which will be added to a request. It will be the
-              original if nothing needs to be changed.
-    """
-    if key_pb.partition_id.HasField('dataset_id'):
-        new_key_pb = datastore_pb.Key()
-        new_key_pb.CopyFrom(key_pb)
-        new_key_pb.partition_id.ClearField('dataset_id')
-        key_pb = new_key_pb
-    return key_pb
-
-
 def _add_keys_to_request(request_field_pb, key_pbs):
     """Add protobuf keys to a request object.
 
+    Each key is copied once, directly into the request, and its dataset ID
+    (if any) is cleared there, as
+    :func:`gcloud.datastore.helpers._prepare_key_for_request` would.
+
     :type request_field_pb: `RepeatedCompositeFieldContainer`
     :param request_field_pb: A repeated proto field that contains keys.
 
@@ -423,5 +410,6 @@ def _add_keys_to_request(request_field_pb, key_pbs):
     :param key_pbs: The keys to add to a request.
     """
     for key_pb in key_pbs:
-        key_pb = _prepare_key_for_request(key_pb)
-        request_field_pb.add().CopyFrom(key_pb)
+        request_key_pb = request_field_pb.add()
+        request_key_pb.CopyFrom(key_pb)
+        request_key_pb.partition_id.ClearField('dataset_id')
@@ -66,6 +66,16 @@ class Entity(dict):
        Python3), will be saved using the 'blob_value' field, without
        any decoding / encoding step.
 
+    Entities loaded from the backend remember the state in which they
+    were loaded, so that saving an unchanged entity can be skipped:
+
+    >>> entity = client.get(key)
+    >>> entity.is_dirty
+    False
+    >>> entity['age'] = 21
+    >>> entity.dirty_properties
+    set(['age'])
+
     :type key: :class:`gcloud.datastore.key.Key`
     :param key: Optional key to be set on entity. Required for
                 :func:`gcloud.datastore.put()` and
@@ -81,6 +91,8 @@ class Entity(dict):
         self.key = key
         self._exclude_from_indexes = set(_ensure_tuple_or_list(
             'exclude_from_indexes', exclude_from_indexes))
+        # Snapshot of the stored state, set by ``_mark_clean``.
+        self._original = None
 
     def __eq__(self, other):
         """Compare two entities for equality.
@@ -129,9 +141,113 @@ class Entity(dict):
         """
         return frozenset(self._exclude_from_indexes)
 
+    @property
+    def dirty_properties(self):
+        """Names of properties changed since the entity was last stored.
+
+        Includes properties which have been added, modified (including
+        in-place changes to list and nested entity values) or removed.
+        For an entity which has never been loaded or saved, all of its
+        current properties are dirty.
+
+        :rtype: set of string
+        :returns: The names of the modified properties.
+        """
+        if self._original is None:
+            return set(self)
+
+        _, _, original = self._original
+        dirty = set(name for name in original if name not in self)
+        for name, value in self.items():
+            if name not in original or _value_changed(value, original[name]):
+                dirty.add(name)
+        return dirty
+
+    @property
+    def is_dirty(self):
+        """Whether the entity differs from its last stored state.
+
+        :rtype: boolean
+        :returns: True if the entity has never been loaded / saved, or if
+                  its key, index exclusions, or properties have changed
+                  since.
+        """
+        if self._original is None:
+            return True
+
+        key, exclude_from_indexes, _ = self._original
+        return (self.key != key or
+                self._exclude_from_indexes != exclude_from_indexes or
+                bool(self.dirty_properties))
+
+    def _mark_clean(self):
+        """Record the current state as the one stored in the backend.
+
+        "Protected", intended for use by
+        :func:`gcloud.datastore.helpers.entity_from_protobuf` and by
+        :meth:`gcloud.datastore.batch.Batch.commit`.  Nested entities
+        (including those inside list values) are stored along with their
+        parent, so they are marked clean as well.
+        """
+        for value in self.values():
+            _mark_nested_clean(value)
+        self._original = (
+            self.key,
+            set(self._exclude_from_indexes),
+            dict((name, _snapshot_value(value))
+                 for name, value in self.items()),
+        )
+
     def __repr__(self):
         if self.key:
             return '<Entity%s %s>' % (self.key.path,
                                       super(Entity, self).__repr__())
         else:
             return '<Entity %s>' % (super(Entity, self).__repr__())
+
+
+def _mark_nested_clean(value):
+    """Mark entities nested in a property value as stored.
+
+    :param value: A property value of an entity.
+    """
+    if isinstance(value, list):
+        for item in value:
+            _mark_nested_clean(item)
+    elif isinstance(value, Entity):
+        value._mark_clean()
+
+
+def _snapshot_value(value):
+    """Copy a property value so later in-place changes can be detected.
+
+    Lists are copied (shallowly);  nested entities track their own state.
+
+    :param value: A property value of an entity.
+
+    :returns: A value suitable for comparison with ``value`` later.
+    """
+    if isinstance(value, list):
+        return [_snapshot_value(item) for item in value]
+    return value
+
+
+def _value_changed(value, original):
+    """Check whether a property value differs from its snapshot.
+
+    :param value: The current property value.
+
+    :param original: The value returned by :func:`_snapshot_value` when
+                     the entity was last marked clean.
+
+    :rtype: boolean
+    :returns: True if the value has changed.
+    """
+    if isinstance(value, list):
+        if not isinstance(original, list) or len(value) != len(original):
+            return True
+        return any(_value_changed(item, orig_item)
+                   for item, orig_item in zip(value, original))
+    if isinstance(value, Entity) and value.is_dirty:
+        return True
+    return value != original
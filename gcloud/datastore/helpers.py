@@ -32,6 +32,9 @@ __all__ = ('entity_from_protobuf', 'key_from_protobuf')
 
 INT_VALUE_CHECKER = Int64ValueChecker()
 
+_MAX_LOOPS = 128
+"""Maximum number of iterations to wait for deferred keys."""
+
 
 def find_true_dataset_id(dataset_id, connection):
     """Find the true (unaliased) dataset ID.
@@ -73,6 +76,86 @@ def find_true_dataset_id(dataset_id, connection):
     return returned_pb.key.partition_id.dataset_id
 
 
+def _extended_lookup(connection, dataset_id, key_pbs,
+                     missing=None, deferred=None,
+                     eventual=False, transaction_id=None):
+    """Repeat lookup until all keys found (unless stop requested).
+
+    Helper function for :meth:`gcloud.datastore.client.Client.get_multi`
+    and :class:`gcloud.datastore.query.LookupIterator`.
+
+    :type connection: :class:`gcloud.datastore.connection.Connection`
+    :param connection: The connection used to connect to datastore.
+
+    :type dataset_id: string
+    :param dataset_id: The ID of the dataset of which to make the request.
+
+    :type key_pbs: list of :class:`gcloud.datastore._datastore_v1_pb2.Key`
+    :param key_pbs: The keys to retrieve from the datastore.
+
+    :type missing: an empty list or None.
+    :param missing: If a list is passed, the key-only entity protobufs
+                    returned by the backend as "missing" will be copied
+                    into it.  Use only as a keyword param.
+
+    :type deferred: an empty list or None.
+    :param deferred: If a list is passed, the key protobufs returned
+                     by the backend as "deferred" will be copied into it.
+                     Use only as a keyword param.
+
+    :type eventual: boolean
+    :param eventual: If False (the default), request ``STRONG`` read
+                     consistency.  If True, request ``EVENTUAL`` read
+                     consistency.
+
+    :type transaction_id: string
+    :param transaction_id: If passed, make the request in the scope of
+                           the given transaction.  Incompatible with
+                           ``eventual==True``.
+
+    :rtype: list of :class:`gcloud.datastore._datastore_v1_pb2.Entity`
+    :returns: The requested entities.
+    :raises: :class:`ValueError` if missing / deferred are not null or
+             empty list.
+    """
+    if missing is not None and missing != []:
+        raise ValueError('missing must be None or an empty list')
+
+    if deferred is not None and deferred != []:
+        raise ValueError('deferred must be None or an empty list')
+
+    results = []
+
+    loop_num = 0
+    while loop_num < _MAX_LOOPS:  # loop against possible deferred.
+        loop_num += 1
+
+        results_found, missing_found, deferred_found = connection.lookup(
+            dataset_id=dataset_id,
+            key_pbs=key_pbs,
+            eventual=eventual,
+            transaction_id=transaction_id,
+        )
+
+        results.extend(results_found)
+
+        if missing is not None:
+            missing.extend(missing_found)
+
+        if deferred is not None:
+            deferred.extend(deferred_found)
+            break
+
+        if len(deferred_found) == 0:
+            break
+
+        # We have deferred keys, and the user didn't ask to know about
+        # them, so retry (but only with the deferred ones).
+        key_pbs = deferred_found
+
+    return results
+
+
 def entity_from_protobuf(pb):
     """Factory method for creating an entity based on a protobuf.
 
@@ -113,6 +196,7 @@ def entity_from_protobuf(pb):
 
     entity = Entity(key=key, exclude_from_indexes=exclude_from_indexes)
     entity.update(entity_props)
+    entity._mark_clean()
     return entity
 
 
@@ -292,15 +376,19 @@ def _set_protobuf_value(value_pb, val):
         value_pb.Clear()
         return
 
+    if isinstance(val, Key):
+        # Write the key in place, rather than copying ``val.to_protobuf()``.
+        value_pb.ClearField('key_value')
+        val._set_protobuf(value_pb.key_value)
+        return
+
     attr, val = _pb_attr_value(val)
-    if attr == 'key_value':
-        value_pb.key_value.CopyFrom(val)
-    elif attr == 'entity_value':
+    if attr == 'entity_value':
         e_pb = value_pb.entity_value
         e_pb.Clear()
         key = val.key
         if key is not None:
-            e_pb.key.CopyFrom(key.to_protobuf())
+            key._set_protobuf(e_pb.key)
         for item_key, value in val.items():
             p_pb = e_pb.property.add()
             p_pb.name = item_key
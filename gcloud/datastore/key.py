@@ -239,13 +239,33 @@ class Key(object):
         :returns: The protobuf representing the key.
         """
         key = datastore_pb.Key()
-        key.partition_id.dataset_id = self.dataset_id
+        self._set_protobuf(key)
+        return key
+
+    def _set_protobuf(self, key_pb, for_request=False):
+        """Write the key into an existing (empty) protobuf.
+
+        "Protected", used to build requests in place, rather than copying
+        the result of :meth:`to_protobuf` into them.
+
+        :type key_pb: :class:`gcloud.datastore._datastore_v1_pb2.Key`
+        :param key_pb: The protobuf to be filled in.
+
+        :type for_request: boolean
+        :param for_request: If True, leave out the dataset ID, which the
+                            backend rejects in the keys of requests.
+        """
+        if for_request:
+            # Match ``_prepare_key_for_request``:  an empty partition ID.
+            key_pb.partition_id.SetInParent()
+        else:
+            key_pb.partition_id.dataset_id = self.dataset_id
 
         if self.namespace:
-            key.partition_id.namespace = self.namespace
+            key_pb.partition_id.namespace = self.namespace
 
-        for item in self.path:
-            element = key.path_element.add()
+        for item in self._path:
+            element = key_pb.path_element.add()
             if 'kind' in item:
                 element.kind = item['kind']
             if 'id' in item:
@@ -253,8 +273,6 @@ class Key(object):
             if 'name' in item:
                 element.name = item['name']
 
-        return key
-
     @property
     def is_partial(self):
         """Boolean indicating if the key has an ID (or name).
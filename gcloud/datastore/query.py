@@ -15,13 +15,27 @@
 """Create / interact with gcloud datastore queries."""
 
 import base64
+import functools
 
 from gcloud._helpers import _ensure_tuple_or_list
+from gcloud._helpers import _imap_unordered
 from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
 from gcloud.datastore import helpers
 from gcloud.datastore.key import Key
 
 
+_LOOKUP_BATCH_SIZE = 100
+"""Default number of keys sent in each lookup by :class:`LookupIterator`."""
+
+_LOOKUP_MAX_WORKERS = 4
+"""Default number of concurrent lookups made by :class:`LookupIterator`."""
+
+_SCAN_MAX_WORKERS = 4
+"""Default number of key ranges scanned concurrently by aggregations."""
+
+_NO_VALUE = object()  # Result of aggregating a range without any values.
+
+
 class Query(object):
     """A Query against the Cloud Datastore.
 
@@ -331,6 +345,226 @@ class Query(object):
         return Iterator(
             self, client, limit, offset, start_cursor, end_cursor)
 
+    def fetch_by_keys(self, limit=None, offset=0, start_cursor=None,
+                      end_cursor=None, client=None,
+                      batch_size=_LOOKUP_BATCH_SIZE,
+                      max_workers=_LOOKUP_MAX_WORKERS, cache=None):
+        """Execute the Query as a keys-only scan plus batched lookups.
+
+        Rather than returning full entities from the query itself, runs a
+        keys-only version of the query and passes the keys, in batches of
+        ``batch_size``, to concurrent lookup requests.  The scan of later
+        pages overlaps with the lookup of earlier ones, which is usually
+        much faster than :meth:`fetch` for kinds with large entities.
+
+        For example::
+
+          >>> from gcloud import datastore
+          >>> query = datastore.Query('Person')
+          >>> for entity in query.fetch_by_keys(max_workers=8):
+          ...     do_something(entity)
+
+        .. note::
+
+           Entities are yielded as their lookups complete, which need not
+           be in query order.  Entities deleted between the scan and the
+           lookup are skipped.
+
+        :type limit: integer or None
+        :param limit: An optional limit passed through to the key scan.
+
+        :type offset: integer
+        :param offset: An optional offset passed through to the key scan.
+
+        :type start_cursor: bytes
+        :param start_cursor: An optional cursor passed through to the scan.
+
+        :type end_cursor: bytes
+        :param end_cursor: An optional cursor passed through to the scan.
+
+        :type client: :class:`gcloud.datastore.client.Client`
+        :param client: client used to connect to datastore.
+                       If not supplied, uses the query's value.
+
+        :type batch_size: integer
+        :param batch_size: Maximum number of keys in each lookup request.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent lookup requests.
+
+        :type cache: dict-like object, or ``NoneType``
+        :param cache: Optional mapping of keys to entities, checked before
+                      each lookup;  looked-up entities are stored in it.
+
+        :rtype: :class:`LookupIterator`
+        :raises: ValueError if the query has a projection or grouping.
+        """
+        if client is None:
+            client = self._client
+
+        return LookupIterator(
+            self, client, limit, offset, start_cursor, end_cursor,
+            batch_size=batch_size, max_workers=max_workers, cache=cache)
+
+    def _scan_ranges(self, client, projection, split_keys, max_workers,
+                     reduce_pbs):
+        """Scan key ranges of the query concurrently, reducing each one.
+
+        Helper for :meth:`count` and :meth:`aggregate`.
+
+        :type client: :class:`gcloud.datastore.client.Client` or ``NoneType``
+        :param client: client used to connect to datastore.
+                       If not supplied, uses the query's value.
+
+        :type projection: sequence of string
+        :param projection: The projection used for the scans.
+
+        :type split_keys: sequence of :class:`gcloud.datastore.key.Key`
+        :param split_keys: Keys, in ascending order, at which to split the
+                           key space into ranges.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of ranges scanned concurrently.
+
+        :type reduce_pbs: callable
+        :param reduce_pbs: Function reducing the entity protobufs of one
+                           range to a single value.
+
+        :rtype: list
+        :returns: The reduced value of each range, in no particular order.
+        """
+        if client is None:
+            client = self._client
+
+        bounds = [None] + list(split_keys) + [None]
+        queries = []
+        for lower, upper in zip(bounds[:-1], bounds[1:]):
+            filters = []
+            if lower is not None:
+                filters.append(('__key__', '>=', lower))
+            if upper is not None:
+                filters.append(('__key__', '<', upper))
+            queries.append(_scan_query(self, client, projection,
+                                       filters=filters))
+
+        # The current transaction is thread-local:  scan in this thread.
+        if client.current_transaction is not None:
+            max_workers = 1
+
+        def _scan(query):
+            """Reduce the results of a single range."""
+            return reduce_pbs(Iterator(query, client)._iter_pbs())
+
+        return list(_imap_unordered(_scan, queries, max_workers))
+
+    def count(self, client=None, split_keys=(),
+              max_workers=_SCAN_MAX_WORKERS):
+        """Count the entities matching the query.
+
+        Runs a keys-only scan, counting the results of each page without
+        building entities.  If ``split_keys`` are passed, the key space is
+        split at those keys and the ranges are scanned concurrently::
+
+          >>> query = client.query(kind='Person')
+          >>> query.count()
+          1234
+          >>> query.count(split_keys=[client.key('Person', 5000)])
+          1234
+
+        .. note::
+
+           Splitting adds inequality filters on ``__key__``, so it cannot
+           be combined with inequality filters on other properties.
+
+        :type client: :class:`gcloud.datastore.client.Client`
+        :param client: client used to connect to datastore.
+                       If not supplied, uses the query's value.
+
+        :type split_keys: sequence of :class:`gcloud.datastore.key.Key`
+        :param split_keys: Keys, in ascending order, at which to split the
+                           key space into concurrently-scanned ranges.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of ranges scanned concurrently.
+
+        :rtype: integer
+        :returns: The number of matching entities.
+        :raises: ValueError if the query has a projection or grouping.
+        """
+        return sum(self._scan_ranges(client, ['__key__'], split_keys,
+                                     max_workers, _count_pbs))
+
+    def aggregate(self, property_name, function, initial=None, client=None,
+                  split_keys=(), max_workers=_SCAN_MAX_WORKERS):
+        """Reduce the values of a property over the matching entities.
+
+        Runs a projection scan on ``property_name``, reducing the values
+        with ``function`` as they stream in, without building entities.
+        ``function`` is also used to combine the results of the ranges
+        when ``split_keys`` are passed (see :meth:`count`), so it must be
+        associative and commutative, e.g. :func:`operator.add`,
+        :func:`min` or :func:`max`::
+
+          >>> import operator
+          >>> query = client.query(kind='Person')
+          >>> query.aggregate('age', operator.add, 0)
+          45678
+          >>> query.aggregate('age', max)
+          107
+
+        .. note::
+
+           As for any projection query, only entities with an indexed value
+           for ``property_name`` are scanned, and each value of a list
+           property is reduced separately.
+
+        :type property_name: string
+        :param property_name: The name of the property to aggregate.
+
+        :type function: callable
+        :param function: Function of two values, returning their reduction.
+
+        :type initial: object
+        :param initial: Optional value placed before the property values.
+
+        :type client: :class:`gcloud.datastore.client.Client`
+        :param client: client used to connect to datastore.
+                       If not supplied, uses the query's value.
+
+        :type split_keys: sequence of :class:`gcloud.datastore.key.Key`
+        :param split_keys: Keys, in ascending order, at which to split the
+                           key space into concurrently-scanned ranges.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of ranges scanned concurrently.
+
+        :rtype: object
+        :returns: The reduced value, ``initial`` if no entity has the
+                  property, or None if there is no initial value either.
+        :raises: ValueError if the query has a projection or grouping.
+        """
+        def _reduce_pbs(entity_pbs):
+            """Reduce the property values of a single range."""
+            result = _NO_VALUE
+            for entity_pb in entity_pbs:
+                # Projected results only carry the projected property.
+                for property_pb in entity_pb.property:
+                    value = helpers._get_value_from_property_pb(property_pb)
+                    if result is _NO_VALUE:
+                        result = value
+                    else:
+                        result = function(result, value)
+            return result
+
+        results = [result for result in self._scan_ranges(
+            client, [property_name], split_keys, max_workers, _reduce_pbs)
+            if result is not _NO_VALUE]
+        if initial is not None:
+            results.insert(0, initial)
+        if not results:
+            return None
+        return functools.reduce(function, results)
+
 
 class Iterator(object):
     """Represent the state of a given execution of a Query.
@@ -376,15 +610,18 @@ class Iterator(object):
         self._end_cursor = end_cursor
         self._page = self._more_results = None
 
-    def next_page(self):
-        """Fetch a single "page" of query results.
+    def _next_page_pbs(self):
+        """Fetch a single "page" of query results as raw protobufs.
 
-        Low-level API for fine control:  the more convenient API is
-        to iterate on the current Iterator.
+        Helper for :meth:`next_page`, also used to scan results without
+        building entities.
 
-        :rtype: tuple, (entities, more_results, cursor)
+        :rtype: list of :class:`gcloud.datastore._datastore_v1_pb2.Entity`
+        :returns: The entity protobufs of the page.
         """
-        pb = _pb_from_query(self._query)
+        # Build the query directly inside the request to be sent.
+        request = datastore_pb.RunQueryRequest()
+        pb = _pb_from_query(self._query, request.query)
 
         start_cursor = self._start_cursor
         if start_cursor is not None:
@@ -402,7 +639,7 @@ class Iterator(object):
         transaction = self._client.current_transaction
 
         query_results = self._client.connection.run_query(
-            query_pb=pb,
+            request_pb=request,
             dataset_id=self._query.dataset_id,
             namespace=self._query.namespace,
             transaction_id=transaction and transaction.id,
@@ -431,11 +668,32 @@ class Iterator(object):
         else:
             raise ValueError('Unexpected value returned for `more_results`.')
 
+        return entity_pbs
+
+    def next_page(self):
+        """Fetch a single "page" of query results.
+
+        Low-level API for fine control:  the more convenient API is
+        to iterate on the current Iterator.
+
+        :rtype: tuple, (entities, more_results, cursor)
+        """
         self._page = [
             helpers.entity_from_protobuf(entity)
-            for entity in entity_pbs]
+            for entity in self._next_page_pbs()]
         return self._page, self._more_results, self._start_cursor
 
+    def _iter_pbs(self):
+        """Generator yielding the raw protobufs of all matching results.
+
+        :rtype: sequence of :class:`gcloud.datastore._datastore_v1_pb2.Entity`
+        """
+        while True:
+            for entity_pb in self._next_page_pbs():
+                yield entity_pb
+            if not self._more_results:
+                break
+
     def __iter__(self):
         """Generator yielding all results matching our query.
 
@@ -450,18 +708,199 @@ class Iterator(object):
             self.next_page()
 
 
-def _pb_from_query(query):
+class LookupIterator(object):
+    """Represent an execution of a Query as keys-only scan plus lookups.
+
+    See :meth:`Query.fetch_by_keys`.
+
+    :type query: :class:`gcloud.datastore.query.Query`
+    :param query: Query object holding permanent configuration.  It must
+                  not have a projection or grouping.
+
+    :type client: :class:`gcloud.datastore.client.Client`
+    :param client: The client used to make requests.
+
+    :type limit: integer
+    :param limit: (Optional) Limit the number of results returned.
+
+    :type offset: integer
+    :param offset: (Optional) Defaults to 0. Offset used to begin
+                   a query.
+
+    :type start_cursor: bytes
+    :param start_cursor: (Optional) Cursor to begin paging through
+                         query results.
+
+    :type end_cursor: bytes
+    :param end_cursor: (Optional) Cursor to end paging through
+                       query results.
+
+    :type batch_size: integer
+    :param batch_size: Maximum number of keys in each lookup request.
+
+    :type max_workers: integer
+    :param max_workers: Maximum number of concurrent lookup requests.
+
+    :type cache: dict-like object, or ``NoneType``
+    :param cache: Optional mapping of keys to entities.
+    """
+
+    def __init__(self, query, client, limit=None, offset=0,
+                 start_cursor=None, end_cursor=None,
+                 batch_size=_LOOKUP_BATCH_SIZE,
+                 max_workers=_LOOKUP_MAX_WORKERS, cache=None):
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive')
+
+        keys_query = _scan_query(query, client, ['__key__'],
+                                 order=query.order)
+
+        self._query = query
+        self._client = client
+        self._key_iterator = Iterator(
+            keys_query, client, limit, offset, start_cursor, end_cursor)
+        self._batch_size = batch_size
+        self._max_workers = max_workers
+        self._cache = cache
+
+    def _key_batches(self):
+        """Group the keys from the scan into batches for lookup.
+
+        :rtype: generator
+        :returns: ``(keys, cached_entities)`` pairs, where ``keys`` still
+                  need to be looked up.
+        """
+        keys, cached = [], []
+        for key_entity_pb in self._key_iterator._iter_pbs():
+            key = helpers.key_from_protobuf(key_entity_pb.key)
+            entity = None
+            if self._cache is not None:
+                entity = self._cache.get(key)
+            if entity is None:
+                keys.append(key)
+            else:
+                cached.append(entity)
+            if len(keys) >= self._batch_size:
+                yield keys, cached
+                keys, cached = [], []
+        if keys or cached:
+            yield keys, cached
+
+    def _lookup(self, batch, transaction_id):
+        """Look up a batch of keys;  run in a worker thread.
+
+        :type batch: tuple, (keys, cached_entities)
+        :param batch: A batch produced by :meth:`_key_batches`.
+
+        :type transaction_id: string or ``NoneType``
+        :param transaction_id: The ID of the caller's transaction, if any.
+
+        :rtype: list of :class:`gcloud.datastore.entity.Entity`
+        :returns: The cached entities followed by the found entities.
+        """
+        keys, entities = batch
+        if keys:
+            entity_pbs = helpers._extended_lookup(
+                connection=self._client.connection,
+                dataset_id=self._query.dataset_id,
+                key_pbs=[key.to_protobuf() for key in keys],
+                transaction_id=transaction_id,
+            )
+            entities.extend(helpers.entity_from_protobuf(entity_pb)
+                            for entity_pb in entity_pbs)
+        return entities
+
+    def __iter__(self):
+        """Generator yielding all entities matching our query.
+
+        :rtype: sequence of :class:`gcloud.datastore.entity.Entity`
+        """
+        # The current transaction is thread-local, so look it up here
+        # rather than in the worker threads.
+        transaction = self._client.current_transaction
+        lookup = functools.partial(
+            self._lookup, transaction_id=transaction and transaction.id)
+
+        for entities in _imap_unordered(lookup, self._key_batches(),
+                                        self._max_workers):
+            for entity in entities:
+                if self._cache is not None:
+                    self._cache[entity.key] = entity
+                yield entity
+
+
+def _count_pbs(entity_pbs):
+    """Count entity protobufs.
+
+    Helper for :meth:`Query.count`.
+
+    :type entity_pbs: iterable of
+                      :class:`gcloud.datastore._datastore_v1_pb2.Entity`
+    :param entity_pbs: The protobufs to be counted.
+
+    :rtype: integer
+    :returns: The number of protobufs.
+    """
+    return sum(1 for _ in entity_pbs)
+
+
+def _scan_query(query, client, projection, order=(), filters=()):
+    """Derive a query scanning the same entities as ``query``.
+
+    Helper for :class:`LookupIterator` and the aggregation methods of
+    :class:`Query`.
+
+    :type query: :class:`Query`
+    :param query: The source query.  It must not have a projection or
+                  grouping.
+
+    :type client: :class:`gcloud.datastore.client.Client`
+    :param client: The client used to connect to datastore.
+
+    :type projection: sequence of string
+    :param projection: The projection of the derived query.
+
+    :type order: sequence of string
+    :param order: The order of the derived query.
+
+    :type filters: sequence of (property_name, operator, value) tuples
+    :param filters: Filters added to those of ``query``.
+
+    :rtype: :class:`Query`
+    :returns: The derived query.
+    :raises: ValueError if ``query`` has a projection or grouping.
+    """
+    if query.projection or query.group_by:
+        raise ValueError('Cannot scan a query with a projection or grouping.')
+
+    return Query(client,
+                 kind=query.kind,
+                 dataset_id=query.dataset_id,
+                 namespace=query.namespace,
+                 ancestor=query.ancestor,
+                 filters=query.filters + list(filters),
+                 projection=projection,
+                 order=order)
+
+
+def _pb_from_query(query, pb=None):
     """Convert a Query instance to the corresponding protobuf.
 
     :type query: :class:`Query`
     :param query: The source query.
 
+    :type pb: :class:`gcloud.datastore._datastore_v1_pb2.Query`
+    :param pb: (Optional) An empty protobuf to build the query in, e.g.
+               the ``query`` field of a request.  If not passed, a new
+               protobuf is created.
+
     :rtype: :class:`gcloud.datastore._datastore_v1_pb2.Query`
     :returns: A protobuf that can be sent to the protobuf API.  N.b. that
               it does not contain "in-flight" fields for ongoing query
               executions (cursors, offset, limit).
     """
-    pb = datastore_pb.Query()
+    if pb is None:
+        pb = datastore_pb.Query()
 
     for projection_name in query.projection:
         pb.projection.add().property.name = projection_name
@@ -473,14 +912,12 @@ def _pb_from_query(query):
     composite_filter.operator = datastore_pb.CompositeFilter.AND
 
     if query.ancestor:
-        ancestor_pb = helpers._prepare_key_for_request(
-            query.ancestor.to_protobuf())
-
         # Filter on __key__ HAS_ANCESTOR == ancestor.
         ancestor_filter = composite_filter.filter.add().property_filter
         ancestor_filter.property.name = '__key__'
         ancestor_filter.operator = datastore_pb.PropertyFilter.HAS_ANCESTOR
-        ancestor_filter.value.key_value.CopyFrom(ancestor_pb)
+        query.ancestor._set_protobuf(ancestor_filter.value.key_value,
+                                     for_request=True)
 
     for property_name, operator, value in query.filters:
         pb_op_enum = query.OPERATORS.get(operator)
@@ -492,9 +929,8 @@ def _pb_from_query(query):
 
         # Set the value to filter on based on the type.
         if property_name == '__key__':
-            key_pb = value.to_protobuf()
-            property_filter.value.key_value.CopyFrom(
-                helpers._prepare_key_for_request(key_pb))
+            value._set_protobuf(property_filter.value.key_value,
+                                for_request=True)
         else:
             helpers._set_protobuf_value(property_filter.value, value)
 
@@ -121,6 +121,37 @@ class TestBatch(unittest2.TestCase):
         self.assertEqual(len(deletes), 0)
         self.assertEqual(batch._auto_id_entities, [entity])
 
+    def test_put_entity_unchanged(self):
+        _DATASET = 'DATASET'
+        connection = _Connection()
+        client = _Client(_DATASET, connection)
+        batch = self._makeOne(client)
+        entity = _Entity({'foo': 'bar'})
+        entity.key = _Key(_DATASET)
+        entity.is_dirty = False
+
+        batch.put(entity)
+
+        self.assertEqual(len(batch.mutation.upsert), 0)
+        self.assertEqual(batch._put_entities, [])
+
+    def test_put_entity_unchanged_w_force(self):
+        _DATASET = 'DATASET'
+        connection = _Connection()
+        client = _Client(_DATASET, connection)
+        batch = self._makeOne(client)
+        entity = _Entity({'foo': 'bar'})
+        key = entity.key = _Key(_DATASET)
+        entity.is_dirty = False
+
+        batch.put(entity, force=True)
+
+        upserts = list(batch.mutation.upsert)
+        self.assertEqual(len(upserts), 1)
+        self.assertEqual(upserts[0].key, key._key)
+        self.assertTrue(key._for_request)
+        self.assertEqual(batch._put_entities, [entity])
+
     def test_put_entity_w_completed_key(self):
         _DATASET = 'DATASET'
         _PROPERTIES = {
@@ -228,6 +259,7 @@ class TestBatch(unittest2.TestCase):
         deletes = list(batch.mutation.delete)
         self.assertEqual(len(deletes), 1)
         self.assertEqual(deletes[0], key._key)
+        self.assertTrue(key._for_request)
 
     def test_delete_w_completed_key_w_prefixed_dataset_id(self):
         _DATASET = 'DATASET'
@@ -255,7 +287,23 @@ class TestBatch(unittest2.TestCase):
         batch.commit()
 
         self.assertEqual(connection._committed,
-                         [(_DATASET, batch.mutation, None)])
+                         [(_DATASET, batch._commit_request, None)])
+
+    def test_commit_sends_request_built_in_place(self):
+        _DATASET = 'DATASET'
+        connection = _Connection()
+        client = _Client(_DATASET, connection)
+        batch = self._makeOne(client)
+        entity = _Entity(foo=u'bar')
+        entity.key = _Key(_DATASET)
+        batch.put(entity)
+
+        batch.commit()
+
+        (_, request_pb, _), = connection._committed
+        self.assertTrue(request_pb is batch._commit_request)
+        upsert, = request_pb.mutation.upsert
+        self.assertEqual(upsert.property[0].name, 'foo')
 
     def test_commit_w_auto_id_entities(self):
         _DATASET = 'DATASET'
@@ -271,10 +319,24 @@ class TestBatch(unittest2.TestCase):
         batch.commit()
 
         self.assertEqual(connection._committed,
-                         [(_DATASET, batch.mutation, None)])
+                         [(_DATASET, batch._commit_request, None)])
         self.assertFalse(entity.key.is_partial)
         self.assertEqual(entity.key._id, _NEW_ID)
 
+    def test_commit_marks_put_entities_clean(self):
+        _DATASET = 'DATASET'
+        connection = _Connection()
+        client = _Client(_DATASET, connection)
+        batch = self._makeOne(client)
+        entity = _Entity({'foo': 'bar'})
+        entity.key = _Key(_DATASET)
+        batch.put(entity)
+        self.assertFalse(entity._marked_clean)
+
+        batch.commit()
+
+        self.assertTrue(entity._marked_clean)
+
     def test_as_context_mgr_wo_error(self):
         _DATASET = 'DATASET'
         _PROPERTIES = {'foo': 'bar'}
@@ -299,7 +361,7 @@ class TestBatch(unittest2.TestCase):
         deletes = list(batch.mutation.delete)
         self.assertEqual(len(deletes), 0)
         self.assertEqual(connection._committed,
-                         [(_DATASET, batch.mutation, None)])
+                         [(_DATASET, batch._commit_request, None)])
 
     def test_as_context_mgr_nested(self):
         _DATASET = 'DATASET'
@@ -341,8 +403,8 @@ class TestBatch(unittest2.TestCase):
         self.assertEqual(len(deletes), 0)
 
         self.assertEqual(connection._committed,
-                         [(_DATASET, batch2.mutation, None),
-                          (_DATASET, batch1.mutation, None)])
+                         [(_DATASET, batch2._commit_request, None),
+                          (_DATASET, batch1._commit_request, None)])
 
     def test_as_context_mgr_w_error(self):
         _DATASET = 'DATASET'
@@ -400,14 +462,19 @@ class _Connection(object):
         self._commit_result = _CommitResult(*new_keys)
         self._committed = []
 
-    def commit(self, dataset_id, mutation, transaction_id):
-        self._committed.append((dataset_id, mutation, transaction_id))
+    def commit(self, dataset_id, request_pb, transaction_id):
+        self._committed.append((dataset_id, request_pb, transaction_id))
         return self._commit_result
 
 
 class _Entity(dict):
     key = None
     exclude_from_indexes = ()
+    is_dirty = True
+    _marked_clean = False
+
+    def _mark_clean(self):
+        self._marked_clean = True
 
 
 class _Key(object):
@@ -438,6 +505,10 @@ class _Key(object):
 
         return key
 
+    def _set_protobuf(self, key_pb, for_request=False):
+        self._for_request = for_request
+        key_pb.CopyFrom(self.to_protobuf())
+
     def completed_key(self, new_id):
         assert self.is_partial
         new_key = self.__class__(self.dataset_id)
@@ -496,7 +496,7 @@ class TestClient(unittest2.TestCase):
 
     def test_get_multi_max_loops(self):
         from gcloud._testing import _Monkey
-        from gcloud.datastore import client as _MUT
+        from gcloud.datastore import helpers as _MUT
         from gcloud.datastore.key import Key
 
         KIND = 'Kind'
@@ -538,6 +538,7 @@ class TestClient(unittest2.TestCase):
 
         self.assertEqual(_called_with[0][0], ())
         self.assertEqual(_called_with[0][1]['entities'], [entity])
+        self.assertEqual(_called_with[0][1]['force'], False)
 
     def test_put_multi_no_entities(self):
         creds = object()
@@ -579,6 +580,61 @@ class TestClient(unittest2.TestCase):
         self.assertEqual(properties[0].value.string_value, u'bar')
         self.assertTrue(transaction_id is None)
 
+    def test_put_multi_no_batch_w_unchanged_entity(self):
+        from gcloud.datastore.entity import Entity
+        from gcloud.datastore.key import Key
+
+        creds = object()
+        client = self._makeOne(credentials=creds)
+        entity = Entity(key=Key('KIND', 1234, dataset_id=self.DATASET_ID))
+        entity['foo'] = u'bar'
+        entity._mark_clean()
+
+        result = client.put_multi([entity])
+
+        self.assertTrue(result is None)
+        self.assertEqual(client.connection._commit_cw, [])
+
+    def test_put_multi_no_batch_w_unchanged_entity_w_force(self):
+        from gcloud.datastore.entity import Entity
+        from gcloud.datastore.key import Key
+        from gcloud.datastore.test_batch import _CommitResult
+
+        creds = object()
+        client = self._makeOne(credentials=creds)
+        entity = Entity(key=Key('KIND', 1234, dataset_id=self.DATASET_ID))
+        entity['foo'] = u'bar'
+        entity._mark_clean()
+        client.connection._commit.append(_CommitResult())
+
+        client.put_multi([entity], force=True)
+
+        self.assertEqual(len(client.connection._commit_cw), 1)
+        _, mutation, _ = client.connection._commit_cw[0]
+        upserts = list(mutation.upsert)
+        self.assertEqual(len(upserts), 1)
+        self.assertEqual(upserts[0].property[0].name, 'foo')
+
+    def test_put_multi_no_batch_w_embedded_entity_saved(self):
+        from gcloud.datastore.entity import Entity
+        from gcloud.datastore.key import Key
+        from gcloud.datastore.test_batch import _CommitResult
+
+        creds = object()
+        client = self._makeOne(credentials=creds)
+        entity = Entity(key=Key('KIND', 1234, dataset_id=self.DATASET_ID))
+        nested = Entity()
+        nested['bar'] = u'baz'
+        entity['foo'] = nested
+        entity['qux'] = [nested]
+        client.connection._commit.append(_CommitResult())
+
+        client.put_multi([entity])
+        client.put_multi([entity])  # unchanged since saved:  skipped
+
+        self.assertEqual(len(client.connection._commit_cw), 1)
+        self.assertFalse(nested.is_dirty)
+
     def test_put_multi_existing_batch_w_completed_key(self):
         from gcloud.datastore.test_batch import _Entity
         from gcloud.datastore.test_batch import _Key
@@ -677,6 +733,91 @@ class TestClient(unittest2.TestCase):
         self.assertEqual(deletes[0], key._key)
         self.assertEqual(len(client.connection._commit_cw), 0)
 
+    def test_delete_by_query(self):
+        from base64 import b64encode
+        from gcloud.datastore.test_batch import _CommitResult
+
+        creds = object()
+        client = self._makeOne(credentials=creds)
+        connection = client.connection
+        connection._add_query_result([1, 2, 3], cursor=b'\x01', more=True)
+        connection._add_query_result([4], cursor=b'\x02')
+        connection._commit.extend([_CommitResult()] * 3)
+        query = client.query(kind='Kind')
+        reported = []
+
+        result = client.delete_by_query(
+            query, batch_size=2, max_workers=1,
+            progress=lambda *args: reported.append(args))
+
+        self.assertEqual(result, 4)
+        _, query_pb, _, _, _ = connection._query_cw[0]
+        self.assertEqual([proj.property.name for proj in query_pb.projection],
+                         ['__key__'])
+        deleted_ids = [
+            [key_pb.path_element[0].id for key_pb in mutation.delete]
+            for _, mutation, _ in connection._commit_cw]
+        self.assertEqual(deleted_ids, [[1, 2], [3], [4]])
+        self.assertEqual(reported, [(2, None),
+                                    (3, b64encode(b'\x01')),
+                                    (4, b64encode(b'\x02'))])
+
+    def test_delete_by_query_w_start_cursor(self):
+        from base64 import b64encode
+
+        creds = object()
+        client = self._makeOne(credentials=creds)
+        connection = client.connection
+        connection._add_query_result([])
+        query = client.query(kind='Kind')
+
+        result = client.delete_by_query(
+            query, start_cursor=b64encode(b'\x01'), max_workers=1)
+
+        self.assertEqual(result, 0)
+        _, query_pb, _, _, _ = connection._query_cw[0]
+        self.assertEqual(query_pb.start_cursor, b'\x01')
+        self.assertEqual(connection._commit_cw, [])
+
+    def test_delete_by_query_concurrent(self):
+        from gcloud.datastore.test_batch import _CommitResult
+
+        creds = object()
+        client = self._makeOne(credentials=creds)
+        connection = client.connection
+        connection._add_query_result(list(range(1, 31)), cursor=b'\x01',
+                                     more=True)
+        connection._add_query_result(list(range(31, 51)), cursor=b'\x02')
+        connection._commit.extend([_CommitResult()] * 10)
+        query = client.query(kind='Kind')
+        reported = []
+
+        result = client.delete_by_query(
+            query, batch_size=5, max_workers=4,
+            progress=lambda *args: reported.append(args))
+
+        self.assertEqual(result, 50)
+        deleted_ids = sorted(key_pb.path_element[0].id
+                             for _, mutation, _ in connection._commit_cw
+                             for key_pb in mutation.delete)
+        self.assertEqual(deleted_ids, list(range(1, 51)))
+        self.assertEqual(reported[-1][0], 50)
+
+    def test_delete_by_query_w_existing_batch(self):
+        creds = object()
+        client = self._makeOne(credentials=creds)
+        query = client.query(kind='Kind')
+
+        with _NoCommitBatch(client):
+            self.assertRaises(ValueError, client.delete_by_query, query)
+
+    def test_delete_by_query_w_bad_batch_size(self):
+        creds = object()
+        client = self._makeOne(credentials=creds)
+        query = client.query(kind='Kind')
+        self.assertRaises(ValueError, client.delete_by_query, query,
+                          batch_size=0)
+
     def test_allocate_ids_w_partial_key(self):
         from gcloud.datastore.test_batch import _Key
 
@@ -944,6 +1085,9 @@ class _MockConnection(object):
         self._commit = []
         self._alloc_cw = []
         self._alloc = []
+        self._query_cw = []
+        self._query = []
+        self._dataset_id = 'DATASET'
 
     def _add_lookup_result(self, results=(), missing=(), deferred=()):
         self._lookup.append((list(results), list(missing), list(deferred)))
@@ -954,11 +1098,31 @@ class _MockConnection(object):
         results, missing, deferred = triple
         return results, missing, deferred
 
-    def commit(self, dataset_id, mutation, transaction_id):
-        self._commit_cw.append((dataset_id, mutation, transaction_id))
+    def commit(self, dataset_id, request_pb, transaction_id):
+        self._commit_cw.append((dataset_id, request_pb.mutation,
+                                transaction_id))
         response, self._commit = self._commit[0], self._commit[1:]
         return response
 
+    def _add_query_result(self, key_ids, cursor=b'', more=False):
+        from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
+        MORE = datastore_pb.QueryResultBatch.NOT_FINISHED
+        NO_MORE = datastore_pb.QueryResultBatch.MORE_RESULTS_AFTER_LIMIT
+        entity_pbs = []
+        for key_id in key_ids:
+            entity_pb = datastore_pb.Entity()
+            entity_pb.key.partition_id.dataset_id = 's~' + self._dataset_id
+            entity_pb.key.path_element.add(kind='Kind', id=key_id)
+            entity_pbs.append(entity_pb)
+        self._query.append((entity_pbs, cursor, MORE if more else NO_MORE))
+
+    def run_query(self, dataset_id, request_pb, namespace=None,
+                  eventual=False, transaction_id=None):
+        self._query_cw.append((dataset_id, request_pb.query, namespace,
+                               eventual, transaction_id))
+        result, self._query = self._query[0], self._query[1:]
+        return result
+
     def allocate_ids(self, dataset_id, key_pbs):
         from gcloud.datastore.test_connection import _KeyProto
         self._alloc_cw.append((dataset_id, key_pbs))
@@ -29,11 +29,11 @@ class TestConnection(unittest2.TestCase):
             path_args += (id,)
         return Key(*path_args, dataset_id=dataset_id).to_protobuf()
 
-    def _make_query_pb(self, kind):
+    def _make_query_request_pb(self, kind):
         from gcloud.datastore.connection import datastore_pb
-        pb = datastore_pb.Query()
-        pb.kind.add().name = kind
-        return pb
+        request_pb = datastore_pb.RunQueryRequest()
+        request_pb.query.kind.add().name = kind
+        return request_pb
 
     def _makeOne(self, *args, **kw):
         return self._getTargetClass()(*args, **kw)
@@ -479,7 +479,7 @@ class TestConnection(unittest2.TestCase):
         DATASET_ID = 'DATASET'
         KIND = 'Nonesuch'
         CURSOR = b'\x00'
-        q_pb = self._make_query_pb(KIND)
+        rq_pb = self._make_query_request_pb(KIND)
         rsp_pb = datastore_pb.RunQueryResponse()
         rsp_pb.batch.end_cursor = CURSOR
         no_more = datastore_pb.QueryResultBatch.NO_MORE_RESULTS
@@ -495,7 +495,7 @@ class TestConnection(unittest2.TestCase):
             'runQuery',
         ])
         http = conn._http = Http({'status': '200'}, rsp_pb.SerializeToString())
-        pbs, end, more, skipped = conn.run_query(DATASET_ID, q_pb,
+        pbs, end, more, skipped = conn.run_query(DATASET_ID, rq_pb,
                                                  eventual=True)
         self.assertEqual(pbs, [])
         self.assertEqual(end, CURSOR)
@@ -507,7 +507,7 @@ class TestConnection(unittest2.TestCase):
         request = rq_class()
         request.ParseFromString(cw['body'])
         self.assertEqual(request.partition_id.namespace, '')
-        self.assertEqual(request.query, q_pb)
+        self.assertEqual(request.query, rq_pb.query)
         self.assertEqual(request.read_options.read_consistency,
                          datastore_pb.ReadOptions.EVENTUAL)
         self.assertEqual(request.read_options.transaction, b'')
@@ -519,7 +519,7 @@ class TestConnection(unittest2.TestCase):
         KIND = 'Nonesuch'
         CURSOR = b'\x00'
         TRANSACTION = b'TRANSACTION'
-        q_pb = self._make_query_pb(KIND)
+        rq_pb = self._make_query_request_pb(KIND)
         rsp_pb = datastore_pb.RunQueryResponse()
         rsp_pb.batch.end_cursor = CURSOR
         no_more = datastore_pb.QueryResultBatch.NO_MORE_RESULTS
@@ -536,7 +536,7 @@ class TestConnection(unittest2.TestCase):
         ])
         http = conn._http = Http({'status': '200'}, rsp_pb.SerializeToString())
         pbs, end, more, skipped = conn.run_query(
-            DATASET_ID, q_pb, transaction_id=TRANSACTION)
+            DATASET_ID, rq_pb, transaction_id=TRANSACTION)
         self.assertEqual(pbs, [])
         self.assertEqual(end, CURSOR)
         self.assertTrue(more)
@@ -547,7 +547,7 @@ class TestConnection(unittest2.TestCase):
         request = rq_class()
         request.ParseFromString(cw['body'])
         self.assertEqual(request.partition_id.namespace, '')
-        self.assertEqual(request.query, q_pb)
+        self.assertEqual(request.query, rq_pb.query)
         self.assertEqual(request.read_options.read_consistency,
                          datastore_pb.ReadOptions.DEFAULT)
         self.assertEqual(request.read_options.transaction, TRANSACTION)
@@ -559,14 +559,14 @@ class TestConnection(unittest2.TestCase):
         KIND = 'Nonesuch'
         CURSOR = b'\x00'
         TRANSACTION = b'TRANSACTION'
-        q_pb = self._make_query_pb(KIND)
+        rq_pb = self._make_query_request_pb(KIND)
         rsp_pb = datastore_pb.RunQueryResponse()
         rsp_pb.batch.end_cursor = CURSOR
         no_more = datastore_pb.QueryResultBatch.NO_MORE_RESULTS
         rsp_pb.batch.more_results = no_more
         rsp_pb.batch.entity_result_type = datastore_pb.EntityResult.FULL
         conn = self._makeOne()
-        self.assertRaises(ValueError, conn.run_query, DATASET_ID, q_pb,
+        self.assertRaises(ValueError, conn.run_query, DATASET_ID, rq_pb,
                           eventual=True, transaction_id=TRANSACTION)
 
     def test_run_query_wo_namespace_empty_result(self):
@@ -575,7 +575,7 @@ class TestConnection(unittest2.TestCase):
         DATASET_ID = 'DATASET'
         KIND = 'Nonesuch'
         CURSOR = b'\x00'
-        q_pb = self._make_query_pb(KIND)
+        rq_pb = self._make_query_request_pb(KIND)
         rsp_pb = datastore_pb.RunQueryResponse()
         rsp_pb.batch.end_cursor = CURSOR
         no_more = datastore_pb.QueryResultBatch.NO_MORE_RESULTS
@@ -591,7 +591,7 @@ class TestConnection(unittest2.TestCase):
             'runQuery',
         ])
         http = conn._http = Http({'status': '200'}, rsp_pb.SerializeToString())
-        pbs, end, more, skipped = conn.run_query(DATASET_ID, q_pb)
+        pbs, end, more, skipped = conn.run_query(DATASET_ID, rq_pb)
         self.assertEqual(pbs, [])
         self.assertEqual(end, CURSOR)
         self.assertTrue(more)
@@ -602,7 +602,7 @@ class TestConnection(unittest2.TestCase):
         request = rq_class()
         request.ParseFromString(cw['body'])
         self.assertEqual(request.partition_id.namespace, '')
-        self.assertEqual(request.query, q_pb)
+        self.assertEqual(request.query, rq_pb.query)
 
     def test_run_query_w_namespace_nonempty_result(self):
         from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
@@ -610,7 +610,7 @@ class TestConnection(unittest2.TestCase):
         DATASET_ID = 'DATASET'
         KIND = 'Kind'
         entity = datastore_pb.Entity()
-        q_pb = self._make_query_pb(KIND)
+        rq_pb = self._make_query_request_pb(KIND)
         rsp_pb = datastore_pb.RunQueryResponse()
         rsp_pb.batch.entity_result.add(entity=entity)
         rsp_pb.batch.entity_result_type = 1  # FULL
@@ -625,7 +625,7 @@ class TestConnection(unittest2.TestCase):
             'runQuery',
         ])
         http = conn._http = Http({'status': '200'}, rsp_pb.SerializeToString())
-        pbs = conn.run_query(DATASET_ID, q_pb, 'NS')[0]
+        pbs = conn.run_query(DATASET_ID, rq_pb, 'NS')[0]
         self.assertEqual(len(pbs), 1)
         cw = http._called_with
         self._verifyProtobufCall(cw, URI, conn)
@@ -633,7 +633,27 @@ class TestConnection(unittest2.TestCase):
         request = rq_class()
         request.ParseFromString(cw['body'])
         self.assertEqual(request.partition_id.namespace, 'NS')
-        self.assertEqual(request.query, q_pb)
+        self.assertEqual(request.query, rq_pb.query)
+
+    def test_run_query_sends_request_pb_uncopied(self):
+        from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
+
+        DATASET_ID = 'DATASET'
+        rq_pb = self._make_query_request_pb('Kind')
+        conn = self._makeOne()
+        sent = []
+
+        def _rpc(dataset_id, method, request_pb, response_pb_cls):
+            sent.append(request_pb)
+            return response_pb_cls()
+
+        conn._rpc = _rpc
+        conn.run_query(DATASET_ID, rq_pb, 'NS')
+        self.assertEqual(len(sent), 1)
+        self.assertTrue(sent[0] is rq_pb)
+        self.assertEqual(rq_pb.partition_id.namespace, 'NS')
+        self.assertEqual(rq_pb.read_options.read_consistency,
+                         datastore_pb.ReadOptions.DEFAULT)
 
     def test_begin_transaction_default_serialize(self):
         from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
@@ -691,7 +711,8 @@ class TestConnection(unittest2.TestCase):
         DATASET_ID = 'DATASET'
         key_pb = self._make_key_pb(DATASET_ID)
         rsp_pb = datastore_pb.CommitResponse()
-        mutation = datastore_pb.Mutation()
+        request_pb = datastore_pb.CommitRequest()
+        mutation = request_pb.mutation
         insert = mutation.upsert.add()
         insert.key.CopyFrom(key_pb)
         prop = insert.property.add()
@@ -707,7 +728,7 @@ class TestConnection(unittest2.TestCase):
             'commit',
         ])
         http = conn._http = Http({'status': '200'}, rsp_pb.SerializeToString())
-        result = conn.commit(DATASET_ID, mutation, None)
+        result = conn.commit(DATASET_ID, request_pb, None)
         self.assertEqual(result.index_updates, 0)
         self.assertEqual(list(result.insert_auto_id_key), [])
         cw = http._called_with
@@ -725,7 +746,8 @@ class TestConnection(unittest2.TestCase):
         DATASET_ID = 'DATASET'
         key_pb = self._make_key_pb(DATASET_ID)
         rsp_pb = datastore_pb.CommitResponse()
-        mutation = datastore_pb.Mutation()
+        request_pb = datastore_pb.CommitRequest()
+        mutation = request_pb.mutation
         insert = mutation.upsert.add()
         insert.key.CopyFrom(key_pb)
         prop = insert.property.add()
@@ -741,7 +763,7 @@ class TestConnection(unittest2.TestCase):
             'commit',
         ])
         http = conn._http = Http({'status': '200'}, rsp_pb.SerializeToString())
-        result = conn.commit(DATASET_ID, mutation, b'xact')
+        result = conn.commit(DATASET_ID, request_pb, b'xact')
         self.assertEqual(result.index_updates, 0)
         self.assertEqual(list(result.insert_auto_id_key), [])
         cw = http._called_with
@@ -753,6 +775,28 @@ class TestConnection(unittest2.TestCase):
         self.assertEqual(request.mutation, mutation)
         self.assertEqual(request.mode, rq_class.TRANSACTIONAL)
 
+    def test_commit_sends_request_pb_uncopied(self):
+        from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
+
+        DATASET_ID = 'DATASET'
+        request_pb = datastore_pb.CommitRequest()
+        request_pb.mutation.upsert.add().key.CopyFrom(
+            self._make_key_pb(DATASET_ID))
+        conn = self._makeOne()
+        sent = []
+
+        def _rpc(dataset_id, method, request_pb, response_pb_cls):
+            sent.append(request_pb)
+            return response_pb_cls()
+
+        conn._rpc = _rpc
+        conn.commit(DATASET_ID, request_pb, b'xact')
+        self.assertEqual(len(sent), 1)
+        self.assertTrue(sent[0] is request_pb)
+        self.assertEqual(request_pb.transaction, b'xact')
+        self.assertEqual(request_pb.mode,
+                         datastore_pb.CommitRequest.TRANSACTIONAL)
+
     def test_rollback_ok(self):
         from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
         DATASET_ID = 'DATASET'
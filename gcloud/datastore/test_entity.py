@@ -140,6 +140,74 @@ class TestEntity(unittest2.TestCase):
         self.assertFalse(entity1 == entity2)
         self.assertTrue(entity1 != entity2)
 
+    def test_is_dirty_never_stored(self):
+        entity = self._makeOne(key=_Key())
+        entity['foo'] = 'Foo'
+        self.assertTrue(entity.is_dirty)
+        self.assertEqual(entity.dirty_properties, set(['foo']))
+
+    def test_is_dirty_after_mark_clean(self):
+        entity = self._makeOne(key=_Key())
+        entity['foo'] = 'Foo'
+        entity._mark_clean()
+        self.assertFalse(entity.is_dirty)
+        self.assertEqual(entity.dirty_properties, set())
+
+    def test_dirty_properties_added_changed_removed(self):
+        entity = self._makeOne(key=_Key())
+        entity.update({'foo': 'Foo', 'bar': 'Bar', 'baz': 'Baz'})
+        entity._mark_clean()
+        entity['foo'] = 'Changed'
+        del entity['bar']
+        entity['qux'] = 'Qux'
+        entity['baz'] = 'Baz'  # same value:  not dirty
+        self.assertTrue(entity.is_dirty)
+        self.assertEqual(entity.dirty_properties, set(['foo', 'bar', 'qux']))
+
+    def test_dirty_properties_list_changed_in_place(self):
+        entity = self._makeOne(key=_Key())
+        entity['foo'] = [1, 2]
+        entity._mark_clean()
+        entity['foo'].append(3)
+        self.assertEqual(entity.dirty_properties, set(['foo']))
+
+    def test_dirty_properties_nested_entity_changed_in_place(self):
+        entity = self._makeOne(key=_Key())
+        nested = self._makeOne()
+        nested['bar'] = 'Bar'
+        nested._mark_clean()
+        entity['foo'] = nested
+        entity['baz'] = [nested]
+        entity._mark_clean()
+        self.assertFalse(entity.is_dirty)
+        nested['bar'] = 'Changed'
+        self.assertEqual(entity.dirty_properties, set(['foo', 'baz']))
+
+    def test_mark_clean_marks_nested_entities(self):
+        entity = self._makeOne(key=_Key())
+        nested = self._makeOne()
+        listed = self._makeOne()
+        entity['foo'] = nested
+        entity['bar'] = [listed, 1]
+        entity._mark_clean()
+        self.assertFalse(nested.is_dirty)
+        self.assertFalse(listed.is_dirty)
+        self.assertFalse(entity.is_dirty)
+
+    def test_is_dirty_w_changed_key(self):
+        entity = self._makeOne(key=_Key())
+        entity._mark_clean()
+        entity.key = _Key()
+        self.assertTrue(entity.is_dirty)
+        self.assertEqual(entity.dirty_properties, set())
+
+    def test_is_dirty_w_changed_exclude_from_indexes(self):
+        entity = self._makeOne(key=_Key())
+        entity['foo'] = 'Foo'
+        entity._mark_clean()
+        entity._exclude_from_indexes.add('foo')
+        self.assertTrue(entity.is_dirty)
+
     def test___repr___no_key_empty(self):
         entity = self._makeOne()
         self.assertEqual(repr(entity), '<Entity {}>')
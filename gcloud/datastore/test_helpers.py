@@ -70,6 +70,9 @@ class Test_entity_from_protobuf(unittest2.TestCase):
         self.assertEqual(key.kind, _KIND)
         self.assertEqual(key.id, _ID)
 
+        # Freshly-loaded entities are clean.
+        self.assertFalse(entity.is_dirty)
+
     def test_mismatched_value_indexed(self):
         from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
 
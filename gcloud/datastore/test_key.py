@@ -388,6 +388,28 @@ class TestKey(unittest2.TestCase):
         pb = key.to_protobuf()
         self.assertFalse(pb.path_element[0].HasField('kind'))
 
+    def test__set_protobuf(self):
+        from gcloud.datastore._datastore_v1_pb2 import Key as KeyPB
+        key = self._makeOne('PARENT', 'NAME', 'CHILD', 1234,
+                            namespace='NAMESPACE',
+                            dataset_id=self._DEFAULT_DATASET)
+        pb = KeyPB()
+        key._set_protobuf(pb)
+        self.assertEqual(pb, key.to_protobuf())
+
+    def test__set_protobuf_for_request(self):
+        from gcloud.datastore._datastore_v1_pb2 import Key as KeyPB
+        from gcloud.datastore.helpers import _prepare_key_for_request
+        key = self._makeOne('PARENT', 'NAME', 'CHILD', 1234,
+                            namespace='NAMESPACE',
+                            dataset_id=self._DEFAULT_DATASET)
+        pb = KeyPB()
+        key._set_protobuf(pb, for_request=True)
+        self.assertEqual(pb, _prepare_key_for_request(key.to_protobuf()))
+        self.assertEqual(pb.SerializeToString(),
+                         _prepare_key_for_request(
+                             key.to_protobuf()).SerializeToString())
+
     def test_is_partial_no_name_or_id(self):
         key = self._makeOne('KIND', dataset_id=self._DEFAULT_DATASET)
         self.assertTrue(key.is_partial)
@@ -298,6 +298,162 @@ class TestQuery(unittest2.TestCase):
         self.assertEqual(iterator._limit, None)
         self.assertEqual(iterator._offset, 0)
 
+    def test_fetch_by_keys_defaults(self):
+        from gcloud.datastore.query import _LOOKUP_BATCH_SIZE
+        from gcloud.datastore.query import _LOOKUP_MAX_WORKERS
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeOne(client)
+        iterator = query.fetch_by_keys()
+        self.assertTrue(iterator._query is query)
+        self.assertTrue(iterator._client is client)
+        self.assertEqual(iterator._key_iterator._query.projection,
+                         ['__key__'])
+        self.assertEqual(iterator._batch_size, _LOOKUP_BATCH_SIZE)
+        self.assertEqual(iterator._max_workers, _LOOKUP_MAX_WORKERS)
+        self.assertEqual(iterator._cache, None)
+
+    def test_fetch_by_keys_explicit(self):
+        connection = _Connection()
+        client = self._makeClient(connection)
+        other_client = self._makeClient(connection)
+        query = self._makeOne(client)
+        cache = {}
+        iterator = query.fetch_by_keys(limit=7, offset=8, client=other_client,
+                                       batch_size=10, max_workers=2,
+                                       cache=cache)
+        self.assertTrue(iterator._client is other_client)
+        self.assertEqual(iterator._key_iterator._limit, 7)
+        self.assertEqual(iterator._key_iterator._offset, 8)
+        self.assertEqual(iterator._batch_size, 10)
+        self.assertEqual(iterator._max_workers, 2)
+        self.assertTrue(iterator._cache is cache)
+
+    def _addScanResults(self, connection, values, more=False):
+        from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
+        MORE = datastore_pb.QueryResultBatch.NOT_FINISHED
+        NO_MORE = datastore_pb.QueryResultBatch.MORE_RESULTS_AFTER_LIMIT
+        entity_pbs = []
+        for value in values:
+            entity_pb = datastore_pb.Entity()
+            entity_pb.key.path_element.add(kind='KIND', id=1)
+            if value is not None:
+                prop = entity_pb.property.add()
+                prop.name = 'foo'
+                prop.value.integer_value = value
+            entity_pbs.append(entity_pb)
+        connection._results.append(
+            (entity_pbs, b'\xFF' if more else b'', MORE if more else NO_MORE))
+
+    def test_count(self):
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeOne(client, kind='KIND')
+        self._addScanResults(connection, [None] * 3, more=True)
+        self._addScanResults(connection, [None] * 2)
+        self.assertEqual(query.count(), 5)
+        self.assertEqual(len(connection._called_with), 2)
+        query_pb = connection._called_with[0]['request_pb'].query
+        self.assertEqual([proj.property.name for proj in query_pb.projection],
+                         ['__key__'])
+
+    def test_count_w_split_keys(self):
+        from gcloud.datastore.key import Key
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeOne(client, kind='KIND')
+        self._addScanResults(connection, [None] * 3)
+        self._addScanResults(connection, [None] * 2)
+        self._addScanResults(connection, [None] * 4)
+        split_keys = [Key('KIND', 100, dataset_id=self._DATASET),
+                      Key('KIND', 200, dataset_id=self._DATASET)]
+        self.assertEqual(query.count(split_keys=split_keys, max_workers=1), 9)
+        key_filters = []
+        for called_with in connection._called_with:
+            cfilter = called_with['request_pb'].query.filter.composite_filter
+            key_filters.append([
+                (f.property_filter.operator,
+                 f.property_filter.value.key_value.path_element[0].id)
+                for f in cfilter.filter])
+        GTE = query.OPERATORS['>=']
+        LT = query.OPERATORS['<']
+        self.assertEqual(key_filters,
+                         [[(LT, 100)], [(GTE, 100), (LT, 200)], [(GTE, 200)]])
+
+    def test_count_concurrent(self):
+        from gcloud.datastore.key import Key
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeOne(client, kind='KIND')
+        for _ in range(4):
+            self._addScanResults(connection, [None] * 3)
+        split_keys = [Key('KIND', i, dataset_id=self._DATASET)
+                      for i in (100, 200, 300)]
+        self.assertEqual(query.count(split_keys=split_keys, max_workers=4),
+                         12)
+
+    def test_count_w_transaction(self):
+        from gcloud.datastore.key import Key
+        connection = _Connection()
+        client = self._makeClient(connection)
+        client._transaction = _Transaction('TRANSACTION')
+        query = self._makeOne(client, kind='KIND')
+        self._addScanResults(connection, [None])
+        self._addScanResults(connection, [None])
+        split_keys = [Key('KIND', 100, dataset_id=self._DATASET)]
+        self.assertEqual(query.count(split_keys=split_keys), 2)
+        self.assertEqual([called_with['transaction_id']
+                          for called_with in connection._called_with],
+                         ['TRANSACTION', 'TRANSACTION'])
+
+    def test_count_w_projection(self):
+        client = self._makeClient()
+        query = self._makeOne(client, projection=['foo'])
+        self.assertRaises(ValueError, query.count)
+
+    def test_aggregate(self):
+        import operator
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeOne(client, kind='KIND')
+        self._addScanResults(connection, [1, 2], more=True)
+        self._addScanResults(connection, [3])
+        self.assertEqual(query.aggregate('foo', operator.add), 6)
+        query_pb = connection._called_with[0]['request_pb'].query
+        self.assertEqual([proj.property.name for proj in query_pb.projection],
+                         ['foo'])
+
+    def test_aggregate_w_initial_and_split_keys(self):
+        import operator
+        from gcloud.datastore.key import Key
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeOne(client, kind='KIND')
+        self._addScanResults(connection, [1, 2])
+        self._addScanResults(connection, [])
+        self._addScanResults(connection, [5])
+        split_keys = [Key('KIND', i, dataset_id=self._DATASET)
+                      for i in (100, 200)]
+        self.assertEqual(query.aggregate('foo', operator.add, 10,
+                                         split_keys=split_keys), 18)
+
+    def test_aggregate_max(self):
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeOne(client, kind='KIND')
+        self._addScanResults(connection, [4, 7, 2])
+        self.assertEqual(query.aggregate('foo', max), 7)
+
+    def test_aggregate_empty(self):
+        import operator
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeOne(client, kind='KIND')
+        self._addScanResults(connection, [])
+        self.assertEqual(query.aggregate('foo', operator.add), None)
+        self._addScanResults(connection, [])
+        self.assertEqual(query.aggregate('foo', operator.add, 0), 0)
+
     def test_fetch_w_explicit_client(self):
         connection = _Connection()
         client = self._makeClient(connection)
@@ -382,7 +538,7 @@ class TestIterator(unittest2.TestCase):
         qpb.offset = 0
         EXPECTED = {
             'dataset_id': self._DATASET,
-            'query_pb': qpb,
+            'request_pb': _make_request_pb(qpb),
             'namespace': self._NAMESPACE,
             'transaction_id': None,
         }
@@ -409,7 +565,7 @@ class TestIterator(unittest2.TestCase):
         qpb.offset = 29
         EXPECTED = {
             'dataset_id': self._DATASET,
-            'query_pb': qpb,
+            'request_pb': _make_request_pb(qpb),
             'namespace': self._NAMESPACE,
             'transaction_id': None,
         }
@@ -443,7 +599,7 @@ class TestIterator(unittest2.TestCase):
         qpb.end_cursor = b64decode(self._END)
         EXPECTED = {
             'dataset_id': self._DATASET,
-            'query_pb': qpb,
+            'request_pb': _make_request_pb(qpb),
             'namespace': self._NAMESPACE,
             'transaction_id': None,
         }
@@ -477,7 +633,7 @@ class TestIterator(unittest2.TestCase):
         qpb.offset = 0
         EXPECTED = {
             'dataset_id': self._DATASET,
-            'query_pb': qpb,
+            'request_pb': _make_request_pb(qpb),
             'namespace': self._NAMESPACE,
             'transaction_id': None,
         }
@@ -507,13 +663,13 @@ class TestIterator(unittest2.TestCase):
         qpb2.start_cursor = self._END
         EXPECTED1 = {
             'dataset_id': self._DATASET,
-            'query_pb': qpb1,
+            'request_pb': _make_request_pb(qpb1),
             'namespace': self._NAMESPACE,
             'transaction_id': None,
         }
         EXPECTED2 = {
             'dataset_id': self._DATASET,
-            'query_pb': qpb2,
+            'request_pb': _make_request_pb(qpb2),
             'namespace': self._NAMESPACE,
             'transaction_id': None,
         }
@@ -522,6 +678,133 @@ class TestIterator(unittest2.TestCase):
         self.assertEqual(connection._called_with[1], EXPECTED2)
 
 
+class TestLookupIterator(unittest2.TestCase):
+    _DATASET = 'DATASET'
+    _NAMESPACE = 'NAMESPACE'
+    _KIND = 'KIND'
+
+    def _getTargetClass(self):
+        from gcloud.datastore.query import LookupIterator
+        return LookupIterator
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _makeClient(self, connection=None):
+        if connection is None:
+            connection = _Connection()
+        return _Client(self._DATASET, connection)
+
+    def _addKeyResults(self, connection, ids, cursor=b'', more=False):
+        from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
+        MORE = datastore_pb.QueryResultBatch.NOT_FINISHED
+        NO_MORE = datastore_pb.QueryResultBatch.MORE_RESULTS_AFTER_LIMIT
+        entity_pbs = []
+        for _id in ids:
+            entity_pb = datastore_pb.Entity()
+            entity_pb.key.partition_id.dataset_id = self._DATASET
+            path_element = entity_pb.key.path_element.add()
+            path_element.kind = self._KIND
+            path_element.id = _id
+            entity_pbs.append(entity_pb)
+        connection._results.append(
+            (entity_pbs, cursor, MORE if more else NO_MORE))
+
+    def _makeQuery(self, client, **kw):
+        from gcloud.datastore.query import Query
+        return Query(client, self._KIND, self._DATASET, self._NAMESPACE,
+                     **kw)
+
+    def test_ctor_w_projection(self):
+        client = self._makeClient()
+        query = self._makeQuery(client, projection=['foo'])
+        self.assertRaises(ValueError, self._makeOne, query, client)
+
+    def test_ctor_w_group_by(self):
+        client = self._makeClient()
+        query = self._makeQuery(client, group_by=['foo'])
+        self.assertRaises(ValueError, self._makeOne, query, client)
+
+    def test_ctor_w_bad_batch_size(self):
+        client = self._makeClient()
+        query = self._makeQuery(client)
+        self.assertRaises(ValueError, self._makeOne, query, client,
+                          batch_size=0)
+
+    def test___iter___serial(self):
+        from gcloud.datastore.query import _pb_from_query
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeQuery(client, filters=[('foo', '=', u'Foo')])
+        self._addKeyResults(connection, [1, 2, 3], cursor=b'\xFF',
+                            more=True)
+        self._addKeyResults(connection, [4])
+        iterator = self._makeOne(query, client, batch_size=2, max_workers=1)
+        entities = list(iterator)
+
+        self.assertEqual([entity.key.id for entity in entities],
+                         [1, 2, 3, 4])
+        self.assertEqual([entity['foo'] for entity in entities],
+                         [u'Foo'] * 4)
+        key_query_pb = _pb_from_query(query)
+        key_query_pb.projection.add().property.name = '__key__'
+        key_query_pb.offset = 0
+        self.assertEqual(connection._called_with[0]['request_pb'].query,
+                         key_query_pb)
+        self.assertEqual([len(key_pbs) for key_pbs, _ in connection._lookups],
+                         [2, 2])
+        self.assertEqual([transaction_id
+                          for _, transaction_id in connection._lookups],
+                         [None, None])
+
+    def test___iter___concurrent(self):
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeQuery(client)
+        self._addKeyResults(connection, list(range(1, 51)))
+        iterator = self._makeOne(query, client, batch_size=3, max_workers=4)
+        entities = list(iterator)
+
+        self.assertEqual(sorted(entity.key.id for entity in entities),
+                         list(range(1, 51)))
+        self.assertEqual(len(connection._lookups), 17)
+
+    def test___iter___w_cache(self):
+        from gcloud.datastore.entity import Entity
+        from gcloud.datastore.key import Key
+        connection = _Connection()
+        client = self._makeClient(connection)
+        query = self._makeQuery(client)
+        self._addKeyResults(connection, [1, 2])
+        cached_key = Key(self._KIND, 1, dataset_id=self._DATASET)
+        cached = Entity(key=cached_key)
+        cache = {cached_key: cached}
+        iterator = self._makeOne(query, client, max_workers=1, cache=cache)
+        entities = list(iterator)
+
+        self.assertTrue(entities[0] is cached)
+        self.assertEqual(entities[1].key.id, 2)
+        self.assertEqual(len(connection._lookups), 1)
+        key_pbs, _ = connection._lookups[0]
+        self.assertEqual([key_pb.path_element[0].id for key_pb in key_pbs],
+                         [2])
+        self.assertTrue(cache[entities[1].key] is entities[1])
+
+    def test___iter___w_transaction(self):
+        connection = _Connection()
+        client = self._makeClient(connection)
+        client._transaction = _Transaction('TRANSACTION')
+        query = self._makeQuery(client)
+        self._addKeyResults(connection, [1])
+        iterator = self._makeOne(query, client, max_workers=2)
+        entities = list(iterator)
+
+        self.assertEqual(len(entities), 1)
+        self.assertEqual(connection._lookups[0][1], 'TRANSACTION')
+        self.assertEqual(connection._called_with[0]['transaction_id'],
+                         'TRANSACTION')
+
+
 class Test__pb_from_query(unittest2.TestCase):
 
     def _callFUT(self, query):
@@ -638,6 +921,13 @@ class _Query(object):
         self.group_by = group_by
 
 
+def _make_request_pb(query_pb):
+    from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
+    request_pb = datastore_pb.RunQueryRequest()
+    request_pb.query.CopyFrom(query_pb)
+    return request_pb
+
+
 class _Connection(object):
 
     _called_with = None
@@ -647,12 +937,27 @@ class _Connection(object):
     def __init__(self):
         self._results = []
         self._called_with = []
+        self._lookups = []
 
     def run_query(self, **kw):
         self._called_with.append(kw)
         result, self._results = self._results[0], self._results[1:]
         return result
 
+    def lookup(self, dataset_id, key_pbs, eventual=False,
+               transaction_id=None):
+        from gcloud.datastore import _datastore_v1_pb2 as datastore_pb
+        self._lookups.append((key_pbs, transaction_id))
+        found = []
+        for key_pb in key_pbs:
+            entity_pb = datastore_pb.Entity()
+            entity_pb.key.CopyFrom(key_pb)
+            prop = entity_pb.property.add()
+            prop.name = 'foo'
+            prop.value.string_value = u'Foo'
+            found.append(entity_pb)
+        return found, [], []
+
 
 class _Client(object):
 
@@ -661,6 +966,14 @@ class _Client(object):
         self.connection = connection
         self.namespace = namespace
 
+    _transaction = None
+
     @property
     def current_transaction(self):
-        pass
+        return self._transaction
+
+
+class _Transaction(object):
+
+    def __init__(self, id):
+        self.id = id
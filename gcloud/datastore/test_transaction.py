@@ -102,10 +102,10 @@ class TestTransaction(unittest2.TestCase):
         connection = _Connection(234)
         client = _Client(_DATASET, connection)
         xact = self._makeOne(client)
-        xact._mutation = mutation = object()
+        xact._commit_request = request_pb = object()
         xact.begin()
         xact.commit()
-        self.assertEqual(connection._committed, (_DATASET, mutation, 234))
+        self.assertEqual(connection._committed, (_DATASET, request_pb, 234))
         self.assertEqual(xact.id, None)
 
     def test_commit_w_auto_ids(self):
@@ -119,10 +119,10 @@ class TestTransaction(unittest2.TestCase):
         xact = self._makeOne(client)
         entity = _Entity()
         xact.add_auto_id_entity(entity)
-        xact._mutation = mutation = object()
+        xact._commit_request = request_pb = object()
         xact.begin()
         xact.commit()
-        self.assertEqual(connection._committed, (_DATASET, mutation, 234))
+        self.assertEqual(connection._committed, (_DATASET, request_pb, 234))
         self.assertEqual(xact.id, None)
         self.assertEqual(entity.key.path, [{'kind': _KIND, 'id': _ID}])
 
@@ -131,11 +131,11 @@ class TestTransaction(unittest2.TestCase):
         connection = _Connection(234)
         client = _Client(_DATASET, connection)
         xact = self._makeOne(client)
-        xact._mutation = mutation = object()
+        xact._commit_request = request_pb = object()
         with xact:
             self.assertEqual(xact.id, 234)
             self.assertEqual(connection._begun, _DATASET)
-        self.assertEqual(connection._committed, (_DATASET, mutation, 234))
+        self.assertEqual(connection._committed, (_DATASET, request_pb, 234))
         self.assertEqual(xact.id, None)
 
     def test_context_manager_w_raise(self):
@@ -147,7 +147,7 @@ class TestTransaction(unittest2.TestCase):
         connection = _Connection(234)
         client = _Client(_DATASET, connection)
         xact = self._makeOne(client)
-        xact._mutation = object()
+        xact._commit_request = object()
         try:
             with xact:
                 self.assertEqual(xact.id, 234)
@@ -186,8 +186,8 @@ class _Connection(object):
     def rollback(self, dataset_id, transaction_id):
         self._rolled_back = dataset_id, transaction_id
 
-    def commit(self, dataset_id, mutation, transaction_id):
-        self._committed = (dataset_id, mutation, transaction_id)
+    def commit(self, dataset_id, request_pb, transaction_id):
+        self._committed = (dataset_id, request_pb, transaction_id)
         return self._commit_result
 
 
@@ -181,8 +181,11 @@ def make_exception(response, content, error_info=None, use_json=True):
         content = content.decode('utf-8')
 
     if isinstance(content, six.string_types):
-        if use_json:
+        if use_json and content:
             payload = json.loads(content)
+        elif use_json:
+            # E.g. '304 Not Modified', which has no body.
+            payload = {}
         else:
             payload = {'error': {'message': content}}
     else:
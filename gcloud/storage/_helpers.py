@@ -19,6 +19,16 @@ These are *not* part of the API.
 
 from Crypto.Hash import MD5
 import base64
+import struct
+
+try:
+    import google_crc32c
+except ImportError:
+    google_crc32c = None
+
+
+_CRC32C_POLYNOMIAL = 0x82F63B78
+"""Reversed Castagnoli polynomial used by the CRC32C checksum."""
 
 
 class _PropertyMixin(object):
@@ -171,3 +181,338 @@ def _base64_md5hash(buffer_object):
     _write_buffer_to_hash(buffer_object, hash_obj)
     digest_bytes = hash_obj.digest()
     return base64.b64encode(digest_bytes)
+
+
+def _make_crc32c_table():
+    """Build the byte-wise lookup table for :func:`_crc32c`.
+
+    :rtype: list of integers
+    :returns: The CRC32C of each single byte value.
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ _CRC32C_POLYNOMIAL
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = _make_crc32c_table()
+
+
+def _crc32c(data, crc=0):
+    """Compute (or continue computing) the CRC32C checksum of some bytes.
+
+    Uses the ``google_crc32c`` native extension when it is installed, and a
+    table-driven pure Python implementation otherwise.
+
+    :type data: bytes
+    :param data: The bytes to be checksummed.
+
+    :type crc: integer
+    :param crc: The checksum of any preceding bytes, to continue a running
+                computation.  Defaults to 0.
+
+    :rtype: integer
+    :returns: The (unsigned, 32-bit) checksum.
+    """
+    if google_crc32c is not None:
+        return google_crc32c.extend(crc, data)
+    table = _CRC32C_TABLE
+    crc ^= 0xFFFFFFFF
+    for byte in bytearray(data):
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _gf2_matrix_times(matrix, vector):
+    """Multiply a 32x32 GF(2) matrix by a 32-bit vector."""
+    result = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return result
+
+
+def _gf2_matrix_square(matrix):
+    """Square a 32x32 GF(2) matrix."""
+    return [_gf2_matrix_times(matrix, row) for row in matrix]
+
+
+def _crc32c_combine(crc1, crc2, length2):
+    """Combine the CRC32C checksums of two adjacent byte strings.
+
+    Uses the same technique as zlib's ``crc32_combine``, so the checksum of
+    a concatenation can be found without re-reading either part.
+
+    :type crc1: integer
+    :param crc1: The checksum of the first byte string.
+
+    :type crc2: integer
+    :param crc2: The checksum of the second byte string.
+
+    :type length2: integer
+    :param length2: The length of the second byte string.
+
+    :rtype: integer
+    :returns: The checksum of the first byte string followed by the second.
+    """
+    if length2 <= 0:
+        return crc1
+
+    # Operator for one zero bit, then for two and four zero bits.
+    odd = [_CRC32C_POLYNOMIAL] + [1 << bit for bit in range(31)]
+    even = _gf2_matrix_square(odd)
+    odd = _gf2_matrix_square(even)
+
+    # Apply ``length2`` zero bytes to ``crc1``, squaring the operator for
+    # each bit of ``length2``.
+    while True:
+        even = _gf2_matrix_square(odd)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(even, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+        odd = _gf2_matrix_square(even)
+        if length2 & 1:
+            crc1 = _gf2_matrix_times(odd, crc1)
+        length2 >>= 1
+        if not length2:
+            break
+
+    return crc1 ^ crc2
+
+
+def _base64_crc32c(crc):
+    """Encode a CRC32C checksum the way Cloud Storage reports it.
+
+    :type crc: integer
+    :param crc: The (unsigned, 32-bit) checksum.
+
+    :rtype: string
+    :returns: The base64 encoding of the big-endian checksum bytes.
+    """
+    return base64.b64encode(struct.pack('>I', crc)).decode('ascii')
+
+
+class _Checksums(object):
+    """Running MD5 and / or CRC32C checksums of a stream of bytes.
+
+    :type md5: boolean
+    :param md5: Whether to compute the MD5 hash.
+
+    :type crc32c: boolean
+    :param crc32c: Whether to compute the CRC32C checksum.
+    """
+
+    def __init__(self, md5=True, crc32c=True):
+        self._md5 = None
+        self._crc32c = None
+        if md5:
+            self._md5 = MD5.new()
+        if crc32c:
+            self._crc32c = 0
+
+    @classmethod
+    def for_upload(cls):
+        """Checksums worth computing while uploading.
+
+        MD5 is always computed;  CRC32C only if it is natively accelerated.
+
+        :rtype: :class:`_Checksums`
+        :returns: The new checksums.
+        """
+        return cls(md5=True, crc32c=google_crc32c is not None)
+
+    @classmethod
+    def for_download(cls, md5_hash, crc32c):
+        """Checksums worth computing while downloading.
+
+        MD5 is computed if the object has an MD5 hash;  CRC32C if the object
+        has one and either it is natively accelerated or there is no MD5
+        (e.g. for composite objects).
+
+        :type md5_hash: string or ``NoneType``
+        :param md5_hash: The object's MD5 hash, if known.
+
+        :type crc32c: string or ``NoneType``
+        :param crc32c: The object's CRC32C checksum, if known.
+
+        :rtype: :class:`_Checksums`
+        :returns: The new checksums.
+        """
+        use_crc32c = crc32c is not None and (
+            google_crc32c is not None or md5_hash is None)
+        return cls(md5=md5_hash is not None, crc32c=use_crc32c)
+
+    def update(self, data):
+        """Add bytes to the checksums.
+
+        :type data: bytes-like
+        :param data: The next bytes of the stream.
+        """
+        if self._md5 is not None:
+            self._md5.update(data)
+        if self._crc32c is not None:
+            self._crc32c = _crc32c(data, self._crc32c)
+
+    @property
+    def md5_hash(self):
+        """The base64-encoded MD5 hash, if computed.
+
+        :rtype: string or ``NoneType``
+        :returns: The hash, encoded as Cloud Storage reports it.
+        """
+        if self._md5 is not None:
+            return base64.b64encode(self._md5.digest()).decode('ascii')
+
+    @property
+    def crc32c(self):
+        """The base64-encoded CRC32C checksum, if computed.
+
+        :rtype: string or ``NoneType``
+        :returns: The checksum, encoded as Cloud Storage reports it.
+        """
+        if self._crc32c is not None:
+            return _base64_crc32c(self._crc32c)
+
+    def verify(self, md5_hash, crc32c, name):
+        """Compare the checksums with those reported by Cloud Storage.
+
+        Checksums not computed here, or not reported, are skipped.
+
+        :type md5_hash: string or ``NoneType``
+        :param md5_hash: The object's reported MD5 hash.
+
+        :type crc32c: string or ``NoneType``
+        :param crc32c: The object's reported CRC32C checksum.
+
+        :type name: string
+        :param name: The object's name, for the error message.
+
+        :raises: :class:`ValueError` if a checksum does not match.
+        """
+        for label, expected, actual in (('MD5', md5_hash, self.md5_hash),
+                                        ('CRC32C', crc32c, self.crc32c)):
+            if expected is not None and actual is not None and (
+                    expected != actual):
+                raise ValueError('%s mismatch for %r: expected %s, got %s.' % (
+                    label, name, expected, actual))
+
+
+class _HashingReader(object):
+    """Wrap a readable stream, checksumming the bytes read from it.
+
+    Seekable streams may be rewound (e.g. by apitools, to retry part of a
+    resumable upload):  bytes are only checksummed the first time they are
+    read.  If a read starts beyond the bytes seen so far, the checksums are
+    abandoned (see :attr:`checksums`).  Bytes read from other streams (e.g.
+    pipes) are checksummed in order.
+
+    :type stream: file
+    :param stream: A file-like object open for reading.
+
+    :type checksums: :class:`_Checksums`
+    :param checksums: The checksums to update.
+    """
+
+    def __init__(self, stream, checksums):
+        self._stream = stream
+        self._checksums = checksums
+        self._seekable = _is_seekable(stream)
+        if self._seekable:
+            self._seen = stream.tell()
+        else:
+            self._seen = 0
+
+    @property
+    def checksums(self):
+        """The checksums, or ``None`` if some bytes were skipped.
+
+        :rtype: :class:`_Checksums` or ``NoneType``
+        :returns: The checksums of the bytes read.
+        """
+        return self._checksums
+
+    def read(self, size=-1):
+        """Read from the stream, checksumming new bytes.
+
+        :type size: integer
+        :param size: The maximum number of bytes to read (all, if negative).
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        if self._seekable:
+            start = self._stream.tell()
+        else:
+            start = self._seen
+        data = self._stream.read(size)
+        end = start + len(data)
+        if self._checksums is not None and end > self._seen:
+            if start > self._seen:
+                self._checksums = None
+            else:
+                self._checksums.update(data[self._seen - start:])
+                self._seen = end
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _is_seekable(stream):
+    """Tell whether a stream's position can be queried and changed.
+
+    :type stream: file
+    :param stream: A file-like object.
+
+    :rtype: boolean
+    :returns: True if the stream is seekable.
+    """
+    seekable = getattr(stream, 'seekable', None)
+    if seekable is not None:
+        return seekable()
+    try:
+        stream.tell()
+    except (AttributeError, IOError, OSError):
+        return False
+    return True
+
+
+class _HashingWriter(object):
+    """Wrap a writable stream, checksumming the bytes written to it.
+
+    :type stream: file
+    :param stream: A file-like object open for writing.
+
+    :type checksums: :class:`_Checksums`
+    :param checksums: The checksums to update.
+    """
+
+    def __init__(self, stream, checksums):
+        self._stream = stream
+        self.checksums = checksums
+
+    def write(self, data):
+        """Write to the stream, checksumming the bytes.
+
+        :type data: bytes
+        :param data: The bytes to write.
+
+        :rtype: integer or ``NoneType``
+        :returns: Whatever the wrapped stream's ``write`` returns.
+        """
+        self.checksums.update(data)
+        return self._stream.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
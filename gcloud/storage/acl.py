@@ -76,8 +76,28 @@ To get the list of ``entity`` and ``role`` for each unique pair, the
 
 This list of tuples can be used as the ``entity`` and ``role`` fields
 when sending metadata for ACLs to the API.
+
+Many ACLs (e.g. those of every blob in a bucket) can be saved, or cleared,
+with batched requests, several of which are sent at once::
+
+  >>> from gcloud.storage.acl import save_acls
+  >>> acls = []
+  >>> for blob in bucket.list_blobs():
+  ...     blob.acl.all().grant_read()
+  ...     acls.append(blob.acl)
+  >>> save_acls(acls)
 """
 
+import itertools
+
+from gcloud._helpers import _imap_unordered
+from gcloud.exceptions import make_exception
+from gcloud.storage.batch import Batch
+
+
+_BULK_MAX_WORKERS = 4
+"""Default number of concurrent batch requests saving ACLs in bulk."""
+
 
 class _ACLEntity(object):
     """Class representing a set of roles for an entity.
@@ -381,8 +401,18 @@ class ACL(object):
         self.entities.clear()
 
         found = client.connection.api_request(method='GET', path=path)
+        self._load_entries(found.get('items', ()))
+
+    def _load_entries(self, entries):
+        """Replace this ACL's entities with those of a resource.
+
+        :type entries: iterable of dict
+        :param entries: The ``entity`` / ``role`` mappings returned by the
+                        API.
+        """
+        self.entities.clear()
         self.loaded = True
-        for entry in found.get('items', ()):
+        for entry in entries:
             self.add_entity(self.entity_from_dict(entry))
 
     def save(self, acl=None, client=None):
@@ -410,10 +440,7 @@ class ACL(object):
                 path=path,
                 data={self._URL_PATH_ELEM: list(acl)},
                 query_params={'projection': 'full'})
-            self.entities.clear()
-            for entry in result.get(self._URL_PATH_ELEM, ()):
-                self.add_entity(self.entity_from_dict(entry))
-            self.loaded = True
+            self._load_entries(result.get(self._URL_PATH_ELEM, ()))
 
     def clear(self, client=None):
         """Remove all ACL entries.
@@ -488,3 +515,96 @@ class ObjectACL(ACL):
     def save_path(self):
         """Compute the path for PATCH API requests for this ACL."""
         return self.blob.path
+
+
+def save_acls(acls, client=None, on_error=None,
+              max_workers=_BULK_MAX_WORKERS):
+    """Save many ACLs, with batched requests.
+
+    As with :meth:`ACL.save`, ACLs which have not been loaded (or
+    modified) are skipped.  ``acls`` is consumed lazily, in batches of
+    ``Batch._MAX_BATCH_SIZE``, up to ``max_workers`` of which are sent
+    concurrently.
+
+    :type acls: iterable of :class:`ACL`
+    :param acls: The ACLs to save.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: Optional. The client to use.  If not passed, falls back
+                   to the ``client`` of each batch's first ACL.
+
+    :type on_error: a callable taking (acl), or ``NoneType``
+    :param on_error: If not ``None``, called for each ACL failing to save;
+                     otherwise, the first failure is raised.
+
+    :type max_workers: integer
+    :param max_workers: Maximum number of concurrent batch requests.
+    """
+    _save_in_batches(((acl, acl) for acl in acls if acl.loaded),
+                     client, on_error, max_workers)
+
+
+def clear_acls(acls, client=None, on_error=None,
+               max_workers=_BULK_MAX_WORKERS):
+    """Remove all (non-default) entries from many ACLs, with batched requests.
+
+    See :meth:`ACL.clear` and :func:`save_acls`.
+
+    :type acls: iterable of :class:`ACL`
+    :param acls: The ACLs to clear.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: Optional. The client to use.  If not passed, falls back
+                   to the ``client`` of each batch's first ACL.
+
+    :type on_error: a callable taking (acl), or ``NoneType``
+    :param on_error: If not ``None``, called for each ACL failing to clear;
+                     otherwise, the first failure is raised.
+
+    :type max_workers: integer
+    :param max_workers: Maximum number of concurrent batch requests.
+    """
+    _save_in_batches(((acl, ()) for acl in acls),
+                     client, on_error, max_workers)
+
+
+def _save_in_batches(pairs, client, on_error, max_workers):
+    """Save entries into ACLs, sending a batch request per chunk.
+
+    :type pairs: iterable of (:class:`ACL`, iterable of dict)
+    :param pairs: Each ACL, with the entries to save into it.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: The client to use, if not each chunk's first ACL's.
+
+    :type on_error: a callable taking (acl), or ``NoneType``
+    :param on_error: Called for each failure, if not ``None``.
+
+    :type max_workers: integer
+    :param max_workers: Maximum number of concurrent batch requests.
+
+    :raises: the first failure, if ``on_error`` is ``None``.
+    """
+    def _save_chunk(chunk):
+        """Send one chunk's PATCH requests as a batch."""
+        batch = Batch(client or chunk[0][0].client)
+        for acl, entries in chunk:
+            batch.api_request(method='PATCH', path=acl.save_path,
+                              data={acl._URL_PATH_ELEM: list(entries)},
+                              query_params={'projection': 'full'},
+                              _target_object=None)
+        return chunk, batch._submit()
+
+    chunks = iter(lambda: list(itertools.islice(pairs, Batch._MAX_BATCH_SIZE)),
+                  [])
+    for chunk, responses in _imap_unordered(_save_chunk, chunks, max_workers):
+        if len(responses) != len(chunk):
+            raise ValueError('Expected a response for every request.')
+        for (acl, _), (headers, payload) in zip(chunk, responses):
+            if 200 <= int(headers.status) < 300:
+                acl._load_entries(payload.get(acl._URL_PATH_ELEM, ()))
+                continue
+            error = make_exception(headers, payload or {})
+            if on_error is None:
+                raise error
+            on_error(acl)
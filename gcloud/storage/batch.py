@@ -15,14 +15,12 @@
 
 See: https://cloud.google.com/storage/docs/json_api/v1/how-tos/batch
 """
-from email.encoders import encode_noop
-from email.generator import Generator
-from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.parser import Parser
 import httplib2
-import io
 import json
+import re
+import sys
+import threading
+import uuid
 
 import six
 
@@ -30,43 +28,15 @@ from gcloud.exceptions import make_exception
 from gcloud.storage.connection import Connection
 
 
-class MIMEApplicationHTTP(MIMEApplication):
-    """MIME type for ``application/http``.
+_PART_HEADERS = (b'Content-Type: application/http\r\n'
+                 b'MIME-Version: 1.0\r\n\r\n')
+"""Headers of each part of a batch request."""
 
-    Constructs payload from headers and body
+_BLANK_LINE_RE = re.compile(b'\r?\n\r?\n')
+"""Separator between headers and body."""
 
-    :type method: string
-    :param method: HTTP method
-
-    :type uri: string
-    :param uri: URI for HTTP request
-
-    :type headers:  dict
-    :param headers: HTTP headers
-
-    :type body: text or None
-    :param body: HTTP payload
-    """
-    def __init__(self, method, uri, headers, body):
-        if isinstance(body, dict):
-            body = json.dumps(body)
-            headers['Content-Type'] = 'application/json'
-            headers['Content-Length'] = len(body)
-        if body is None:
-            body = ''
-        lines = ['%s %s HTTP/1.1' % (method, uri)]
-        lines.extend(['%s: %s' % (key, value)
-                      for key, value in sorted(headers.items())])
-        lines.append('')
-        lines.append(body)
-        payload = '\r\n'.join(lines)
-        if six.PY2:  # pragma: NO COVER  Python2
-            # Sigh.  email.message.Message is an old-style class, so we
-            #        cannot use 'super()'.
-            MIMEApplication.__init__(self, payload, 'http', encode_noop)
-        else:                        # pragma: NO COVER  Python3
-            super_init = super(MIMEApplicationHTTP, self).__init__
-            super_init(payload, 'http', encode_noop)
+_FLUSH_MAX_WORKERS = 4
+"""Default number of full batches submitted concurrently."""
 
 
 class NoContent(object):
@@ -125,16 +95,35 @@ class _FutureDict(object):
 class Batch(Connection):
     """Proxy an underlying connection, batching up change operations.
 
+    By default, deferring more than ``_MAX_BATCH_SIZE`` requests raises
+    :class:`ValueError`.  With ``auto_flush``, a full batch is instead
+    submitted in the background as its own multipart request, while
+    further requests are deferred into the next one;  :meth:`finish` waits
+    for those requests and resolves the futures of all of them.
+
     :type client: :class:`gcloud.storage.client.Client`
     :param client: The client to use for making connections.
+
+    :type auto_flush: boolean
+    :param auto_flush: If True, roll over into a new multipart request
+                       whenever the current one is full.
+
+    :type max_workers: integer
+    :param max_workers: With ``auto_flush``, the maximum number of full
+                        batches being submitted concurrently;  deferring
+                        another request blocks until one completes.
     """
     _MAX_BATCH_SIZE = 1000
 
-    def __init__(self, client):
+    def __init__(self, client, auto_flush=False,
+                 max_workers=_FLUSH_MAX_WORKERS):
         super(Batch, self).__init__()
         self._client = client
         self._requests = []
         self._target_objects = []
+        self._auto_flush = auto_flush
+        self._flush_slots = threading.BoundedSemaphore(max(max_workers, 1))
+        self._flushes = []
 
     def _do_request(self, method, url, headers, data, target_object):
         """Override Connection:  defer actual HTTP request.
@@ -164,8 +153,10 @@ class Batch(Connection):
         :returns: The HTTP response object and the content of the response.
         """
         if len(self._requests) >= self._MAX_BATCH_SIZE:
-            raise ValueError("Too many deferred requests (max %d)" %
-                             self._MAX_BATCH_SIZE)
+            if not self._auto_flush:
+                raise ValueError("Too many deferred requests (max %d)" %
+                                 self._MAX_BATCH_SIZE)
+            self._flush_in_background()
         self._requests.append((method, url, headers, data))
         result = _FutureDict()
         self._target_objects.append(target_object)
@@ -176,31 +167,19 @@ class Batch(Connection):
     def _prepare_batch_request(self):
         """Prepares headers and body for a batch request.
 
-        :rtype: tuple (dict, string)
+        :rtype: tuple (dict, bytes)
         :returns: The pair of headers and body of the batch request to be sent.
         :raises: :class:`ValueError` if no requests have been deferred.
         """
         if len(self._requests) == 0:
             raise ValueError("No deferred requests")
 
-        multi = MIMEMultipart()
-
-        for method, uri, headers, body in self._requests:
-            subrequest = MIMEApplicationHTTP(method, uri, headers, body)
-            multi.attach(subrequest)
-
-        # The `email` package expects to deal with "native" strings
-        if six.PY3:             # pragma: NO COVER  Python3
-            buf = io.StringIO()
-        else:                   # pragma: NO COVER  Python2
-            buf = io.BytesIO()
-        generator = Generator(buf, False, 0)
-        generator.flatten(multi)
-        payload = buf.getvalue()
-
-        # Strip off redundant header text
-        _, body = payload.split('\n\n', 1)
-        return dict(multi._headers), body
+        boundary = '===============%s==' % (uuid.uuid4().hex,)
+        headers = {
+            'Content-Type': 'multipart/mixed; boundary="%s"' % (boundary,),
+            'MIME-Version': '1.0',
+        }
+        return headers, _encode_batch_body(self._requests, boundary)
 
     def _finish_futures(self, responses):
         """Apply all the batch responses to the futures created.
@@ -230,12 +209,72 @@ class Batch(Connection):
         if exception_args is not None:
             raise make_exception(*exception_args)
 
+    def _flush_in_background(self):
+        """Move the deferred requests into a batch submitted by a thread.
+
+        Blocks while ``max_workers`` earlier batches are still in flight.
+        """
+        self._flush_slots.acquire()
+        part = Batch(self._client)
+        part._requests, self._requests = self._requests, []
+        part._target_objects, self._target_objects = self._target_objects, []
+        result = {}
+
+        def _run():
+            """Submit the full batch, recording its outcome."""
+            try:
+                result['responses'] = part._submit()
+            except Exception:  # pylint: disable=broad-except
+                result['exc_info'] = sys.exc_info()
+            finally:
+                self._flush_slots.release()
+
+        thread = threading.Thread(target=_run)
+        thread.daemon = True
+        thread.start()
+        self._flushes.append((part, thread, result))
+
     def finish(self):
         """Submit a single `multipart/mixed` request w/ deferred requests.
 
+        With ``auto_flush``, first waits for any batches submitted in the
+        background, then submits the remaining requests.
+
         :rtype: list of tuples
         :returns: one ``(headers, payload)`` tuple per deferred request.
         """
+        if not self._flushes:
+            responses = self._submit()
+            self._finish_futures(responses)
+            return responses
+
+        flushes, self._flushes = self._flushes, []
+        responses = []
+        target_objects = []
+        exc_info = None
+        for part, thread, result in flushes:
+            thread.join()
+            exc_info = exc_info or result.get('exc_info')
+            responses.extend(result.get('responses', ()))
+            target_objects.extend(part._target_objects)
+        if exc_info is not None:
+            six.reraise(*exc_info)
+        # Batches are only handed off when a request overflows them, so
+        # at least that request remains.
+        responses.extend(self._submit())
+        self._target_objects = target_objects + self._target_objects
+        self._finish_futures(responses)
+        return responses
+
+    def _submit(self):
+        """Submit the deferred requests, without resolving their futures.
+
+        Lets callers inspect the status of each part, rather than having
+        the first failure raised.
+
+        :rtype: list of tuples
+        :returns: one ``(headers, payload)`` tuple per response part.
+        """
         headers, body = self._prepare_batch_request()
 
         url = '%s/batch' % self.API_BASE_URL
@@ -245,9 +284,7 @@ class Batch(Connection):
         # current batch.
         response, content = self._client._connection._make_request(
             'POST', url, data=body, headers=headers)
-        responses = list(_unpack_batch_response(response, content))
-        self._finish_futures(responses)
-        return responses
+        return list(_unpack_batch_response(response, content))
 
     def current(self):
         """Return the topmost batch, or None."""
@@ -265,37 +302,120 @@ class Batch(Connection):
             self._client._pop_batch()
 
 
-def _generate_faux_mime_message(parser, response, content):
-    """Convert response, content -> (multipart) email.message.
+def _encode_batch_body(requests, boundary):
+    """Encode deferred requests as a ``multipart/mixed`` body.
 
-    Helper for _unpack_batch_response.
+    Each request becomes an ``application/http`` part holding the request
+    line, headers and body.  Writes bytes directly, rather than building
+    and flattening :mod:`email` message objects.
+
+    :type requests: list of tuples
+    :param requests: ``(method, uri, headers, body)`` for each request;
+                     ``body`` may be a dict (sent as JSON), text, bytes or
+                     ``None``.
+
+    :type boundary: string
+    :param boundary: The multipart boundary.
+
+    :rtype: bytes
+    :returns: The encoded body.
     """
-    # We coerce to bytes to get consitent concat across
-    # Py2 and Py3. Percent formatting is insufficient since
-    # it includes the b in Py3.
-    if not isinstance(content, six.binary_type):
-        content = content.encode('utf-8')
-    content_type = response['content-type']
-    if not isinstance(content_type, six.binary_type):
-        content_type = content_type.encode('utf-8')
-    faux_message = b''.join([
-        b'Content-Type: ',
-        content_type,
-        b'\nMIME-Version: 1.0\n\n',
-        content,
-    ])
+    delimiter = ('--%s\r\n' % (boundary,)).encode('ascii')
+    chunks = []
+    for method, uri, headers, body in requests:
+        headers = dict(headers)
+        if isinstance(body, dict):
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+            headers['Content-Length'] = len(body)
+        if body is None:
+            body = b''
+        elif not isinstance(body, six.binary_type):
+            body = body.encode('utf-8')
+        lines = [delimiter,
+                 _PART_HEADERS,
+                 ('%s %s HTTP/1.1\r\n' % (method, uri)).encode('utf-8')]
+        lines.extend([('%s: %s\r\n' % (key, value)).encode('utf-8')
+                      for key, value in sorted(headers.items())])
+        lines.extend([b'\r\n', body, b'\r\n'])
+        chunks.extend(lines)
+    chunks.append(('--%s--\r\n' % (boundary,)).encode('ascii'))
+    return b''.join(chunks)
 
-    if six.PY2:
-        return parser.parsestr(faux_message)
-    else:  # pragma: NO COVER  Python3
-        return parser.parsestr(faux_message.decode('utf-8'))
+
+def _get_boundary(content_type):
+    """Extract the boundary parameter from a multipart content type.
+
+    :type content_type: string
+    :param content_type: The ``Content-Type`` header value.
+
+    :rtype: bytes or ``NoneType``
+    :returns: The boundary, or ``None`` if not a multipart content type.
+    """
+    media_type, _, params = content_type.partition(';')
+    if not media_type.strip().lower().startswith('multipart/'):
+        return None
+    for param in params.split(';'):
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'boundary':
+            return value.strip().strip('"').encode('ascii')
+    return None
+
+
+def _split_headers(block):
+    """Split a header block from the body following it.
+
+    :type block: bytes
+    :param block: Header lines, optionally followed by a blank line and
+                  a body.
+
+    :rtype: tuple (list of bytes, bytes)
+    :returns: The header lines and the body.
+    """
+    match = _BLANK_LINE_RE.search(block)
+    if match is None:
+        head, body = block, b''
+    else:
+        head, body = block[:match.start()], block[match.end():]
+    return head.splitlines(), body
+
+
+def _parse_part(part):
+    """Parse one ``application/http`` part of a batch response.
+
+    :type part: bytes
+    :param part: The part, between its delimiters.
+
+    :rtype: tuple
+    :returns: The ``(headers, payload)`` pair for the sub-response.
+    :raises: :class:`ValueError` if the part holds no HTTP response.
+    """
+    # Skip the part's own (``application/http``) headers.
+    _, http_response = _split_headers(part)
+    lines, body = _split_headers(http_response)
+    if not lines:
+        raise ValueError('Bad response:  empty part')
+    status_line = lines[0].decode('utf-8')
+    _, status, _ = (status_line + ' ').split(' ', 2)
+    msg_headers = {'status': status}
+    for line in lines[1:]:
+        name, _, value = line.decode('utf-8').partition(':')
+        msg_headers[name.strip()] = value.strip()
+    headers = httplib2.Response(msg_headers)
+    ctype = headers.get('content-type')
+    if ctype and ctype.startswith('application/json'):
+        payload = json.loads(body.decode('utf-8'))
+    else:
+        payload = body.decode('utf-8')
+    return headers, payload
 
 
 def _unpack_batch_response(response, content):
     """Convert response, content -> [(headers, payload)].
 
     Creates a generator of tuples of emulating the responses to
-    :meth:`httplib2.Http.request` (a pair of headers and payload).
+    :meth:`httplib2.Http.request` (a pair of headers and payload).  Each
+    part is located and parsed only when the generator reaches it.
 
     :type response: :class:`httplib2.Response`
     :param response: HTTP response / headers from a request.
@@ -305,22 +425,33 @@ def _unpack_batch_response(response, content):
 
     :rtype: generator
     :returns: A generator of header, payload pairs.
+    :raises: :class:`ValueError` if the response is not multipart.
     """
-    parser = Parser()
-    message = _generate_faux_mime_message(parser, response, content)
+    content_type = response['content-type']
+    if isinstance(content_type, six.binary_type):
+        content_type = content_type.decode('utf-8')
+    if not isinstance(content, six.binary_type):
+        content = content.encode('utf-8')
 
-    if not isinstance(message._payload, list):
+    boundary = _get_boundary(content_type)
+    delimiter = None if boundary is None else b'--' + boundary
+    start = -1 if delimiter is None else content.find(delimiter)
+    if start == -1:
         raise ValueError('Bad response:  not multi-part')
 
-    for subrequest in message._payload:
-        status_line, rest = subrequest._payload.split('\n', 1)
-        _, status, _ = status_line.split(' ', 2)
-        sub_message = parser.parsestr(rest)
-        payload = sub_message._payload
-        ctype = sub_message['Content-Type']
-        msg_headers = dict(sub_message._headers)
-        msg_headers['status'] = status
-        headers = httplib2.Response(msg_headers)
-        if ctype and ctype.startswith('application/json'):
-            payload = json.loads(payload)
-        yield headers, payload
+    while True:
+        start += len(delimiter)
+        if content[start:start + 2] == b'--':  # The close delimiter.
+            return
+        end = content.find(delimiter, start)
+        if end == -1:
+            raise ValueError('Bad response:  unterminated multi-part')
+        # The line break before a delimiter belongs to the delimiter.
+        part_end = end
+        if content[part_end - 2:part_end] == b'\r\n':
+            part_end -= 2
+        elif content[part_end - 1:part_end] == b'\n':
+            part_end -= 1
+        part_start = content.find(b'\n', start) + 1
+        yield _parse_part(content[part_start:part_end])
+        start = end
@@ -14,31 +14,74 @@
 
 """Create / interact with Google Cloud Storage blobs."""
 
+import binascii
+import calendar
+import collections
 import copy
 import datetime
+import functools
+import hashlib
+import io
 from io import BytesIO
 import json
 import mimetypes
+import mmap
 import os
+import sys
+import threading
 import time
 
 import six
+from six.moves import http_client
 from six.moves.urllib.parse import quote  # pylint: disable=F0401
 
+from apitools.base.py import exceptions as apitools_exceptions
 from apitools.base.py import http_wrapper
 from apitools.base.py import transfer
 
+from gcloud._helpers import _imap_unordered
 from gcloud._helpers import _RFC3339_MICROS
 from gcloud._helpers import UTC
 from gcloud.credentials import generate_signed_url
 from gcloud.exceptions import NotFound
+from gcloud.storage._helpers import _Checksums
+from gcloud.storage._helpers import _HashingReader
+from gcloud.storage._helpers import _HashingWriter
 from gcloud.storage._helpers import _PropertyMixin
+from gcloud.storage._helpers import _base64_crc32c
+from gcloud.storage._helpers import _crc32c
+from gcloud.storage._helpers import _crc32c_combine
+from gcloud.storage.cache import _active_cache
+from gcloud.storage.stats import _transfer_monitor
+from gcloud.storage.stats import DOWNLOAD
+from gcloud.storage.stats import UPLOAD
 from gcloud.storage._helpers import _scalar_property
 from gcloud.storage.acl import ObjectACL
 
 
 _API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
 
+_COMPOSITE_MAX_WORKERS = 4
+"""Default number of components uploaded concurrently."""
+
+_DEFAULT_READ_SIZE = 1024 * 1024
+"""Default size (1 MB) of each ranged request when streaming a download."""
+
+_DEFAULT_WRITE_SIZE = 8 * 1024 * 1024
+"""Default size (8 MB) of each chunk when streaming an upload."""
+
+_SESSION_MAX_AGE = 7 * 24 * 60 * 60
+"""Age (one week, in seconds) after which resumable sessions expire."""
+
+_SESSION_STATE_SUFFIX = '.upload-session'
+"""Suffix of the files persisting resumable upload sessions."""
+
+_SLICED_MAX_WORKERS = 4
+"""Default number of slices downloaded concurrently."""
+
+_COMPONENT_NAME_TEMPLATE = '%s.gcloud-component-%s-%d-%05d'
+"""Name of a temporary component: blob name, token, tier and index."""
+
 
 class Blob(_PropertyMixin):
     """A wrapper around Cloud Storage's concept of an ``Object``.
@@ -58,9 +101,20 @@ class Blob(_PropertyMixin):
 
     _chunk_size = None  # Default value for each instance.
 
+    adaptive_chunk_size = None
+    """:class:`gcloud.storage.stats.AdaptiveChunkSize` which, if set,
+    replaces ``chunk_size`` for resumable transfers, adapting it to each
+    chunk's throughput and failures."""
+
     _CHUNK_SIZE_MULTIPLE = 256 * 1024
     """Number (256 KB, in bytes) that must divide the chunk size."""
 
+    _MAX_COMPOSE_SOURCES = 32
+    """Maximum number of source objects in a single compose request."""
+
+    _MAX_COMPONENT_COUNT = 1024
+    """Maximum number of components making up a composite object."""
+
     def __init__(self, name, bucket, chunk_size=None):
         super(Blob, self).__init__(name=name)
 
@@ -207,11 +261,18 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        If the client has a metadata cache, it is consulted (and filled)
+        instead.
+
         :rtype: boolean
         :returns: True if the blob exists in Cloud Storage.
         """
         client = self._require_client(client)
+        cache = _active_cache(client)
         try:
+            if cache is not None:
+                cache.fetch(self, client)
+                return True
             # We only need the status code (200 or not) so we seek to
             # minimize the returned payload.
             query_params = {'fields': 'name'}
@@ -227,6 +288,47 @@ class Blob(_PropertyMixin):
         except NotFound:
             return False
 
+    def reload(self, client=None):
+        """Reload properties from Cloud Storage.
+
+        If the client has a metadata cache, the properties are served from
+        (and stored in) it.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+        """
+        client = self._require_client(client)
+        cache = _active_cache(client)
+        if cache is None:
+            super(Blob, self).reload(client=client)
+        else:
+            self._set_properties(cache.fetch(self, client))
+
+    def patch(self, client=None):
+        """Sends all changed properties in a PATCH request.
+
+        Updates the ``_properties`` with the response from the backend,
+        and the client's metadata cache, if any.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+        """
+        client = self._require_client(client)
+        super(Blob, self).patch(client=client)
+        self._update_cache(client)
+
+    def _update_cache(self, client):
+        """Record this blob's new properties in the client's cache, if any.
+
+        :type client: :class:`gcloud.storage.client.Client`
+        :param client: The client whose cache to update.
+        """
+        cache = getattr(client, 'metadata_cache', None)
+        if cache is not None:
+            cache.update(self)
+
     def delete(self, client=None):
         """Deletes a blob from Cloud Storage.
 
@@ -242,7 +344,7 @@ class Blob(_PropertyMixin):
         """
         return self.bucket.delete_blob(self.name, client=client)
 
-    def download_to_file(self, file_obj, client=None):
+    def download_to_file(self, file_obj, client=None, progress=None):
         """Download the contents of this blob into a file-like object.
 
         :type file_obj: file
@@ -252,17 +354,29 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
-        :raises: :class:`gcloud.exceptions.NotFound`
+        :type progress: a callable taking
+                        (:class:`gcloud.storage.stats.TransferProgress`),
+                        or ``NoneType``
+        :param progress: Optional. Called after each chunk is received.
+
+        :raises: :class:`gcloud.exceptions.NotFound`, or
+                 :class:`ValueError` if the MD5 hash or CRC32C checksum
+                 of the bytes received does not match the blob's.
         """
         client = self._require_client(client)
         download_url = self.media_link
+        checksums = self._download_checksums()
 
         # Use apitools 'Download' facility.
-        download = transfer.Download.FromStream(file_obj, auto_transfer=False)
+        download = transfer.Download.FromStream(
+            _HashingWriter(file_obj, checksums), auto_transfer=False)
         headers = {}
-        if self.chunk_size is not None:
-            download.chunksize = self.chunk_size
-            headers['Range'] = 'bytes=0-%d' % (self.chunk_size - 1,)
+        chunk_size = self.chunk_size
+        if self.adaptive_chunk_size is not None:
+            chunk_size = self.adaptive_chunk_size.chunk_size
+        if chunk_size is not None:
+            download.chunksize = chunk_size
+            headers['Range'] = 'bytes=0-%d' % (chunk_size - 1,)
         request = http_wrapper.Request(download_url, 'GET', headers)
 
         # Use the private ``_connection`` rather than the public
@@ -271,15 +385,37 @@ class Blob(_PropertyMixin):
         # object. The rest (API_BASE_URL and build_api_url) are also defined
         # on the Batch class, but we just use the wrapped connection since
         # it has all three (http, API_BASE_URL and build_api_url).
-        download.InitializeDownload(request, client._connection.http)
-
-        # Should we be passing callbacks through from caller?  We can't
-        # pass them as None, because apitools wants to print to the console
-        # by default.
+        # Requests are timed on the HTTP object, since apitools calls its
+        # own callbacks from new threads, after the fact.
+        monitor = _transfer_monitor(
+            self, client, DOWNLOAD, self.size, progress,
+            resize=functools.partial(setattr, download, 'chunksize'))
+        download.InitializeDownload(request,
+                                    monitor.http(client._connection.http))
+
+        # We can't pass the callbacks as None, because apitools wants to
+        # print to the console by default.
         download.StreamInChunks(callback=lambda *args: None,
                                 finish_callback=lambda *args: None)
+        checksums.verify(self.md5_hash, self.crc32c, self.name)
+        monitor.finish()
+
+    def _download_checksums(self):
+        """Checksums to compute while downloading this blob's content.
+
+        Nothing is checked for blobs with a ``content_encoding``, which may
+        be decoded in transit.
+
+        :rtype: :class:`gcloud.storage._helpers._Checksums`
+        :returns: The (empty) checksums.
+        """
+        if self.content_encoding:
+            return _Checksums(md5=False, crc32c=False)
+        return _Checksums.for_download(self.md5_hash, self.crc32c)
 
-    def download_to_filename(self, filename, client=None):
+    def download_to_filename(self, filename, client=None, slice_size=None,
+                             max_workers=_SLICED_MAX_WORKERS,
+                             num_retries=6, progress=None):
         """Download the contents of this blob into a named file.
 
         :type filename: string
@@ -289,13 +425,215 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
-        :raises: :class:`gcloud.exceptions.NotFound`
+        :type slice_size: integer or ``NoneType``
+        :param slice_size: Optional. If passed and the blob is larger, the
+                           file is preallocated and slices of this size are
+                           fetched with concurrent ranged requests, each
+                           written at its own offset.  The blob's metadata
+                           is reloaded first if its size is not known.
+                           Blobs with a ``content_encoding`` are never
+                           sliced.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of slices downloaded concurrently.
+
+        :type num_retries: integer
+        :param num_retries: Number of retries for each slice. Defaults to 6.
+
+        :type progress: a callable taking
+                        (:class:`gcloud.storage.stats.TransferProgress`),
+                        or ``NoneType``
+        :param progress: Optional. Called after each chunk is received (not
+                         for sliced downloads).
+
+        :raises: :class:`gcloud.exceptions.NotFound`, or
+                 :class:`ValueError` if the CRC32C of a sliced download does
+                 not match the blob's.
         """
+        if slice_size is not None and self.size is None:
+            self.reload(client=client)
+
+        if (slice_size is not None and self.size > slice_size and
+                not self.content_encoding):
+            # Ranges of encoded content may be answered with the whole,
+            # decoded object:  those are downloaded in one stream.
+            self._download_sliced(filename, slice_size, max_workers,
+                                  num_retries, client)
+        else:
+            with open(filename, 'wb') as file_obj:
+                self.download_to_file(file_obj, client=client,
+                                      progress=progress)
+
+        mtime = calendar.timegm(self.updated.utctimetuple())
+        os.utime(filename, (mtime, mtime))
+
+    def _request_range(self, connection, start, end, num_retries=6):
+        """Request a range of the blob's content.
+
+        :type connection: :class:`gcloud.storage.connection.Connection`
+        :param connection: The connection whose ``http`` is used.
+
+        :type start: integer
+        :param start: Offset of the first byte to fetch.
+
+        :type end: integer
+        :param end: Offset of the last byte to fetch (inclusive).
+
+        :type num_retries: integer
+        :param num_retries: Number of retries for transient errors.
+
+        :rtype: :class:`apitools.base.py.http_wrapper.Response`
+        :returns: The response:  ``206 Partial Content``, or ``200 OK`` if
+                  the server sent the whole object instead.
+        :raises: :class:`apitools.base.py.exceptions.HttpError` if the
+                 request fails.
+        """
+        headers = {'Range': 'bytes=%d-%d' % (start, end)}
+        request = http_wrapper.Request(self.media_link, 'GET', headers)
+        response = http_wrapper.MakeRequest(connection.http, request,
+                                            retries=num_retries)
+        if response.status_code not in (http_client.OK,
+                                        http_client.PARTIAL_CONTENT):
+            raise apitools_exceptions.HttpError.FromResponse(response)
+        return response
+
+    def _download_sliced(self, filename, slice_size, max_workers,
+                         num_retries, client):
+        """Download the blob into a file using concurrent ranged requests.
+
+        :type filename: string
+        :param filename: A filename to be passed to ``open``.
+
+        :type slice_size: integer
+        :param slice_size: The size of each ranged request.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent requests.
+
+        :type num_retries: integer
+        :param num_retries: Number of retries for each slice.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.
+
+        :raises: :class:`ValueError` if a slice cannot be completed or the
+                 CRC32C does not match.
+        """
+        client = self._require_client(client)
+        # See ``download_to_file`` for why ``_connection`` is used.
+        connection = client._connection
+        total_bytes = self.size
+        lock = threading.Lock()
+
+        def _download_slice(offset):
+            """Fetch one slice, resuming after short responses."""
+            end = min(offset + slice_size, total_bytes) - 1
+            position = offset
+            crc = 0
+            failures = 0
+            while position <= end:
+                response = self._request_range(connection, position, end,
+                                               num_retries=num_retries)
+                if response.status_code == http_client.OK:
+                    raise _WholeObjectSent(response.content)
+                data = response.content
+                if not data:
+                    failures += 1
+                    if failures > num_retries:
+                        raise ValueError(
+                            'Could not download bytes %d-%d of %r.' % (
+                                position, end, self.name))
+                    continue
+                _write_at(file_obj, lock, data, position)
+                crc = _crc32c(data, crc)
+                position += len(data)
+            return offset, crc, end + 1 - offset
+
         with open(filename, 'wb') as file_obj:
-            self.download_to_file(file_obj, client=client)
+            _preallocate(file_obj, total_bytes)
+        with open(filename, 'r+b', 0) as file_obj:
+            try:
+                checksums = dict(
+                    (offset, (crc, length)) for offset, crc, length in
+                    _imap_unordered(_download_slice,
+                                    range(0, total_bytes, slice_size),
+                                    max_workers))
+            except _WholeObjectSent as whole:
+                # The server ignored the range:  no more slices are
+                # started, and the content it sent is written once.
+                content = whole.content
+                _write_at(file_obj, lock, content, 0)
+                file_obj.truncate(len(content))
+                checksums = {0: (_crc32c(content), len(content))}
+
+        if self.crc32c is not None:
+            actual_crc = 0
+            for offset in sorted(checksums):
+                crc, length = checksums[offset]
+                actual_crc = _crc32c_combine(actual_crc, crc, length)
+            if _base64_crc32c(actual_crc) != self.crc32c:
+                raise ValueError('CRC32C mismatch downloading %r.' % (
+                    self.name,))
+
+    def open_reader(self, chunk_size=None, client=None):
+        """Open the blob's content as a read-only, seekable file object.
+
+        Data is fetched with one ranged request per buffer fill, so memory
+        use is bounded by ``chunk_size`` whatever the blob's size, and
+        reading can start before the whole blob is transferred::
+
+          >>> with blob.open_reader() as file_obj:
+          ...     for line in file_obj:
+          ...         process(line)
+
+        :type chunk_size: integer or ``NoneType``
+        :param chunk_size: Optional. The size of each ranged request.
+                           Defaults to the blob's ``chunk_size``, or 1 MB.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: :class:`io.BufferedReader`
+        :returns: A buffered reader wrapping a :class:`BlobReader`.
+        :raises: :class:`ValueError` if the blob has a ``content_encoding``
+                 (use :meth:`download_to_file` to read those).
+        """
+        chunk_size = chunk_size or self.chunk_size or _DEFAULT_READ_SIZE
+        return io.BufferedReader(BlobReader(self, client=client),
+                                 buffer_size=chunk_size)
+
+    def iter_bytes(self, chunk_size=None, client=None):
+        """Iterate over the blob's content, one ranged request at a time.
 
-        mtime = time.mktime(self.updated.timetuple())
-        os.utime(file_obj.name, (mtime, mtime))
+        :type chunk_size: integer or ``NoneType``
+        :param chunk_size: Optional. The size of each chunk (and request).
+                           Defaults to the blob's ``chunk_size``, or 1 MB.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: generator
+        :returns: Chunks of at most ``chunk_size`` bytes.
+        :raises: :class:`ValueError` if the blob has a ``content_encoding``
+                 or, once the last chunk has been consumed, if the MD5 hash
+                 or CRC32C checksum of the chunks does not match the
+                 blob's.
+        """
+        chunk_size = chunk_size or self.chunk_size or _DEFAULT_READ_SIZE
+        reader = BlobReader(self, client=client)
+        checksums = self._download_checksums()
+        try:
+            while True:
+                chunk = reader.read(chunk_size)
+                if not chunk:
+                    break
+                checksums.update(chunk)
+                yield chunk
+        finally:
+            reader.close()
+        checksums.verify(self.md5_hash, self.crc32c, self.name)
 
     def download_as_string(self, client=None):
         """Download the contents of this blob as a string.
@@ -312,8 +650,71 @@ class Blob(_PropertyMixin):
         self.download_to_file(string_buffer, client=client)
         return string_buffer.getvalue()
 
+    def download_into(self, buffer, client=None):
+        """Download the contents of this blob into a writable buffer.
+
+        The bytes are written in place at the start of ``buffer`` (e.g. a
+        ``bytearray``, a ``memoryview`` of one, or an ``mmap``), as they are
+        received, so no intermediate copy of the whole content is made.
+        The blob's metadata is reloaded first if its size is not known.
+
+        :type buffer: writable object supporting the buffer protocol
+        :param buffer: The buffer to fill;  it must hold at least ``size``
+                       bytes.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: integer
+        :returns: The number of bytes written to ``buffer``.
+        :raises: :class:`gcloud.exceptions.NotFound`, or
+                 :class:`ValueError` if the blob has a ``content_encoding``
+                 (its size in transit may differ from ``size``), if
+                 ``buffer`` is read-only or too small, or if the checksums
+                 do not match.
+        """
+        if self.size is None:
+            self.reload(client=client)
+        if self.content_encoding:
+            raise ValueError(
+                'Cannot download %r into a buffer:  its content is '
+                '%s-encoded.' % (self.name, self.content_encoding))
+        writer = _BufferWriter(buffer)
+        if len(writer) < self.size:
+            raise ValueError('Buffer of %d bytes cannot hold %d bytes.' % (
+                len(writer), self.size))
+        self.download_to_file(writer, client=client)
+        return writer.position
+
+    def download_as_bytes(self, client=None):
+        """Download the contents of this blob into a new ``bytearray``.
+
+        Unlike :meth:`download_as_string`, the result is allocated once, at
+        the blob's size, and filled in place by :meth:`download_into`.
+        Blobs with a ``content_encoding`` (whose size in transit may differ)
+        are downloaded via :meth:`download_as_string`.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: bytearray
+        :returns: The data stored in this blob.
+        :raises: :class:`gcloud.exceptions.NotFound`
+        """
+        if self.size is None:
+            self.reload(client=client)
+        if self.content_encoding:
+            return bytearray(self.download_as_string(client=client))
+        data = bytearray(self.size)
+        written = self.download_into(data, client=client)
+        del data[written:]
+        return data
+
     def upload_from_file(self, file_obj, rewind=False, size=None,
-                         content_type=None, num_retries=6, client=None):
+                         content_type=None, num_retries=6, client=None,
+                         progress=None):
         """Upload the contents of this blob from a file-like object.
 
         The content type of the upload will either be
@@ -355,8 +756,14 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        :type progress: a callable taking
+                        (:class:`gcloud.storage.stats.TransferProgress`),
+                        or ``NoneType``
+        :param progress: Optional. Called after each chunk is sent.
+
         :raises: :class:`ValueError` if size is not passed in and can not be
-                 determined
+                 determined, or if the MD5 hash (or CRC32C checksum) the
+                 server reports does not match the bytes sent.
         """
         client = self._require_client(client)
         # Use the private ``_connection`` rather than the public
@@ -387,9 +794,13 @@ class Blob(_PropertyMixin):
             'User-Agent': connection.USER_AGENT,
         }
 
+        # Checksum the bytes as apitools reads them, rather than re-reading.
+        file_obj = _HashingReader(file_obj, _Checksums.for_upload())
+        chunk_size = self.chunk_size
+        if self.adaptive_chunk_size is not None:
+            chunk_size = self.adaptive_chunk_size.chunk_size
         upload = transfer.Upload(file_obj, content_type, total_bytes,
-                                 auto_transfer=False,
-                                 chunksize=self.chunk_size)
+                                 auto_transfer=False, chunksize=chunk_size)
 
         url_builder = _UrlBuilder(bucket_name=self.bucket.name,
                                   object_name=self.name)
@@ -409,26 +820,39 @@ class Blob(_PropertyMixin):
         request.url = connection.build_api_url(api_base_url=base_url,
                                                path=self.bucket.path + '/o',
                                                query_params=query_params)
+        # See ``download_to_file`` for why requests are timed on the HTTP
+        # object.  Only requests carrying content are timed, so a resumable
+        # upload's initial request is made without it.
+        monitor = _transfer_monitor(
+            self, client, UPLOAD, total_bytes, progress,
+            resize=functools.partial(setattr, upload, 'chunksize'))
+        http = monitor.http(connection.http)
+        upload.bytes_http = http
         upload.InitializeUpload(request, connection.http)
 
-        # Should we be passing callbacks through from caller?  We can't
-        # pass them as None, because apitools wants to print to the console
-        # by default.
+        # We can't pass the callbacks as None, because apitools wants to
+        # print to the console by default.
         if upload.strategy == transfer.RESUMABLE_UPLOAD:
             http_response = upload.StreamInChunks(
                 callback=lambda *args: None,
                 finish_callback=lambda *args: None)
         else:
-            http_response = http_wrapper.MakeRequest(connection.http, request,
+            http_response = http_wrapper.MakeRequest(http, request,
                                                      retries=num_retries)
         response_content = http_response.content
         if not isinstance(response_content,
                           six.string_types):  # pragma: NO COVER  Python3
             response_content = response_content.decode('utf-8')
         self._set_properties(json.loads(response_content))
+        self._update_cache(client)
+        if file_obj.checksums is not None:
+            file_obj.checksums.verify(self.md5_hash, self.crc32c, self.name)
+        monitor.finish()
 
     def upload_from_filename(self, filename, content_type=None,
-                             client=None):
+                             client=None, slice_size=None,
+                             max_workers=_COMPOSITE_MAX_WORKERS,
+                             state_dir=None, progress=None, use_mmap=False):
         """Upload this blob's contents from the content of a named file.
 
         The content type of the upload will either be
@@ -456,14 +880,297 @@ class Blob(_PropertyMixin):
         :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
+
+        :type slice_size: integer or ``NoneType``
+        :param slice_size: Optional. If passed and the file is larger, the
+                           file is uploaded as slices of (about) this size,
+                           in parallel, which are then composed into this
+                           blob.  Composite objects carry a CRC32C but no
+                           MD5 hash.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of slices uploaded concurrently.
+
+        :type state_dir: string or ``NoneType``
+        :param state_dir: Optional. If passed, the file is sent with a
+                          resumable upload whose session URL and persisted
+                          offset are saved in this directory after every
+                          chunk.  Uploading the same (unchanged) file to
+                          the same blob again, e.g. after the process was
+                          restarted, continues from the offset the server
+                          reports.  Sessions older than a week, which the
+                          server has expired, are removed.
+
+        :type progress: a callable taking
+                        (:class:`gcloud.storage.stats.TransferProgress`),
+                        or ``NoneType``
+        :param progress: Optional. Called after each chunk is sent (not for
+                         sliced uploads).
+
+        :type use_mmap: boolean
+        :param use_mmap: If True, memory-map the file rather than reading
+                         it, so that checksums and resumable chunks
+                         (``state_dir``) are taken from the mapping without
+                         copies or ``read`` calls.  The file must not be
+                         truncated during the upload:  touching the
+                         missing pages kills the process with ``SIGBUS``,
+                         where reading it would raise an error.
+
+        :raises: :class:`ValueError` if the CRC32C of a sliced upload does
+                 not match the local file, or if the file shrinks during a
+                 ``state_dir`` upload.
         """
         content_type = content_type or self._properties.get('contentType')
         if content_type is None:
             content_type, _ = mimetypes.guess_type(filename)
 
-        with open(filename, 'rb') as file_obj:
-            self.upload_from_file(file_obj, content_type=content_type,
-                                  client=client)
+        opener = _MappedFile if use_mmap else _FileWindow
+        if state_dir is not None:
+            self._upload_persisted(filename, content_type, state_dir, client,
+                                   progress, opener)
+            return
+
+        if slice_size is not None:
+            total_bytes = os.path.getsize(filename)
+            if total_bytes > slice_size:
+                self._upload_composite(filename, total_bytes, slice_size,
+                                       content_type, max_workers, client,
+                                       opener)
+                return
+
+        with opener(filename) as file_obj:
+            self.upload_from_file(file_obj, size=len(file_obj),
+                                  content_type=content_type, client=client,
+                                  progress=progress)
+
+    def _upload_persisted(self, filename, content_type, state_dir, client,
+                          progress, opener):
+        """Upload a file with a resumable session persisted to disk.
+
+        :type filename: string
+        :param filename: The path to the file.
+
+        :type content_type: string or ``NoneType``
+        :param content_type: Type of content being uploaded.
+
+        :type state_dir: string
+        :param state_dir: Directory holding session state files.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.
+
+        :type progress: a callable taking
+                        (:class:`gcloud.storage.stats.TransferProgress`),
+                        or ``NoneType``
+        :param progress: Optional. Called after each chunk is sent.
+
+        :type opener: :class:`_FileWindow` or :class:`_MappedFile`
+        :param opener: How to read the file.
+
+        :raises: :class:`ValueError` if the file shrinks during the upload.
+        """
+        if not os.path.isdir(state_dir):
+            os.makedirs(state_dir)
+        _remove_stale_sessions(state_dir)
+        source = os.stat(filename)
+        key = '\n'.join([self.bucket.name, self.name,
+                         os.path.abspath(filename)])
+        state_path = os.path.join(
+            state_dir,
+            hashlib.sha1(key.encode('utf-8')).hexdigest() +
+            _SESSION_STATE_SUFFIX)
+        state = {
+            'bucket': self.bucket.name,
+            'name': self.name,
+            'filename': os.path.abspath(filename),
+            'size': source.st_size,
+            'mtime': source.st_mtime,
+        }
+
+        writer = BlobWriter(self, content_type=content_type, client=client,
+                            progress=progress)
+        offset = 0
+        saved = _load_session_state(state_path)
+        if saved is not None and saved.get('upload_url') and all(
+                saved.get(name) == value for name, value in state.items()):
+            try:
+                offset = writer.resume(saved['upload_url'], source.st_size)
+            except apitools_exceptions.HttpError as exc:
+                if exc.status_code not in (http_client.NOT_FOUND,
+                                           http_client.GONE):
+                    raise
+                # The session has expired:  start a new one.
+                offset = 0
+            if offset is None:
+                os.remove(state_path)
+                return
+
+        with opener(filename) as source:
+            with writer:
+                start = offset
+                while start < len(source):
+                    # The chunk size may adapt after each chunk sent.
+                    written = writer.write(
+                        source.view(start, start + writer.chunk_size))
+                    if not written:
+                        raise ValueError('%r shrank during the upload.' % (
+                            filename,))
+                    start += written
+                    state['upload_url'] = writer.upload_url
+                    state['offset'] = writer.committed
+                    _save_session_state(state_path, state)
+
+        if os.path.exists(state_path):
+            os.remove(state_path)
+
+    def _upload_composite(self, filename, total_bytes, slice_size,
+                          content_type, max_workers, client, opener):
+        """Upload a file as concurrently uploaded, then composed, slices.
+
+        Each slice is uploaded as a temporary component object, the
+        components are composed (in tiers, if there are more than
+        :attr:`_MAX_COMPOSE_SOURCES`) into this blob and then deleted.
+        The CRC32C of the result is checked against the checksum computed
+        while reading the slices.
+
+        :type filename: string
+        :param filename: The path to the file.
+
+        :type total_bytes: integer
+        :param total_bytes: The size of the file.
+
+        :type slice_size: integer
+        :param slice_size: The size of each slice.  Raised as needed to
+                           keep within :attr:`_MAX_COMPONENT_COUNT`.
+
+        :type content_type: string or ``NoneType``
+        :param content_type: Type of content being uploaded.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent requests.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.
+
+        :type opener: :class:`_FileWindow` or :class:`_MappedFile`
+        :param opener: How to read the file.
+
+        :raises: :class:`ValueError` if a checksum does not match.
+        """
+        client = self._require_client(client)
+        content_type = content_type or 'application/octet-stream'
+        num_slices = -(-total_bytes // slice_size)
+        if num_slices > self._MAX_COMPONENT_COUNT:
+            num_slices = self._MAX_COMPONENT_COUNT
+            slice_size = -(-total_bytes // num_slices)
+            num_slices = -(-total_bytes // slice_size)
+
+        token = binascii.hexlify(os.urandom(8)).decode('ascii')
+        created = []
+
+        def _component(tier, index):
+            """Create a temporary component blob."""
+            name = _COMPONENT_NAME_TEMPLATE % (self.name, token, tier, index)
+            component = Blob(name, bucket=self.bucket,
+                             chunk_size=self.chunk_size)
+            component.adaptive_chunk_size = self.adaptive_chunk_size
+            return component
+
+        def _upload_slice(index):
+            """Upload one slice, returning its index, blob and checksum."""
+            component = _component(0, index)
+            offset = index * slice_size
+            length = min(slice_size, total_bytes - offset)
+            try:
+                with opener(filename, offset, length) as window:
+                    crc = _crc32c(window.view())
+                    component.upload_from_file(
+                        window, size=length, content_type=content_type,
+                        client=client)
+            except Exception:  # pylint: disable=broad-except
+                return index, component, None, sys.exc_info()
+            return index, component, (crc, length), None
+
+        try:
+            components = self._run_component_tasks(
+                _upload_slice, range(num_slices), max_workers, created)
+            expected_crc = 0
+            for component, (crc, length) in components:
+                if (component.crc32c is not None and
+                        component.crc32c != _base64_crc32c(crc)):
+                    raise ValueError('CRC32C mismatch uploading %r.' % (
+                        component.name,))
+                expected_crc = _crc32c_combine(expected_crc, crc, length)
+
+            sources = [component for component, _ in components]
+            tier = 0
+            while len(sources) > self._MAX_COMPOSE_SOURCES:
+                tier += 1
+                groups = [
+                    sources[start:start + self._MAX_COMPOSE_SOURCES]
+                    for start in range(0, len(sources),
+                                       self._MAX_COMPOSE_SOURCES)]
+
+                def _compose_group(index, tier=tier, groups=groups):
+                    """Compose one group of sources into a component."""
+                    component = _component(tier, index)
+                    component.content_type = content_type
+                    try:
+                        component.compose(groups[index], client=client)
+                    except Exception:  # pylint: disable=broad-except
+                        return index, component, None, sys.exc_info()
+                    return index, component, None, None
+
+                sources = [component for component, _ in
+                           self._run_component_tasks(
+                               _compose_group, range(len(groups)),
+                               max_workers, created)]
+
+            self.content_type = content_type
+            self.compose(sources, client=client)
+            if self.crc32c != _base64_crc32c(expected_crc):
+                raise ValueError('CRC32C mismatch composing %r.' % (
+                    self.name,))
+        finally:
+            self.bucket.delete_blobs(created, on_error=lambda blob: None,
+                                     client=client)
+
+    @staticmethod
+    def _run_component_tasks(func, indices, max_workers, created):
+        """Run component tasks concurrently, waiting for all of them.
+
+        :type func: callable
+        :param func: Takes an index and returns a tuple ``(index, blob,
+                     value, exc_info)``, where ``exc_info`` is ``None`` if
+                     the task succeeded.
+
+        :type indices: iterable of integers
+        :param indices: The task indices.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent tasks.
+
+        :type created: list of :class:`Blob`
+        :param created: Every blob touched by a task is appended here, so
+                        that it can be cleaned up later.
+
+        :rtype: list of tuples
+        :returns: ``(blob, value)`` for each task, in index order.
+        :raises: The first exception raised by a task, once every task
+                 has finished.
+        """
+        results = {}
+        error = None
+        for index, blob, value, exc_info in _imap_unordered(
+                func, indices, max_workers):
+            created.append(blob)
+            if exc_info is not None:
+                error = error or exc_info
+            else:
+                results[index] = (blob, value)
+        if error is not None:
+            six.reraise(*error)
+        return [results[index] for index in sorted(results)]
 
     def upload_from_string(self, data, content_type='text/plain',
                            client=None):
@@ -500,6 +1207,164 @@ class Blob(_PropertyMixin):
                               size=len(data), content_type=content_type,
                               client=client)
 
+    def compose(self, sources, client=None):
+        """Concatenate source blobs into this blob.
+
+        See: https://cloud.google.com/storage/docs/json_api/v1/objects/compose
+
+        Properties changed locally on this blob (e.g. ``content_type``) are
+        sent as the destination's metadata.
+
+        :type sources: list of string or :class:`Blob`
+        :param sources: Names of, or blobs for, the objects to concatenate,
+                        all in this blob's bucket.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :raises: :class:`ValueError` if there are more than
+                 :attr:`_MAX_COMPOSE_SOURCES` sources.
+        """
+        sources = list(sources)
+        if len(sources) > self._MAX_COMPOSE_SOURCES:
+            raise ValueError('Cannot compose more than %d sources.' % (
+                self._MAX_COMPOSE_SOURCES,))
+        client = self._require_client(client)
+        source_objects = []
+        for source in sources:
+            if not isinstance(source, six.string_types):
+                source = source.name
+            source_objects.append({'name': source})
+        request = {
+            'sourceObjects': source_objects,
+            'destination': dict((key, self._properties[key])
+                                for key in self._changes),
+        }
+        api_response = client.connection.api_request(
+            method='POST', path=self.path + '/compose', data=request,
+            _target_object=self)
+        self._set_properties(api_response)
+        self._update_cache(client)
+
+    def rewrite(self, source, token=None, client=None,
+                max_bytes_per_call=None):
+        """Rewrite a source blob's content into this blob, in steps.
+
+        See: https://cloud.google.com/storage/docs/json_api/v1/objects/rewrite
+
+        Unlike the ``copyTo`` endpoint, a rewrite of a large object (e.g.
+        to another location or storage class) is done over several calls:
+        while the returned token is not ``None``, call again, passing it.
+        Properties changed locally on this blob (e.g. ``content_type``) are
+        sent as the destination's metadata.
+
+        :type source: :class:`Blob`
+        :param source: The blob to rewrite from.
+
+        :type token: string or ``NoneType``
+        :param token: Optional. The token returned by the previous call.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type max_bytes_per_call: integer or ``NoneType``
+        :param max_bytes_per_call: Optional. The most bytes to rewrite in one
+                                   call (a multiple of 1 MB).
+
+        :rtype: tuple
+        :returns: ``(token, bytes_rewritten, total_bytes)``, where ``token``
+                  is ``None`` once the rewrite is done (and this blob's
+                  properties are set from the new object).
+        """
+        client = self._require_client(client)
+        query_params = {}
+        if token is not None:
+            query_params['rewriteToken'] = token
+        if max_bytes_per_call is not None:
+            query_params['maxBytesRewrittenPerCall'] = max_bytes_per_call
+        data = dict((key, self._properties[key]) for key in self._changes)
+        api_response = client.connection.api_request(
+            method='POST', path=source.path + '/rewriteTo' + self.path,
+            query_params=query_params, data=data)
+        rewritten = int(api_response.get('totalBytesRewritten', 0))
+        size = int(api_response.get('objectSize', 0))
+        if api_response.get('done', True):
+            self._set_properties(api_response.get('resource', {}))
+            self._update_cache(client)
+            return None, rewritten, size
+        return api_response['rewriteToken'], rewritten, size
+
+    def open_writer(self, content_type=None, chunk_size=None, client=None,
+                    progress=None):
+        """Open a writable file object streaming into this blob.
+
+        The content is sent with a resumable upload, one chunk at a time,
+        so its size need not be known in advance and memory use is bounded
+        by ``chunk_size``.  The upload is completed by ``close()``::
+
+          >>> with blob.open_writer(content_type='application/gzip') as dst:
+          ...     with gzip.GzipFile(fileobj=dst, mode='wb') as gz:
+          ...         shutil.copyfileobj(source, gz)
+
+        If the ``with`` block exits with an exception, the upload is
+        abandoned rather than completed.
+
+        :type content_type: string or ``NoneType``
+        :param content_type: Optional type of content being uploaded.
+
+        :type chunk_size: integer or ``NoneType``
+        :param chunk_size: Optional. The size of each chunk, which must be a
+                           multiple of 256 KB.  Defaults to the blob's
+                           ``adaptive_chunk_size`` (adapted as chunks are
+                           sent), its ``chunk_size``, or 8 MB.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type progress: a callable taking
+                        (:class:`gcloud.storage.stats.TransferProgress`),
+                        or ``NoneType``
+        :param progress: Optional. Called after each chunk is sent.
+
+        :rtype: :class:`BlobWriter`
+        :returns: The writer.
+        """
+        return BlobWriter(self, content_type=content_type,
+                          chunk_size=chunk_size, client=client,
+                          progress=progress)
+
+    def upload_from_iterable(self, iterable, content_type=None,
+                             chunk_size=None, client=None):
+        """Upload this blob's contents from an iterable of byte strings.
+
+        Suited to generators, pipes and other streams of unknown length:
+        see :meth:`open_writer`.
+
+        :type iterable: iterable of bytes or text
+        :param iterable: The pieces of content, in order.  Text is encoded
+                         as UTF-8.
+
+        :type content_type: string or ``NoneType``
+        :param content_type: Optional type of content being uploaded.
+
+        :type chunk_size: integer or ``NoneType``
+        :param chunk_size: Optional. The size of each chunk uploaded.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+        """
+        with self.open_writer(content_type=content_type,
+                              chunk_size=chunk_size,
+                              client=client) as writer:
+            for data in iterable:
+                if isinstance(data, six.text_type):
+                    data = data.encode('utf-8')
+                writer.write(data)
+
     def make_public(self, client=None):
         """Make this blob public giving all users read access.
 
@@ -773,6 +1638,890 @@ class Blob(_PropertyMixin):
             return naive.replace(tzinfo=UTC)
 
 
+class BlobSummary(collections.namedtuple(
+        'BlobSummary', ['name', 'size', 'md5_hash', 'crc32c', 'updated_raw'])):
+    """Compact, read-only record of a blob's listing properties.
+
+    Yielded by ``summary`` listings (see
+    :meth:`gcloud.storage.bucket.Bucket.list_blobs`), which skip building
+    a full :class:`Blob` (with its ACL and property state) per object.
+
+    :type name: string
+    :param name: The name of the blob.
+
+    :type size: integer or ``NoneType``
+    :param size: The size of the blob, in bytes.
+
+    :type md5_hash: string or ``NoneType``
+    :param md5_hash: The base64-encoded MD5 hash of the blob's data.
+
+    :type crc32c: string or ``NoneType``
+    :param crc32c: The base64-encoded CRC32C checksum of the blob's data.
+
+    :type updated_raw: string or ``NoneType``
+    :param updated_raw: The RFC 3339 timestamp of the last update, as
+                        returned by the API;  see :attr:`updated`.
+    """
+    __slots__ = ()
+
+    _API_FIELDS = 'items(name,size,md5Hash,crc32c,updated)'
+    """Partial response selector for the items of a summary listing."""
+
+    @classmethod
+    def from_api_repr(cls, resource):
+        """Build a summary from an object resource.
+
+        :type resource: dict
+        :param resource: The (possibly partial) object resource.
+
+        :rtype: :class:`BlobSummary`
+        :returns: The summary.
+        """
+        size = resource.get('size')
+        if size is not None:
+            size = int(size)
+        return cls(resource.get('name'), size, resource.get('md5Hash'),
+                   resource.get('crc32c'), resource.get('updated'))
+
+    @property
+    def updated(self):
+        """Retrieve the timestamp at which the object was updated.
+
+        Parsed on access, so that listings need not parse every timestamp.
+
+        :rtype: :class:`datetime.datetime` or ``NoneType``
+        :returns: Datetime object parsed from RFC3339 valid timestamp, or
+                  ``None`` if the property was not returned.
+        """
+        if self.updated_raw is not None:
+            naive = datetime.datetime.strptime(self.updated_raw,
+                                               _RFC3339_MICROS)
+            return naive.replace(tzinfo=UTC)
+
+
+class BlobReader(io.RawIOBase):
+    """Read-only, seekable file object reading a blob via ranged requests.
+
+    Each :meth:`readinto` issues a single ranged request for (at most) the
+    size of the buffer passed.  Wrap in :class:`io.BufferedReader` (as
+    :meth:`Blob.open_reader` does) for efficient small reads and lines.
+
+    If the blob's ``size`` or ``media_link`` is not known, its metadata is
+    reloaded when the reader is created.
+
+    If the server ignores the range and sends the whole object, it is kept
+    to serve all later reads, rather than being downloaded again for each.
+
+    :type blob: :class:`Blob`
+    :param blob: The blob to read.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: Optional. The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type num_retries: integer
+    :param num_retries: Number of retries for each request. Defaults to 6.
+
+    :raises: :class:`ValueError` if the blob has a ``content_encoding``:
+             byte ranges of its stored content do not match the (decoded)
+             content which may be served.
+    """
+
+    def __init__(self, blob, client=None, num_retries=6):
+        super(BlobReader, self).__init__()
+        client = blob._require_client(client)
+        if blob.size is None or blob.media_link is None:
+            blob.reload(client=client)
+        if blob.content_encoding:
+            raise ValueError(
+                'Cannot read %r by ranges:  its content is %s-encoded.' % (
+                    blob.name, blob.content_encoding))
+        self.blob = blob
+        # See ``Blob.download_to_file`` for why ``_connection`` is used.
+        self._connection = client._connection
+        self._num_retries = num_retries
+        self._size = blob.size
+        self._position = 0
+        # The whole content, if the server sent it instead of a range.
+        self._content = None
+
+    def _check_open(self):
+        """Raise if the reader has been closed."""
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+
+    def readable(self):
+        """The reader is readable.
+
+        :rtype: boolean
+        :returns: True.
+        """
+        return True
+
+    def seekable(self):
+        """The reader supports :meth:`seek`.
+
+        :rtype: boolean
+        :returns: True.
+        """
+        return True
+
+    def tell(self):
+        """Current position in the blob.
+
+        :rtype: integer
+        :returns: The offset of the next byte to be read.
+        """
+        self._check_open()
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change the position from which the next read starts.
+
+        No request is made until the next read.
+
+        :type offset: integer
+        :param offset: The offset, relative to ``whence``.
+
+        :type whence: integer
+        :param whence: One of ``os.SEEK_SET``, ``os.SEEK_CUR`` or
+                       ``os.SEEK_END``.
+
+        :rtype: integer
+        :returns: The new position.
+        :raises: :class:`ValueError` if ``whence`` is invalid or the new
+                 position is negative.
+        """
+        self._check_open()
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError('Invalid whence: %r' % (whence,))
+        if position < 0:
+            raise ValueError('Negative seek position: %d' % (position,))
+        self._position = position
+        return position
+
+    def readinto(self, buffer):
+        """Read bytes into a buffer with (at most) one ranged request.
+
+        :type buffer: writable buffer (e.g. ``bytearray``)
+        :param buffer: The buffer to fill.
+
+        :rtype: integer
+        :returns: The number of bytes read;  0 at the end of the blob.
+        :raises: :class:`ValueError` if the server sends no data before the
+                 end of the blob.
+        """
+        self._check_open()
+        length = min(len(buffer), self._size - self._position)
+        if length <= 0:
+            return 0
+        start, end = self._position, self._position + length
+        if self._content is None:
+            response = self.blob._request_range(
+                self._connection, start, end - 1,
+                num_retries=self._num_retries)
+            if response.status_code == http_client.OK:
+                self._content = response.content
+            else:
+                data = response.content
+        if self._content is not None:
+            data = self._content[start:end]
+        if not data:
+            raise ValueError('No data received at offset %d of %r.' % (
+                self._position, self.blob.name))
+        received = len(data)
+        buffer[:received] = data
+        self._position += received
+        return received
+
+    def readall(self):
+        """Read the rest of the blob, in a single ranged request if possible.
+
+        :rtype: bytes
+        :returns: The bytes from the current position to the end.
+        """
+        self._check_open()
+        remaining = self._size - self._position
+        if remaining <= 0:
+            return b''
+        buffer = bytearray(remaining)
+        view = memoryview(buffer)
+        filled = 0
+        while filled < remaining:
+            filled += self.readinto(view[filled:])
+        return bytes(buffer)
+
+
+class BlobWriter(io.RawIOBase):
+    """Write-only file object streaming into a blob via a resumable upload.
+
+    Written bytes are buffered until a whole chunk is available, which is
+    then sent;  :meth:`close` sends the remainder, along with the total
+    size, and completes the upload.  The upload session is only started
+    when the first chunk is sent.
+
+    :type blob: :class:`Blob`
+    :param blob: The blob to upload to.  Its changed properties (e.g.
+                 ``metadata``) are sent with the upload.
+
+    :type content_type: string or ``NoneType``
+    :param content_type: Optional type of content being uploaded.  Defaults
+                         to the blob's ``content_type``, or
+                         ``application/octet-stream``.
+
+    :type chunk_size: integer or ``NoneType``
+    :param chunk_size: Optional. The size of each chunk, which must be a
+                       multiple of 256 KB.  Defaults to the blob's
+                       ``adaptive_chunk_size`` (adapted as chunks are
+                       sent), its ``chunk_size``, or 8 MB.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: Optional. The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type num_retries: integer
+    :param num_retries: Number of retries for each request. Defaults to 6.
+
+    :type progress: a callable taking
+                    (:class:`gcloud.storage.stats.TransferProgress`), or
+                    ``NoneType``
+    :param progress: Optional. Called after each chunk is sent.
+
+    :raises: :class:`ValueError` if ``chunk_size`` is not a multiple of
+             256 KB.
+    """
+
+    def __init__(self, blob, content_type=None, chunk_size=None,
+                 client=None, num_retries=6, progress=None):
+        super(BlobWriter, self).__init__()
+        resize = None
+        if not chunk_size and blob.adaptive_chunk_size is not None:
+            chunk_size = blob.adaptive_chunk_size.chunk_size
+            resize = self._resize
+        chunk_size = chunk_size or blob.chunk_size or _DEFAULT_WRITE_SIZE
+        if chunk_size % blob._CHUNK_SIZE_MULTIPLE != 0:
+            raise ValueError('Chunk size must be a multiple of %d.' % (
+                blob._CHUNK_SIZE_MULTIPLE,))
+        client = blob._require_client(client)
+        self.blob = blob
+        self.content_type = (content_type or blob.content_type or
+                             'application/octet-stream')
+        self.chunk_size = chunk_size
+        # See ``Blob.download_to_file`` for why ``_connection`` is used.
+        self._connection = client._connection
+        self._metadata_cache = getattr(client, 'metadata_cache', None)
+        self._monitor = _transfer_monitor(blob, client, UPLOAD,
+                                          callback=progress, resize=resize)
+        self._num_retries = num_retries
+        self._buffer = bytearray()
+        self._offset = 0
+        self._stalled = 0
+        self._abandoned = False
+        self._checksums = _Checksums.for_upload()
+        self.upload_url = None
+
+    def __del__(self):
+        # Never complete an upload from the garbage collector, which would
+        # commit whatever happened to be written so far.
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self._abandoned = True
+        self.close()
+
+    def _check_open(self):
+        """Raise if the writer has been closed."""
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+
+    def _resize(self, chunk_size):
+        """Send chunks of a new size from now on.
+
+        :type chunk_size: integer
+        :param chunk_size: The new chunk size, a multiple of 256 KB.
+        """
+        self.chunk_size = chunk_size
+
+    def writable(self):
+        """The writer is writable.
+
+        :rtype: boolean
+        :returns: True.
+        """
+        return True
+
+    def tell(self):
+        """Number of bytes written so far.
+
+        :rtype: integer
+        :returns: The offset of the next byte to be written.
+        """
+        self._check_open()
+        return self._offset + len(self._buffer)
+
+    @property
+    def committed(self):
+        """Number of bytes the server has persisted.
+
+        :rtype: integer
+        :returns: The byte count acknowledged so far.
+        """
+        return self._offset
+
+    def resume(self, upload_url, total_bytes=None):
+        """Continue an existing upload session.
+
+        Asks the server how many bytes the session has persisted;  the
+        caller should then write the content from that offset onwards.
+
+        :type upload_url: string
+        :param upload_url: The session URL (see :attr:`upload_url`) of an
+                           upload started earlier, e.g. by another process.
+
+        :type total_bytes: integer or ``NoneType``
+        :param total_bytes: Optional. The total size of the upload, if known.
+
+        :rtype: integer or ``NoneType``
+        :returns: The number of bytes persisted, or ``None`` if the upload
+                  had already completed (the blob's properties are then
+                  set from the response).
+        :raises: :class:`apitools.base.py.exceptions.HttpError` if the
+                 session cannot be queried (e.g. it has expired).
+        """
+        self._check_open()
+        if total_bytes is None:
+            total_bytes = '*'
+        headers = {'Content-Range': 'bytes */%s' % (total_bytes,)}
+        request = http_wrapper.Request(upload_url, 'PUT', headers, b'')
+        response = http_wrapper.MakeRequest(self._connection.http, request,
+                                            retries=self._num_retries)
+        if response.status_code in (http_client.OK, http_client.CREATED):
+            self._set_blob_properties(response)
+            self.upload_url = upload_url
+            self._abandoned = True
+            self.close()
+            return None
+        if response.status_code != http_wrapper.RESUME_INCOMPLETE:
+            raise apitools_exceptions.HttpError.FromResponse(response)
+        del self._buffer[:]
+        self.upload_url = upload_url
+        self._offset = _committed_bytes(response)
+        # Bytes persisted earlier were not seen here, so cannot be checked.
+        self._checksums = None
+        return self._offset
+
+    def write(self, data):
+        """Buffer bytes, sending any whole chunks.
+
+        :type data: bytes-like
+        :param data: The bytes to write.
+
+        :rtype: integer
+        :returns: The number of bytes written (always all of ``data``).
+        """
+        self._check_open()
+        self._buffer.extend(data)
+        if self._checksums is not None:
+            self._checksums.update(data)
+        while len(self._buffer) >= self.chunk_size:
+            self._send(final=False)
+        return len(data)
+
+    def close(self):
+        """Send any buffered bytes and complete the upload.
+
+        Does nothing more than mark the writer closed if the upload was
+        abandoned.
+        """
+        if not self.closed and not self._abandoned:
+            self._send(final=True)
+        super(BlobWriter, self).close()
+
+    def _initiate(self):
+        """Start a resumable upload session, storing its URL."""
+        connection = self._connection
+        metadata = dict((key, self.blob._properties[key])
+                        for key in self.blob._changes)
+        metadata['contentType'] = self.content_type
+        headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json; charset=UTF-8',
+            'User-Agent': connection.USER_AGENT,
+            'X-Upload-Content-Type': self.content_type,
+        }
+        query_params = {'uploadType': 'resumable', 'name': self.blob.name}
+        upload_url = connection.build_api_url(
+            api_base_url=connection.API_BASE_URL + '/upload',
+            path=self.blob.bucket.path + '/o', query_params=query_params)
+        request = http_wrapper.Request(upload_url, 'POST', headers,
+                                       json.dumps(metadata))
+        response = http_wrapper.MakeRequest(connection.http, request,
+                                            retries=self._num_retries)
+        if response.status_code != http_client.OK:
+            raise apitools_exceptions.HttpError.FromResponse(response)
+        self.upload_url = response.info['location']
+
+    def _send(self, final):
+        """Send one chunk (or, if ``final``, everything buffered).
+
+        Bytes not acknowledged by the server stay buffered, to be sent
+        again with the next chunk;  a chunk of which the server persisted
+        nothing is sent again, up to ``num_retries`` times in a row.
+
+        :type final: boolean
+        :param final: If True, send the total size and complete the upload.
+
+        :raises: :class:`ValueError` if the server keeps persisting none of
+                 the bytes sent, or if the MD5 hash (or CRC32C checksum) the
+                 server reports for the completed upload does not match
+                 the bytes written.
+        """
+        if self.upload_url is None:
+            self._initiate()
+        if final:
+            body = bytes(self._buffer)
+        else:
+            body = bytes(self._buffer[:self.chunk_size])
+        end = self._offset + len(body)
+        if final:
+            total = str(end)
+        else:
+            total = '*'
+        if body:
+            content_range = 'bytes %d-%d/%s' % (self._offset, end - 1, total)
+        else:
+            content_range = 'bytes */%s' % (total,)
+        headers = {'Content-Range': content_range,
+                   'Content-Type': self.content_type}
+        request = http_wrapper.Request(self.upload_url, 'PUT', headers, body)
+        response = http_wrapper.MakeRequest(
+            self._monitor.http(self._connection.http), request,
+            retries=self._num_retries)
+
+        if response.status_code in (http_client.OK, http_client.CREATED):
+            del self._buffer[:]
+            self._offset = end
+            self._set_blob_properties(response)
+            if self._checksums is not None:
+                self._checksums.verify(self.blob.md5_hash, self.blob.crc32c,
+                                       self.blob.name)
+            self._monitor.finish()
+        elif response.status_code == http_wrapper.RESUME_INCOMPLETE:
+            committed = _committed_bytes(response)
+            if committed <= self._offset:
+                self._stalled += 1
+                if self._stalled > self._num_retries:
+                    raise ValueError('No bytes persisted uploading %r.' % (
+                        self.blob.name,))
+            else:
+                self._stalled = 0
+                del self._buffer[:committed - self._offset]
+                self._offset = committed
+            if final:
+                self._send(final=True)
+        else:
+            raise apitools_exceptions.HttpError.FromResponse(response)
+
+    def _set_blob_properties(self, response):
+        """Set the blob's properties from a completed upload's response.
+
+        :type response: :class:`apitools.base.py.http_wrapper.Response`
+        :param response: The final response of the upload.
+        """
+        content = response.content
+        if not isinstance(content,
+                          six.string_types):  # pragma: NO COVER  Python3
+            content = content.decode('utf-8')
+        self.blob._set_properties(json.loads(content))
+        if self._metadata_cache is not None:
+            self._metadata_cache.update(self.blob)
+
+
+def _load_session_state(path):
+    """Load a persisted upload session.
+
+    :type path: string
+    :param path: The state file.
+
+    :rtype: dict or ``NoneType``
+    :returns: The saved state, or ``None`` if the file is missing or
+              unreadable (e.g. truncated by a crash).
+    """
+    try:
+        with open(path) as file_obj:
+            return json.load(file_obj)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _save_session_state(path, state):
+    """Persist an upload session, atomically replacing any earlier state.
+
+    :type path: string
+    :param path: The state file.
+
+    :type state: dict
+    :param state: The session state.
+    """
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as file_obj:
+        json.dump(state, file_obj)
+    getattr(os, 'replace', os.rename)(temp_path, path)
+
+
+def _remove_stale_sessions(state_dir, max_age=_SESSION_MAX_AGE):
+    """Remove state files of sessions which the server has expired.
+
+    :type state_dir: string
+    :param state_dir: Directory holding session state files.
+
+    :type max_age: integer
+    :param max_age: Age, in seconds, after which a session is stale.
+    """
+    cutoff = time.time() - max_age
+    for name in os.listdir(state_dir):
+        if not name.endswith(_SESSION_STATE_SUFFIX):
+            continue
+        path = os.path.join(state_dir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:  # Removed concurrently.
+            pass
+
+
+def _committed_bytes(response):
+    """Number of bytes a resumable upload has persisted.
+
+    :type response: :class:`apitools.base.py.http_wrapper.Response`
+    :param response: A "308 Resume Incomplete" response.
+
+    :rtype: integer
+    :returns: The byte count, from the response's ``range`` header (no
+              header means nothing has been persisted).
+    """
+    range_header = response.info.get('range', response.info.get('Range'))
+    if range_header is None:
+        return 0
+    _, _, last = range_header.rpartition('-')
+    return int(last) + 1
+
+
+def _preallocate(file_obj, size):
+    """Reserve ``size`` bytes for a file, before writing at offsets.
+
+    :type file_obj: file
+    :param file_obj: A file handle open for writing.
+
+    :type size: integer
+    :param size: The final size of the file.
+    """
+    file_obj.flush()
+    fallocate = getattr(os, 'posix_fallocate', None)
+    if fallocate is not None:
+        try:
+            fallocate(file_obj.fileno(), 0, size)
+            return
+        except OSError:  # E.g. not supported by the filesystem.
+            pass
+    file_obj.truncate(size)
+
+
+def _write_at(file_obj, lock, data, offset):
+    """Write bytes at an offset of an unbuffered file.
+
+    Uses :func:`os.pwrite` where available, so that concurrent writers need
+    not share the file position; otherwise seeks and writes under ``lock``.
+
+    :type file_obj: file
+    :param file_obj: An unbuffered file handle open for writing.
+
+    :type lock: :class:`threading.Lock`
+    :param lock: Lock serializing seek / write pairs.
+
+    :type data: bytes
+    :param data: The bytes to write.
+
+    :type offset: integer
+    :param offset: The offset in the file of the first byte.
+    """
+    pwrite = getattr(os, 'pwrite', None)
+    view = memoryview(data)
+    if pwrite is None:
+        with lock:
+            file_obj.seek(offset)
+            while view:
+                view = view[file_obj.write(view):]
+        return
+    while view:
+        written = pwrite(file_obj.fileno(), view, offset)
+        view = view[written:]
+        offset += written
+
+
+class _WholeObjectSent(Exception):
+    """A ranged request was answered with the whole object.
+
+    :type content: bytes
+    :param content: The object's content.
+    """
+
+    def __init__(self, content):
+        super(_WholeObjectSent, self).__init__()
+        self.content = content
+
+
+class _BufferWriter(object):
+    """Writable stream filling a preallocated buffer in place.
+
+    :type buffer: writable object supporting the buffer protocol
+    :param buffer: The buffer to fill, from its start.
+
+    :raises: :class:`ValueError` if ``buffer`` is read-only.
+    """
+
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        if view.readonly:
+            raise ValueError('Buffer is read-only.')
+        if view.ndim != 1 or view.itemsize != 1:
+            view = view.cast('B')
+        self._view = view
+        self.position = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def write(self, data):
+        """Copy ``data`` into the buffer, after the bytes written so far.
+
+        :type data: bytes
+        :param data: The bytes to write.
+
+        :rtype: integer
+        :returns: The number of bytes written.
+        :raises: :class:`ValueError` if the buffer is full.
+        """
+        end = self.position + len(data)
+        if end > len(self._view):
+            raise ValueError('Received more than %d bytes.' % (
+                len(self._view),))
+        self._view[self.position:end] = data
+        self.position = end
+        return len(data)
+
+
+class _FileWindow(object):
+    """Read-only window of a file, readable as a stream.
+
+    Reads go through ordinary ``read`` calls, so a file truncated by
+    another process during an upload yields short reads (and an error)
+    rather than a crash:  see :class:`_MappedFile`.
+
+    :type filename: string
+    :param filename: The path to the file.
+
+    :type offset: integer
+    :param offset: The offset of the window in the file.
+
+    :type length: integer or ``NoneType``
+    :param length: The size of the window.  Defaults to the rest of the
+                   file.
+    """
+
+    def __init__(self, filename, offset=0, length=None):
+        self._file = open(filename, 'rb')
+        if length is None:
+            length = os.fstat(self._file.fileno()).st_size - offset
+        self._offset = offset
+        self._length = max(length, 0)
+        self._position = 0
+
+    def __len__(self):
+        return self._length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
+    def _read(self, start, end):
+        """Return the bytes in a range of the window.
+
+        :type start: integer
+        :param start: Offset of the first byte, within the window.
+
+        :type end: integer
+        :param end: Offset after the last byte, within the window.
+
+        :rtype: bytes
+        :returns: The bytes in the range (fewer, if the file has shrunk).
+        """
+        self._file.seek(self._offset + start)
+        return self._file.read(end - start)
+
+    def view(self, start=0, end=None):
+        """Return part of the window.
+
+        :type start: integer
+        :param start: Offset of the first byte, within the window.
+
+        :type end: integer or ``NoneType``
+        :param end: Offset after the last byte.  Defaults to the end.
+
+        :rtype: :class:`memoryview`
+        :returns: The bytes in the range.
+        """
+        if end is None or end > self._length:
+            end = self._length
+        return memoryview(self._read(start, max(start, end)))
+
+    def read(self, size=-1):
+        """Read bytes from the current position.
+
+        :type size: integer
+        :param size: The maximum number of bytes to read (all, if negative).
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        start = self._position
+        if size is None or size < 0:
+            end = self._length
+        else:
+            end = min(start + size, self._length)
+        end = max(start, end)
+        self._position = end
+        return self._read(start, end)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move the current position.
+
+        :type offset: integer
+        :param offset: The new position, relative to ``whence``.
+
+        :type whence: integer
+        :param whence: ``os.SEEK_SET``, ``os.SEEK_CUR`` or ``os.SEEK_END``.
+
+        :rtype: integer
+        :returns: The new position.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        if offset < 0:
+            raise ValueError('Negative seek position %d.' % (offset,))
+        self._position = offset
+        return offset
+
+    def tell(self):
+        """Return the current position.
+
+        :rtype: integer
+        :returns: The offset within the window.
+        """
+        return self._position
+
+
+class _MappedFile(_FileWindow):
+    """Read-only, memory-mapped window of a file, readable as a stream.
+
+    :meth:`read` copies out of the mapping with no ``read`` system calls,
+    and :meth:`view` exposes it without copying at all.
+
+    .. warning::
+
+       If another process truncates the file while it is mapped, touching
+       the missing pages kills this process with ``SIGBUS`` (there is no
+       exception to catch).  Only map files which are not modified while
+       they are uploaded.
+
+    :type filename: string
+    :param filename: The path to the file.
+
+    :type offset: integer
+    :param offset: The offset of the window in the file.
+
+    :type length: integer or ``NoneType``
+    :param length: The size of the window.  Defaults to the rest of the
+                   file.
+    """
+
+    def __init__(self, filename, offset=0, length=None):
+        # pylint: disable=super-init-not-called
+        with open(filename, 'rb') as file_obj:
+            if length is None:
+                length = os.fstat(file_obj.fileno()).st_size - offset
+            if length > 0:
+                # Mappings must start at a multiple of the granularity.
+                map_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
+                self._map = mmap.mmap(file_obj.fileno(),
+                                      offset + length - map_offset,
+                                      access=mmap.ACCESS_READ,
+                                      offset=map_offset)
+                self._start = offset - map_offset
+            else:
+                # Empty files (and windows) cannot be mapped.
+                self._map = b''
+                self._start = 0
+        self._length = max(length, 0)
+        self._position = 0
+
+    def close(self):
+        """Unmap the file."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def _read(self, start, end):
+        """Copy the bytes in a range of the window out of the mapping.
+
+        :type start: integer
+        :param start: Offset of the first byte, within the window.
+
+        :type end: integer
+        :param end: Offset after the last byte, within the window.
+
+        :rtype: bytes
+        :returns: The bytes in the range.
+        """
+        return self._map[self._start + start:self._start + end]
+
+    def view(self, start=0, end=None):
+        """Return part of the window, without copying it if possible.
+
+        Views must not be kept after the file is closed.
+
+        :type start: integer
+        :param start: Offset of the first byte, within the window.
+
+        :type end: integer or ``NoneType``
+        :param end: Offset after the last byte.  Defaults to the end.
+
+        :rtype: :class:`memoryview`
+        :returns: The bytes in the range.
+        """
+        if end is None or end > self._length:
+            end = self._length
+        start, end = self._start + start, self._start + end
+        if six.PY3:
+            return memoryview(self._map)[start:end]
+        else:  # pragma: NO COVER  Python2 mmaps lack the buffer interface.
+            return memoryview(self._map[start:end])
+
+
 class _UploadConfig(object):
     """Faux message FBO apitools' 'ConfigureRequest'.
 
@@ -16,18 +16,45 @@
 
 import datetime
 import copy
+import sys
+import threading
 
 import six
+from six.moves import queue  # pylint: disable=F0401
 
+from gcloud._helpers import _imap_unordered
 from gcloud._helpers import _RFC3339_MICROS
 from gcloud._helpers import UTC
+from gcloud.exceptions import GCloudError
+from gcloud.exceptions import make_exception
 from gcloud.exceptions import NotFound
 from gcloud.iterator import Iterator
 from gcloud.storage._helpers import _PropertyMixin
 from gcloud.storage._helpers import _scalar_property
 from gcloud.storage.acl import BucketACL
 from gcloud.storage.acl import DefaultObjectACL
+from gcloud.storage.acl import _BULK_MAX_WORKERS
+from gcloud.storage.acl import save_acls
+from gcloud.storage.batch import Batch
 from gcloud.storage.blob import Blob
+from gcloud.storage.blob import BlobSummary
+from gcloud.storage.cache import _active_cache
+
+
+_BATCH_MAX_WORKERS = 4
+"""Default number of batch requests submitted concurrently."""
+
+_REWRITE_MAX_WORKERS = 4
+"""Default number of concurrent rewrites in :meth:`Bucket.rewrite_blobs`."""
+
+_LIST_MAX_WORKERS = 8
+"""Default number of shards listed concurrently."""
+
+_LIST_PREFETCH_PAGES = 2
+"""Default number of pages fetched ahead of the consumer, per shard."""
+
+_SHARD_DONE = object()
+"""Marks the end of a shard's pages."""
 
 
 class _BlobIterator(Iterator):
@@ -71,6 +98,247 @@ class _BlobIterator(Iterator):
             yield blob
 
 
+class _BlobSummaryIterator(_BlobIterator):
+    """An iterator listing compact summaries of the blobs in a bucket.
+
+    You shouldn't have to use this directly, but instead should use the
+    :class:`gcloud.storage.blob.Bucket.list_blobs` method, passing
+    ``summary=True``.
+    """
+
+    def get_items_from_response(self, response):
+        """Yield :class:`.storage.blob.BlobSummary` items from response.
+
+        :type response: dict
+        :param response: The JSON API response for a page of blobs.
+        """
+        self._current_prefixes = tuple(response.get('prefixes', ()))
+        self.prefixes.update(self._current_prefixes)
+        from_api_repr = BlobSummary.from_api_repr
+        for item in response.get('items', ()):
+            yield from_api_repr(item)
+
+
+def _summary_fields(fields):
+    """Return the partial response selector for a summary listing.
+
+    :type fields: string or ``NoneType``
+    :param fields: The selector passed by the caller, if any.
+
+    :rtype: string
+    :returns: ``fields``, or a selector for just the summarized properties.
+    """
+    if fields is not None:
+        return fields
+    return BlobSummary._API_FIELDS + ',prefixes,nextPageToken'
+
+
+class _ShardedBlobIterator(object):
+    """An iterator listing key ranges ("shards") of a bucket concurrently.
+
+    You shouldn't have to use this directly, but instead should use the
+    :meth:`gcloud.storage.bucket.Bucket.list_blobs_parallel` method.
+
+    The shards are the ranges between consecutive split points.  If none
+    are given, they are discovered from the ``prefixes`` of a listing with
+    ``shard_delimiter``:  e.g. a bucket holding ``a/...``, ``b/...`` and
+    ``c/...`` is listed as the ranges before ``a/``, from ``a/`` to
+    ``b/``, from ``b/`` to ``c/`` and after ``c/``.
+
+    Each shard is listed by a worker thread, which fetches up to
+    ``prefetch`` pages ahead of the consumer.
+
+    :type bucket: :class:`gcloud.storage.bucket.Bucket`
+    :param bucket: The bucket from which to list blobs.
+
+    :type extra_params: dict
+    :param extra_params: Query string parameters for each shard's listing.
+
+    :type split_points: list of string or ``NoneType``
+    :param split_points: Blob names at which to split the listing.
+
+    :type shard_delimiter: string
+    :param shard_delimiter: Delimiter used to discover split points, if
+                            ``split_points`` is not passed.
+
+    :type ordered: boolean
+    :param ordered: If True, yield blobs in name order;  otherwise, in
+                    the order in which pages arrive.
+
+    :type max_workers: integer
+    :param max_workers: Maximum number of shards listed concurrently.
+
+    :type prefetch: integer
+    :param prefetch: Maximum number of pages fetched ahead, per shard.
+
+    :type client: :class:`gcloud.storage.client.Client`
+    :param client: Optional. The client to use for making connections.
+                   Defaults to the bucket's client.
+
+    :type iterator_class: type
+    :param iterator_class: The :class:`_BlobIterator` (sub)class listing
+                           each shard.
+    """
+
+    def __init__(self, bucket, extra_params, split_points=None,
+                 shard_delimiter='/', ordered=True,
+                 max_workers=_LIST_MAX_WORKERS,
+                 prefetch=_LIST_PREFETCH_PAGES, client=None,
+                 iterator_class=_BlobIterator):
+        self.bucket = bucket
+        self.extra_params = extra_params
+        self.split_points = split_points
+        self.shard_delimiter = shard_delimiter
+        self.ordered = ordered
+        self.max_workers = max(max_workers, 1)
+        self.prefetch = max(prefetch, 1)
+        self.client = client
+        self.iterator_class = iterator_class
+        self.prefixes = set()
+
+    def _discover_split_points(self):
+        """List the top-level prefixes, to be used as split points.
+
+        :rtype: list of string
+        :returns: The sorted prefixes.
+        """
+        params = {'delimiter': self.shard_delimiter,
+                  'fields': 'prefixes,nextPageToken'}
+        if 'prefix' in self.extra_params:
+            params['prefix'] = self.extra_params['prefix']
+        iterator = _BlobIterator(self.bucket, extra_params=params,
+                                 client=self.client)
+        for _ in iterator:
+            pass
+        return sorted(iterator.prefixes)
+
+    def _shard_params(self):
+        """Build the query parameters for each shard's listing.
+
+        :rtype: list of dict
+        :returns: The parameters, in name order of the shards.
+        """
+        split_points = self.split_points
+        if split_points is None:
+            split_points = self._discover_split_points()
+        bounds = [None] + sorted(set(split_points)) + [None]
+        shards = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            params = dict(self.extra_params)
+            if start is not None:
+                params['startOffset'] = start
+            if end is not None:
+                params['endOffset'] = end
+            shards.append(params)
+        return shards
+
+    def _list_shards(self, shards, output_for, stopped):
+        """Worker:  list shards from ``shards``, queueing their pages.
+
+        :type shards: :class:`six.moves.queue.Queue`
+        :param shards: ``(index, params)`` pairs, then ``None``.
+
+        :type output_for: callable
+        :param output_for: Maps a shard index to the queue for its pages.
+
+        :type stopped: :class:`threading.Event`
+        :param stopped: Set when the consumer has gone away.
+        """
+        def _put(output, item):
+            """Queue ``item``, giving up if the consumer goes away."""
+            while not stopped.is_set():
+                try:
+                    output.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        while True:
+            task = shards.get()
+            if task is None:
+                return
+            index, params = task
+            output = output_for(index)
+            iterator = self.iterator_class(self.bucket, extra_params=params,
+                                           client=self.client)
+            try:
+                while iterator.has_next_page():
+                    response = iterator.get_next_page_response()
+                    blobs = list(iterator.get_items_from_response(response))
+                    page = (index, blobs, iterator._current_prefixes)
+                    if not _put(output, page):
+                        return
+            except Exception:  # pylint: disable=broad-except
+                _put(output, (index, None, sys.exc_info()))
+                return
+            if not _put(output, (index, _SHARD_DONE, None)):
+                return
+
+    def __iter__(self):
+        """Iterate through the blobs of all shards."""
+        shard_params = self._shard_params()
+        shards = queue.Queue()
+        for task in enumerate(shard_params):
+            shards.put(task)
+        num_workers = min(self.max_workers, len(shard_params))
+        for _ in range(num_workers):
+            shards.put(None)
+
+        if self.ordered:
+            outputs = [queue.Queue(self.prefetch) for _ in shard_params]
+            output_for = outputs.__getitem__
+        else:
+            shared = queue.Queue(self.prefetch * num_workers)
+            outputs = [shared] * len(shard_params)
+
+            def output_for(index):  # pylint: disable=unused-argument
+                """All shards share a single output queue."""
+                return shared
+
+        stopped = threading.Event()
+        for _ in range(num_workers):
+            worker = threading.Thread(target=self._list_shards,
+                                      args=(shards, output_for, stopped))
+            worker.daemon = True
+            worker.start()
+
+        try:
+            if self.ordered:
+                for output in outputs:
+                    for blob in self._drain(output, 1):
+                        yield blob
+            else:
+                for blob in self._drain(shared, len(shard_params)):
+                    yield blob
+        finally:
+            stopped.set()
+
+    def _drain(self, output, num_shards):
+        """Yield the blobs queued by workers, until shards are done.
+
+        :type output: :class:`six.moves.queue.Queue`
+        :param output: The queue of pages.
+
+        :type num_shards: integer
+        :param num_shards: The number of shards queueing to ``output``.
+
+        :rtype: generator
+        :returns: The blobs, page by page.
+        :raises: The first exception raised by a worker.
+        """
+        while num_shards:
+            _, blobs, extra = output.get()
+            if blobs is _SHARD_DONE:
+                num_shards -= 1
+            elif blobs is None:
+                six.reraise(*extra)
+            else:
+                self.prefixes.update(extra)
+                for blob in blobs:
+                    yield blob
+
+
 class Bucket(_PropertyMixin):
     """A class representing a Bucket on Cloud Storage.
 
@@ -222,12 +490,19 @@ class Bucket(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        If the client has a metadata cache, it is consulted (and filled)
+        first.
+
         :rtype: :class:`gcloud.storage.blob.Blob` or None
         :returns: The blob object if it exists, otherwise None.
         """
         client = self._require_client(client)
         blob = Blob(bucket=self, name=blob_name)
+        cache = _active_cache(client)
         try:
+            if cache is not None:
+                blob._set_properties(cache.fetch(blob, client))
+                return blob
             response = client.connection.api_request(
                 method='GET', path=blob.path, _target_object=blob)
             # NOTE: We assume response.get('name') matches `blob_name`.
@@ -241,7 +516,8 @@ class Bucket(_PropertyMixin):
 
     def list_blobs(self, max_results=None, page_token=None, prefix=None,
                    delimiter=None, versions=None,
-                   projection='noAcl', fields=None, client=None):
+                   projection='noAcl', fields=None, client=None,
+                   summary=False):
         """Return an iterator used to find blobs in the bucket.
 
         :type max_results: integer or ``NoneType``
@@ -277,6 +553,12 @@ class Bucket(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type summary: boolean
+        :param summary: If True, yield a compact, read-only
+                        :class:`gcloud.storage.blob.BlobSummary` per blob
+                        instead of a full Blob, and (unless ``fields`` is
+                        passed) request only the summarized properties.
+
         :rtype: :class:`_BlobIterator`.
         :returns: An iterator of blobs.
         """
@@ -296,10 +578,15 @@ class Bucket(_PropertyMixin):
 
         extra_params['projection'] = projection
 
+        iterator_class = self._iterator_class
+        if summary:
+            fields = _summary_fields(fields)
+            iterator_class = _BlobSummaryIterator
+
         if fields is not None:
             extra_params['fields'] = fields
 
-        result = self._iterator_class(
+        result = iterator_class(
             self, extra_params=extra_params, client=client)
         # Page token must be handled specially since the base `Iterator`
         # class has it as a reserved property.
@@ -307,6 +594,97 @@ class Bucket(_PropertyMixin):
             result.next_page_token = page_token
         return result
 
+    def list_blobs_parallel(self, prefix=None, split_points=None,
+                            shard_delimiter='/', delimiter=None,
+                            versions=None, projection='noAcl', fields=None,
+                            ordered=True, max_workers=_LIST_MAX_WORKERS,
+                            prefetch=_LIST_PREFETCH_PAGES, client=None,
+                            summary=False):
+        """Return an iterator listing ranges of the bucket concurrently.
+
+        Unlike :meth:`list_blobs`, which follows a single chain of page
+        tokens, the bucket (or ``prefix``) is split into key ranges at
+        ``split_points``, which are listed concurrently.  If no split points
+        are passed, the prefixes found with ``shard_delimiter`` are used;
+        e.g. for a bucket laid out as ``<customer>/<date>/<file>``, each
+        customer is listed separately::
+
+          >>> for blob in bucket.list_blobs_parallel(ordered=False):
+          ...     print(blob.name)
+
+        :type prefix: string or ``NoneType``
+        :param prefix: optional prefix used to filter blobs.
+
+        :type split_points: list of string or ``NoneType``
+        :param split_points: optional blob names at which to split the
+                             listing, e.g. ``['m', 't']`` for the three
+                             ranges before ``m``, from ``m`` to ``t`` and
+                             from ``t`` on.
+
+        :type shard_delimiter: string
+        :param shard_delimiter: Delimiter whose prefixes are used as split
+                                points if ``split_points`` is not passed.
+
+        :type delimiter: string or ``NoneType``
+        :param delimiter: optional delimiter, used with ``prefix`` to
+                          emulate hierarchy.  The ``prefixes`` found in
+                          every range are aggregated on the iterator.
+
+        :type versions: boolean or ``NoneType``
+        :param versions: whether object versions should be returned as
+                         separate blobs.
+
+        :type projection: string or ``NoneType``
+        :param projection: If used, must be 'full' or 'noAcl'. Defaults to
+                           'noAcl'. Specifies the set of properties to return.
+
+        :type fields: string or ``NoneType``
+        :param fields: Selector specifying which fields to include in a
+                       partial response.  Must include ``nextPageToken``.
+
+        :type ordered: boolean
+        :param ordered: If True (the default), yield blobs in name order.
+                        Otherwise, yield them as pages arrive, which is
+                        faster when some ranges are much larger than others.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of ranges listed concurrently.
+
+        :type prefetch: integer
+        :param prefetch: Maximum number of pages fetched ahead of the
+                         consumer, per range.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type summary: boolean
+        :param summary: If True, yield compact
+                        :class:`gcloud.storage.blob.BlobSummary` records,
+                        as for :meth:`list_blobs`.
+
+        :rtype: :class:`_ShardedBlobIterator`
+        :returns: An iterator of blobs.
+        """
+        iterator_class = _BlobIterator
+        if summary:
+            fields = _summary_fields(fields)
+            iterator_class = _BlobSummaryIterator
+        extra_params = {'projection': projection}
+        if prefix is not None:
+            extra_params['prefix'] = prefix
+        if delimiter is not None:
+            extra_params['delimiter'] = delimiter
+        if versions is not None:
+            extra_params['versions'] = versions
+        if fields is not None:
+            extra_params['fields'] = fields
+        return _ShardedBlobIterator(
+            self, extra_params, split_points=split_points,
+            shard_delimiter=shard_delimiter, ordered=ordered,
+            max_workers=max_workers, prefetch=prefetch, client=client,
+            iterator_class=iterator_class)
+
     def delete(self, force=False, client=None):
         """Delete this bucket.
 
@@ -321,7 +699,8 @@ class Bucket(_PropertyMixin):
         If ``force=True`` and the bucket contains more than 256 objects / blobs
         this will cowardly refuse to delete the objects (or the bucket). This
         is to prevent accidental bucket deletion and to prevent extremely long
-        runtime of this method.
+        runtime of this method.  The objects are deleted in batch requests
+        via :meth:`delete_blobs`.
 
         :type force: boolean
         :param force: If True, empties the bucket's objects then deletes it.
@@ -391,6 +770,7 @@ class Bucket(_PropertyMixin):
                  >>> bucket.delete_blobs([blob], on_error=lambda blob: None)
         """
         client = self._require_client(client)
+        _invalidate_cached(client, self.name, blob_name)
         blob_path = Blob.path_helper(self.path, blob_name)
         # We intentionally pass `_target_object=None` since a DELETE
         # request has no response value (whether in a standard request or
@@ -398,13 +778,20 @@ class Bucket(_PropertyMixin):
         client.connection.api_request(method='DELETE', path=blob_path,
                                       _target_object=None)
 
-    def delete_blobs(self, blobs, on_error=None, client=None):
+    def delete_blobs(self, blobs, on_error=None, client=None,
+                     max_workers=_BATCH_MAX_WORKERS):
         """Deletes a list of blobs from the current bucket.
 
-        Uses :func:`Bucket.delete_blob` to delete each individual blob.
+        The deletes are grouped into batch requests of up to
+        ``Batch._MAX_BATCH_SIZE`` blobs, up to ``max_workers`` of which are
+        submitted concurrently.  ``blobs`` is consumed lazily, so it may be
+        e.g. the iterator returned by :meth:`list_blobs`.
 
-        :type blobs: list of string or :class:`gcloud.storage.blob.Blob`
-        :param blobs: A list of blob names or Blob objects to delete.
+        If a batch is already active on the client, the deletes are instead
+        deferred into that batch, one per blob.
+
+        :type blobs: iterable of string or :class:`gcloud.storage.blob.Blob`
+        :param blobs: Blob names or Blob objects to delete.
 
         :type on_error: a callable taking (blob)
         :param on_error: If not ``None``, called once for each blob raising
@@ -415,20 +802,72 @@ class Bucket(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent batch requests.
+
         :raises: :class:`gcloud.exceptions.NotFound` (if
-                 `on_error` is not passed).
+                 `on_error` is not passed), or the error for the first
+                 blob failing with any other status.
         """
-        for blob in blobs:
-            try:
-                blob_name = blob
-                if not isinstance(blob_name, six.string_types):
-                    blob_name = blob.name
-                self.delete_blob(blob_name, client=client)
-            except NotFound:
-                if on_error is not None:
+        client = self._require_client(client)
+        if client.current_batch is not None:
+            for blob in blobs:
+                self._delete_blob_or_report(blob, on_error, client)
+            return
+
+        def _delete_chunk(chunk):
+            """Delete one chunk of blobs, returning the response parts."""
+            if len(chunk) == 1:
+                # Not worth the multipart overhead.
+                self._delete_blob_or_report(chunk[0], on_error, client)
+                return chunk, None
+            batch = Batch(client)
+            for blob in chunk:
+                _invalidate_cached(client, self.name, _blob_name(blob))
+                batch.api_request(method='DELETE',
+                                  path=Blob.path_helper(
+                                      self.path, _blob_name(blob)),
+                                  _target_object=None)
+            return chunk, batch._submit()
+
+        chunks = _iter_chunks(blobs, Batch._MAX_BATCH_SIZE)
+        for chunk, responses in _imap_unordered(_delete_chunk, chunks,
+                                                max_workers):
+            if responses is None:
+                continue
+            if len(responses) != len(chunk):
+                raise ValueError('Expected a response for every request.')
+            for blob, (headers, payload) in zip(chunk, responses):
+                if 200 <= int(headers.status) < 300:
+                    continue
+                error = make_exception(headers, payload or {})
+                if isinstance(error, NotFound) and on_error is not None:
                     on_error(blob)
                 else:
-                    raise
+                    raise error
+
+    def _delete_blob_or_report(self, blob, on_error, client):
+        """Delete a single blob, passing it to ``on_error`` if not found.
+
+        :type blob: string or :class:`gcloud.storage.blob.Blob`
+        :param blob: A blob name or Blob object.
+
+        :type on_error: a callable taking (blob) or ``NoneType``
+        :param on_error: Called if the blob is not found.
+
+        :type client: :class:`gcloud.storage.client.Client`
+        :param client: The client to use.
+
+        :raises: :class:`gcloud.exceptions.NotFound` (if
+                 `on_error` is not passed).
+        """
+        try:
+            self.delete_blob(_blob_name(blob), client=client)
+        except NotFound:
+            if on_error is not None:
+                on_error(blob)
+            else:
+                raise
 
     def copy_blob(self, blob, destination_bucket, new_name=None,
                   client=None):
@@ -459,6 +898,132 @@ class Bucket(_PropertyMixin):
         copy_result = client.connection.api_request(
             method='POST', path=api_path, _target_object=new_blob)
         new_blob._set_properties(copy_result)
+        new_blob._update_cache(client)
+        return new_blob
+
+    def rewrite_blob(self, blob, destination_bucket, new_name=None,
+                     client=None, progress=None, max_bytes_per_call=None):
+        """Copy the given blob to the given bucket with the rewrite API.
+
+        Unlike :meth:`copy_blob`, large objects (e.g. copied to another
+        location or storage class) are copied over several requests, none
+        of which blocks for long.
+
+        :type blob: :class:`gcloud.storage.blob.Blob`
+        :param blob: The blob to be copied.
+
+        :type destination_bucket: :class:`gcloud.storage.bucket.Bucket`
+        :param destination_bucket: The bucket into which the blob should be
+                                   copied.
+
+        :type new_name: string
+        :param new_name: (optional) the new name for the copied file.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type progress: a callable taking (new_blob, bytes_rewritten,
+                        total_bytes), or ``NoneType``
+        :param progress: Optional. Called after each request.
+
+        :type max_bytes_per_call: integer or ``NoneType``
+        :param max_bytes_per_call: Optional. The most bytes to rewrite per
+                                   request (a multiple of 1 MB).
+
+        :rtype: :class:`gcloud.storage.blob.Blob`
+        :returns: The new Blob.
+        """
+        client = self._require_client(client)
+        if new_name is None:
+            new_name = blob.name
+        new_blob = Blob(bucket=destination_bucket, name=new_name)
+        token = None
+        while True:
+            token, rewritten, size = new_blob.rewrite(
+                blob, token=token, client=client,
+                max_bytes_per_call=max_bytes_per_call)
+            if progress is not None:
+                progress(new_blob, rewritten, size)
+            if token is None:
+                return new_blob
+
+    def rewrite_blobs(self, blobs, destination_bucket, client=None,
+                      progress=None, max_bytes_per_call=None,
+                      max_workers=_REWRITE_MAX_WORKERS):
+        """Copy blobs to the given bucket, running several rewrites at once.
+
+        :type blobs: iterable of :class:`gcloud.storage.blob.Blob`, or of
+                     (blob, new_name) tuples
+        :param blobs: The blobs to be copied, keeping their names unless
+                      paired with a new one.
+
+        :type destination_bucket: :class:`gcloud.storage.bucket.Bucket`
+        :param destination_bucket: The bucket into which the blobs should be
+                                   copied.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type progress: a callable taking (new_blob, bytes_rewritten,
+                        total_bytes), or ``NoneType``
+        :param progress: Optional. Called after each request, from the
+                         thread making it.
+
+        :type max_bytes_per_call: integer or ``NoneType``
+        :param max_bytes_per_call: Optional. The most bytes to rewrite per
+                                   request (a multiple of 1 MB).
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent rewrites.
+
+        :rtype: list of :class:`gcloud.storage.blob.Blob`
+        :returns: The new Blobs, in the order of ``blobs``.
+        :raises: the first error raised by any rewrite.
+        """
+        client = self._require_client(client)
+
+        def _rewrite(indexed):
+            """Run one rewrite to completion."""
+            index, item = indexed
+            if isinstance(item, tuple):
+                blob, new_name = item
+            else:
+                blob, new_name = item, None
+            return index, self.rewrite_blob(
+                blob, destination_bucket, new_name=new_name, client=client,
+                progress=progress, max_bytes_per_call=max_bytes_per_call)
+
+        new_blobs = dict(_imap_unordered(_rewrite, enumerate(blobs),
+                                         max_workers))
+        return [new_blobs[index] for index in range(len(new_blobs))]
+
+    def compose_blob(self, sources, new_name, content_type=None,
+                     client=None):
+        """Concatenate blobs in this bucket into a new blob.
+
+        :type sources: list of string or :class:`gcloud.storage.blob.Blob`
+        :param sources: Names of, or blobs for, the objects to concatenate
+                        (at most 32).
+
+        :type new_name: string
+        :param new_name: The name of the composed blob.
+
+        :type content_type: string or ``NoneType``
+        :param content_type: Optional type of the composed content.
+
+        :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :rtype: :class:`gcloud.storage.blob.Blob`
+        :returns: The new Blob.
+        """
+        new_blob = Blob(bucket=self, name=new_name)
+        if content_type is not None:
+            new_blob.content_type = content_type
+        new_blob.compose(sources, client=client)
         return new_blob
 
     def rename_blob(self, blob, new_name, client=None):
@@ -467,6 +1032,11 @@ class Bucket(_PropertyMixin):
         Effectively, copies blob to the same bucket with a new name, then
         deletes the blob.
 
+        The copy is made with :meth:`rewrite_blob`, so renaming a large
+        object takes several short requests rather than one long one.
+        (In a batch, which cannot follow rewrite tokens, it is made with
+        :meth:`copy_blob`.)
+
         .. warning::
 
           This method will first duplicate the data and then delete the
@@ -486,7 +1056,11 @@ class Bucket(_PropertyMixin):
         :rtype: :class:`Blob`
         :returns: The newly-renamed blob.
         """
-        new_blob = self.copy_blob(blob, self, new_name, client=client)
+        client = self._require_client(client)
+        if client.current_batch is not None:
+            new_blob = self.copy_blob(blob, self, new_name, client=client)
+        else:
+            new_blob = self.rewrite_blob(blob, self, new_name, client=client)
         blob.delete(client=client)
         return new_blob
 
@@ -763,12 +1337,16 @@ class Bucket(_PropertyMixin):
         """
         return self.configure_website(None, None)
 
-    def make_public(self, recursive=False, future=False, client=None):
+    def make_public(self, recursive=False, future=False, client=None,
+                    on_error=None, max_workers=_BULK_MAX_WORKERS):
         """Make a bucket public.
 
-        If ``recursive=True`` and the bucket contains more than 256
-        objects / blobs this will cowardly refuse to make the objects public.
-        This is to prevent extremely long runtime of this method.
+        If ``recursive=True``, the ACL of every blob is updated too:  the
+        blobs are listed (with their ACLs) page by page, and their ACLs
+        saved with batched requests, up to ``max_workers`` of which are
+        sent concurrently (see :func:`gcloud.storage.acl.save_acls`).
+        ACLs missing from the listing (which the API omits for objects the
+        caller does not own) are reloaded first.
 
         :type recursive: boolean
         :param recursive: If True, this will make all blobs inside the bucket
@@ -781,6 +1359,15 @@ class Bucket(_PropertyMixin):
         :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
+
+        :type on_error: a callable taking (acl), or ``NoneType``
+        :param on_error: If not ``None``, called for each blob ACL failing to
+                         reload or save (``acl.blob`` is the blob);
+                         otherwise, the first failure is raised.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent batch requests
+                            when ``recursive``.
         """
         self.acl.all().grant_read()
         self.acl.save(client=client)
@@ -793,19 +1380,98 @@ class Bucket(_PropertyMixin):
             doa.save(client=client)
 
         if recursive:
-            blobs = list(self.list_blobs(
-                projection='full',
-                max_results=self._MAX_OBJECTS_FOR_ITERATION + 1,
-                client=client))
-            if len(blobs) > self._MAX_OBJECTS_FOR_ITERATION:
-                message = (
-                    'Refusing to make public recursively with more than '
-                    '%d objects. If you actually want to make every object '
-                    'in this bucket public, please do it on the objects '
-                    'yourself.'
-                ) % (self._MAX_OBJECTS_FOR_ITERATION,)
-                raise ValueError(message)
+            blobs = self.list_blobs(projection='full', client=client)
+            save_acls(_public_acls(blobs, client, on_error),
+                      client=client, on_error=on_error,
+                      max_workers=max_workers)
 
-            for blob in blobs:
-                blob.acl.all().grant_read()
-                blob.acl.save(client=client)
+
+def _public_acls(blobs, client, on_error):
+    """Yield the ACL of each blob, granting read access to all users.
+
+    Saving an ACL replaces it whole, so an ACL missing from a blob's
+    listed resource is reloaded rather than taken as empty.
+
+    :type blobs: iterable of :class:`gcloud.storage.blob.Blob`
+    :param blobs: Blobs listed with ``projection=full``, whose ``acl``
+                  property holds their current ACL (if the caller owns
+                  them).
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: The client to reload ACLs with.
+
+    :type on_error: a callable taking (acl), or ``NoneType``
+    :param on_error: If not ``None``, called for each ACL failing to
+                     reload, which is then skipped;  otherwise, the
+                     failure is raised.
+
+    :rtype: iterator of :class:`gcloud.storage.acl.ObjectACL`
+    :returns: The updated (but unsaved) ACLs.
+    """
+    for blob in blobs:
+        acl = blob.acl
+        if 'acl' in blob._properties:
+            acl._load_entries(blob._properties['acl'])
+        else:
+            try:
+                acl.reload(client=client)
+            except GCloudError:
+                if on_error is None:
+                    raise
+                on_error(acl)
+                continue
+        acl.all().grant_read()
+        yield acl
+
+
+def _blob_name(blob):
+    """Return the name of a blob passed as a name or a Blob object.
+
+    :type blob: string or :class:`gcloud.storage.blob.Blob`
+    :param blob: A blob name or Blob object.
+
+    :rtype: string
+    :returns: The blob's name.
+    """
+    if isinstance(blob, six.string_types):
+        return blob
+    return blob.name
+
+
+def _invalidate_cached(client, bucket_name, blob_name):
+    """Drop a blob from the client's metadata cache, if any.
+
+    :type client: :class:`gcloud.storage.client.Client`
+    :param client: The client whose cache to update.
+
+    :type bucket_name: string
+    :param bucket_name: The name of the blob's bucket.
+
+    :type blob_name: string
+    :param blob_name: The name of the blob.
+    """
+    cache = getattr(client, 'metadata_cache', None)
+    if cache is not None:
+        cache.invalidate(bucket_name, blob_name)
+
+
+def _iter_chunks(items, size):
+    """Group the items of an iterable into lists of at most ``size``.
+
+    :type items: iterable
+    :param items: The items to group;  consumed lazily.
+
+    :type size: integer
+    :param size: The maximum length of each group.
+
+    :rtype: generator
+    :returns: Lists of consecutive items.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,268 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of blob metadata, revalidated by generation.
+
+For example::
+
+  >>> from gcloud import storage
+  >>> from gcloud.storage.cache import BlobMetadataCache
+  >>> client = storage.Client(metadata_cache=BlobMetadataCache(ttl=30))
+  >>> bucket = client.get_bucket('my-bucket')
+  >>> blob = bucket.get_blob('my-file.txt')  # Fetched.
+  >>> blob = bucket.get_blob('my-file.txt')  # Served from the cache.
+
+Once an entry is older than ``ttl`` it is revalidated with a conditional
+request, which costs a ``304 Not Modified`` (and no payload) if the
+object's generation and metageneration are unchanged.  Patching,
+uploading, composing and deleting a blob through the client update or
+drop its entry;  changes made by other clients are only noticed once the
+entry goes stale.
+"""
+
+import collections
+import copy
+import threading
+import time
+
+from gcloud.exceptions import NotFound
+from gcloud.exceptions import NotModified
+from gcloud.exceptions import PreconditionFailed
+
+
+_now = time.time
+
+
+class BlobMetadataCache(object):
+    """Least-recently-used cache of blob resources, keyed by name.
+
+    Safe to share between threads.
+
+    :type max_entries: integer
+    :param max_entries: The maximum number of blobs to hold;  the least
+                        recently used entries are evicted beyond it.
+
+    :type ttl: float
+    :param ttl: Seconds for which an entry is served without revalidation.
+
+    :raises: :class:`ValueError` if ``max_entries`` is not positive or
+             ``ttl`` is negative.
+    """
+
+    def __init__(self, max_entries=1024, ttl=60.0):
+        if max_entries < 1:
+            raise ValueError('max_entries must be positive.')
+        if ttl < 0:
+            raise ValueError('ttl must not be negative.')
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        # Entries are ``[resource, fetched_at, last_used]``;  ``_used``
+        # holds ``(last_used, key)`` in order of use, including stale
+        # pairs for keys used again since (skipped when evicting).
+        self._entries = {}
+        self._used = collections.deque()
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _touch(self, key, entry):
+        """Mark an entry as the most recently used.
+
+        Must be called with ``_lock`` held.
+
+        :type key: tuple
+        :param key: The (bucket name, blob name) of the entry.
+
+        :type entry: list
+        :param entry: The entry stored for ``key``.
+        """
+        self._clock += 1
+        entry[2] = self._clock
+        self._used.append((self._clock, key))
+        if len(self._used) > 2 * len(self._entries) + 16:
+            # Drop the stale pairs left behind by repeated use.
+            self._used = collections.deque(
+                (used, key) for used, key in self._used
+                if key in self._entries and self._entries[key][2] == used)
+
+    def _lookup(self, key):
+        """Return the entry for ``key``, marking it most recently used.
+
+        Counts the lookup as a hit, revalidation or miss.
+
+        :type key: tuple
+        :param key: The (bucket name, blob name) of the entry.
+
+        :rtype: tuple
+        :returns: ``(resource, fresh)``:  the cached resource (``None`` if
+                  not cached) and whether it may be served as is.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._touch(key, entry)
+            if _now() - entry[1] < self.ttl:
+                self.hits += 1
+                return entry[0], True
+            self.revalidations += 1
+            return entry[0], False
+
+    def _store(self, key, resource):
+        """Cache ``resource`` for ``key`` as freshly fetched.
+
+        :type key: tuple
+        :param key: The (bucket name, blob name) of the entry.
+
+        :type resource: dict
+        :param resource: The blob's resource, as returned by the API.
+        """
+        with self._lock:
+            entry = self._entries[key] = [copy.deepcopy(resource), _now(), 0]
+            self._touch(key, entry)
+            while len(self._entries) > self.max_entries:
+                used, oldest = self._used.popleft()
+                entry = self._entries.get(oldest)
+                if entry is not None and entry[2] == used:
+                    del self._entries[oldest]
+
+    def invalidate(self, bucket_name, blob_name):
+        """Drop the entry for a blob, if any.
+
+        :type bucket_name: string
+        :param bucket_name: The name of the blob's bucket.
+
+        :type blob_name: string
+        :param blob_name: The name of the blob.
+        """
+        with self._lock:
+            self._entries.pop((bucket_name, blob_name), None)
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._used.clear()
+
+    def update(self, blob):
+        """Record a blob's properties, as just returned by the API.
+
+        Entries are only kept for complete resources:  if the properties
+        lack a generation (e.g. they are a batch's pending response), the
+        blob's entry is dropped instead.
+
+        :type blob: :class:`gcloud.storage.blob.Blob`
+        :param blob: The blob whose properties were updated.
+        """
+        properties = blob._properties
+        if (isinstance(properties, dict) and
+                properties.get('generation') is not None and
+                properties.get('metageneration') is not None):
+            self._store((blob.bucket.name, blob.name), properties)
+        else:
+            self.invalidate(blob.bucket.name, blob.name)
+
+    def fetch(self, blob, client):
+        """Return a blob's resource, from the cache if possible.
+
+        A fresh entry is returned as is;  a stale one is revalidated with
+        ``ifGenerationMatch`` / ``ifMetagenerationNotMatch``, so that an
+        unchanged object is answered with ``304 Not Modified``.
+
+        :type blob: :class:`gcloud.storage.blob.Blob`
+        :param blob: The blob to fetch.
+
+        :type client: :class:`gcloud.storage.client.Client`
+        :param client: The client to use for any request.
+
+        :rtype: dict
+        :returns: A copy of the blob's resource (``projection=noAcl``).
+        :raises: :class:`gcloud.exceptions.NotFound` (dropping any entry).
+        """
+        key = (blob.bucket.name, blob.name)
+        cached, fresh = self._lookup(key)
+        if fresh:
+            return copy.deepcopy(cached)
+
+        query_params = {'projection': 'noAcl'}
+        try:
+            if cached is None:
+                resource = client.connection.api_request(
+                    method='GET', path=blob.path, query_params=query_params)
+            else:
+                resource = self._revalidate(blob, client, cached,
+                                            query_params)
+        except NotFound:
+            self.invalidate(*key)
+            raise
+        self._store(key, resource)
+        return copy.deepcopy(resource)
+
+    @staticmethod
+    def _revalidate(blob, client, cached, query_params):
+        """Fetch a blob's resource unless it matches ``cached``.
+
+        :type blob: :class:`gcloud.storage.blob.Blob`
+        :param blob: The blob to fetch.
+
+        :type client: :class:`gcloud.storage.client.Client`
+        :param client: The client to use for the request.
+
+        :type cached: dict
+        :param cached: The blob's cached resource.
+
+        :type query_params: dict
+        :param query_params: The parameters of an unconditional request.
+
+        :rtype: dict
+        :returns: The current resource, which is ``cached`` if unchanged.
+        """
+        conditional = dict(query_params,
+                           ifGenerationMatch=cached['generation'],
+                           ifMetagenerationNotMatch=cached['metageneration'])
+        try:
+            return client.connection.api_request(
+                method='GET', path=blob.path, query_params=conditional)
+        except NotModified:
+            return cached
+        except PreconditionFailed:
+            # Overwritten since:  the generation no longer matches.
+            return client.connection.api_request(
+                method='GET', path=blob.path, query_params=query_params)
+
+
+def _active_cache(client):
+    """Return the client's metadata cache, if it may be used right now.
+
+    The cache is bypassed while a batch is active, since requests in a
+    batch only return placeholders.
+
+    :type client: :class:`gcloud.storage.client.Client`
+    :param client: The client in use.
+
+    :rtype: :class:`BlobMetadataCache` or ``NoneType``
+    :returns: The client's cache, or ``None``.
+    """
+    cache = getattr(client, 'metadata_cache', None)
+    if cache is not None and getattr(client, 'current_batch', None) is None:
+        return cache
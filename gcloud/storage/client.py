@@ -19,9 +19,11 @@ from gcloud._helpers import _LocalStack
 from gcloud.client import JSONClient
 from gcloud.exceptions import NotFound
 from gcloud.iterator import Iterator
+from gcloud.storage.batch import _FLUSH_MAX_WORKERS
 from gcloud.storage.batch import Batch
 from gcloud.storage.bucket import Bucket
 from gcloud.storage.connection import Connection
+from gcloud.storage.stats import TransferStats
 
 
 class Client(JSONClient):
@@ -43,15 +45,24 @@ class Client(JSONClient):
     :param http: An optional HTTP object to make requests. If not passed, an
                  ``http`` object is created that is bound to the
                  ``credentials`` for the current object.
+
+    :type metadata_cache: :class:`gcloud.storage.cache.BlobMetadataCache`
+                          or ``NoneType``
+    :param metadata_cache: Optional. A cache of blob metadata, consulted by
+                           :meth:`Bucket.get_blob`, :meth:`Blob.reload` and
+                           :meth:`Blob.exists`.
     """
 
     _connection_class = Connection
 
-    def __init__(self, project=None, credentials=None, http=None):
+    def __init__(self, project=None, credentials=None, http=None,
+                 metadata_cache=None):
         self._connection = None
         super(Client, self).__init__(project=project, credentials=credentials,
                                      http=http)
         self._batch_stack = _LocalStack()
+        self.metadata_cache = metadata_cache
+        self.transfer_stats = TransferStats()
 
     @property
     def connection(self):
@@ -129,17 +140,27 @@ class Client(JSONClient):
         """
         return Bucket(client=self, name=bucket_name)
 
-    def batch(self):
+    def batch(self, auto_flush=False, max_workers=_FLUSH_MAX_WORKERS):
         """Factory constructor for batch object.
 
         .. note::
           This will not make an HTTP request; it simply instantiates
           a batch object owned by this client.
 
+        :type auto_flush: boolean
+        :param auto_flush: If True, the batch submits itself in the
+                           background whenever it is full, rather than
+                           refusing further requests.
+
+        :type max_workers: integer
+        :param max_workers: With ``auto_flush``, the maximum number of full
+                            batches submitted concurrently.
+
         :rtype: :class:`gcloud.storage.batch.Batch`
         :returns: The batch object created.
         """
-        return Batch(client=self)
+        return Batch(client=self, auto_flush=auto_flush,
+                     max_workers=max_workers)
 
     def get_bucket(self, bucket_name):
         """Get a bucket by name.
@@ -0,0 +1,426 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local SQLite index of a bucket's object metadata.
+
+Snapshot a bucket's listing once, refresh it as needed, and answer
+prefix, size and "changed since" questions without listing again::
+
+  >>> from gcloud import storage
+  >>> from gcloud.storage.index import BucketIndex
+  >>> client = storage.Client()
+  >>> bucket = client.get_bucket('my-bucket')
+  >>> with BucketIndex(bucket, '/var/cache/my-bucket.db') as index:
+  ...     stats = index.refresh(prefix='logs/')
+  ...     print(index.total_size('logs/2015-'))
+  ...     for summary in index.changed_since(last_run, prefix='logs/'):
+  ...         print(summary.name)
+
+Refreshing still lists the (prefix of the) bucket, since deletions can
+only be found that way, but only rows whose generation or metageneration
+changed are rewritten.
+"""
+
+import collections
+import datetime
+import sqlite3
+
+import six
+
+from gcloud._helpers import _microseconds_from_datetime
+from gcloud._helpers import _RFC3339_MICROS
+from gcloud.storage.blob import BlobSummary
+from gcloud.storage.bucket import _BlobIterator
+from gcloud.storage.bucket import _LIST_MAX_WORKERS
+from gcloud.storage.bucket import _ShardedBlobIterator
+
+
+_REFRESH_CHUNK_SIZE = 1000
+"""Number of listed objects compared against the index at once."""
+
+_LISTING_FIELDS = ('items(name,size,md5Hash,crc32c,generation,'
+                   'metageneration,updated),nextPageToken')
+"""Partial response selector for the properties indexed."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS objects (
+    name TEXT PRIMARY KEY,
+    size INTEGER,
+    md5_hash TEXT,
+    crc32c TEXT,
+    generation INTEGER,
+    metageneration INTEGER,
+    updated TEXT,
+    updated_micros INTEGER
+);
+CREATE INDEX IF NOT EXISTS objects_updated ON objects (updated_micros);
+"""
+
+
+RefreshStats = collections.namedtuple(
+    'RefreshStats', ['added', 'changed', 'deleted', 'unchanged'])
+"""Counts of the objects found by :meth:`BucketIndex.refresh`."""
+
+
+class _ResourceIterator(_BlobIterator):
+    """An iterator yielding the raw resources listed, without wrapping."""
+
+    def get_items_from_response(self, response):
+        """Return the object resources from response.
+
+        :type response: dict
+        :param response: The JSON API response for a page of blobs.
+        """
+        self._current_prefixes = tuple(response.get('prefixes', ()))
+        self.prefixes.update(self._current_prefixes)
+        return response.get('items', ())
+
+
+class BucketIndex(object):
+    """Local SQLite index of a bucket's object metadata.
+
+    :type bucket: :class:`gcloud.storage.bucket.Bucket`
+    :param bucket: The bucket to index.
+
+    :type path: string
+    :param path: The SQLite database file;  ``':memory:'`` for an index
+                 lasting only as long as this object.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: Optional. The client used to refresh.  If not passed,
+                   falls back to the ``client`` stored on the bucket.
+
+    :raises: :class:`ValueError` if ``path`` indexes another bucket.
+    """
+
+    def __init__(self, bucket, path, client=None):
+        self.bucket = bucket
+        self.path = path
+        self.client = client
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = 'bucket'").fetchone()
+        if row is None:
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO meta (key, value) VALUES ('bucket', ?)",
+                    (bucket.name,))
+        elif row[0] != bucket.name:
+            self._db.close()
+            raise ValueError('%s indexes bucket %r, not %r' % (
+                path, row[0], bucket.name))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+    def _list(self, prefix, max_workers):
+        """List the resources under a prefix, in name order.
+
+        :type prefix: string
+        :param prefix: The prefix to list.
+
+        :type max_workers: integer
+        :param max_workers: If greater than 1, list prefix-sharded ranges
+                            concurrently.
+
+        :rtype: iterable of dict
+        :returns: The (partial) object resources.
+        """
+        extra_params = {'projection': 'noAcl', 'fields': _LISTING_FIELDS}
+        if prefix:
+            extra_params['prefix'] = prefix
+        if max_workers > 1:
+            return _ShardedBlobIterator(
+                self.bucket, extra_params, max_workers=max_workers,
+                client=self.client, iterator_class=_ResourceIterator)
+        return _ResourceIterator(self.bucket, extra_params=extra_params,
+                                 client=self.client)
+
+    def refresh(self, prefix='', max_workers=_LIST_MAX_WORKERS):
+        """Bring the index up to date with the bucket (or a prefix of it).
+
+        :type prefix: string
+        :param prefix: Only refresh the objects under this prefix.
+
+        :type max_workers: integer
+        :param max_workers: Maximum number of concurrent listings;  see
+                            :meth:`.Bucket.list_blobs_parallel`.
+
+        :rtype: :class:`RefreshStats`
+        :returns: The numbers of objects added, changed, deleted and left
+                  unchanged.
+        """
+        counts = {'added': 0, 'changed': 0, 'deleted': 0, 'unchanged': 0}
+        with self._db:
+            # Rows after ``done`` (within the prefix) have not been seen.
+            done = None
+            chunk = []
+            for resource in self._list(prefix, max_workers):
+                chunk.append(resource)
+                if len(chunk) >= _REFRESH_CHUNK_SIZE:
+                    done = self._refresh_chunk(prefix, done, chunk, counts)
+                    chunk = []
+            if chunk:
+                done = self._refresh_chunk(prefix, done, chunk, counts)
+            counts['deleted'] += self._delete_range(prefix, done)
+        return RefreshStats(**counts)
+
+    def _refresh_chunk(self, prefix, done, chunk, counts):
+        """Apply a chunk of the (name-ordered) listing to the index.
+
+        :type prefix: string
+        :param prefix: The prefix being refreshed.
+
+        :type done: string or ``NoneType``
+        :param done: The last name already refreshed, if any.
+
+        :type chunk: list of dict
+        :param chunk: Consecutive object resources from the listing.
+
+        :type counts: dict
+        :param counts: Running counts of added / changed / deleted /
+                       unchanged objects, updated in place.
+
+        :rtype: string
+        :returns: The last name in ``chunk``.
+        """
+        last = chunk[-1]['name']
+        known = dict(
+            (name, (generation, metageneration))
+            for name, generation, metageneration in self._db.execute(
+                'SELECT name, generation, metageneration FROM objects '
+                'WHERE name <= ? AND ' + _range_clause(prefix, done),
+                (last,) + _range_params(prefix, done)))
+        rows = []
+        for resource in chunk:
+            name = resource['name']
+            row = _row_from_resource(resource)
+            version = known.pop(name, None)
+            if version is None:
+                counts['added'] += 1
+            elif version != row[4:6]:
+                counts['changed'] += 1
+            else:
+                counts['unchanged'] += 1
+                continue
+            rows.append(row)
+        self._db.executemany(
+            'INSERT OR REPLACE INTO objects (name, size, md5_hash, crc32c, '
+            'generation, metageneration, updated, updated_micros) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        # Whatever is left was not listed:  the objects are gone.
+        self._db.executemany('DELETE FROM objects WHERE name = ?',
+                             [(name,) for name in known])
+        counts['deleted'] += len(known)
+        return last
+
+    def _delete_range(self, prefix, done):
+        """Delete the rows under ``prefix`` after ``done``.
+
+        :type prefix: string
+        :param prefix: The prefix being refreshed.
+
+        :type done: string or ``NoneType``
+        :param done: Keep rows up to and including this name.
+
+        :rtype: integer
+        :returns: The number of rows deleted.
+        """
+        cursor = self._db.execute(
+            'DELETE FROM objects WHERE ' + _range_clause(prefix, done),
+            _range_params(prefix, done))
+        return cursor.rowcount
+
+    def _query(self, columns, prefix, where='', params=(), index=None):
+        """Run a query over the rows under ``prefix``.
+
+        :type columns: string
+        :param columns: The expressions to select.
+
+        :type prefix: string
+        :param prefix: Only consider objects under this prefix.
+
+        :type where: string
+        :param where: Further SQL appended to the ``WHERE`` clause.
+
+        :type params: tuple
+        :param params: Parameters for the placeholders in ``where``.
+
+        :type index: string or ``NoneType``
+        :param index: Optional. An index the query must use.
+
+        :rtype: :class:`sqlite3.Cursor`
+        :returns: The cursor over the result rows.
+        """
+        table = 'objects'
+        if index is not None:
+            table += ' INDEXED BY ' + index
+        sql = 'SELECT %s FROM %s WHERE %s' % (
+            columns, table, _range_clause(prefix, None))
+        return self._db.execute(sql + where,
+                                _range_params(prefix, None) + params)
+
+    def list_blobs(self, prefix=''):
+        """Iterate the indexed objects under a prefix, in name order.
+
+        :type prefix: string
+        :param prefix: The prefix to list.
+
+        :rtype: generator
+        :returns: :class:`gcloud.storage.blob.BlobSummary` records.
+        """
+        cursor = self._query('name, size, md5_hash, crc32c, updated',
+                             prefix, ' ORDER BY name')
+        for row in cursor:
+            yield BlobSummary(*row)
+
+    def count(self, prefix=''):
+        """Count the indexed objects under a prefix.
+
+        :type prefix: string
+        :param prefix: The prefix to count.
+
+        :rtype: integer
+        :returns: The number of objects.
+        """
+        return self._query('COUNT(*)', prefix).fetchone()[0]
+
+    def total_size(self, prefix=''):
+        """Sum the sizes of the indexed objects under a prefix.
+
+        :type prefix: string
+        :param prefix: The prefix to sum.
+
+        :rtype: integer
+        :returns: The total size, in bytes.
+        """
+        return self._query('COALESCE(SUM(size), 0)', prefix).fetchone()[0]
+
+    def changed_since(self, when, prefix=''):
+        """Iterate the indexed objects updated after a time, in name order.
+
+        :type when: :class:`datetime.datetime`
+        :param when: The time;  if naive, it is assumed to be UTC.
+
+        :type prefix: string
+        :param prefix: Only consider objects under this prefix.
+
+        :rtype: generator
+        :returns: :class:`gcloud.storage.blob.BlobSummary` records.
+        """
+        cursor = self._query(
+            'name, size, md5_hash, crc32c, updated', prefix,
+            ' AND updated_micros > ? ORDER BY name',
+            (_microseconds_from_datetime(when),),
+            # Otherwise SQLite prefers scanning in name order, which
+            # visits every row when few have changed.
+            index='objects_updated')
+        for row in cursor:
+            yield BlobSummary(*row)
+
+
+def _prefix_end(prefix):
+    """Return the smallest string greater than all those with ``prefix``.
+
+    :type prefix: string
+    :param prefix: A non-empty prefix.
+
+    :rtype: string or ``NoneType``
+    :returns: The bound, or ``None`` if there is none.
+    """
+    while prefix and ord(prefix[-1]) == 0x10FFFF:
+        prefix = prefix[:-1]
+    if not prefix:
+        return None
+    return prefix[:-1] + six.unichr(ord(prefix[-1]) + 1)
+
+
+def _range_clause(prefix, after):
+    """Build a ``WHERE`` condition for names under ``prefix`` after ``after``.
+
+    :type prefix: string
+    :param prefix: The prefix (may be empty).
+
+    :type after: string or ``NoneType``
+    :param after: If not ``None``, only match names greater than this.
+
+    :rtype: string
+    :returns: The condition, with ``?`` placeholders for
+              :func:`_range_params`.
+    """
+    clauses = ['1']
+    if prefix:
+        clauses.append('name >= ?')
+        if _prefix_end(prefix) is not None:
+            clauses.append('name < ?')
+    if after is not None:
+        clauses.append('name > ?')
+    return ' AND '.join(clauses)
+
+
+def _range_params(prefix, after):
+    """Build the parameters for :func:`_range_clause`.
+
+    :rtype: tuple
+    :returns: The parameters.
+    """
+    params = []
+    if prefix:
+        params.append(prefix)
+        end = _prefix_end(prefix)
+        if end is not None:
+            params.append(end)
+    if after is not None:
+        params.append(after)
+    return tuple(params)
+
+
+def _row_from_resource(resource):
+    """Convert a listed object resource to an ``objects`` row.
+
+    :type resource: dict
+    :param resource: The (partial) object resource.
+
+    :rtype: tuple
+    :returns: The column values.
+    """
+    size = resource.get('size')
+    if size is not None:
+        size = int(size)
+    generation = resource.get('generation')
+    if generation is not None:
+        generation = int(generation)
+    metageneration = resource.get('metageneration')
+    if metageneration is not None:
+        metageneration = int(metageneration)
+    updated = resource.get('updated')
+    updated_micros = None
+    if updated is not None:
+        updated_micros = _microseconds_from_datetime(
+            datetime.datetime.strptime(updated, _RFC3339_MICROS))
+    return (resource['name'], size, resource.get('md5Hash'),
+            resource.get('crc32c'), generation, metageneration, updated,
+            updated_micros)
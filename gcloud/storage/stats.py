@@ -0,0 +1,454 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Progress reporting and throughput statistics for blob transfers.
+
+Transfers report each chunk sent or received to an optional ``progress``
+callback, as a :class:`TransferProgress`::
+
+  >>> def progress(update):
+  ...     print('%s: %d / %d bytes, %.0f B/s' % (
+  ...         update.blob_name, update.bytes_done, update.total_bytes,
+  ...         update.average_throughput))
+  >>> blob.upload_from_filename('/tmp/big-file', progress=progress)
+
+Every client also aggregates its transfers in a :class:`TransferStats`::
+
+  >>> client.transfer_stats.average_throughput
+  41943040.0
+
+Resumable transfers can size their chunks from the same measurements,
+through an :class:`AdaptiveChunkSize`::
+
+  >>> blob.adaptive_chunk_size = AdaptiveChunkSize(maximum=32 * 1024 * 1024)
+  >>> blob.upload_from_filename('/tmp/big-file')
+  >>> blob.adaptive_chunk_size.chunk_size
+  16777216
+"""
+
+import collections
+import threading
+import time
+
+from six.moves import http_client
+
+
+_now = time.time
+
+UPLOAD = 'upload'
+"""Direction of transfers sending bytes to Cloud Storage."""
+
+DOWNLOAD = 'download'
+"""Direction of transfers receiving bytes from Cloud Storage."""
+
+_RETRIED_STATUSES = frozenset([429])
+"""Statuses (besides 5xx) after which a request is retried."""
+
+_CHUNK_SIZE_MULTIPLE = 256 * 1024
+"""Number (256 KB, in bytes) that must divide resumable chunk sizes."""
+
+_SMOOTHING = 0.5
+"""Weight of the latest chunk in :class:`AdaptiveChunkSize`'s throughput."""
+
+
+class TransferProgress(collections.namedtuple(
+        'TransferProgress', ['blob_name', 'direction', 'bytes_done',
+                             'total_bytes', 'chunk_bytes', 'chunk_seconds',
+                             'elapsed', 'retries'])):
+    """The state of a transfer after a chunk completed.
+
+    :type blob_name: string
+    :param blob_name: The name of the blob transferred.
+
+    :type direction: string
+    :param direction: :data:`UPLOAD` or :data:`DOWNLOAD`.
+
+    :type bytes_done: integer
+    :param bytes_done: Bytes transferred so far.
+
+    :type total_bytes: integer or ``NoneType``
+    :param total_bytes: The size of the transfer, if known.
+
+    :type chunk_bytes: integer
+    :param chunk_bytes: Bytes transferred by the last request.
+
+    :type chunk_seconds: float
+    :param chunk_seconds: Duration of the last request.
+
+    :type elapsed: float
+    :param elapsed: Seconds since the transfer started.
+
+    :type retries: integer
+    :param retries: Failed requests retried so far.
+    """
+    __slots__ = ()
+
+    @property
+    def throughput(self):
+        """Bytes per second of the last request.
+
+        :rtype: float or ``NoneType``
+        :returns: The instantaneous throughput, if measurable.
+        """
+        if self.chunk_seconds > 0:
+            return self.chunk_bytes / self.chunk_seconds
+
+    @property
+    def average_throughput(self):
+        """Bytes per second since the transfer started.
+
+        :rtype: float or ``NoneType``
+        :returns: The average throughput, if measurable.
+        """
+        if self.elapsed > 0:
+            return self.bytes_done / self.elapsed
+
+
+class TransferStats(object):
+    """Aggregate statistics of a client's transfers.
+
+    Safe to update from several threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zero all counters."""
+        with self._lock:
+            self.transfers = 0
+            self.bytes_uploaded = 0
+            self.bytes_downloaded = 0
+            self.chunks = 0
+            self.retries = 0
+            self.busy_seconds = 0.0
+            self.max_chunk_seconds = 0.0
+
+    def record_chunk(self, direction, nbytes, seconds):
+        """Count a completed request transferring some bytes.
+
+        :type direction: string
+        :param direction: :data:`UPLOAD` or :data:`DOWNLOAD`.
+
+        :type nbytes: integer
+        :param nbytes: The bytes transferred.
+
+        :type seconds: float
+        :param seconds: The duration of the request.
+        """
+        with self._lock:
+            if direction == UPLOAD:
+                self.bytes_uploaded += nbytes
+            else:
+                self.bytes_downloaded += nbytes
+            self.chunks += 1
+            self.busy_seconds += seconds
+            self.max_chunk_seconds = max(self.max_chunk_seconds, seconds)
+
+    def record_retry(self, seconds):
+        """Count a failed request, which will be retried.
+
+        :type seconds: float
+        :param seconds: The duration of the request.
+        """
+        with self._lock:
+            self.retries += 1
+            self.busy_seconds += seconds
+
+    def record_transfer(self):
+        """Count a completed transfer."""
+        with self._lock:
+            self.transfers += 1
+
+    @property
+    def average_throughput(self):
+        """Bytes per second spent in requests, in either direction.
+
+        :rtype: float or ``NoneType``
+        :returns: The average throughput, if any bytes were transferred.
+        """
+        if self.busy_seconds > 0:
+            return (self.bytes_uploaded +
+                    self.bytes_downloaded) / self.busy_seconds
+
+    @property
+    def average_request_seconds(self):
+        """Mean duration of the requests made, including retried ones.
+
+        :rtype: float or ``NoneType``
+        :returns: The mean latency, if any requests were made.
+        """
+        requests = self.chunks + self.retries
+        if requests:
+            return self.busy_seconds / requests
+
+
+class AdaptiveChunkSize(object):
+    """Chunk size of resumable transfers, adapted to measured throughput.
+
+    After each chunk, the size is moved towards the number of bytes the
+    link carries in ``target_seconds`` (using a moving average of the
+    chunks' throughput), by at most a factor of two.  Each failed request
+    halves it.  The size always stays a multiple of 256 KB within
+    ``[minimum, maximum]``, which bounds the memory a transfer buffers.
+
+    Safe to share between transfers (and threads), which then start from
+    the size learned so far.
+
+    :type initial: integer
+    :param initial: The chunk size of the first transfer.
+
+    :type minimum: integer
+    :param minimum: The smallest chunk size.
+
+    :type maximum: integer
+    :param maximum: The largest chunk size.
+
+    :type target_seconds: float
+    :param target_seconds: Intended duration of each chunk's request:  long
+                           enough to amortize its latency, short enough
+                           that a failure costs little to resend.
+
+    :raises: :class:`ValueError` if the sizes are not multiples of 256 KB,
+             ``initial`` is not within ``[minimum, maximum]``, or
+             ``target_seconds`` is not positive.
+    """
+
+    def __init__(self, initial=1024 * 1024, minimum=_CHUNK_SIZE_MULTIPLE,
+                 maximum=64 * 1024 * 1024, target_seconds=2.0):
+        for size in (initial, minimum, maximum):
+            if size <= 0 or size % _CHUNK_SIZE_MULTIPLE != 0:
+                raise ValueError(
+                    'Chunk sizes must be positive multiples of %d.' % (
+                        _CHUNK_SIZE_MULTIPLE,))
+        if not minimum <= initial <= maximum:
+            raise ValueError('initial must be within [minimum, maximum].')
+        if target_seconds <= 0:
+            raise ValueError('target_seconds must be positive.')
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.chunk_size = initial
+        self.throughput = None
+        self._lock = threading.Lock()
+
+    def _resize(self, size):
+        """Set the chunk size, rounded down and kept within bounds.
+
+        :type size: float
+        :param size: The desired chunk size.
+        """
+        size = int(size) // _CHUNK_SIZE_MULTIPLE * _CHUNK_SIZE_MULTIPLE
+        self.chunk_size = max(self.minimum, min(self.maximum, size))
+
+    def record_chunk(self, nbytes, seconds):
+        """Adapt to a completed request.
+
+        Chunks shorter than half the current size (e.g. the end of a
+        transfer) are ignored, since their latency understates the link.
+
+        :type nbytes: integer
+        :param nbytes: The bytes transferred.
+
+        :type seconds: float
+        :param seconds: The duration of the request.
+        """
+        with self._lock:
+            current = self.chunk_size
+            if nbytes < current // 2:
+                return
+            if seconds <= 0:
+                self._resize(current * 2)
+                return
+            throughput = nbytes / float(seconds)
+            if self.throughput is not None:
+                throughput = (_SMOOTHING * throughput +
+                              (1 - _SMOOTHING) * self.throughput)
+            self.throughput = throughput
+            desired = throughput * self.target_seconds
+            self._resize(max(current / 2.0, min(current * 2.0, desired)))
+
+    def record_error(self):
+        """Adapt to a failed request, which will be retried."""
+        with self._lock:
+            self._resize(self.chunk_size / 2.0)
+
+
+class _TransferMonitor(object):
+    """Time the requests of one transfer, reporting its progress.
+
+    :type blob_name: string
+    :param blob_name: The name of the blob transferred.
+
+    :type direction: string
+    :param direction: :data:`UPLOAD` or :data:`DOWNLOAD`.
+
+    :type total_bytes: integer or ``NoneType``
+    :param total_bytes: The size of the transfer, if known.
+
+    :type callback: a callable taking (:class:`TransferProgress`), or
+                    ``NoneType``
+    :param callback: Called after each request transferring bytes.
+
+    :type stats: :class:`TransferStats` or ``NoneType``
+    :param stats: Client statistics to update.
+
+    :type sizer: :class:`AdaptiveChunkSize` or ``NoneType``
+    :param sizer: Chunk size to adapt to each request.
+
+    :type resize: a callable taking (integer), or ``NoneType``
+    :param resize: Called with the ``sizer``'s chunk size after each
+                   request, to apply it to the next chunk.
+    """
+
+    def __init__(self, blob_name, direction, total_bytes=None,
+                 callback=None, stats=None, sizer=None, resize=None):
+        self.blob_name = blob_name
+        self.direction = direction
+        self.total_bytes = total_bytes
+        self.bytes_done = 0
+        self.retries = 0
+        self._callback = callback
+        self._stats = stats
+        self._sizer = sizer
+        self._resize = resize
+        self._started = _now()
+
+    def http(self, http):
+        """Wrap an HTTP object, so that its requests are timed.
+
+        :type http: :class:`httplib2.Http`
+        :param http: The HTTP object to wrap.
+
+        :rtype: :class:`_MonitoredHttp`
+        :returns: The wrapped HTTP object.
+        """
+        return _MonitoredHttp(http, self)
+
+    def record(self, status, nbytes, seconds):
+        """Account for one request.
+
+        :type status: integer or ``NoneType``
+        :param status: The response status, or ``None`` if none was
+                       received.
+
+        :type nbytes: integer
+        :param nbytes: The bytes sent or received.
+
+        :type seconds: float
+        :param seconds: The duration of the request.
+        """
+        if (status is None or status >= http_client.INTERNAL_SERVER_ERROR or
+                status in _RETRIED_STATUSES):
+            self.retries += 1
+            if self._stats is not None:
+                self._stats.record_retry(seconds)
+            if self._sizer is not None:
+                self._sizer.record_error()
+                self._resize(self._sizer.chunk_size)
+            return
+        if status >= http_client.BAD_REQUEST or not nbytes:
+            return
+        self.bytes_done += nbytes
+        if self._stats is not None:
+            self._stats.record_chunk(self.direction, nbytes, seconds)
+        if self._sizer is not None:
+            self._sizer.record_chunk(nbytes, seconds)
+            self._resize(self._sizer.chunk_size)
+        if self._callback is not None:
+            self._callback(TransferProgress(
+                self.blob_name, self.direction, self.bytes_done,
+                self.total_bytes, nbytes, seconds, _now() - self._started,
+                self.retries))
+
+    def finish(self):
+        """Count the transfer as completed."""
+        if self._stats is not None:
+            self._stats.record_transfer()
+
+
+class _MonitoredHttp(object):
+    """Proxy of an HTTP object, timing each request for a monitor.
+
+    :type http: :class:`httplib2.Http`
+    :param http: The HTTP object making requests.
+
+    :type monitor: :class:`_TransferMonitor`
+    :param monitor: The monitor to report requests to.
+    """
+
+    def __init__(self, http, monitor):
+        self._http = http
+        self._monitor = monitor
+
+    def request(self, uri, method='GET', body=None, headers=None, **kw):
+        """Make a request, timing it.
+
+        See :meth:`httplib2.Http.request`.
+        """
+        started = _now()
+        try:
+            response, content = self._http.request(
+                uri, method=method, body=body, headers=headers, **kw)
+        except Exception:
+            self._monitor.record(None, 0, _now() - started)
+            raise
+        if self._monitor.direction == UPLOAD:
+            nbytes = int((headers or {}).get('content-length', 0))
+        else:
+            nbytes = len(content or b'')
+        self._monitor.record(int(response['status']), nbytes,
+                             _now() - started)
+        return response, content
+
+    def __getattr__(self, name):
+        return getattr(self._http, name)
+
+
+def _transfer_monitor(blob, client, direction, total_bytes=None,
+                      callback=None, resize=None):
+    """Create a monitor for a blob's transfer, using the client's stats.
+
+    If ``resize`` is passed, the blob's ``adaptive_chunk_size`` (if any)
+    is adapted to the transfer's requests.
+
+    :type blob: :class:`gcloud.storage.blob.Blob`
+    :param blob: The blob transferred.
+
+    :type client: :class:`gcloud.storage.client.Client`
+    :param client: The client making the transfer.
+
+    :type direction: string
+    :param direction: :data:`UPLOAD` or :data:`DOWNLOAD`.
+
+    :type total_bytes: integer or ``NoneType``
+    :param total_bytes: The size of the transfer, if known.
+
+    :type callback: a callable taking (:class:`TransferProgress`), or
+                    ``NoneType``
+    :param callback: Called after each request transferring bytes.
+
+    :type resize: a callable taking (integer), or ``NoneType``
+    :param resize: Applies a new chunk size to the transfer.
+
+    :rtype: :class:`_TransferMonitor`
+    :returns: The monitor.
+    """
+    sizer = None
+    if resize is not None:
+        sizer = getattr(blob, 'adaptive_chunk_size', None)
+    return _TransferMonitor(blob.name, direction, total_bytes, callback,
+                            getattr(client, 'transfer_stats', None),
+                            sizer, resize)
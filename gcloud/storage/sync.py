@@ -0,0 +1,413 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Mirror local directory trees to / from bucket prefixes.
+
+Only files which differ are transferred:  sizes are compared first, then
+MD5 hashes (or, for objects without one, modification times).  Local
+MD5 hashes can be cached in a manifest file, so that syncing an
+unchanged tree costs a single listing and no hashing::
+
+  >>> from gcloud import storage
+  >>> from gcloud.storage.sync import sync_to_bucket
+  >>> client = storage.Client()
+  >>> bucket = client.get_bucket('my-bucket')
+  >>> result = sync_to_bucket('/var/www', bucket, prefix='www/',
+  ...                         delete=True, manifest_path='/tmp/www.json')
+  >>> print(len(result.transferred))
+"""
+
+import calendar
+import collections
+import json
+import os
+
+from gcloud._helpers import _imap_unordered
+from gcloud.storage._helpers import _base64_md5hash
+
+
+_SYNC_MAX_WORKERS = 8
+"""Default number of files transferred concurrently."""
+
+_LISTING_FIELDS = ('items(name,size,md5Hash,crc32c,updated,mediaLink,'
+                   'contentEncoding),nextPageToken')
+"""Partial response selector for the properties compared when syncing."""
+
+
+SyncResult = collections.namedtuple(
+    'SyncResult', ['transferred', 'deleted', 'unchanged'])
+"""Outcome of a sync:  lists of the relative paths in each category."""
+
+
+class _Manifest(object):
+    """Cache of local files' MD5 hashes, keyed by size and mtime.
+
+    :type path: string or ``NoneType``
+    :param path: Optional. The JSON file persisting the cache.  If not
+                 passed, the cache only lasts for one sync.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = {}
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path) as file_obj:
+                    self._entries = json.load(file_obj)
+            except ValueError:  # Corrupt:  start afresh.
+                self._entries = {}
+
+    def md5_hash(self, relpath, filename, stat):
+        """Return a local file's MD5 hash, computing it only if needed.
+
+        :type relpath: string
+        :param relpath: The file's path relative to the synced directory.
+
+        :type filename: string
+        :param filename: The file's full path.
+
+        :type stat: :class:`os.stat_result`
+        :param stat: The file's current status.
+
+        :rtype: string
+        :returns: The base64-encoded MD5 hash.
+        """
+        entry = self._entries.get(relpath)
+        if entry is not None and entry[:2] == [stat.st_size, stat.st_mtime]:
+            return entry[2]
+        with open(filename, 'rb') as file_obj:
+            md5_hash = _base64_md5hash(file_obj).decode('ascii')
+        self.record(relpath, stat, md5_hash)
+        return md5_hash
+
+    def record(self, relpath, stat, md5_hash):
+        """Cache a local file's MD5 hash.
+
+        :type relpath: string
+        :param relpath: The file's path relative to the synced directory.
+
+        :type stat: :class:`os.stat_result`
+        :param stat: The file's status when ``md5_hash`` was valid.
+
+        :type md5_hash: string or ``NoneType``
+        :param md5_hash: The base64-encoded MD5 hash.  Nothing is cached
+                         if ``None``.
+        """
+        if md5_hash is None:
+            self._entries.pop(relpath, None)
+        else:
+            self._entries[relpath] = [stat.st_size, stat.st_mtime, md5_hash]
+
+    def retain(self, relpaths):
+        """Drop cached hashes for files which no longer exist.
+
+        :type relpaths: iterable of string
+        :param relpaths: The paths still present.
+        """
+        relpaths = set(relpaths)
+        for relpath in list(self._entries):
+            if relpath not in relpaths:
+                del self._entries[relpath]
+
+    def save(self):
+        """Persist the cache, if it has a path."""
+        if self.path is None:
+            return
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as file_obj:
+            json.dump(self._entries, file_obj)
+        getattr(os, 'replace', os.rename)(temp_path, self.path)
+
+
+def _list_local(local_dir):
+    """Map relative paths of the files under a directory to their status.
+
+    :type local_dir: string
+    :param local_dir: The directory to walk.
+
+    :rtype: dict
+    :returns: ``/``-separated relative paths mapped to
+              :class:`os.stat_result`.
+    """
+    files = {}
+    for dirpath, _, filenames in os.walk(local_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            relpath = os.path.relpath(path, local_dir)
+            files[relpath.replace(os.sep, '/')] = os.stat(path)
+    return files
+
+
+def _list_remote(bucket, prefix, client):
+    """Map relative names of the blobs under a prefix to the blobs.
+
+    "Directory" placeholders (names ending in ``/``) are skipped.
+
+    :type bucket: :class:`gcloud.storage.bucket.Bucket`
+    :param bucket: The bucket to list.
+
+    :type prefix: string
+    :param prefix: The prefix to list.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: Optional. The client to use.
+
+    :rtype: dict
+    :returns: Names relative to ``prefix`` mapped to
+              :class:`gcloud.storage.blob.Blob`.
+    """
+    blobs = {}
+    iterator = bucket.list_blobs(prefix=prefix or None,
+                                 fields=_LISTING_FIELDS, client=client)
+    for blob in iterator:
+        relpath = blob.name[len(prefix):]
+        if relpath and not relpath.endswith('/'):
+            blobs[relpath] = blob
+    return blobs
+
+
+def _updated_timestamp(blob):
+    """The blob's ``updated`` time, as a local file modification time.
+
+    Matches the mtime set by
+    :meth:`gcloud.storage.blob.Blob.download_to_filename`.
+
+    :type blob: :class:`gcloud.storage.blob.Blob`
+    :param blob: The blob.
+
+    :rtype: float or ``NoneType``
+    :returns: The timestamp, or ``None`` if not known.
+    """
+    if blob.updated is not None:
+        return calendar.timegm(blob.updated.utctimetuple())
+
+
+def _differs(manifest, relpath, filename, stat, blob, uploading):
+    """Decide whether a local file and a blob hold different content.
+
+    :type manifest: :class:`_Manifest`
+    :param manifest: The local MD5 hash cache.
+
+    :type relpath: string
+    :param relpath: The file's path relative to the synced directory.
+
+    :type filename: string
+    :param filename: The file's full path.
+
+    :type stat: :class:`os.stat_result`
+    :param stat: The file's status.
+
+    :type blob: :class:`gcloud.storage.blob.Blob`
+    :param blob: The blob.
+
+    :type uploading: boolean
+    :param uploading: True if the file would be uploaded, False if the
+                      blob would be downloaded.
+
+    :rtype: boolean
+    :returns: True if the file and blob differ.
+    """
+    if blob.size != stat.st_size:
+        return True
+    if blob.md5_hash is not None:
+        return manifest.md5_hash(relpath, filename, stat) != blob.md5_hash
+    # E.g. composite objects:  fall back to comparing times.  Uploads
+    # leave the blob newer than the file;  downloads copy the blob's time.
+    updated = _updated_timestamp(blob)
+    if updated is None:
+        return True
+    if uploading:
+        return stat.st_mtime > updated
+    return stat.st_mtime != updated
+
+
+def _remove_empty_dirs(local_dir):
+    """Remove empty directories below (but not including) ``local_dir``.
+
+    :type local_dir: string
+    :param local_dir: The root directory.
+    """
+    for dirpath, _, _ in os.walk(local_dir, topdown=False):
+        if dirpath != local_dir and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+
+def sync_to_bucket(local_dir, bucket, prefix='', delete=False,
+                   manifest_path=None, max_workers=_SYNC_MAX_WORKERS,
+                   client=None):
+    """Upload the files under a local directory which differ from a prefix.
+
+    :type local_dir: string
+    :param local_dir: The directory to upload from.
+
+    :type bucket: :class:`gcloud.storage.bucket.Bucket`
+    :param bucket: The bucket to upload to.
+
+    :type prefix: string
+    :param prefix: Prefix prepended to each file's relative path (with
+                   ``/`` separators) to give its blob name, e.g.
+                   ``'backups/'``.
+
+    :type delete: boolean
+    :param delete: If True, also delete blobs under ``prefix`` which have
+                   no local file.
+
+    :type manifest_path: string or ``NoneType``
+    :param manifest_path: Optional. A JSON file caching local MD5 hashes
+                          between syncs.
+
+    :type max_workers: integer
+    :param max_workers: Maximum number of concurrent uploads.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: Optional. The client to use.  If not passed, falls back
+                   to the ``client`` stored on the bucket.
+
+    :rtype: :class:`SyncResult`
+    :returns: The relative paths uploaded, deleted and left unchanged.
+    """
+    manifest = _Manifest(manifest_path)
+    local = _list_local(local_dir)
+    remote = _list_remote(bucket, prefix, client)
+    manifest.retain(local)
+
+    to_upload = []
+    unchanged = []
+    for relpath in sorted(local):
+        filename = os.path.join(local_dir, *relpath.split('/'))
+        blob = remote.get(relpath)
+        if blob is None or _differs(manifest, relpath, filename,
+                                    local[relpath], blob, True):
+            to_upload.append(relpath)
+        else:
+            unchanged.append(relpath)
+
+    def _upload(relpath):
+        """Upload one file, returning its blob."""
+        filename = os.path.join(local_dir, *relpath.split('/'))
+        blob = bucket.blob(prefix + relpath)
+        blob.upload_from_filename(filename, client=client)
+        return relpath, blob
+
+    transferred = []
+    try:
+        for relpath, blob in _imap_unordered(_upload, to_upload,
+                                             max_workers):
+            transferred.append(relpath)
+            # The upload checked the server's MD5 against the bytes sent.
+            manifest.record(relpath, local[relpath], blob.md5_hash)
+    finally:
+        manifest.save()
+
+    deleted = []
+    if delete:
+        deleted = sorted(set(remote) - set(local))
+        bucket.delete_blobs([remote[relpath] for relpath in deleted],
+                            on_error=lambda blob: None, client=client)
+
+    return SyncResult(sorted(transferred), deleted, unchanged)
+
+
+def sync_from_bucket(bucket, local_dir, prefix='', delete=False,
+                     manifest_path=None, max_workers=_SYNC_MAX_WORKERS,
+                     client=None):
+    """Download the blobs under a prefix which differ from a local directory.
+
+    Downloaded files get the blob's ``updated`` time as their modification
+    time.  Blobs whose names would fall outside ``local_dir`` (e.g.
+    containing ``..``) are skipped.
+
+    :type bucket: :class:`gcloud.storage.bucket.Bucket`
+    :param bucket: The bucket to download from.
+
+    :type local_dir: string
+    :param local_dir: The directory to download to.
+
+    :type prefix: string
+    :param prefix: The prefix to download;  it is removed from blob names
+                   to give relative paths.
+
+    :type delete: boolean
+    :param delete: If True, also delete local files which have no blob
+                   under ``prefix`` (and directories left empty).
+
+    :type manifest_path: string or ``NoneType``
+    :param manifest_path: Optional. A JSON file caching local MD5 hashes
+                          between syncs.
+
+    :type max_workers: integer
+    :param max_workers: Maximum number of concurrent downloads.
+
+    :type client: :class:`gcloud.storage.client.Client` or ``NoneType``
+    :param client: Optional. The client to use.  If not passed, falls back
+                   to the ``client`` stored on the bucket.
+
+    :rtype: :class:`SyncResult`
+    :returns: The relative paths downloaded, deleted and left unchanged.
+    """
+    if not os.path.isdir(local_dir):
+        os.makedirs(local_dir)
+    root = os.path.abspath(local_dir)
+    manifest = _Manifest(manifest_path)
+    local = _list_local(local_dir)
+    remote = {}
+    for relpath, blob in _list_remote(bucket, prefix, client).items():
+        filename = os.path.abspath(os.path.join(root, *relpath.split('/')))
+        if filename.startswith(root + os.sep):
+            remote[relpath] = blob
+    manifest.retain(local)
+
+    to_download = []
+    unchanged = []
+    for relpath in sorted(remote):
+        filename = os.path.join(local_dir, *relpath.split('/'))
+        stat = local.get(relpath)
+        if stat is None or _differs(manifest, relpath, filename, stat,
+                                    remote[relpath], False):
+            to_download.append(relpath)
+        else:
+            unchanged.append(relpath)
+
+    def _download(relpath):
+        """Download one blob, returning its file's status."""
+        filename = os.path.join(local_dir, *relpath.split('/'))
+        dirname = os.path.dirname(filename)
+        try:
+            os.makedirs(dirname)
+        except OSError:
+            if not os.path.isdir(dirname):
+                raise
+        remote[relpath].download_to_filename(filename, client=client)
+        return relpath, os.stat(filename)
+
+    transferred = []
+    try:
+        for relpath, stat in _imap_unordered(_download, to_download,
+                                             max_workers):
+            transferred.append(relpath)
+            # The download checked the bytes received against the MD5.
+            manifest.record(relpath, stat, remote[relpath].md5_hash)
+    finally:
+        manifest.save()
+
+    deleted = []
+    if delete:
+        deleted = sorted(set(local) - set(remote))
+        for relpath in deleted:
+            os.remove(os.path.join(local_dir, *relpath.split('/')))
+        _remove_empty_dirs(local_dir)
+        manifest.retain(remote)
+        manifest.save()
+
+    return SyncResult(sorted(transferred), deleted, unchanged)
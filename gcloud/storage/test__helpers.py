@@ -167,6 +167,247 @@ class Test__base64_md5hash(unittest2.TestCase):
         self.assertEqual(MD5.hash_obj._blocks, [BYTES_TO_SIGN])
 
 
+class Test__crc32c(unittest2.TestCase):
+
+    def _callFUT(self, data, crc=0):
+        from gcloud.storage._helpers import _crc32c
+        return _crc32c(data, crc)
+
+    def test_empty(self):
+        self.assertEqual(self._callFUT(b''), 0)
+
+    def test_check_value(self):
+        # Standard check value for CRC-32C (RFC 3720, appendix B.4).
+        self.assertEqual(self._callFUT(b'123456789'), 0xE3069283)
+
+    def test_running(self):
+        crc = self._callFUT(b'12345')
+        self.assertEqual(self._callFUT(b'6789', crc), 0xE3069283)
+
+    def test_native(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage import _helpers as MUT
+        native = _NativeCRC32C(42)
+        with _Monkey(MUT, google_crc32c=native):
+            self.assertEqual(self._callFUT(b'abc', 7), 42)
+        self.assertEqual(native._extended, [(7, b'abc')])
+
+
+class Test__crc32c_combine(unittest2.TestCase):
+
+    def _callFUT(self, crc1, crc2, length2):
+        from gcloud.storage._helpers import _crc32c_combine
+        return _crc32c_combine(crc1, crc2, length2)
+
+    def test_empty_second(self):
+        from gcloud.storage._helpers import _crc32c
+        crc = _crc32c(b'abc')
+        self.assertEqual(self._callFUT(crc, 0, 0), crc)
+
+    def test_it(self):
+        from gcloud.storage._helpers import _crc32c
+        FIRST = b'abcdefghij' * 7
+        SECOND = b'0123456789' * 13
+        combined = self._callFUT(_crc32c(FIRST), _crc32c(SECOND), len(SECOND))
+        self.assertEqual(combined, _crc32c(FIRST + SECOND))
+
+
+class Test__base64_crc32c(unittest2.TestCase):
+
+    def _callFUT(self, crc):
+        from gcloud.storage._helpers import _base64_crc32c
+        return _base64_crc32c(crc)
+
+    def test_it(self):
+        self.assertEqual(self._callFUT(0xE3069283), '4waSgw==')
+
+
+class Test_Checksums(unittest2.TestCase):
+
+    MD5_ABCDEF = '6AtQFwmJUPxYqtg8jBSXjg=='
+    CRC32C_ABCDEF = 'U7zv8Q=='
+
+    def _getTargetClass(self):
+        from gcloud.storage._helpers import _Checksums
+        return _Checksums
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def test_defaults(self):
+        checksums = self._makeOne()
+        checksums.update(b'abc')
+        checksums.update(bytearray(b'def'))
+        self.assertEqual(checksums.md5_hash, self.MD5_ABCDEF)
+        self.assertEqual(checksums.crc32c, self.CRC32C_ABCDEF)
+
+    def test_disabled(self):
+        checksums = self._makeOne(md5=False, crc32c=False)
+        checksums.update(b'abc')
+        self.assertEqual(checksums.md5_hash, None)
+        self.assertEqual(checksums.crc32c, None)
+
+    def test_for_upload(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage import _helpers as MUT
+        with _Monkey(MUT, google_crc32c=None):
+            checksums = self._getTargetClass().for_upload()
+        checksums.update(b'abcdef')
+        self.assertEqual(checksums.md5_hash, self.MD5_ABCDEF)
+        self.assertEqual(checksums.crc32c, None)
+        with _Monkey(MUT, google_crc32c=object()):
+            checksums = self._getTargetClass().for_upload()
+        self.assertTrue(checksums._crc32c is not None)
+
+    def test_for_download(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage import _helpers as MUT
+        klass = self._getTargetClass()
+        with _Monkey(MUT, google_crc32c=None):
+            both = klass.for_download('MD5', 'CRC')
+            crc_only = klass.for_download(None, 'CRC')
+            neither = klass.for_download(None, None)
+        self.assertTrue(both._md5 is not None)
+        self.assertTrue(both._crc32c is None)
+        self.assertTrue(crc_only._md5 is None)
+        self.assertTrue(crc_only._crc32c is not None)
+        self.assertTrue(neither._md5 is None)
+        self.assertTrue(neither._crc32c is None)
+        with _Monkey(MUT, google_crc32c=object()):
+            both = klass.for_download('MD5', 'CRC')
+        self.assertTrue(both._md5 is not None)
+        self.assertTrue(both._crc32c is not None)
+
+    def test_verify_match(self):
+        checksums = self._makeOne()
+        checksums.update(b'abcdef')
+        checksums.verify(self.MD5_ABCDEF, self.CRC32C_ABCDEF, 'name')
+        checksums.verify(None, None, 'name')
+
+    def test_verify_md5_mismatch(self):
+        checksums = self._makeOne()
+        checksums.update(b'abcdeF')
+        with self.assertRaises(ValueError):
+            checksums.verify(self.MD5_ABCDEF, None, 'name')
+
+    def test_verify_crc32c_mismatch(self):
+        checksums = self._makeOne(md5=False)
+        checksums.update(b'abcdeF')
+        checksums.verify(self.MD5_ABCDEF, None, 'name')
+        with self.assertRaises(ValueError):
+            checksums.verify(None, self.CRC32C_ABCDEF, 'name')
+
+
+class Test_HashingReader(unittest2.TestCase):
+
+    def _makeOne(self, data, start=0):
+        from io import BytesIO
+        from gcloud.storage._helpers import _Checksums
+        from gcloud.storage._helpers import _HashingReader
+        stream = BytesIO(data)
+        stream.seek(start)
+        return _HashingReader(stream, _Checksums(crc32c=False))
+
+    def test_read(self):
+        reader = self._makeOne(b'abcdef')
+        self.assertEqual(reader.read(4), b'abcd')
+        self.assertEqual(reader.read(), b'ef')
+        self.assertEqual(reader.checksums.md5_hash,
+                         Test_Checksums.MD5_ABCDEF)
+
+    def test_reread(self):
+        reader = self._makeOne(b'abcdef')
+        reader.read(4)
+        reader.seek(2)
+        self.assertEqual(reader.tell(), 2)
+        self.assertEqual(reader.read(1), b'c')
+        self.assertEqual(reader.read(), b'def')
+        self.assertEqual(reader.checksums.md5_hash,
+                         Test_Checksums.MD5_ABCDEF)
+
+    def test_start_offset(self):
+        reader = self._makeOne(b'xxabcdef', start=2)
+        self.assertEqual(reader.read(), b'abcdef')
+        self.assertEqual(reader.checksums.md5_hash,
+                         Test_Checksums.MD5_ABCDEF)
+
+    def test_skipped_bytes(self):
+        reader = self._makeOne(b'abcdef')
+        reader.read(2)
+        reader.seek(4)
+        self.assertEqual(reader.read(), b'ef')
+        self.assertEqual(reader.checksums, None)
+        reader.seek(0)
+        self.assertEqual(reader.read(), b'abcdef')
+        self.assertEqual(reader.checksums, None)
+
+    def test_non_seekable(self):
+        from gcloud.storage._helpers import _Checksums
+        from gcloud.storage._helpers import _HashingReader
+        reader = _HashingReader(_Pipe(b'abcdef'), _Checksums(crc32c=False))
+        self.assertEqual(reader.read(4), b'abcd')
+        self.assertEqual(reader.read(), b'ef')
+        self.assertEqual(reader.checksums.md5_hash,
+                         Test_Checksums.MD5_ABCDEF)
+
+    def test_wo_seekable(self):
+        from gcloud.storage._helpers import _Checksums
+        from gcloud.storage._helpers import _HashingReader
+        stream = _Pipe(b'abcdef')
+        stream.seekable = None  # Like Python 2 files.
+        reader = _HashingReader(stream, _Checksums(crc32c=False))
+        self.assertEqual(reader.read(), b'abcdef')
+        self.assertEqual(reader.checksums.md5_hash,
+                         Test_Checksums.MD5_ABCDEF)
+        stream = _Pipe(b'abcdef')
+        stream.seekable = None
+        stream.tell = lambda: 0
+        reader = _HashingReader(stream, _Checksums(crc32c=False))
+        self.assertTrue(reader._seekable)
+
+
+class Test_HashingWriter(unittest2.TestCase):
+
+    def test_write(self):
+        from io import BytesIO
+        from gcloud.storage._helpers import _Checksums
+        from gcloud.storage._helpers import _HashingWriter
+        stream = BytesIO()
+        writer = _HashingWriter(stream, _Checksums(crc32c=False))
+        self.assertEqual(writer.write(b'abc'), 3)
+        writer.write(b'def')
+        self.assertEqual(writer.getvalue(), b'abcdef')
+        self.assertEqual(writer.checksums.md5_hash,
+                         Test_Checksums.MD5_ABCDEF)
+
+
+class _Pipe(object):
+
+    def __init__(self, data):
+        from io import BytesIO
+        self._stream = BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+    def seekable(self):
+        return False
+
+    def tell(self):
+        raise IOError(29, 'Illegal seek')
+
+
+class _NativeCRC32C(object):
+
+    def __init__(self, result):
+        self._result = result
+        self._extended = []
+
+    def extend(self, crc, data):
+        self._extended.append((crc, data))
+        return self._result
+
+
 class _Connection(object):
 
     def __init__(self, *responses):
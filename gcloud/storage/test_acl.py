@@ -703,6 +703,100 @@ class Test_ObjectACL(unittest2.TestCase):
         self.assertEqual(acl.save_path, '/b/%s/o/%s' % (NAME, BLOB_NAME))
 
 
+class _BulkTestBase(unittest2.TestCase):
+
+    def _makeACLs(self, names, loaded=True):
+        from gcloud.storage.acl import ObjectACL
+        bucket = _Bucket('name')
+        acls = []
+        for name in names:
+            acl = ObjectACL(_Blob(bucket, name))
+            acl.loaded = loaded
+            acls.append(acl)
+        return acls
+
+
+class Test_save_acls(_BulkTestBase):
+
+    def _callFUT(self, *args, **kw):
+        from gcloud.storage.acl import save_acls
+        return save_acls(*args, **kw)
+
+    def test_batches(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage.batch import Batch
+        connection = _BatchConnection()
+        client = _Client(connection)
+        acls = self._makeACLs(['a', 'b', 'c'])
+        for acl in acls:
+            acl.all().grant_read()
+        skipped, = self._makeACLs(['d'], loaded=False)
+        with _Monkey(Batch, _MAX_BATCH_SIZE=2):
+            self._callFUT(iter(acls + [skipped]), client=client,
+                          max_workers=1)
+        self.assertEqual(len(connection._batches), 2)
+        self.assertEqual(connection._patched, [
+            ('/b/name/o/a', {'acl': [{'entity': 'allUsers',
+                                      'role': 'READER'}]}),
+            ('/b/name/o/b', {'acl': [{'entity': 'allUsers',
+                                      'role': 'READER'}]}),
+            ('/b/name/o/c', {'acl': [{'entity': 'allUsers',
+                                      'role': 'READER'}]}),
+        ])
+        # Entities are reloaded from the responses.
+        self.assertEqual(list(acls[0]),
+                         [{'entity': 'allUsers', 'role': 'READER'}])
+        self.assertTrue(acls[0].loaded)
+        self.assertFalse(skipped.loaded)
+
+    def test_empty(self):
+        connection = _BatchConnection()
+        self._callFUT([], client=_Client(connection))
+        self.assertEqual(connection._batches, [])
+
+    def test_client_from_acl(self):
+        connection = _BatchConnection()
+        acl, = self._makeACLs(['a'])
+        acl.blob.client = _Client(connection)
+        self._callFUT([acl])
+        self.assertEqual(len(connection._batches), 1)
+
+    def test_failure_raised(self):
+        from gcloud.exceptions import Forbidden
+        connection = _BatchConnection(errors={'/b/name/o/b': 403})
+        acls = self._makeACLs(['a', 'b'])
+        with self.assertRaises(Forbidden):
+            self._callFUT(acls, client=_Client(connection))
+
+    def test_failure_reported(self):
+        connection = _BatchConnection(errors={'/b/name/o/a': 404})
+        acls = self._makeACLs(['a', 'b'])
+        failed = []
+        self._callFUT(acls, client=_Client(connection),
+                      on_error=failed.append)
+        acl, = failed
+        self.assertTrue(acl is acls[0])
+        self.assertEqual(len(connection._patched), 2)
+
+
+class Test_clear_acls(_BulkTestBase):
+
+    def _callFUT(self, *args, **kw):
+        from gcloud.storage.acl import clear_acls
+        return clear_acls(*args, **kw)
+
+    def test_it(self):
+        connection = _BatchConnection()
+        acls = self._makeACLs(['a', 'b'], loaded=False)
+        self._callFUT(acls, client=_Client(connection))
+        self.assertEqual(connection._patched, [
+            ('/b/name/o/a', {'acl': []}),
+            ('/b/name/o/b', {'acl': []}),
+        ])
+        self.assertEqual(list(acls[1]), [])
+        self.assertTrue(acls[1].loaded)
+
+
 class _Blob(object):
 
     def __init__(self, bucket, blob):
@@ -744,7 +838,44 @@ class _Connection(object):
             return response
 
 
+class _BatchConnection(object):
+    """Answer batches of PATCH requests, echoing each request's body."""
+
+    def __init__(self, errors=None):
+        self._errors = errors or {}
+        self._batches = []
+        self._patched = []
+
+    def _make_request(self, method, url, data=None, content_type=None,
+                      headers=None):
+        import json
+        import re
+        data = data.decode('utf-8')
+        self._batches.append(data)
+        parts = []
+        for path, body in re.findall(
+                r'PATCH \S+(/b/[^?\s]+)\S* HTTP/1.1\r\n.*?\r\n\r\n(.*?)\r\n',
+                data, re.S):
+            self._patched.append((path, json.loads(body)))
+            if path in self._errors:
+                status = self._errors[path]
+                body = '{"error": {"message": "failed"}}'
+            else:
+                status = 200
+            parts.append('--BOUNDARY\nContent-Type: application/http\n\n'
+                         'HTTP/1.1 %d Status\nContent-Type: application/json'
+                         '\n\n%s\n' % (status, body))
+        content = ''.join(parts) + '--BOUNDARY--'
+        response = _Response(
+            {'content-type': 'multipart/mixed; boundary="BOUNDARY"'})
+        return response, content
+
+
+class _Response(dict):
+    status = 200
+
+
 class _Client(object):
 
     def __init__(self, connection):
-        self.connection = connection
+        self.connection = self._connection = connection
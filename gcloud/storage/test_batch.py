@@ -15,57 +15,6 @@
 import unittest2
 
 
-class TestMIMEApplicationHTTP(unittest2.TestCase):
-
-    def _getTargetClass(self):
-        from gcloud.storage.batch import MIMEApplicationHTTP
-        return MIMEApplicationHTTP
-
-    def _makeOne(self, *args, **kw):
-        return self._getTargetClass()(*args, **kw)
-
-    def test_ctor_body_None(self):
-        METHOD = 'DELETE'
-        PATH = '/path/to/api'
-        LINES = [
-            "DELETE /path/to/api HTTP/1.1",
-            "",
-            ]
-        mah = self._makeOne(METHOD, PATH, {}, None)
-        self.assertEqual(mah.get_content_type(), 'application/http')
-        self.assertEqual(mah.get_payload().splitlines(), LINES)
-
-    def test_ctor_body_str(self):
-        METHOD = 'GET'
-        PATH = '/path/to/api'
-        BODY = 'ABC'
-        HEADERS = {'Content-Length': len(BODY), 'Content-Type': 'text/plain'}
-        LINES = [
-            "GET /path/to/api HTTP/1.1",
-            "Content-Length: 3",
-            "Content-Type: text/plain",
-            "",
-            "ABC",
-            ]
-        mah = self._makeOne(METHOD, PATH, HEADERS, BODY)
-        self.assertEqual(mah.get_payload().splitlines(), LINES)
-
-    def test_ctor_body_dict(self):
-        METHOD = 'GET'
-        PATH = '/path/to/api'
-        BODY = {'foo': 'bar'}
-        HEADERS = {}
-        LINES = [
-            'GET /path/to/api HTTP/1.1',
-            'Content-Length: 14',
-            'Content-Type: application/json',
-            '',
-            '{"foo": "bar"}',
-            ]
-        mah = self._makeOne(METHOD, PATH, HEADERS, BODY)
-        self.assertEqual(mah.get_payload().splitlines(), LINES)
-
-
 class TestBatch(unittest2.TestCase):
 
     def _getTargetClass(self):
@@ -211,6 +160,70 @@ class TestBatch(unittest2.TestCase):
                           batch._make_request, 'POST', URL, data={'foo': 1})
         self.assertTrue(connection.http is http)
 
+    def test_ctor_w_auto_flush(self):
+        client = _Client(_Connection(http=_HTTP()))
+        batch = self._makeOne(client, auto_flush=True, max_workers=2)
+        self.assertTrue(batch._auto_flush)
+        self.assertEqual(batch._flushes, [])
+
+    def _auto_flush_helper(self, count, *contents, **kw):
+        URL = 'http://api.example.com/other_api'
+        responses = []
+        for content in contents:
+            response = _Response()
+            response['content-type'] = 'multipart/mixed; boundary="DEADBEEF="'
+            responses.append((response, content))
+        http = _HTTP(*responses)
+        client = _Client(_Connection(http=http))
+        batch = self._makeOne(client, auto_flush=True, **kw)
+        batch._MAX_BATCH_SIZE = 2
+        targets = [_MockObject() for _ in range(count)]
+        for index, target in enumerate(targets):
+            batch._do_request('PATCH', URL, {}, {'bar': index}, target)
+        return batch, http, targets
+
+    def test_finish_w_auto_flush(self):
+        batch, http, targets = self._auto_flush_helper(
+            5, _mime_response({'foo': 0}, {'foo': 1}),
+            _mime_response({'foo': 2}, {'foo': 3}),
+            _mime_response({'foo': 4}), max_workers=1)
+        # Two full batches were handed off;  the fifth request is pending.
+        self.assertEqual(len(batch._requests), 1)
+        result = batch.finish()
+        self.assertEqual(len(http._requests), 3)
+        self.assertEqual([payload for _, payload in result],
+                         [{'foo': index} for index in range(5)])
+        self.assertEqual([target._properties for target in targets],
+                         [{'foo': index} for index in range(5)])
+        self.assertEqual(batch._target_objects, targets)
+        self.assertEqual(batch._flushes, [])
+
+    def test_finish_w_auto_flush_concurrent(self):
+        CONTENT = _mime_response({'foo': 'same'}, {'foo': 'same'})
+        batch, http, targets = self._auto_flush_helper(
+            8, *([CONTENT] * 4), max_workers=3)
+        result = batch.finish()
+        self.assertEqual(len(http._requests), 4)
+        self.assertEqual(len(result), 8)
+        for target in targets:
+            self.assertEqual(target._properties, {'foo': 'same'})
+
+    def test_finish_w_auto_flush_background_failure(self):
+        batch, http, targets = self._auto_flush_helper(
+            3, 'not multipart', max_workers=1)
+        self.assertRaises(ValueError, batch.finish)
+        self.assertEqual(len(http._requests), 1)
+
+    def test_finish_w_auto_flush_status_failure(self):
+        from gcloud.exceptions import NotFound
+        batch, http, targets = self._auto_flush_helper(
+            3, _TWO_PART_MIME_RESPONSE_WITH_FAIL,
+            _mime_response({'foo': 2}), max_workers=1)
+        self.assertRaises(NotFound, batch.finish)
+        self.assertEqual(len(http._requests), 2)
+        self.assertEqual(targets[0]._properties, {'foo': 1, 'bar': 2})
+        self.assertEqual(targets[2]._properties, {'foo': 2})
+
     def test_finish_empty(self):
         http = _HTTP()  # no requests expected
         connection = _Connection(http=http)
@@ -292,6 +305,7 @@ class TestBatch(unittest2.TestCase):
         self.assertEqual(headers['MIME-Version'], '1.0')
 
         divider = '--' + boundary[len('boundary="'):-1]
+        body = body.decode('utf-8')
         chunks = body.split(divider)[1:-1]  # discard prolog / epilog
         self.assertEqual(len(chunks), 3)
 
@@ -350,6 +364,7 @@ class TestBatch(unittest2.TestCase):
         self.assertEqual(headers['MIME-Version'], '1.0')
 
         divider = '--' + boundary[len('boundary="'):-1]
+        body = body.decode('utf-8')
         chunks = body.split(divider)[1:-1]  # discard prolog / epilog
         self.assertEqual(len(chunks), 2)
 
@@ -479,6 +494,121 @@ class Test__unpack_batch_response(unittest2.TestCase):
         self._unpack_helper(RESPONSE, CONTENT)
 
 
+class Test__encode_batch_body(unittest2.TestCase):
+
+    def _callFUT(self, requests, boundary):
+        from gcloud.storage.batch import _encode_batch_body
+        return _encode_batch_body(requests, boundary)
+
+    def test_payload_types(self):
+        headers = {'X-Foo': 'bar'}
+        requests = [
+            ('POST', '/one', headers, {'a': 1}),
+            ('PUT', '/two', {}, u'\u00e9'),
+            ('PUT', '/three', {}, b'\x00\xff'),
+            ('DELETE', '/four', {}, None),
+        ]
+        body = self._callFUT(requests, 'XYZ')
+        self.assertEqual(headers, {'X-Foo': 'bar'})  # Not mutated.
+        part = (b'--XYZ\r\n'
+                b'Content-Type: application/http\r\n'
+                b'MIME-Version: 1.0\r\n\r\n')
+        self.assertEqual(body, b''.join([
+            part,
+            b'POST /one HTTP/1.1\r\n'
+            b'Content-Length: 8\r\n'
+            b'Content-Type: application/json\r\n'
+            b'X-Foo: bar\r\n\r\n'
+            b'{"a": 1}\r\n',
+            part,
+            b'PUT /two HTTP/1.1\r\n\r\n\xc3\xa9\r\n',
+            part,
+            b'PUT /three HTTP/1.1\r\n\r\n\x00\xff\r\n',
+            part,
+            b'DELETE /four HTTP/1.1\r\n\r\n\r\n',
+            b'--XYZ--\r\n',
+        ]))
+
+    def test_round_trip_through_email_parser(self):
+        from email.parser import Parser
+        body = self._callFUT([('GET', '/one', {}, None),
+                              ('PATCH', '/two', {}, {'b': 2})], 'XYZ')
+        message = Parser().parsestr(
+            'Content-Type: multipart/mixed; boundary="XYZ"\n\n' +
+            body.decode('utf-8'))
+        parts = message.get_payload()
+        self.assertEqual(len(parts), 2)
+        self.assertEqual(parts[0].get_content_type(), 'application/http')
+        self.assertTrue(
+            parts[1].get_payload().startswith('PATCH /two HTTP/1.1'))
+
+
+class Test__get_boundary(unittest2.TestCase):
+
+    def _callFUT(self, content_type):
+        from gcloud.storage.batch import _get_boundary
+        return _get_boundary(content_type)
+
+    def test_quoted(self):
+        self.assertEqual(
+            self._callFUT('multipart/mixed; boundary="batch_abc"'),
+            b'batch_abc')
+
+    def test_unquoted_w_other_params(self):
+        self.assertEqual(
+            self._callFUT('Multipart/Mixed; charset=x; Boundary=abc'),
+            b'abc')
+
+    def test_not_multipart(self):
+        self.assertEqual(self._callFUT('application/json'), None)
+
+    def test_no_boundary(self):
+        self.assertEqual(self._callFUT('multipart/mixed'), None)
+
+
+class Test__unpack_batch_response_errors(unittest2.TestCase):
+
+    RESPONSE = {'content-type': 'multipart/mixed; boundary="XYZ"'}
+
+    def _callFUT(self, response, content):
+        from gcloud.storage.batch import _unpack_batch_response
+        return _unpack_batch_response(response, content)
+
+    def test_crlf_line_endings(self):
+        CONTENT = (b'--XYZ\r\n'
+                   b'Content-Type: application/http\r\n\r\n'
+                   b'HTTP/1.1 404 Not Found\r\n'
+                   b'Content-Type: text/plain\r\n\r\n'
+                   b'missing\r\n'
+                   b'--XYZ--\r\n')
+        (headers, payload), = self._callFUT(self.RESPONSE, CONTENT)
+        self.assertEqual(headers.status, 404)
+        self.assertEqual(headers['content-type'], 'text/plain')
+        self.assertEqual(payload, 'missing')
+
+    def test_not_multipart(self):
+        RESPONSE = {'content-type': 'application/json'}
+        with self.assertRaises(ValueError):
+            list(self._callFUT(RESPONSE, b'{}'))
+
+    def test_missing_delimiter(self):
+        with self.assertRaises(ValueError):
+            list(self._callFUT(self.RESPONSE, b'no parts here'))
+
+    def test_parts_parsed_lazily(self):
+        CONTENT = (b'--XYZ\n'
+                   b'Content-Type: application/http\n\n'
+                   b'HTTP/1.1 204 No Content\n\n'
+                   b'--XYZ\n'
+                   b'truncated')
+        parts = self._callFUT(self.RESPONSE, CONTENT)
+        headers, payload = next(parts)
+        self.assertEqual(headers.status, 204)
+        self.assertEqual(payload, '')
+        with self.assertRaises(ValueError):
+            next(parts)
+
+
 _TWO_PART_MIME_RESPONSE_WITH_FAIL = b"""\
 --DEADBEEF=
 Content-Type: application/http
@@ -535,6 +665,22 @@ Content-Length: 0
 """
 
 
+def _mime_response(*payloads):
+    import json
+    parts = []
+    for index, payload in enumerate(payloads):
+        body = json.dumps(payload)
+        parts.append(
+            '--DEADBEEF=\n'
+            'Content-Type: application/http\n'
+            'Content-ID: <response-%d>\n\n'
+            'HTTP/1.1 200 OK\n'
+            'Content-Type: application/json; charset=UTF-8\n'
+            'Content-Length: %d\n\n'
+            '%s\n\n' % (index, len(body), body))
+    return (''.join(parts) + '--DEADBEEF=--\n').encode('utf-8')
+
+
 class Test__FutureDict(unittest2.TestCase):
 
     def _makeOne(self, *args, **kw):
@@ -232,6 +232,59 @@ class Test_Blob(unittest2.TestCase):
         bucket._blobs[BLOB_NAME] = 1
         self.assertTrue(blob.exists())
 
+    def test_exists_w_metadata_cache(self):
+        from gcloud.storage.cache import BlobMetadataCache
+        connection = _Connection({'name': 'blob-name', 'generation': '1',
+                                  'metageneration': '1'})
+        client = _Client(connection)
+        client.metadata_cache = BlobMetadataCache()
+        blob = self._makeOne('blob-name', bucket=_Bucket(client))
+        self.assertTrue(blob.exists())
+        self.assertTrue(blob.exists())
+        kw, = connection._requested
+        self.assertEqual(kw['query_params'], {'projection': 'noAcl'})
+
+    def test_exists_miss_w_metadata_cache(self):
+        from six.moves.http_client import NOT_FOUND
+        from gcloud.storage.cache import BlobMetadataCache
+        connection = _Connection({'status': NOT_FOUND})
+        client = _Client(connection)
+        client.metadata_cache = BlobMetadataCache()
+        blob = self._makeOne('nonesuch', bucket=_Bucket(client))
+        self.assertFalse(blob.exists())
+        self.assertEqual(len(client.metadata_cache), 0)
+
+    def test_reload_w_metadata_cache(self):
+        from gcloud.storage.cache import BlobMetadataCache
+        connection = _Connection({'name': 'blob-name', 'generation': '1',
+                                  'metageneration': '1', 'size': '3'})
+        client = _Client(connection)
+        client.metadata_cache = BlobMetadataCache()
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        blob.reload()
+        other = self._makeOne('blob-name', bucket=bucket)
+        other.reload()
+        self.assertEqual(other.size, 3)
+        self.assertEqual(len(connection._requested), 1)
+
+    def test_patch_w_metadata_cache(self):
+        from gcloud.storage.cache import BlobMetadataCache
+        connection = _Connection({'name': 'blob-name', 'generation': '1',
+                                  'metageneration': '2',
+                                  'contentType': 'text/plain'})
+        client = _Client(connection)
+        client.metadata_cache = cache = BlobMetadataCache()
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        blob.content_type = 'text/plain'
+        blob.patch()
+        other = self._makeOne('blob-name', bucket=bucket)
+        other.reload()  # Served from the cache.
+        self.assertEqual(other.content_type, 'text/plain')
+        self.assertEqual(len(connection._requested), 1)
+        self.assertEqual(cache.hits, 1)
+
     def test_delete(self):
         from six.moves.http_client import NOT_FOUND
         BLOB_NAME = 'blob-name'
@@ -276,9 +329,96 @@ class Test_Blob(unittest2.TestCase):
     def test_download_to_file_with_chunk_size(self):
         self._download_to_file_helper(chunk_size=3)
 
+    def test_download_to_file_w_adaptive_chunk_size(self):
+        from io import BytesIO
+        from six.moves.http_client import OK
+        from six.moves.http_client import PARTIAL_CONTENT
+        from gcloud.storage.stats import AdaptiveChunkSize
+        KB = 1024
+        connection = _Connection(
+            ({'status': PARTIAL_CONTENT,
+              'content-range': 'bytes 0-%d/%d' % (256 * KB - 1, 768 * KB)},
+             b'x' * (256 * KB)),
+            ({'status': OK,
+              'content-range': 'bytes %d-%d/%d' % (256 * KB, 768 * KB - 1,
+                                                   768 * KB)},
+             b'y' * (512 * KB)),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        properties = {'mediaLink': 'http://example.com/media/'}
+        blob = self._makeOne('blob-name', bucket=bucket,
+                             properties=properties)
+        blob.adaptive_chunk_size = AdaptiveChunkSize(initial=256 * KB)
+        fh = BytesIO()
+        blob.download_to_file(fh)
+        self.assertEqual(len(fh.getvalue()), 768 * KB)
+        ranges = [req['headers']['range']
+                  for req in connection.http._requested]
+        self.assertEqual(ranges, ['bytes=0-%d' % (256 * KB - 1,),
+                                  'bytes=%d-%d' % (256 * KB, 768 * KB - 1)])
+
+    def test_download_to_file_w_progress(self):
+        from io import BytesIO
+        from six.moves.http_client import OK
+        from six.moves.http_client import PARTIAL_CONTENT
+        from gcloud.storage.stats import TransferStats
+        connection = _Connection(
+            ({'status': PARTIAL_CONTENT, 'content-range': 'bytes 0-2/6'},
+             b'abc'),
+            ({'status': OK, 'content-range': 'bytes 3-5/6'}, b'def'),
+        )
+        client = _Client(connection)
+        client.transfer_stats = TransferStats()
+        bucket = _Bucket(client)
+        properties = {'mediaLink': 'http://example.com/media/', 'size': '6'}
+        blob = self._makeOne('blob-name', bucket=bucket,
+                             properties=properties)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+        updates = []
+        blob.download_to_file(BytesIO(), progress=updates.append)
+        self.assertEqual([(update.bytes_done, update.chunk_bytes)
+                          for update in updates], [(3, 3), (6, 3)])
+        self.assertEqual(updates[-1].total_bytes, 6)
+        self.assertEqual(updates[-1].direction, 'download')
+        stats = client.transfer_stats
+        self.assertEqual((stats.transfers, stats.chunks,
+                          stats.bytes_downloaded), (1, 2, 6))
+
+    def _download_checked_helper(self, **properties):
+        from io import BytesIO
+        from six.moves.http_client import OK
+        connection = _Connection(
+            ({'status': OK, 'content-range': 'bytes 0-5/6'}, b'abcdef'),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        properties['mediaLink'] = 'http://example.com/media/'
+        blob = self._makeOne('blob-name', bucket=bucket,
+                             properties=properties)
+        fh = BytesIO()
+        blob.download_to_file(fh)
+        self.assertEqual(fh.getvalue(), b'abcdef')
+
+    def test_download_to_file_md5_match(self):
+        self._download_checked_helper(md5Hash='6AtQFwmJUPxYqtg8jBSXjg==')
+
+    def test_download_to_file_md5_mismatch(self):
+        with self.assertRaises(ValueError):
+            self._download_checked_helper(md5Hash='kAFQmDzST7DWlj99KOF/cg==')
+
+    def test_download_to_file_crc32c_mismatch(self):
+        with self.assertRaises(ValueError):
+            self._download_checked_helper(crc32c='AAAAAA==')
+
+    def test_download_to_file_w_content_encoding(self):
+        self._download_checked_helper(md5Hash='kAFQmDzST7DWlj99KOF/cg==',
+                                      contentEncoding='gzip')
+
     def test_download_to_filename(self):
+        import calendar
         import os
-        import time
         from six.moves.http_client import OK
         from six.moves.http_client import PARTIAL_CONTENT
         from tempfile import NamedTemporaryFile
@@ -305,10 +445,233 @@ class Test_Blob(unittest2.TestCase):
             with open(f.name, 'rb') as g:
                 wrote = g.read()
                 mtime = os.path.getmtime(f.name)
-                updatedTime = time.mktime(blob.updated.timetuple())
+                updatedTime = calendar.timegm(
+                    blob.updated.utctimetuple())
         self.assertEqual(wrote, b'abcdef')
         self.assertEqual(mtime, updatedTime)
 
+    def _download_sliced_helper(self, responses, data, slice_size,
+                                properties=None, max_workers=1,
+                                num_retries=6):
+        import os
+        from tempfile import NamedTemporaryFile
+        from gcloud.storage._helpers import _base64_crc32c
+        from gcloud.storage._helpers import _crc32c
+        connection = _Connection(*responses)
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        if properties is None:
+            properties = {'mediaLink': 'http://example.com/media/',
+                          'size': str(len(data)),
+                          'crc32c': _base64_crc32c(_crc32c(data)),
+                          'updated': '2014-12-06T13:13:50.690Z'}
+        blob = self._makeOne('blob-name', bucket=bucket,
+                             properties=properties)
+        with NamedTemporaryFile() as f:
+            blob.download_to_filename(f.name, slice_size=slice_size,
+                                      max_workers=max_workers,
+                                      num_retries=num_retries)
+            with open(f.name, 'rb') as g:
+                wrote = g.read()
+            self.assertEqual(os.path.getsize(f.name), len(data))
+        self.assertEqual(wrote, data)
+        return connection
+
+    def test_download_to_filename_sliced(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        DATA = b'abcdefghij'
+        connection = self._download_sliced_helper([
+            ({'status': PARTIAL_CONTENT}, b'abcd'),
+            ({'status': PARTIAL_CONTENT}, b'efgh'),
+            ({'status': PARTIAL_CONTENT}, b'ij'),
+        ], DATA, 4)
+        rq = connection.http._requested
+        self.assertEqual(len(rq), 3)
+        self.assertEqual([req['uri'] for req in rq],
+                         ['http://example.com/media/'] * 3)
+        self.assertEqual([req['headers']['Range'] for req in rq],
+                         ['bytes=0-3', 'bytes=4-7', 'bytes=8-9'])
+
+    def test_download_to_filename_sliced_w_workers(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        # Identical slices, since responses may be consumed in any order.
+        DATA = b'abcd' * 3
+        connection = self._download_sliced_helper(
+            [({'status': PARTIAL_CONTENT}, b'abcd')] * 3, DATA, 4,
+            max_workers=3)
+        self.assertEqual(len(connection.http._requested), 3)
+
+    def test_download_to_filename_sliced_wo_pwrite(self):
+        import os
+        from six.moves.http_client import PARTIAL_CONTENT
+        from gcloud._testing import _Monkey
+        DATA = b'abcdefghij'
+        with _Monkey(os, pwrite=None):
+            self._download_sliced_helper([
+                ({'status': PARTIAL_CONTENT}, b'abcd'),
+                ({'status': PARTIAL_CONTENT}, b'efgh'),
+                ({'status': PARTIAL_CONTENT}, b'ij'),
+            ], DATA, 4)
+
+    def test_download_to_filename_sliced_wo_fallocate(self):
+        import os
+        from six.moves.http_client import PARTIAL_CONTENT
+        from gcloud._testing import _Monkey
+
+        def _fallocate(*args):
+            raise OSError('not supported')
+
+        DATA = b'abcdefghij'
+        with _Monkey(os, posix_fallocate=_fallocate):
+            self._download_sliced_helper([
+                ({'status': PARTIAL_CONTENT}, b'abcdefgh'),
+                ({'status': PARTIAL_CONTENT}, b'ij'),
+            ], DATA, 8)
+
+    def test_download_to_filename_sliced_short_response(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        DATA = b'abcdefghij'
+        connection = self._download_sliced_helper([
+            ({'status': PARTIAL_CONTENT}, b'ab'),
+            ({'status': PARTIAL_CONTENT}, b''),
+            ({'status': PARTIAL_CONTENT}, b'cd'),
+            ({'status': PARTIAL_CONTENT}, b'efgh'),
+            ({'status': PARTIAL_CONTENT}, b'ij'),
+        ], DATA, 4)
+        rq = connection.http._requested
+        self.assertEqual([req['headers']['Range'] for req in rq],
+                         ['bytes=0-3', 'bytes=2-3', 'bytes=2-3',
+                          'bytes=4-7', 'bytes=8-9'])
+
+    def test_download_to_filename_sliced_empty_responses(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        with self.assertRaises(ValueError):
+            self._download_sliced_helper(
+                [({'status': PARTIAL_CONTENT}, b'')] * 2, b'abcdefghij', 4,
+                num_retries=1)
+
+    def test_download_to_filename_sliced_whole_object(self):
+        from six.moves.http_client import OK
+        DATA = b'abcdefghij'
+        connection = self._download_sliced_helper(
+            [({'status': OK}, DATA)] * 3, DATA, 4)
+        # No slicing after the first whole response.
+        self.assertEqual(len(connection.http._requested), 1)
+
+    def test_download_to_filename_w_slice_size_content_encoding(self):
+        from six.moves.http_client import OK
+        DATA = b'abcdefghij'
+        properties = {'mediaLink': 'http://example.com/media/',
+                      'size': '6', 'contentEncoding': 'gzip',
+                      'updated': '2014-12-06T13:13:50.690Z'}
+        connection = self._download_sliced_helper(
+            [({'status': OK, 'content-range': 'bytes 0-9/10'}, DATA)],
+            DATA, 4, properties=properties)
+        rq = connection.http._requested
+        self.assertEqual(len(rq), 1)
+        self.assertEqual(rq[0]['headers']['range'], 'bytes=0-1048575')
+
+    def test_download_to_filename_sliced_error(self):
+        from six.moves.http_client import NOT_FOUND
+        from apitools.base.py.exceptions import HttpError
+        with self.assertRaises(HttpError):
+            self._download_sliced_helper(
+                [({'status': NOT_FOUND}, b'')], b'abcdefghij', 4)
+
+    def test_download_to_filename_sliced_bad_crc(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        properties = {'mediaLink': 'http://example.com/media/',
+                      'size': '10', 'crc32c': 'AAAAAA=='}
+        with self.assertRaises(ValueError):
+            self._download_sliced_helper([
+                ({'status': PARTIAL_CONTENT}, b'abcdefgh'),
+                ({'status': PARTIAL_CONTENT}, b'ij'),
+            ], b'abcdefghij', 8, properties=properties)
+
+    def test_download_to_filename_sliced_reloads_size(self):
+        from tempfile import NamedTemporaryFile
+        from six.moves.http_client import PARTIAL_CONTENT
+        DATA = b'abcdefghij'
+        connection = _Connection(
+            ({'status': PARTIAL_CONTENT}, b'abcdefgh'),
+            ({'status': PARTIAL_CONTENT}, b'ij'),
+        )
+        # ``reload`` goes through ``api_request``, not ``http``.
+        connection._responses = ({
+            'mediaLink': 'http://example.com/media/',
+            'size': '10',
+            'updated': '2014-12-06T13:13:50.690Z'},)
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        with NamedTemporaryFile() as f:
+            blob.download_to_filename(f.name, slice_size=8, max_workers=1)
+            with open(f.name, 'rb') as g:
+                self.assertEqual(g.read(), DATA)
+        kw, = connection._requested
+        self.assertEqual(kw['method'], 'GET')
+        self.assertEqual(kw['path'], '/b/name/o/blob-name')
+        self.assertEqual(len(connection.http._requested), 2)
+
+    def _make_streaming_blob(self, *responses):
+        connection = _Connection(*responses)
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        properties = {'mediaLink': 'http://example.com/media/',
+                      'size': '10'}
+        blob = self._makeOne('blob-name', bucket=bucket,
+                             properties=properties)
+        return blob, connection
+
+    def test_iter_bytes(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        blob, connection = self._make_streaming_blob(
+            ({'status': PARTIAL_CONTENT}, b'abcd'),
+            ({'status': PARTIAL_CONTENT}, b'efgh'),
+            ({'status': PARTIAL_CONTENT}, b'ij'),
+        )
+        chunks = blob.iter_bytes(chunk_size=4)
+        self.assertEqual(next(chunks), b'abcd')
+        # Only the first chunk has been requested so far.
+        self.assertEqual(len(connection.http._requested), 1)
+        self.assertEqual(list(chunks), [b'efgh', b'ij'])
+        rq = connection.http._requested
+        self.assertEqual([req['headers']['Range'] for req in rq],
+                         ['bytes=0-3', 'bytes=4-7', 'bytes=8-9'])
+
+    def test_iter_bytes_checksum_mismatch(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        blob, _ = self._make_streaming_blob(
+            ({'status': PARTIAL_CONTENT}, b'abcdefghij'),
+        )
+        blob._properties['md5Hash'] = 'kAFQmDzST7DWlj99KOF/cg=='
+        chunks = blob.iter_bytes()
+        self.assertEqual(next(chunks), b'abcdefghij')
+        with self.assertRaises(ValueError):
+            next(chunks)
+
+    def test_iter_bytes_default_chunk_size(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        blob, connection = self._make_streaming_blob(
+            ({'status': PARTIAL_CONTENT}, b'abcdefghij'),
+        )
+        self.assertEqual(list(blob.iter_bytes()), [b'abcdefghij'])
+        req, = connection.http._requested
+        self.assertEqual(req['headers']['Range'], 'bytes=0-9')
+
+    def test_open_reader(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        blob, connection = self._make_streaming_blob(
+            ({'status': PARTIAL_CONTENT}, b'ab\ncd'),
+            ({'status': PARTIAL_CONTENT}, b'efg\nj'),
+        )
+        with blob.open_reader(chunk_size=5) as file_obj:
+            self.assertEqual(list(file_obj), [b'ab\n', b'cdefg\n', b'j'])
+        self.assertTrue(file_obj.closed)
+        rq = connection.http._requested
+        self.assertEqual([req['headers']['Range'] for req in rq],
+                         ['bytes=0-4', 'bytes=5-9'])
+
     def test_download_as_string(self):
         from six.moves.http_client import OK
         from six.moves.http_client import PARTIAL_CONTENT
@@ -331,6 +694,73 @@ class Test_Blob(unittest2.TestCase):
         fetched = blob.download_as_string()
         self.assertEqual(fetched, b'abcdef')
 
+    def _download_into_blob(self, properties=None):
+        from six.moves.http_client import OK
+        from six.moves.http_client import PARTIAL_CONTENT
+        chunk1_response = {'status': PARTIAL_CONTENT,
+                           'content-range': 'bytes 0-2/6'}
+        chunk2_response = {'status': OK,
+                           'content-range': 'bytes 3-5/6'}
+        connection = _Connection(
+            (chunk1_response, b'abc'),
+            (chunk2_response, b'def'),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob_properties = {'mediaLink': 'http://example.com/media/',
+                           'size': '6'}
+        blob_properties.update(properties or {})
+        blob = self._makeOne('blob-name', bucket=bucket,
+                             properties=blob_properties)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+        return blob
+
+    def test_download_into_bytearray(self):
+        blob = self._download_into_blob()
+        buffer = bytearray(b'x' * 8)
+        self.assertEqual(blob.download_into(buffer), 6)
+        self.assertEqual(buffer, bytearray(b'abcdefxx'))
+
+    def test_download_into_memoryview_slice(self):
+        blob = self._download_into_blob()
+        buffer = bytearray(b'x' * 8)
+        self.assertEqual(blob.download_into(memoryview(buffer)[2:]), 6)
+        self.assertEqual(buffer, bytearray(b'xxabcdef'))
+
+    def test_download_into_too_small(self):
+        blob = self._download_into_blob()
+        with self.assertRaises(ValueError):
+            blob.download_into(bytearray(5))
+
+    def test_download_into_read_only(self):
+        blob = self._download_into_blob()
+        with self.assertRaises(ValueError):
+            blob.download_into(b'x' * 6)
+
+    def test_download_into_more_than_size(self):
+        blob = self._download_into_blob({'size': '3'})
+        with self.assertRaises(ValueError):
+            blob.download_into(bytearray(4))
+
+    def test_download_into_w_content_encoding(self):
+        blob = self._download_into_blob({'size': '6',
+                                         'contentEncoding': 'gzip'})
+        with self.assertRaises(ValueError):
+            blob.download_into(bytearray(6))
+        self.assertEqual(blob.bucket.client.connection.http._requested, [])
+
+    def test_download_as_bytes(self):
+        blob = self._download_into_blob()
+        fetched = blob.download_as_bytes()
+        self.assertEqual(fetched, bytearray(b'abcdef'))
+        self.assertTrue(isinstance(fetched, bytearray))
+
+    def test_download_as_bytes_w_content_encoding(self):
+        blob = self._download_into_blob({'contentEncoding': 'gzip',
+                                         'size': '2'})
+        self.assertEqual(blob.download_as_bytes(), bytearray(b'abcdef'))
+
     def test_upload_from_file_size_failure(self):
         BLOB_NAME = 'blob-name'
         connection = _Connection()
@@ -403,6 +833,47 @@ class Test_Blob(unittest2.TestCase):
             content_type_arg=EXPECTED_CONTENT_TYPE,
             expected_content_type=EXPECTED_CONTENT_TYPE)
 
+    def test_upload_from_file_w_pipe(self):
+        import os
+        from six.moves.http_client import OK
+        connection = _Connection(
+            ({'status': OK},
+             b'{"md5Hash": "6AtQFwmJUPxYqtg8jBSXjg=="}'),
+        )
+        client = _Client(connection)
+        blob = self._makeOne('blob-name', bucket=_Bucket(client))
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b'abcdef')
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as pipe:
+            blob.upload_from_file(pipe, size=6)
+        rq = connection.http._requested
+        self.assertEqual(len(rq), 1)
+        self.assertTrue(b'abcdef' in rq[0]['body'])
+
+    def _upload_from_file_checked_helper(self, response_properties):
+        import json
+        from io import BytesIO
+        from six.moves.http_client import OK
+        connection = _Connection(
+            ({'status': OK}, json.dumps(response_properties).encode('ascii')),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        blob.upload_from_file(BytesIO(b'abcdef'), size=6)
+        return blob
+
+    def test_upload_from_file_md5_match(self):
+        blob = self._upload_from_file_checked_helper(
+            {'md5Hash': '6AtQFwmJUPxYqtg8jBSXjg=='})
+        self.assertEqual(blob.md5_hash, '6AtQFwmJUPxYqtg8jBSXjg==')
+
+    def test_upload_from_file_md5_mismatch(self):
+        with self.assertRaises(ValueError):
+            self._upload_from_file_checked_helper(
+                {'md5Hash': 'kAFQmDzST7DWlj99KOF/cg=='})
+
     def test_upload_from_file_resumable(self):
         from six.moves.http_client import OK
         from six.moves.urllib.parse import parse_qsl
@@ -465,6 +936,65 @@ class Test_Blob(unittest2.TestCase):
             [(x.title(), str(y)) for x, y in rq[2]['headers'].items()])
         self.assertEqual(headers['Content-Range'], 'bytes 5-5/6')
 
+    def test_upload_from_file_resumable_w_adaptive_chunk_size(self):
+        from io import BytesIO
+        from six.moves.http_client import OK
+        from gcloud._testing import _Monkey
+        from apitools.base.py import http_wrapper
+        from apitools.base.py import transfer
+        from gcloud.storage.stats import AdaptiveChunkSize
+        KB = 1024
+        UPLOAD_URL = 'http://example.com/upload/name/key'
+        connection = _Connection(
+            ({'status': OK, 'location': UPLOAD_URL}, b''),
+            ({'status': http_wrapper.RESUME_INCOMPLETE,
+              'range': 'bytes 0-%d' % (256 * KB - 1,)}, b''),
+            ({'status': OK}, b'{}'),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        blob.adaptive_chunk_size = AdaptiveChunkSize(initial=256 * KB)
+        data = b'x' * (768 * KB)
+        with _Monkey(transfer, _RESUMABLE_UPLOAD_THRESHOLD=5):
+            blob.upload_from_file(BytesIO(data), size=len(data))
+        rq = connection.http._requested
+        self.assertEqual(
+            [len(req['body']) for req in rq[1:]], [256 * KB, 512 * KB])
+        self.assertEqual(blob.adaptive_chunk_size.chunk_size, 1024 * KB)
+
+    def test_upload_from_file_resumable_w_progress(self):
+        from io import BytesIO
+        from six.moves.http_client import OK
+        from gcloud._testing import _Monkey
+        from apitools.base.py import http_wrapper
+        from apitools.base.py import transfer
+        from gcloud.storage.stats import TransferStats
+        UPLOAD_URL = 'http://example.com/upload/name/key'
+        connection = _Connection(
+            ({'status': OK, 'location': UPLOAD_URL}, b''),
+            ({'status': http_wrapper.RESUME_INCOMPLETE,
+              'range': 'bytes 0-4'}, b''),
+            ({'status': OK}, b'{}'),
+        )
+        client = _Client(connection)
+        client.transfer_stats = TransferStats()
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 5
+        updates = []
+        with _Monkey(transfer, _RESUMABLE_UPLOAD_THRESHOLD=5):
+            blob.upload_from_file(BytesIO(b'ABCDEF'), size=6,
+                                  progress=updates.append)
+        # The session's initial request carries no content:  not counted.
+        self.assertEqual([(update.bytes_done, update.total_bytes)
+                          for update in updates], [(5, 6), (6, 6)])
+        self.assertEqual(updates[0].direction, 'upload')
+        stats = client.transfer_stats
+        self.assertEqual((stats.transfers, stats.chunks,
+                          stats.bytes_uploaded), (1, 2, 6))
+
     def test_upload_from_file_w_slash_in_name(self):
         from six.moves.http_client import OK
         from six.moves.urllib.parse import parse_qsl
@@ -513,7 +1043,8 @@ class Test_Blob(unittest2.TestCase):
 
     def _upload_from_filename_test_helper(self, properties=None,
                                           content_type_arg=None,
-                                          expected_content_type=None):
+                                          expected_content_type=None,
+                                          use_mmap=False):
         from six.moves.http_client import OK
         from six.moves.urllib.parse import parse_qsl
         from six.moves.urllib.parse import urlsplit
@@ -540,7 +1071,8 @@ class Test_Blob(unittest2.TestCase):
         with NamedTemporaryFile(suffix='.jpeg') as fh:
             fh.write(DATA)
             fh.flush()
-            blob.upload_from_filename(fh.name, content_type=content_type_arg)
+            blob.upload_from_filename(fh.name, content_type=content_type_arg,
+                                      use_mmap=use_mmap)
         rq = connection.http._requested
         self.assertEqual(len(rq), 1)
         self.assertEqual(rq[0]['method'], 'POST')
@@ -560,6 +1092,10 @@ class Test_Blob(unittest2.TestCase):
         self._upload_from_filename_test_helper(
             expected_content_type='image/jpeg')
 
+    def test_upload_from_filename_w_mmap(self):
+        self._upload_from_filename_test_helper(
+            expected_content_type='image/jpeg', use_mmap=True)
+
     def test_upload_from_filename_with_content_type(self):
         EXPECTED_CONTENT_TYPE = 'foo/bar'
         self._upload_from_filename_test_helper(
@@ -580,6 +1116,569 @@ class Test_Blob(unittest2.TestCase):
             content_type_arg=EXPECTED_CONTENT_TYPE,
             expected_content_type=EXPECTED_CONTENT_TYPE)
 
+    def _upload_sliced_helper(self, data, slice_size, compose_crc=None,
+                              component_crc=None, max_workers=1,
+                              use_mmap=False):
+        import json
+        from tempfile import NamedTemporaryFile
+        from six.moves.http_client import OK
+        from gcloud.storage._helpers import _base64_crc32c
+        from gcloud.storage._helpers import _crc32c
+        BLOB_NAME = 'blob-name'
+        slices = [data[start:start + slice_size]
+                  for start in range(0, len(data), slice_size)]
+        uploads = []
+        for chunk in slices:
+            crc = component_crc or _base64_crc32c(_crc32c(chunk))
+            uploads.append(({'status': OK},
+                            json.dumps({'crc32c': crc}).encode('ascii')))
+        connection = _Connection(*uploads)
+        if compose_crc is None:
+            compose_crc = _base64_crc32c(_crc32c(data))
+        connection._responses = ({'crc32c': compose_crc,
+                                  'componentCount': len(slices)},)
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne(BLOB_NAME, bucket=bucket)
+        with NamedTemporaryFile() as fh:
+            fh.write(data)
+            fh.flush()
+            try:
+                blob.upload_from_filename(fh.name, content_type='foo/bar',
+                                          slice_size=slice_size,
+                                          max_workers=max_workers,
+                                          use_mmap=use_mmap)
+            finally:
+                self.assertEqual(len(bucket._deleted_blobs), 1)
+        return blob, connection, bucket
+
+    def test_upload_from_filename_sliced(self):
+        DATA = b'ABCDEFGHIJ'
+        blob, connection, bucket = self._upload_sliced_helper(DATA, 4)
+        uploads = connection.http._requested
+        self.assertEqual(len(uploads), 3)
+        self.assertEqual(sorted(rq['body'] for rq in uploads),
+                         [b'ABCD', b'EFGH', b'IJ'])
+        self.assertEqual(blob.component_count, 3)
+        kw = connection._requested
+        self.assertEqual(len(kw), 1)
+        self.assertEqual(kw[0]['method'], 'POST')
+        self.assertEqual(kw[0]['path'], '/b/name/o/blob-name/compose')
+        request = kw[0]['data']
+        self.assertEqual(request['destination'], {'contentType': 'foo/bar'})
+        names = [source['name'] for source in request['sourceObjects']]
+        self.assertEqual(len(names), 3)
+        for index, name in enumerate(names):
+            self.assertTrue(name.startswith('blob-name.gcloud-component-'))
+            self.assertTrue(name.endswith('-0-%05d' % (index,)))
+        blobs, on_error, client = bucket._deleted_blobs[0]
+        self.assertEqual(sorted(deleted.name for deleted in blobs), names)
+        self.assertTrue(on_error(object()) is None)
+        self.assertTrue(client is bucket.client)
+
+    def test_upload_from_filename_sliced_w_mmap(self):
+        DATA = b'ABCDEFGHIJ'
+        blob, connection, _ = self._upload_sliced_helper(DATA, 4,
+                                                         use_mmap=True)
+        uploads = connection.http._requested
+        self.assertEqual(sorted(rq['body'] for rq in uploads),
+                         [b'ABCD', b'EFGH', b'IJ'])
+        self.assertEqual(blob.component_count, 3)
+
+    def test_upload_from_filename_sliced_w_workers(self):
+        # Identical slices, since responses may be consumed in any order.
+        DATA = b'ABCD' * 3
+        blob, connection, _ = self._upload_sliced_helper(
+            DATA, 4, max_workers=3)
+        self.assertEqual(len(connection.http._requested), 3)
+        self.assertEqual(blob.component_count, 3)
+
+    def test_upload_from_filename_sliced_tiers(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage.blob import Blob
+        from gcloud.storage._helpers import _base64_crc32c
+        from gcloud.storage._helpers import _crc32c
+        DATA = b'ABCDEFGHIJ'
+        tier_response = {'crc32c': 'IGNORED'}
+        with _Monkey(Blob, _MAX_COMPOSE_SOURCES=2):
+            blob, connection, _ = self._upload_sliced_helper_tiers(
+                DATA, 2, tier_response)
+        kw = connection._requested
+        # Five slices: three composes into tier 1, two into tier 2, then
+        # the final compose.
+        self.assertEqual(len(kw), 6)
+        final = kw[-1]
+        self.assertEqual(final['path'], '/b/name/o/blob-name/compose')
+        names = [source['name'] for source in final['data']['sourceObjects']]
+        self.assertTrue(names[0].endswith('-2-00000'))
+        self.assertTrue(names[1].endswith('-2-00001'))
+        self.assertEqual(blob.crc32c, _base64_crc32c(_crc32c(DATA)))
+
+    def _upload_sliced_helper_tiers(self, data, slice_size, tier_response):
+        import json
+        from tempfile import NamedTemporaryFile
+        from six.moves.http_client import OK
+        from gcloud.storage._helpers import _base64_crc32c
+        from gcloud.storage._helpers import _crc32c
+        uploads = [({'status': OK}, json.dumps({}).encode('ascii'))
+                   for _ in range(0, len(data), slice_size)]
+        connection = _Connection(*uploads)
+        connection._responses = (
+            (tier_response,) * 5 +
+            ({'crc32c': _base64_crc32c(_crc32c(data))},))
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        with NamedTemporaryFile() as fh:
+            fh.write(data)
+            fh.flush()
+            blob.upload_from_filename(fh.name, slice_size=slice_size,
+                                      max_workers=1)
+        blobs, _, _ = bucket._deleted_blobs[0]
+        self.assertEqual(len(blobs), 10)
+        return blob, connection, bucket
+
+    def test_upload_from_filename_sliced_component_limit(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage.blob import Blob
+        DATA = b'ABCDEFGHIJ'
+        with _Monkey(Blob, _MAX_COMPONENT_COUNT=2):
+            _, connection, _ = self._upload_sliced_helper(DATA, 5)
+        self.assertEqual(len(connection.http._requested), 2)
+
+    def test_upload_from_filename_sliced_bad_component_crc(self):
+        with self.assertRaises(ValueError):
+            self._upload_sliced_helper(b'ABCDEFGHIJ', 4,
+                                       component_crc='AAAAAA==')
+
+    def test_upload_from_filename_sliced_bad_composite_crc(self):
+        with self.assertRaises(ValueError):
+            self._upload_sliced_helper(b'ABCDEFGHIJ', 4,
+                                       compose_crc='AAAAAA==')
+
+    def test_upload_from_filename_sliced_upload_failure(self):
+        from tempfile import NamedTemporaryFile
+        from six.moves.http_client import OK
+        DATA = b'ABCDEFGHIJ'
+        connection = _Connection(
+            ({'status': OK}, b'{}'),
+            ({'status': OK}, b'NOT JSON'),
+            ({'status': OK}, b'{}'),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        with NamedTemporaryFile() as fh:
+            fh.write(DATA)
+            fh.flush()
+            with self.assertRaises(ValueError):
+                blob.upload_from_filename(fh.name, slice_size=4,
+                                          max_workers=1)
+        self.assertEqual(connection._requested, [])
+        blobs, _, _ = bucket._deleted_blobs[0]
+        self.assertEqual(len(blobs), 3)
+
+    def test_upload_from_filename_small_w_slice_size(self):
+        from six.moves.http_client import OK
+        from tempfile import NamedTemporaryFile
+        DATA = b'ABCDEF'
+        connection = _Connection(({'status': OK}, b'{}'))
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        with NamedTemporaryFile() as fh:
+            fh.write(DATA)
+            fh.flush()
+            blob.upload_from_filename(fh.name, slice_size=len(DATA))
+        rq = connection.http._requested
+        self.assertEqual(len(rq), 1)
+        self.assertEqual(rq[0]['body'], DATA)
+        self.assertEqual(bucket._deleted_blobs, [])
+
+    def test_upload_from_iterable(self):
+        import json
+        from six.moves.http_client import OK
+        from apitools.base.py import http_wrapper
+        UPLOAD_URL = 'http://example.com/upload/session'
+        connection = _Connection(
+            ({'status': OK, 'location': UPLOAD_URL}, b''),
+            ({'status': http_wrapper.RESUME_INCOMPLETE,
+              'range': 'bytes=0-3'}, b''),
+            ({'status': OK}, json.dumps({'size': '6'}).encode('ascii')),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+
+        def _pieces():
+            yield b'abc'
+            yield u'def'
+
+        blob.upload_from_iterable(_pieces(), content_type='text/plain',
+                                  chunk_size=4)
+        self.assertEqual(blob.size, 6)
+        rq = connection.http._requested
+        self.assertEqual(len(rq), 3)
+        self.assertEqual(rq[1]['body'], b'abcd')
+        self.assertEqual(rq[2]['body'], b'ef')
+        self.assertEqual(rq[2]['headers']['Content-Range'], 'bytes 4-5/6')
+
+    def _upload_persisted_helper(self, state_dir, data, *responses, **kw):
+        import os
+        connection = _Connection(*responses)
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 4
+        blob.adaptive_chunk_size = kw.get('adaptive_chunk_size')
+        filename = os.path.join(kw.get('source_dir', state_dir), 'source.bin')
+        if not os.path.exists(filename):
+            with open(filename, 'wb') as file_obj:
+                file_obj.write(data)
+        try:
+            blob.upload_from_filename(filename, state_dir=state_dir,
+                                      use_mmap=kw.get('use_mmap', False))
+        finally:
+            sessions = [name for name in os.listdir(state_dir)
+                        if name.endswith('.upload-session')]
+        return blob, connection, sessions
+
+    def _state_dir(self):
+        import shutil
+        import tempfile
+        state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, state_dir)
+        return state_dir
+
+    def test_upload_from_filename_w_state_dir(self):
+        import os
+        from six.moves.http_client import OK
+        from apitools.base.py import http_wrapper
+        UPLOAD_URL = 'http://example.com/upload/session'
+        source_dir = self._state_dir()
+        state_dir = os.path.join(source_dir, 'sessions')
+        blob, connection, sessions = self._upload_persisted_helper(
+            state_dir, b'abcdef',
+            ({'status': OK, 'location': UPLOAD_URL}, b''),
+            ({'status': http_wrapper.RESUME_INCOMPLETE,
+              'range': 'bytes=0-3'}, b''),
+            ({'status': OK}, b'{"size": "6"}'),
+            source_dir=source_dir)
+        self.assertEqual(blob.size, 6)
+        self.assertEqual(sessions, [])
+        rq = connection.http._requested
+        self.assertEqual([req['headers'].get('Content-Range') for req in rq],
+                         [None, 'bytes 0-3/*', 'bytes 4-5/6'])
+
+    def test_upload_from_filename_w_state_dir_w_mmap(self):
+        from six.moves.http_client import OK
+        from apitools.base.py import http_wrapper
+        UPLOAD_URL = 'http://example.com/upload/session'
+        blob, connection, sessions = self._upload_persisted_helper(
+            self._state_dir(), b'abcdef',
+            ({'status': OK, 'location': UPLOAD_URL}, b''),
+            ({'status': http_wrapper.RESUME_INCOMPLETE,
+              'range': 'bytes=0-3'}, b''),
+            ({'status': OK}, b'{"size": "6"}'),
+            use_mmap=True)
+        self.assertEqual(blob.size, 6)
+        self.assertEqual(sessions, [])
+        rq = connection.http._requested
+        self.assertEqual([req['body'] for req in rq[1:]], [b'abcd', b'ef'])
+
+    def test_upload_from_filename_w_state_dir_file_shrinks(self):
+        from six.moves.http_client import OK
+        from gcloud._testing import _Monkey
+        from gcloud.storage import blob as MUT
+
+        class _ShrunkWindow(MUT._FileWindow):
+
+            def _read(self, start, end):
+                return b''
+
+        with _Monkey(MUT, _FileWindow=_ShrunkWindow):
+            with self.assertRaises(ValueError):
+                self._upload_persisted_helper(
+                    self._state_dir(), b'abcdef',
+                    ({'status': OK, 'location': 'http://example.com/'},
+                     b''))
+
+    def test_upload_from_filename_w_state_dir_adaptive_chunk_size(self):
+        import os
+        from six.moves.http_client import OK
+        from apitools.base.py import http_wrapper
+        from gcloud.storage.stats import AdaptiveChunkSize
+        KB = 1024
+        UPLOAD_URL = 'http://example.com/upload/session'
+        data = os.urandom(1792 * KB)
+        source_dir = self._state_dir()
+        state_dir = os.path.join(source_dir, 'sessions')
+
+        def _committed(size):
+            return ({'status': http_wrapper.RESUME_INCOMPLETE,
+                     'range': 'bytes=0-%d' % (size - 1,)}, b'')
+
+        blob, connection, _ = self._upload_persisted_helper(
+            state_dir, data,
+            ({'status': OK, 'location': UPLOAD_URL}, b''),
+            _committed(256 * KB), _committed(768 * KB),
+            _committed(1792 * KB),
+            ({'status': OK}, b'{"size": "%d"}' % (len(data),)),
+            source_dir=source_dir,
+            adaptive_chunk_size=AdaptiveChunkSize(initial=256 * KB))
+        rq = connection.http._requested[1:]
+        # The chunk size doubles after each (fast) chunk;  every byte is
+        # sent exactly once.
+        self.assertEqual([len(req['body']) for req in rq],
+                         [256 * KB, 512 * KB, 1024 * KB, 0])
+        self.assertEqual(b''.join(req['body'] for req in rq), data)
+        self.assertEqual(blob.size, len(data))
+
+    def test_upload_from_filename_w_state_dir_resumes(self):
+        import json
+        import os
+        from six.moves.http_client import FORBIDDEN
+        from six.moves.http_client import OK
+        from apitools.base.py import http_wrapper
+        from apitools.base.py.exceptions import HttpError
+        UPLOAD_URL = 'http://example.com/upload/session'
+        state_dir = self._state_dir()
+        with self.assertRaises(HttpError):
+            self._upload_persisted_helper(
+                state_dir, b'abcdef',
+                ({'status': OK, 'location': UPLOAD_URL}, b''),
+                ({'status': http_wrapper.RESUME_INCOMPLETE,
+                  'range': 'bytes=0-3'}, b''),
+                ({'status': FORBIDDEN}, b''),
+            )
+        session, = [name for name in os.listdir(state_dir)
+                    if name.endswith('.upload-session')]
+        with open(os.path.join(state_dir, session)) as file_obj:
+            state = json.load(file_obj)
+        self.assertEqual(state['upload_url'], UPLOAD_URL)
+        self.assertEqual(state['offset'], 4)
+        self.assertEqual(state['name'], 'blob-name')
+
+        # A new process picks the session up where the server left it.
+        blob, connection, sessions = self._upload_persisted_helper(
+            state_dir, None,
+            ({'status': http_wrapper.RESUME_INCOMPLETE,
+              'range': 'bytes=0-4'}, b''),
+            ({'status': OK}, b'{"size": "6"}'),
+        )
+        self.assertEqual(blob.size, 6)
+        self.assertEqual(sessions, [])
+        query, put = connection.http._requested
+        self.assertEqual(query['uri'], UPLOAD_URL)
+        self.assertEqual(query['headers']['Content-Range'], 'bytes */6')
+        self.assertEqual(put['uri'], UPLOAD_URL)
+        self.assertEqual(put['body'], b'f')
+        self.assertEqual(put['headers']['Content-Range'], 'bytes 5-5/6')
+
+    def _save_session(self, state_dir, **overrides):
+        import hashlib
+        import json
+        import os
+        filename = os.path.join(state_dir, 'source.bin')
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(b'abcdef')
+        source = os.stat(filename)
+        key = '\n'.join(['name', 'blob-name', os.path.abspath(filename)])
+        path = os.path.join(
+            state_dir,
+            hashlib.sha1(key.encode('utf-8')).hexdigest() + '.upload-session')
+        state = {'bucket': 'name', 'name': 'blob-name',
+                 'filename': os.path.abspath(filename),
+                 'size': source.st_size, 'mtime': source.st_mtime,
+                 'upload_url': 'http://example.com/upload/old', 'offset': 4}
+        state.update(overrides)
+        with open(path, 'w') as file_obj:
+            json.dump(state, file_obj)
+        return path
+
+    def test_upload_from_filename_w_state_dir_already_complete(self):
+        from six.moves.http_client import OK
+        state_dir = self._state_dir()
+        self._save_session(state_dir)
+        blob, connection, sessions = self._upload_persisted_helper(
+            state_dir, None, ({'status': OK}, b'{"size": "6"}'))
+        self.assertEqual(blob.size, 6)
+        self.assertEqual(sessions, [])
+        self.assertEqual(len(connection.http._requested), 1)
+
+    def test_upload_from_filename_w_state_dir_expired_session(self):
+        from six.moves.http_client import GONE
+        from six.moves.http_client import OK
+        UPLOAD_URL = 'http://example.com/upload/new'
+        state_dir = self._state_dir()
+        self._save_session(state_dir)
+        blob, connection, _ = self._upload_persisted_helper(
+            state_dir, None,
+            ({'status': GONE}, b''),
+            ({'status': OK, 'location': UPLOAD_URL}, b''),
+            ({'status': 308, 'range': 'bytes=0-3'}, b''),
+            ({'status': OK}, b'{"size": "6"}'),
+        )
+        self.assertEqual(blob.size, 6)
+        rq = connection.http._requested
+        self.assertEqual(rq[0]['uri'], 'http://example.com/upload/old')
+        self.assertEqual(rq[1]['method'], 'POST')
+        self.assertEqual(rq[2]['body'], b'abcd')
+
+    def test_upload_from_filename_w_state_dir_query_error(self):
+        from six.moves.http_client import FORBIDDEN
+        from apitools.base.py.exceptions import HttpError
+        state_dir = self._state_dir()
+        self._save_session(state_dir)
+        with self.assertRaises(HttpError):
+            self._upload_persisted_helper(
+                state_dir, None, ({'status': FORBIDDEN}, b''))
+
+    def test_upload_from_filename_w_state_dir_changed_file(self):
+        from six.moves.http_client import OK
+        state_dir = self._state_dir()
+        self._save_session(state_dir, size=1234)
+        _, connection, _ = self._upload_persisted_helper(
+            state_dir, None,
+            ({'status': OK, 'location': 'http://example.com/new'}, b''),
+            ({'status': 308, 'range': 'bytes=0-3'}, b''),
+            ({'status': OK}, b'{}'),
+        )
+        self.assertEqual(connection.http._requested[0]['method'], 'POST')
+
+    def test_upload_from_filename_w_state_dir_corrupt_state(self):
+        from six.moves.http_client import OK
+        state_dir = self._state_dir()
+        path = self._save_session(state_dir)
+        with open(path, 'w') as file_obj:
+            file_obj.write('{"upload_url": ')
+        _, connection, _ = self._upload_persisted_helper(
+            state_dir, None,
+            ({'status': OK, 'location': 'http://example.com/new'}, b''),
+            ({'status': 308, 'range': 'bytes=0-3'}, b''),
+            ({'status': OK}, b'{}'),
+        )
+        self.assertEqual(connection.http._requested[0]['method'], 'POST')
+
+    def test_upload_from_filename_w_state_dir_removes_stale(self):
+        import os
+        import time
+        from six.moves.http_client import OK
+        state_dir = self._state_dir()
+        stale = os.path.join(state_dir, 'stale.upload-session')
+        other = os.path.join(state_dir, 'other.txt')
+        for path in (stale, other):
+            with open(path, 'w') as file_obj:
+                file_obj.write('{}')
+            long_ago = time.time() - 8 * 24 * 60 * 60
+            os.utime(path, (long_ago, long_ago))
+        self._upload_persisted_helper(
+            state_dir, b'ab',
+            ({'status': OK, 'location': 'http://example.com/new'}, b''),
+            ({'status': OK}, b'{}'),
+        )
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(other))
+
+    def test_open_writer(self):
+        from gcloud.storage.blob import BlobWriter
+        blob = self._makeOne('blob-name', bucket=_Bucket())
+        writer = blob.open_writer(content_type='text/plain')
+        self.assertTrue(isinstance(writer, BlobWriter))
+        self.assertTrue(writer.blob is blob)
+        self.assertEqual(writer.content_type, 'text/plain')
+
+    def test_compose(self):
+        from gcloud.storage.blob import Blob
+        connection = _Connection({'componentCount': 2})
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        blob.content_type = 'text/plain'
+        source = Blob('source-2', bucket=bucket)
+        blob.compose(['source-1', source])
+        self.assertEqual(blob.component_count, 2)
+        self.assertEqual(blob._changes, set())
+        kw = connection._requested
+        self.assertEqual(len(kw), 1)
+        self.assertEqual(kw[0]['method'], 'POST')
+        self.assertEqual(kw[0]['path'], '/b/name/o/blob-name/compose')
+        self.assertEqual(kw[0]['data'], {
+            'sourceObjects': [{'name': 'source-1'}, {'name': 'source-2'}],
+            'destination': {'contentType': 'text/plain'},
+        })
+        self.assertTrue(kw[0]['_target_object'] is blob)
+
+    def test_compose_after_reload(self):
+        connection = _Connection({'componentCount': 2})
+        client = _Client(connection)
+        blob = self._makeOne('blob-name', bucket=_Bucket(client),
+                             properties={'generation': '3', 'size': '10',
+                                         'crc32c': 'AAAAAA=='})
+        blob.cache_control = 'no-cache'
+        blob.compose(['source-1', 'source-2'])
+        self.assertEqual(connection._requested[0]['data']['destination'],
+                         {'cacheControl': 'no-cache'})
+
+    def test_compose_w_metadata_cache(self):
+        from gcloud.storage.cache import BlobMetadataCache
+        connection = _Connection({'name': 'blob-name', 'generation': '5',
+                                  'metageneration': '1'})
+        client = _Client(connection)
+        client.metadata_cache = cache = BlobMetadataCache()
+        blob = self._makeOne('blob-name', bucket=_Bucket(client))
+        blob.compose(['source-1', 'source-2'])
+        self.assertTrue(('name', 'blob-name') in cache)
+
+    def test_rewrite_in_progress(self):
+        from gcloud.storage.blob import Blob
+        connection = _Connection({'totalBytesRewritten': '1048576',
+                                  'objectSize': '4194304', 'done': False,
+                                  'rewriteToken': 'TOKEN'})
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        source = Blob('source', bucket=bucket)
+        blob = self._makeOne('dest', bucket=bucket)
+        result = blob.rewrite(source, max_bytes_per_call=1048576)
+        self.assertEqual(result, ('TOKEN', 1048576, 4194304))
+        kw, = connection._requested
+        self.assertEqual(kw['method'], 'POST')
+        self.assertEqual(kw['path'],
+                         '/b/name/o/source/rewriteTo/b/name/o/dest')
+        self.assertEqual(kw['query_params'],
+                         {'maxBytesRewrittenPerCall': 1048576})
+        self.assertEqual(kw['data'], {})
+
+    def test_rewrite_done(self):
+        from gcloud.storage.blob import Blob
+        connection = _Connection({'totalBytesRewritten': '3',
+                                  'objectSize': '3', 'done': True,
+                                  'resource': {'name': 'dest', 'size': '3'}})
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        source = Blob('source', bucket=bucket)
+        blob = self._makeOne('dest', bucket=bucket)
+        blob.content_type = 'text/plain'
+        result = blob.rewrite(source, token='TOKEN')
+        self.assertEqual(result, (None, 3, 3))
+        self.assertEqual(blob.size, 3)
+        kw, = connection._requested
+        self.assertEqual(kw['query_params'], {'rewriteToken': 'TOKEN'})
+        self.assertEqual(kw['data'], {'contentType': 'text/plain'})
+
+    def test_compose_too_many_sources(self):
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._makeOne('blob-name', bucket=bucket)
+        sources = ['source-%d' % (index,)
+                   for index in range(blob._MAX_COMPOSE_SOURCES + 1)]
+        with self.assertRaises(ValueError):
+            blob.compose(sources)
+        self.assertEqual(connection._requested, [])
+
     def test_upload_from_string_w_bytes(self):
         from six.moves.http_client import OK
         from six.moves.urllib.parse import parse_qsl
@@ -977,6 +2076,571 @@ class Test_Blob(unittest2.TestCase):
         self.assertEqual(blob.updated, None)
 
 
+class TestBlobSummary(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.blob import BlobSummary
+        return BlobSummary
+
+    def test_from_api_repr(self):
+        import datetime
+        from gcloud._helpers import UTC
+        resource = {
+            'name': 'blob-name',
+            'size': '42',
+            'md5Hash': 'MD5',
+            'crc32c': 'CRC',
+            'updated': '2014-11-05T20:34:37.000Z',
+            'ignored': 'value',
+        }
+        summary = self._getTargetClass().from_api_repr(resource)
+        self.assertEqual(summary.name, 'blob-name')
+        self.assertEqual(summary.size, 42)
+        self.assertEqual(summary.md5_hash, 'MD5')
+        self.assertEqual(summary.crc32c, 'CRC')
+        self.assertEqual(summary.updated_raw, '2014-11-05T20:34:37.000Z')
+        self.assertEqual(summary.updated,
+                         datetime.datetime(2014, 11, 5, 20, 34, 37,
+                                           tzinfo=UTC))
+
+    def test_from_api_repr_partial(self):
+        summary = self._getTargetClass().from_api_repr({'name': 'blob-name'})
+        self.assertEqual(summary, ('blob-name', None, None, None, None))
+        self.assertEqual(summary.updated, None)
+
+    def test_read_only_and_compact(self):
+        summary = self._getTargetClass()('blob-name', 1, None, None, None)
+        with self.assertRaises(AttributeError):
+            summary.size = 2
+        self.assertFalse(hasattr(summary, '__dict__'))
+
+
+class TestBlobReader(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.blob import BlobReader
+        return BlobReader
+
+    def _makeOne(self, *responses, **kw):
+        from gcloud.storage.blob import Blob
+        connection = _Connection(*responses)
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = Blob('blob-name', bucket=bucket)
+        blob._properties = kw.pop('properties', {
+            'mediaLink': 'http://example.com/media/', 'size': '10'})
+        return self._getTargetClass()(blob, **kw), connection
+
+    def _ranges(self, connection):
+        return [req['headers']['Range']
+                for req in connection.http._requested]
+
+    def test_ctor(self):
+        reader, connection = self._makeOne()
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+        self.assertFalse(reader.writable())
+        self.assertEqual(reader.tell(), 0)
+        self.assertEqual(connection._requested, [])
+
+    def test_ctor_reloads_metadata(self):
+        reader, connection = self._makeOne(
+            {'size': '3', 'mediaLink': 'http://example.com/media/'},
+            properties={})
+        self.assertEqual(reader._size, 3)
+        kw, = connection._requested
+        self.assertEqual(kw['method'], 'GET')
+
+    def test_read(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        reader, connection = self._makeOne(
+            ({'status': PARTIAL_CONTENT}, b'abcd'),
+            ({'status': PARTIAL_CONTENT}, b'efghij'),
+        )
+        self.assertEqual(reader.read(4), b'abcd')
+        self.assertEqual(reader.tell(), 4)
+        self.assertEqual(reader.read(100), b'efghij')
+        self.assertEqual(reader.read(100), b'')
+        self.assertEqual(self._ranges(connection), ['bytes=0-3', 'bytes=4-9'])
+
+    def test_readinto(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        reader, connection = self._makeOne(
+            ({'status': PARTIAL_CONTENT}, b'cde'),
+        )
+        reader.seek(2)
+        buf = bytearray(3)
+        self.assertEqual(reader.readinto(buf), 3)
+        self.assertEqual(bytes(buf), b'cde')
+        self.assertEqual(self._ranges(connection), ['bytes=2-4'])
+
+    def test_read_whole_object_sent(self):
+        from six.moves.http_client import OK
+        reader, connection = self._makeOne(
+            ({'status': OK}, b'abcdefghij'),
+        )
+        reader.seek(2)
+        self.assertEqual(reader.read(3), b'cde')
+        self.assertEqual(reader.read(3), b'fgh')
+        reader.seek(0)
+        self.assertEqual(reader.read(), b'abcdefghij')
+        # The whole object is kept, rather than fetched for each read.
+        self.assertEqual(self._ranges(connection), ['bytes=2-4'])
+
+    def test_ctor_w_content_encoding(self):
+        with self.assertRaises(ValueError):
+            self._makeOne(properties={'mediaLink': 'http://example.com/',
+                                      'size': '10',
+                                      'contentEncoding': 'gzip'})
+
+    def test_readinto_short_response(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        reader, _ = self._makeOne(({'status': PARTIAL_CONTENT}, b'ab'))
+        buf = bytearray(4)
+        self.assertEqual(reader.readinto(buf), 2)
+        self.assertEqual(reader.tell(), 2)
+
+    def test_readinto_empty_response(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        reader, _ = self._makeOne(({'status': PARTIAL_CONTENT}, b''))
+        with self.assertRaises(ValueError):
+            reader.readinto(bytearray(4))
+
+    def test_readall(self):
+        from six.moves.http_client import PARTIAL_CONTENT
+        reader, connection = self._makeOne(
+            ({'status': PARTIAL_CONTENT}, b'defg'),
+            ({'status': PARTIAL_CONTENT}, b'hij'),
+        )
+        reader.seek(3)
+        self.assertEqual(reader.read(), b'defghij')
+        self.assertEqual(reader.readall(), b'')
+        self.assertEqual(self._ranges(connection), ['bytes=3-9', 'bytes=7-9'])
+
+    def test_seek(self):
+        import os
+        reader, connection = self._makeOne()
+        self.assertEqual(reader.seek(4), 4)
+        self.assertEqual(reader.seek(2, os.SEEK_CUR), 6)
+        self.assertEqual(reader.seek(-3, os.SEEK_END), 7)
+        self.assertEqual(reader.seek(20), 20)
+        self.assertEqual(reader.read(1), b'')
+        self.assertEqual(connection.http._requested, [])
+
+    def test_seek_invalid(self):
+        import os
+        reader, _ = self._makeOne()
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+        with self.assertRaises(ValueError):
+            reader.seek(0, 42)
+        reader.seek(5, os.SEEK_SET)
+        self.assertEqual(reader.tell(), 5)
+
+    def test_closed(self):
+        reader, _ = self._makeOne()
+        reader.close()
+        with self.assertRaises(ValueError):
+            reader.tell()
+        with self.assertRaises(ValueError):
+            reader.seek(0)
+        with self.assertRaises(ValueError):
+            reader.readinto(bytearray(1))
+        with self.assertRaises(ValueError):
+            reader.readall()
+
+
+class TestBlobWriter(unittest2.TestCase):
+
+    UPLOAD_URL = 'http://example.com/upload/session'
+
+    def _getTargetClass(self):
+        from gcloud.storage.blob import BlobWriter
+        return BlobWriter
+
+    def _makeOne(self, *responses, **kw):
+        from gcloud.storage.blob import Blob
+        connection = _Connection(*responses)
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = Blob('blob-name', bucket=bucket)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        kw.setdefault('chunk_size', 4)
+        return self._getTargetClass()(blob, **kw), connection
+
+    def _initiated(self):
+        from six.moves.http_client import OK
+        return ({'status': OK, 'location': self.UPLOAD_URL}, b'')
+
+    def _incomplete(self, last):
+        from apitools.base.py import http_wrapper
+        return ({'status': http_wrapper.RESUME_INCOMPLETE,
+                 'range': 'bytes=0-%d' % (last,)}, b'')
+
+    def _done(self, **properties):
+        import json
+        from six.moves.http_client import OK
+        return ({'status': OK}, json.dumps(properties).encode('ascii'))
+
+    def _content_ranges(self, connection):
+        return [req['headers']['Content-Range']
+                for req in connection.http._requested[1:]]
+
+    def test_ctor_defaults(self):
+        from gcloud.storage.blob import _DEFAULT_WRITE_SIZE
+        writer, connection = self._makeOne(chunk_size=None)
+        self.assertEqual(writer.chunk_size, _DEFAULT_WRITE_SIZE)
+        self.assertEqual(writer.content_type, 'application/octet-stream')
+        self.assertTrue(writer.writable())
+        self.assertFalse(writer.readable())
+        self.assertEqual(writer.upload_url, None)
+        self.assertEqual(connection.http._requested, [])
+
+    def test_ctor_bad_chunk_size(self):
+        from gcloud.storage.blob import Blob
+        blob = Blob('blob-name', bucket=_Bucket())
+        with self.assertRaises(ValueError):
+            self._getTargetClass()(blob, chunk_size=1000)
+
+    def test_small(self):
+        from six.moves.urllib.parse import parse_qsl
+        from six.moves.urllib.parse import urlsplit
+        import json
+        writer, connection = self._makeOne(
+            self._initiated(), self._done(name='blob-name', size='3'),
+            content_type='text/plain')
+        writer.blob.metadata = {'color': 'red'}
+        self.assertEqual(writer.write(b'abc'), 3)
+        self.assertEqual(writer.tell(), 3)
+        self.assertEqual(connection.http._requested, [])
+        writer.close()
+        self.assertTrue(writer.closed)
+        self.assertEqual(writer.blob.size, 3)
+        initiate, put = connection.http._requested
+        self.assertEqual(initiate['method'], 'POST')
+        _, _, path, qs, _ = urlsplit(initiate['uri'])
+        self.assertEqual(path, '/b/name/o')
+        self.assertEqual(dict(parse_qsl(qs)),
+                         {'uploadType': 'resumable', 'name': 'blob-name'})
+        self.assertEqual(initiate['headers']['X-Upload-Content-Type'],
+                         'text/plain')
+        self.assertEqual(json.loads(initiate['body']),
+                         {'contentType': 'text/plain',
+                          'metadata': {'color': 'red'}})
+        self.assertEqual(put['method'], 'PUT')
+        self.assertEqual(put['uri'], self.UPLOAD_URL)
+        self.assertEqual(put['body'], b'abc')
+        self.assertEqual(put['headers']['Content-Range'], 'bytes 0-2/3')
+
+    def test_md5_mismatch(self):
+        writer, _ = self._makeOne(
+            self._initiated(), self._done(md5Hash='6AtQFwmJUPxYqtg8jBSXjg=='))
+        writer.write(b'abc')
+        with self.assertRaises(ValueError):
+            writer.close()
+
+    def test_md5_match(self):
+        writer, _ = self._makeOne(
+            self._initiated(), self._incomplete(3),
+            self._done(md5Hash='6AtQFwmJUPxYqtg8jBSXjg=='))
+        writer.write(b'abcdef')
+        writer.close()
+        self.assertEqual(writer.blob.md5_hash, '6AtQFwmJUPxYqtg8jBSXjg==')
+
+    def test_chunks(self):
+        writer, connection = self._makeOne(
+            self._initiated(), self._incomplete(3), self._incomplete(7),
+            self._done())
+        writer.write(b'ab')
+        writer.write(b'cdefghi')
+        self.assertEqual(writer.tell(), 9)
+        self.assertEqual(len(connection.http._requested), 3)
+        writer.close()
+        self.assertEqual(self._content_ranges(connection),
+                         ['bytes 0-3/*', 'bytes 4-7/*', 'bytes 8-8/9'])
+        bodies = [req['body'] for req in connection.http._requested[1:]]
+        self.assertEqual(bodies, [b'abcd', b'efgh', b'i'])
+
+    def test_chunks_w_adaptive_chunk_size(self):
+        from gcloud.storage.stats import AdaptiveChunkSize
+        KB = 1024
+        writer, connection = self._makeOne(
+            self._initiated(), self._incomplete(256 * KB - 1),
+            self._incomplete(768 * KB - 1), self._incomplete(800 * KB - 1),
+            self._done(), chunk_size=None)
+        sizer = writer.blob.adaptive_chunk_size = AdaptiveChunkSize(
+            initial=256 * KB)
+        # Applied by the constructor:  make a writer for the blob again.
+        writer = self._getTargetClass()(writer.blob)
+        self.assertEqual(writer.chunk_size, 256 * KB)
+        writer.write(b'x' * (800 * KB))
+        writer.close()
+        bodies = [len(req['body']) for req in connection.http._requested[1:]]
+        # Grows after each (fast) whole chunk;  the short final ones are
+        # ignored.
+        self.assertEqual(bodies, [256 * KB, 512 * KB, 32 * KB, 0])
+        self.assertEqual(sizer.chunk_size, 1024 * KB)
+
+    def test_chunks_w_progress(self):
+        updates = []
+        writer, _ = self._makeOne(
+            self._initiated(), self._incomplete(3), self._done(),
+            progress=updates.append)
+        writer.write(b'abcdef')
+        writer.close()
+        self.assertEqual([(update.bytes_done, update.chunk_bytes)
+                          for update in updates], [(4, 4), (6, 2)])
+        self.assertEqual(updates[-1].blob_name, 'blob-name')
+
+    def test_partial_commit(self):
+        writer, connection = self._makeOne(
+            self._initiated(), self._incomplete(1), self._incomplete(5),
+            self._incomplete(6), self._done())
+        writer.write(b'abcdef')
+        # Only "ab" was persisted, leaving a whole chunk to send.
+        self.assertEqual(len(connection.http._requested), 3)
+        writer.write(b'g')
+        writer.close()
+        self.assertEqual(self._content_ranges(connection),
+                         ['bytes 0-3/*', 'bytes 2-5/*', 'bytes 6-6/7',
+                          'bytes */7'])
+
+    def test_exact_multiple(self):
+        writer, connection = self._makeOne(
+            self._initiated(), self._incomplete(3), self._done())
+        writer.write(b'abcd')
+        writer.close()
+        self.assertEqual(self._content_ranges(connection),
+                         ['bytes 0-3/*', 'bytes */4'])
+
+    def test_empty(self):
+        writer, connection = self._makeOne(self._initiated(), self._done())
+        writer.close()
+        self.assertEqual(self._content_ranges(connection), ['bytes */0'])
+
+    def test_close_twice(self):
+        writer, connection = self._makeOne(self._initiated(), self._done())
+        writer.close()
+        writer.close()
+        self.assertEqual(len(connection.http._requested), 2)
+
+    def test_context_manager(self):
+        writer, connection = self._makeOne(self._initiated(), self._done())
+        with writer as dst:
+            dst.write(b'abc')
+        self.assertTrue(writer.closed)
+        self.assertEqual(self._content_ranges(connection), ['bytes 0-2/3'])
+
+    def test_context_manager_w_exception(self):
+        writer, connection = self._makeOne(
+            self._initiated(), self._incomplete(3))
+        with self.assertRaises(RuntimeError):
+            with writer as dst:
+                dst.write(b'abcdef')
+                raise RuntimeError('boom')
+        self.assertTrue(writer.closed)
+        # The upload is abandoned:  the buffered bytes are never sent.
+        self.assertEqual(self._content_ranges(connection), ['bytes 0-3/*'])
+
+    def test_garbage_collected(self):
+        writer, connection = self._makeOne()
+        writer.write(b'abc')
+        writer.__del__()
+        self.assertFalse(writer.closed)
+        self.assertEqual(connection.http._requested, [])
+
+    def test_resume(self):
+        writer, connection = self._makeOne(
+            self._incomplete(3), self._done(size='6'))
+        self.assertEqual(writer.resume(self.UPLOAD_URL), 4)
+        self.assertEqual(writer.upload_url, self.UPLOAD_URL)
+        self.assertEqual(writer.committed, 4)
+        self.assertEqual(writer.tell(), 4)
+        writer.write(b'ef')
+        writer.close()
+        query, put = connection.http._requested
+        self.assertEqual(query['headers']['Content-Range'], 'bytes */*')
+        self.assertEqual(put['headers']['Content-Range'], 'bytes 4-5/6')
+
+    def test_resume_nothing_persisted(self):
+        from apitools.base.py import http_wrapper
+        writer, _ = self._makeOne(
+            ({'status': http_wrapper.RESUME_INCOMPLETE}, b''))
+        self.assertEqual(writer.resume(self.UPLOAD_URL, 6), 0)
+
+    def test_resume_complete(self):
+        writer, connection = self._makeOne(self._done(size='6'))
+        self.assertEqual(writer.resume(self.UPLOAD_URL, 6), None)
+        self.assertTrue(writer.closed)
+        self.assertEqual(writer.blob.size, 6)
+        query, = connection.http._requested
+        self.assertEqual(query['headers']['Content-Range'], 'bytes */6')
+
+    def test_resume_failure(self):
+        from six.moves.http_client import NOT_FOUND
+        from apitools.base.py.exceptions import HttpError
+        writer, _ = self._makeOne(({'status': NOT_FOUND}, b''))
+        with self.assertRaises(HttpError):
+            writer.resume(self.UPLOAD_URL)
+
+    def test_write_closed(self):
+        writer, _ = self._makeOne(self._initiated(), self._done())
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(b'abc')
+        with self.assertRaises(ValueError):
+            writer.tell()
+
+    def test_initiate_failure(self):
+        from six.moves.http_client import FORBIDDEN
+        from apitools.base.py.exceptions import HttpError
+        writer, _ = self._makeOne(({'status': FORBIDDEN}, b''))
+        with self.assertRaises(HttpError):
+            writer.write(b'abcd')
+
+    def test_send_failure(self):
+        from six.moves.http_client import FORBIDDEN
+        from apitools.base.py.exceptions import HttpError
+        writer, _ = self._makeOne(
+            self._initiated(), ({'status': FORBIDDEN}, b''))
+        with self.assertRaises(HttpError):
+            writer.write(b'abcd')
+
+    def test_no_progress(self):
+        from apitools.base.py import http_wrapper
+        no_progress = ({'status': http_wrapper.RESUME_INCOMPLETE}, b'')
+        writer, connection = self._makeOne(
+            self._initiated(), no_progress, no_progress, no_progress,
+            num_retries=2)
+        with self.assertRaises(ValueError):
+            writer.write(b'abcd')
+        self.assertEqual(len(connection.http._requested), 4)
+
+    def test_no_progress_resent(self):
+        from apitools.base.py import http_wrapper
+        no_progress = ({'status': http_wrapper.RESUME_INCOMPLETE}, b'')
+        writer, connection = self._makeOne(
+            self._initiated(), no_progress, self._incomplete(3),
+            no_progress, self._done())
+        writer.write(b'abcdef')
+        writer.close()
+        self.assertEqual(self._content_ranges(connection),
+                         ['bytes 0-3/*', 'bytes 0-3/*', 'bytes 4-5/6',
+                          'bytes 4-5/6'])
+
+
+class Test_MappedFile(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.blob import _MappedFile
+        return _MappedFile
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _write(self, data):
+        import os
+        import shutil
+        import tempfile
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        filename = os.path.join(temp_dir, 'file')
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(data)
+        return filename
+
+    def test_whole_file(self):
+        import os
+        filename = self._write(b'abcdef')
+        with self._makeOne(filename) as mapped:
+            self.assertEqual(len(mapped), 6)
+            self.assertEqual(mapped.read(2), b'ab')
+            self.assertEqual(mapped.tell(), 2)
+            self.assertEqual(mapped.read(), b'cdef')
+            self.assertEqual(mapped.read(1), b'')
+            self.assertEqual(mapped.seek(-2, os.SEEK_END), 4)
+            self.assertEqual(mapped.read(5), b'ef')
+            mapped.seek(1)
+            self.assertEqual(mapped.seek(2, os.SEEK_CUR), 3)
+            self.assertEqual(mapped.read(1), b'd')
+            self.assertEqual(mapped.view(1, 3).tobytes(), b'bc')
+            self.assertEqual(mapped.view(4, 10).tobytes(), b'ef')
+            with self.assertRaises(ValueError):
+                mapped.seek(-1)
+
+    def test_window_unaligned(self):
+        import mmap
+        offset = mmap.ALLOCATIONGRANULARITY + 3
+        data = b'x' * offset + b'abcdef'
+        filename = self._write(data)
+        with self._makeOne(filename, offset, 4) as mapped:
+            self.assertEqual(len(mapped), 4)
+            self.assertEqual(mapped.read(), b'abcd')
+            self.assertEqual(mapped.view().tobytes(), b'abcd')
+        with self._makeOne(filename, offset + 2) as mapped:
+            self.assertEqual(mapped.read(), b'cdef')
+
+    def test_empty_file(self):
+        filename = self._write(b'')
+        with self._makeOne(filename) as mapped:
+            self.assertEqual(len(mapped), 0)
+            self.assertEqual(mapped.read(), b'')
+            self.assertEqual(mapped.view().tobytes(), b'')
+
+
+class Test_FileWindow(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.blob import _FileWindow
+        return _FileWindow
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _write(self, data):
+        import os
+        import shutil
+        import tempfile
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        filename = os.path.join(temp_dir, 'file')
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(data)
+        return filename
+
+    def test_whole_file(self):
+        import os
+        filename = self._write(b'abcdef')
+        with self._makeOne(filename) as window:
+            self.assertEqual(len(window), 6)
+            self.assertEqual(window.read(2), b'ab')
+            self.assertEqual(window.view(3, 10).tobytes(), b'def')
+            self.assertEqual(window.tell(), 2)
+            self.assertEqual(window.read(), b'cdef')
+            self.assertEqual(window.seek(-2, os.SEEK_END), 4)
+            self.assertEqual(window.seek(1, os.SEEK_CUR), 5)
+            self.assertEqual(window.read(5), b'f')
+
+    def test_window(self):
+        filename = self._write(b'abcdef')
+        with self._makeOne(filename, 1, 4) as window:
+            self.assertEqual(len(window), 4)
+            self.assertEqual(window.view().tobytes(), b'bcde')
+            self.assertEqual(window.read(), b'bcde')
+        with self._makeOne(filename, 8) as window:
+            self.assertEqual(len(window), 0)
+            self.assertEqual(window.read(), b'')
+
+    def test_truncated_file(self):
+        filename = self._write(b'abcdef')
+        with self._makeOne(filename) as window:
+            with open(filename, 'wb'):
+                pass  # Another writer truncates the file.
+            self.assertEqual(len(window), 6)
+            self.assertEqual(window.read(4), b'')
+            self.assertEqual(window.view(4).tobytes(), b'')
+
+
 class _Responder(object):
 
     def __init__(self, *responses):
@@ -1042,11 +2706,15 @@ class _Bucket(object):
         self._blobs = {}
         self._copied = []
         self._deleted = []
+        self._deleted_blobs = []
 
     def delete_blob(self, blob_name, client=None):
         del self._blobs[blob_name]
         self._deleted.append((blob_name, client))
 
+    def delete_blobs(self, blobs, on_error=None, client=None):
+        self._deleted_blobs.append((list(blobs), on_error, client))
+
 
 class _Signer(object):
 
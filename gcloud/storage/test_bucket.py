@@ -85,6 +85,140 @@ class Test__BlobIterator(unittest2.TestCase):
         self.assertEqual(iterator.prefixes, set(['foo', 'bar']))
 
 
+class Test__BlobSummaryIterator(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.bucket import _BlobSummaryIterator
+        return _BlobSummaryIterator
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def test_get_items_from_response(self):
+        from gcloud.storage.blob import BlobSummary
+        response = {
+            'items': [{'name': 'one', 'size': '1'}, {'name': 'two'}],
+            'prefixes': ['foo/'],
+        }
+        client = _Client(_Connection())
+        iterator = self._makeOne(_Bucket(), client=client)
+        summaries = list(iterator.get_items_from_response(response))
+        self.assertEqual(summaries, [('one', 1, None, None, None),
+                                     ('two', None, None, None, None)])
+        self.assertTrue(isinstance(summaries[0], BlobSummary))
+        self.assertEqual(iterator.prefixes, set(['foo/']))
+
+    def test_get_items_from_response_empty(self):
+        client = _Client(_Connection())
+        iterator = self._makeOne(_Bucket(), client=client)
+        self.assertEqual(list(iterator.get_items_from_response({})), [])
+
+
+class Test__ShardedBlobIterator(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.bucket import _ShardedBlobIterator
+        return _ShardedBlobIterator
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _listing(self):
+        # Three ranges;  the middle one spans two pages.
+        return _ListingConnection({
+            (None, 'm', None, None): {'items': [{'name': 'a'}]},
+            ('m', 't', None, None): {'items': [{'name': 'm1'}],
+                                     'nextPageToken': 'TOKEN'},
+            ('m', 't', 'TOKEN', None): {'items': [{'name': 'm2'}]},
+            ('t', None, None, None): {'items': [{'name': 'x'}]},
+        })
+
+    def test_ctor(self):
+        client = _Client(_Connection())
+        bucket = _Bucket()
+        iterator = self._makeOne(bucket, {'projection': 'noAcl'},
+                                 client=client)
+        self.assertTrue(iterator.bucket is bucket)
+        self.assertTrue(iterator.client is client)
+        self.assertEqual(iterator.extra_params, {'projection': 'noAcl'})
+        self.assertEqual(iterator.split_points, None)
+        self.assertEqual(iterator.shard_delimiter, '/')
+        self.assertTrue(iterator.ordered)
+        self.assertEqual(iterator.prefixes, set())
+
+    def test_w_split_points_ordered(self):
+        connection = self._listing()
+        iterator = self._makeOne(_Bucket(), {'projection': 'noAcl'},
+                                 split_points=['t', 'm', 'm'],
+                                 client=_Client(connection))
+        self.assertEqual([blob.name for blob in iterator],
+                         ['a', 'm1', 'm2', 'x'])
+        self.assertEqual(len(connection._requested), 4)
+        for kw in connection._requested:
+            self.assertEqual(kw['method'], 'GET')
+            self.assertEqual(kw['path'], '/b/name/o')
+            self.assertEqual(kw['query_params']['projection'], 'noAcl')
+
+    def test_w_split_points_unordered(self):
+        connection = self._listing()
+        iterator = self._makeOne(_Bucket(), {}, split_points=['m', 't'],
+                                 ordered=False, max_workers=2,
+                                 client=_Client(connection))
+        self.assertEqual(sorted(blob.name for blob in iterator),
+                         ['a', 'm1', 'm2', 'x'])
+
+    def test_discovers_split_points(self):
+        connection = self._listing()
+        connection._responses[(None, None, None, '/')] = {
+            'prefixes': ['t', 'm'], 'nextPageToken': 'MORE'}
+        connection._responses[(None, None, 'MORE', '/')] = {
+            'prefixes': ['m']}
+        iterator = self._makeOne(_Bucket(), {'prefix': 'p'},
+                                 client=_Client(connection))
+        self.assertEqual([blob.name for blob in iterator],
+                         ['a', 'm1', 'm2', 'x'])
+        discovery = connection._requested[0]['query_params']
+        self.assertEqual(discovery, {'delimiter': '/', 'prefix': 'p',
+                                     'fields': 'prefixes,nextPageToken'})
+        for kw in connection._requested[2:]:
+            self.assertEqual(kw['query_params']['prefix'], 'p')
+
+    def test_aggregates_prefixes(self):
+        connection = _ListingConnection({
+            (None, 'm', None, '/'): {'prefixes': ['a/']},
+            ('m', None, None, '/'): {'items': [{'name': 'z'}],
+                                     'prefixes': ['n/', 'o/']},
+        })
+        iterator = self._makeOne(_Bucket(), {'delimiter': '/'},
+                                 split_points=['m'], max_workers=1,
+                                 client=_Client(connection))
+        self.assertEqual([blob.name for blob in iterator], ['z'])
+        self.assertEqual(iterator.prefixes, set(['a/', 'n/', 'o/']))
+
+    def test_shard_failure_raised(self):
+        from gcloud.exceptions import NotFound
+        connection = _ListingConnection({
+            (None, 'm', None, None): {'items': [{'name': 'a'}]},
+        })
+        iterator = self._makeOne(_Bucket(), {}, split_points=['m'],
+                                 client=_Client(connection))
+        with self.assertRaises(NotFound):
+            list(iterator)
+
+    def test_consumer_stops_early(self):
+        connection = _ListingConnection(dict(
+            ((None, None, token, None),
+             {'items': [{'name': 'b%d' % index}],
+              'nextPageToken': 'T%d' % (index + 1,)})
+            for index, token in enumerate([None] + [
+                'T%d' % (index,) for index in range(1, 50)])))
+        iterator = self._makeOne(_Bucket(), {}, split_points=[],
+                                 prefetch=1, client=_Client(connection))
+        for blob in iterator:
+            break
+        self.assertEqual(blob.name, 'b0')
+
+
 class Test_Bucket(unittest2.TestCase):
 
     def _makeOne(self, client=None, name=None, properties=None):
@@ -238,6 +372,33 @@ class Test_Bucket(unittest2.TestCase):
         self.assertEqual(kw['method'], 'GET')
         self.assertEqual(kw['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
 
+    def test_get_blob_w_metadata_cache(self):
+        from gcloud.storage.cache import BlobMetadataCache
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        connection = _Connection({'name': BLOB_NAME, 'generation': '1',
+                                  'metageneration': '1'}, {})
+        client = _Client(connection)
+        client.metadata_cache = BlobMetadataCache()
+        bucket = self._makeOne(name=NAME)
+        blob = bucket.get_blob(BLOB_NAME, client=client)
+        self.assertEqual(blob.generation, 1)
+        blob = bucket.get_blob(BLOB_NAME, client=client)
+        self.assertEqual(blob.generation, 1)
+        kw, = connection._requested
+        self.assertEqual(kw['query_params'], {'projection': 'noAcl'})
+        # Deleting drops the entry.
+        bucket.delete_blob(BLOB_NAME, client=client)
+        self.assertEqual(len(client.metadata_cache), 0)
+
+    def test_get_blob_miss_w_metadata_cache(self):
+        from gcloud.storage.cache import BlobMetadataCache
+        connection = _Connection()
+        client = _Client(connection)
+        client.metadata_cache = BlobMetadataCache()
+        bucket = self._makeOne(name='name')
+        self.assertEqual(bucket.get_blob('nonesuch', client=client), None)
+
     def test_list_blobs_defaults(self):
         NAME = 'name'
         connection = _Connection({'items': []})
@@ -302,6 +463,73 @@ class Test_Bucket(unittest2.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], {'projection': 'noAcl'})
 
+    def test_list_blobs_summary(self):
+        NAME = 'name'
+        connection = _Connection({'items': [{'name': 'one', 'size': '3'}]})
+        client = _Client(connection)
+        bucket = self._makeOne(client=client, name=NAME)
+        summaries = list(bucket.list_blobs(prefix='o', summary=True))
+        self.assertEqual(summaries, [('one', 3, None, None, None)])
+        kw, = connection._requested
+        self.assertEqual(kw['query_params'], {
+            'projection': 'noAcl',
+            'prefix': 'o',
+            'fields': 'items(name,size,md5Hash,crc32c,updated),'
+                      'prefixes,nextPageToken',
+        })
+
+    def test_list_blobs_summary_w_fields(self):
+        NAME = 'name'
+        FIELDS = 'items/name,nextPageToken'
+        connection = _Connection({'items': [{'name': 'one'}]})
+        client = _Client(connection)
+        bucket = self._makeOne(client=client, name=NAME)
+        summaries = list(bucket.list_blobs(fields=FIELDS, summary=True))
+        self.assertEqual([summary.name for summary in summaries], ['one'])
+        kw, = connection._requested
+        self.assertEqual(kw['query_params']['fields'], FIELDS)
+
+    def test_list_blobs_parallel_summary(self):
+        from gcloud.storage.bucket import _BlobSummaryIterator
+        client = _Client(_Connection())
+        bucket = self._makeOne(client=client, name='name')
+        iterator = bucket.list_blobs_parallel(summary=True)
+        self.assertTrue(iterator.iterator_class is _BlobSummaryIterator)
+        self.assertTrue(
+            iterator.extra_params['fields'].startswith('items(name,'))
+
+    def test_list_blobs_parallel_defaults(self):
+        from gcloud.storage.bucket import _BlobIterator
+        from gcloud.storage.bucket import _ShardedBlobIterator
+        client = _Client(_Connection())
+        bucket = self._makeOne(client=client, name='name')
+        iterator = bucket.list_blobs_parallel()
+        self.assertTrue(isinstance(iterator, _ShardedBlobIterator))
+        self.assertTrue(iterator.bucket is bucket)
+        self.assertEqual(iterator.client, None)
+        self.assertEqual(iterator.extra_params, {'projection': 'noAcl'})
+        self.assertEqual(iterator.split_points, None)
+        self.assertTrue(iterator.ordered)
+        self.assertTrue(iterator.iterator_class is _BlobIterator)
+
+    def test_list_blobs_parallel_w_all_arguments(self):
+        client = _Client(_Connection())
+        bucket = self._makeOne(client=client, name='name')
+        iterator = bucket.list_blobs_parallel(
+            prefix='pre', split_points=['prem'], shard_delimiter='-',
+            delimiter='/', versions=True, projection='full',
+            fields='items/name,nextPageToken', ordered=False,
+            max_workers=3, prefetch=5, client=client)
+        self.assertTrue(iterator.client is client)
+        self.assertEqual(iterator.extra_params, {
+            'prefix': 'pre', 'delimiter': '/', 'versions': True,
+            'projection': 'full', 'fields': 'items/name,nextPageToken'})
+        self.assertEqual(iterator.split_points, ['prem'])
+        self.assertEqual(iterator.shard_delimiter, '-')
+        self.assertFalse(iterator.ordered)
+        self.assertEqual(iterator.max_workers, 3)
+        self.assertEqual(iterator.prefetch, 5)
+
     def test_delete_miss(self):
         from gcloud.exceptions import NotFound
         NAME = 'name'
@@ -439,6 +667,20 @@ class Test_Bucket(unittest2.TestCase):
         self.assertEqual(kw[0]['method'], 'DELETE')
         self.assertEqual(kw[0]['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
 
+    def test_delete_blobs_w_metadata_cache(self):
+        from gcloud.storage.blob import Blob
+        from gcloud.storage.cache import BlobMetadataCache
+        connection = _Connection({}, {})
+        client = _Client(connection)
+        client.metadata_cache = cache = BlobMetadataCache()
+        bucket = self._makeOne(client=client, name='name')
+        for name in ('a', 'b', 'c'):
+            blob = Blob(name, bucket=bucket)
+            blob._properties = {'generation': '1', 'metageneration': '1'}
+            cache.update(blob)
+        bucket.delete_blobs(['a', 'b'])
+        self.assertEqual(list(cache._entries), [('name', 'c')])
+
     def test_delete_blobs_miss_no_on_error(self):
         from gcloud.exceptions import NotFound
         NAME = 'name'
@@ -448,12 +690,14 @@ class Test_Bucket(unittest2.TestCase):
         client = _Client(connection)
         bucket = self._makeOne(client=client, name=NAME)
         self.assertRaises(NotFound, bucket.delete_blobs, [BLOB_NAME, NONESUCH])
-        kw = connection._requested
-        self.assertEqual(len(kw), 2)
-        self.assertEqual(kw[0]['method'], 'DELETE')
-        self.assertEqual(kw[0]['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
-        self.assertEqual(kw[1]['method'], 'DELETE')
-        self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
+        self.assertEqual(connection._requested, [])
+        self.assertEqual(len(connection._batches), 1)
+        method, url, _ = connection._batches[0]
+        self.assertEqual(method, 'POST')
+        self.assertTrue(url.endswith('/batch'))
+        self.assertEqual(connection._batch_deleted,
+                         ['/b/%s/o/%s' % (NAME, BLOB_NAME),
+                          '/b/%s/o/%s' % (NAME, NONESUCH)])
 
     def test_delete_blobs_miss_w_on_error(self):
         NAME = 'name'
@@ -465,12 +709,74 @@ class Test_Bucket(unittest2.TestCase):
         errors = []
         bucket.delete_blobs([BLOB_NAME, NONESUCH], errors.append)
         self.assertEqual(errors, [NONESUCH])
-        kw = connection._requested
-        self.assertEqual(len(kw), 2)
-        self.assertEqual(kw[0]['method'], 'DELETE')
-        self.assertEqual(kw[0]['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
-        self.assertEqual(kw[1]['method'], 'DELETE')
-        self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
+        self.assertEqual(connection._requested, [])
+        self.assertEqual(connection._batch_deleted,
+                         ['/b/%s/o/%s' % (NAME, BLOB_NAME),
+                          '/b/%s/o/%s' % (NAME, NONESUCH)])
+
+    def test_delete_blobs_other_error_raised(self):
+        from gcloud.exceptions import Forbidden
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        OTHER = 'other'
+        connection = _Connection({}, {})
+        connection._batch_errors['/b/%s/o/%s' % (NAME, OTHER)] = (
+            '403 Forbidden', '{"error": {"message": "nope"}}')
+        client = _Client(connection)
+        bucket = self._makeOne(client=client, name=NAME)
+        errors = []
+        self.assertRaises(Forbidden, bucket.delete_blobs,
+                          [BLOB_NAME, OTHER], errors.append)
+        self.assertEqual(errors, [])
+
+    def test_delete_blobs_splits_batches(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage.batch import Batch
+        NAME = 'name'
+        BLOB_NAMES = ['blob-%d' % (i,) for i in range(5)]
+        connection = _Connection(*([{}] * 3))
+        client = _Client(connection)
+        bucket = self._makeOne(client=client, name=NAME)
+        blobs = [_Blob(blob_name) for blob_name in BLOB_NAMES]
+        errors = []
+        with _Monkey(Batch, _MAX_BATCH_SIZE=2):
+            bucket.delete_blobs(iter(blobs), errors.append, max_workers=1)
+        # Two batches of two, plus a lone request for the last blob.
+        self.assertEqual(len(connection._batches), 2)
+        self.assertEqual(connection._batch_deleted,
+                         ['/b/%s/o/%s' % (NAME, blob_name)
+                          for blob_name in BLOB_NAMES[:4]])
+        kw, = connection._requested
+        self.assertEqual(kw['path'], '/b/%s/o/%s' % (NAME, BLOB_NAMES[4]))
+        self.assertEqual(errors, [blobs[3], blobs[4]])
+
+    def test_delete_blobs_concurrent_batches(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage.batch import Batch
+        NAME = 'name'
+        BLOB_NAMES = ['blob-%d' % (i,) for i in range(6)]
+        connection = _Connection(*([{}] * 6))
+        client = _Client(connection)
+        bucket = self._makeOne(client=client, name=NAME)
+        with _Monkey(Batch, _MAX_BATCH_SIZE=2):
+            bucket.delete_blobs(BLOB_NAMES, max_workers=3)
+        self.assertEqual(len(connection._batches), 3)
+        self.assertEqual(sorted(connection._batch_deleted),
+                         ['/b/%s/o/%s' % (NAME, blob_name)
+                          for blob_name in BLOB_NAMES])
+
+    def test_delete_blobs_w_current_batch(self):
+        NAME = 'name'
+        BLOB_NAMES = ['blob-name1', 'blob-name2']
+        connection = _Connection({}, {})
+        client = _Client(connection)
+        client.current_batch = connection
+        bucket = self._makeOne(client=client, name=NAME)
+        bucket.delete_blobs(BLOB_NAMES)
+        self.assertEqual(connection._batches, [])
+        self.assertEqual([kw['path'] for kw in connection._requested],
+                         ['/b/%s/o/%s' % (NAME, blob_name)
+                          for blob_name in BLOB_NAMES])
 
     def test_copy_blobs_wo_name(self):
         SOURCE = 'source'
@@ -495,6 +801,25 @@ class Test_Bucket(unittest2.TestCase):
         self.assertEqual(kw['method'], 'POST')
         self.assertEqual(kw['path'], COPY_PATH)
 
+    def test_compose_blob(self):
+        NAME = 'name'
+        NEW_NAME = 'new-name'
+        connection = _Connection({'componentCount': 2})
+        client = _Client(connection)
+        bucket = self._makeOne(client=client, name=NAME)
+        new_blob = bucket.compose_blob(['one', 'two'], NEW_NAME,
+                                       content_type='text/plain')
+        self.assertTrue(new_blob.bucket is bucket)
+        self.assertEqual(new_blob.name, NEW_NAME)
+        self.assertEqual(new_blob.component_count, 2)
+        kw, = connection._requested
+        self.assertEqual(kw['method'], 'POST')
+        self.assertEqual(kw['path'], '/b/%s/o/%s/compose' % (NAME, NEW_NAME))
+        self.assertEqual(kw['data'], {
+            'sourceObjects': [{'name': 'one'}, {'name': 'two'}],
+            'destination': {'contentType': 'text/plain'},
+        })
+
     def test_copy_blobs_w_name(self):
         SOURCE = 'source'
         DEST = 'dest'
@@ -544,6 +869,82 @@ class Test_Bucket(unittest2.TestCase):
         self.assertTrue(renamed_blob.bucket is bucket)
         self.assertEqual(renamed_blob.name, NEW_BLOB_NAME)
         self.assertEqual(blob._deleted, [client])
+        kw, = connection._requested
+        self.assertEqual(kw['path'], '/b/%s/o/%s/rewriteTo/b/%s/o/%s' % (
+            BUCKET_NAME, BLOB_NAME, BUCKET_NAME, NEW_BLOB_NAME))
+
+    def test_rename_blob_in_batch(self):
+        connection = _Connection({'name': 'new-name'})
+        client = _Client(connection)
+        client.current_batch = object()
+        bucket = self._makeOne(client=client, name='name')
+        blob = _RenamedBlob('old-name', 'name')
+        bucket.rename_blob(blob, 'new-name')
+        kw, = connection._requested
+        self.assertEqual(kw['path'],
+                         '/b/name/o/old-name/copyTo/b/name/o/new-name')
+        self.assertEqual(blob._deleted, [client])
+
+    def test_rewrite_blob(self):
+        connection = _Connection(
+            {'totalBytesRewritten': '1', 'objectSize': '3', 'done': False,
+             'rewriteToken': 'T1'},
+            {'totalBytesRewritten': '2', 'objectSize': '3', 'done': False,
+             'rewriteToken': 'T2'},
+            {'totalBytesRewritten': '3', 'objectSize': '3', 'done': True,
+             'resource': {'name': 'copy', 'size': '3'}},
+        )
+        client = _Client(connection)
+        source_bucket = self._makeOne(client=client, name='source')
+        dest_bucket = self._makeOne(client=client, name='dest')
+        blob = _RenamedBlob('blob', 'source')
+        reported = []
+
+        def progress(new_blob, rewritten, size):
+            reported.append((new_blob.name, rewritten, size))
+
+        new_blob = source_bucket.rewrite_blob(blob, dest_bucket, 'copy',
+                                              progress=progress,
+                                              max_bytes_per_call=1048576)
+        self.assertTrue(new_blob.bucket is dest_bucket)
+        self.assertEqual(new_blob.size, 3)
+        self.assertEqual(reported, [('copy', 1, 3), ('copy', 2, 3),
+                                    ('copy', 3, 3)])
+        tokens = [kw['query_params'].get('rewriteToken')
+                  for kw in connection._requested]
+        self.assertEqual(tokens, [None, 'T1', 'T2'])
+        self.assertEqual(connection._requested[0]['path'],
+                         '/b/source/o/blob/rewriteTo/b/dest/o/copy')
+        self.assertEqual(
+            connection._requested[0]['query_params'],
+            {'maxBytesRewrittenPerCall': 1048576})
+
+    def test_rewrite_blobs(self):
+        connection = _Connection(
+            {'resource': {'name': 'a'}},
+            {'resource': {'name': 'renamed'}},
+        )
+        client = _Client(connection)
+        bucket = self._makeOne(client=client, name='name')
+        dest_bucket = self._makeOne(client=client, name='dest')
+        blobs = [_RenamedBlob('a', 'name'),
+                 (_RenamedBlob('b', 'name'), 'renamed')]
+        new_blobs = bucket.rewrite_blobs(iter(blobs), dest_bucket,
+                                         max_workers=1)
+        self.assertEqual([blob.name for blob in new_blobs], ['a', 'renamed'])
+        self.assertEqual(
+            [kw['path'] for kw in connection._requested],
+            ['/b/name/o/a/rewriteTo/b/dest/o/a',
+             '/b/name/o/b/rewriteTo/b/dest/o/renamed'])
+
+    def test_rewrite_blobs_failure(self):
+        from gcloud.exceptions import NotFound
+        connection = _Connection()
+        client = _Client(connection)
+        bucket = self._makeOne(client=client, name='name')
+        with self.assertRaises(NotFound):
+            bucket.rewrite_blobs([_RenamedBlob('a', 'name')], bucket,
+                                 max_workers=2)
 
     def test_etag(self):
         ETAG = 'ETAG'
@@ -836,88 +1237,101 @@ class Test_Bucket(unittest2.TestCase):
     def test_make_public_w_future_reload_default(self):
         self._make_public_w_future_helper(default_object_acl_loaded=False)
 
-    def test_make_public_recursive(self):
+    def _make_public_recursive(self, items, reloaded=None, **kw):
         from gcloud.storage.acl import _ACLEntity
-        from gcloud.storage.bucket import _BlobIterator
-        _saved = []
-
-        class _Blob(object):
-            _granted = False
-
-            def __init__(self, bucket, name):
-                self._bucket = bucket
-                self._name = name
-
-            @property
-            def acl(self):
-                return self
-
-            # Faux ACL methods
-            def all(self):
-                return self
-
-            def grant_read(self):
-                self._granted = True
-
-            def save(self, client=None):
-                _saved.append(
-                    (self._bucket, self._name, self._granted, client))
-
-        class _Iterator(_BlobIterator):
-            def get_items_from_response(self, response):
-                for item in response.get('items', []):
-                    yield _Blob(self.bucket, item['name'])
-
-        NAME = 'name'
-        BLOB_NAME = 'blob-name'
         permissive = [{'entity': 'allUsers', 'role': _ACLEntity.READER_ROLE}]
         after = {'acl': permissive, 'defaultObjectAcl': []}
-        connection = _Connection(after, {'items': [{'name': BLOB_NAME}]})
+        responses = [after, {'items': items}]
+        if reloaded is not None:
+            responses.append(reloaded)
+        connection = _Connection(*responses)
         client = _Client(connection)
-        bucket = self._makeOne(client=client, name=NAME)
+        bucket = self._makeOne(client=client, name='name')
         bucket.acl.loaded = True
         bucket.default_object_acl.loaded = True
-        bucket._iterator_class = _Iterator
-        bucket.make_public(recursive=True)
+        bucket.make_public(recursive=True, **kw)
         self.assertEqual(list(bucket.acl), permissive)
         self.assertEqual(list(bucket.default_object_acl), [])
-        self.assertEqual(_saved, [(bucket, BLOB_NAME, True, None)])
+        return connection
+
+    def test_make_public_recursive(self):
+        owner = {'entity': 'user-me', 'role': 'OWNER'}
+        connection = self._make_public_recursive(
+            [{'name': 'blob-name', 'acl': [owner]}])
         kw = connection._requested
         self.assertEqual(len(kw), 2)
         self.assertEqual(kw[0]['method'], 'PATCH')
-        self.assertEqual(kw[0]['path'], '/b/%s' % NAME)
-        self.assertEqual(kw[0]['data'], {'acl': permissive})
-        self.assertEqual(kw[0]['query_params'], {'projection': 'full'})
+        self.assertEqual(kw[0]['path'], '/b/name')
         self.assertEqual(kw[1]['method'], 'GET')
-        self.assertEqual(kw[1]['path'], '/b/%s/o' % NAME)
-        max_results = bucket._MAX_OBJECTS_FOR_ITERATION + 1
-        self.assertEqual(kw[1]['query_params'],
-                         {'maxResults': max_results, 'projection': 'full'})
-
-    def test_make_public_recursive_too_many(self):
-        from gcloud.storage.acl import _ACLEntity
-
-        PERMISSIVE = [{'entity': 'allUsers', 'role': _ACLEntity.READER_ROLE}]
-        AFTER = {'acl': PERMISSIVE, 'defaultObjectAcl': []}
-
-        NAME = 'name'
-        BLOB_NAME1 = 'blob-name1'
-        BLOB_NAME2 = 'blob-name2'
-        GET_BLOBS_RESP = {
-            'items': [
-                {'name': BLOB_NAME1},
-                {'name': BLOB_NAME2},
-            ],
-        }
-        connection = _Connection(AFTER, GET_BLOBS_RESP)
-        client = _Client(connection)
-        bucket = self._makeOne(client=client, name=NAME)
+        self.assertEqual(kw[1]['path'], '/b/name/o')
+        self.assertEqual(kw[1]['query_params'], {'projection': 'full'})
+        # The listed ACL is extended, with no per-blob GET.
+        (path, data), = connection._batch_patched
+        self.assertEqual(path, '/b/name/o/blob-name')
+        self.assertEqual(sorted(data['acl'], key=lambda entry: entry['role']),
+                         [owner, {'entity': 'allUsers', 'role': 'READER'}])
+
+    def test_make_public_recursive_no_cap(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage.batch import Batch
+        items = [{'name': 'blob-%d' % (index,), 'acl': []}
+                 for index in range(5)]
+        with _Monkey(Batch, _MAX_BATCH_SIZE=2):
+            connection = self._make_public_recursive(items, max_workers=2)
+        self.assertEqual(len(connection._batches), 3)
+        self.assertEqual(sorted(path for path, _ in connection._batch_patched),
+                         ['/b/name/o/blob-%d' % (index,)
+                          for index in range(5)])
+
+    def test_make_public_recursive_acl_not_listed(self):
+        owner = {'entity': 'user-me', 'role': 'OWNER'}
+        connection = self._make_public_recursive(
+            [{'name': 'blob-name'}], reloaded={'items': [owner]})
+        kw = connection._requested
+        self.assertEqual(kw[2]['method'], 'GET')
+        self.assertEqual(kw[2]['path'], '/b/name/o/blob-name/acl')
+        # The reloaded ACL is extended, rather than replaced.
+        (path, data), = connection._batch_patched
+        self.assertEqual(sorted(data['acl'], key=lambda entry: entry['role']),
+                         [owner, {'entity': 'allUsers', 'role': 'READER'}])
+
+    def test_make_public_recursive_acl_reload_fails(self):
+        failed = []
+        connection = _Connection({}, {'items': [{'name': 'a'},
+                                                {'name': 'b', 'acl': []}]})
+        bucket = self._makeOne(client=_Client(connection), name='name')
         bucket.acl.loaded = True
-        bucket.default_object_acl.loaded = True
+        bucket.make_public(
+            recursive=True,
+            on_error=lambda acl: failed.append(acl.blob.name))
+        self.assertEqual(failed, ['a'])
+        # Nothing is patched for the ACL which could not be reloaded.
+        (path, _), = connection._batch_patched
+        self.assertEqual(path, '/b/name/o/b')
+
+    def test_make_public_recursive_acl_reload_fails_wo_on_error(self):
+        from gcloud.exceptions import NotFound
+        connection = _Connection({}, {'items': [{'name': 'a'}]})
+        bucket = self._makeOne(client=_Client(connection), name='name')
+        bucket.acl.loaded = True
+        with self.assertRaises(NotFound):
+            bucket.make_public(recursive=True)
+        self.assertEqual(connection._batch_patched, [])
 
-        # Make the Bucket refuse to make_public with 2 objects.
-        bucket._MAX_OBJECTS_FOR_ITERATION = 1
-        self.assertRaises(ValueError, bucket.make_public, recursive=True)
+    def test_make_public_recursive_w_on_error(self):
+        failed = []
+        connection = _Connection()
+        connection._batch_errors['/b/name/o/b'] = (
+            '403 Forbidden', '{"error": {"message": "denied"}}')
+        connection._responses = ({}, {'items': [{'name': 'a', 'acl': []},
+                                                {'name': 'b', 'acl': []}]})
+        bucket = self._makeOne(client=_Client(connection), name='name')
+        bucket.acl.loaded = True
+        bucket.make_public(
+            recursive=True,
+            on_error=lambda acl: failed.append(acl.blob.name))
+        self.assertEqual(failed, ['b'])
+        self.assertEqual(len(connection._batch_patched), 2)
 
 
 class _Connection(object):
@@ -927,6 +1341,10 @@ class _Connection(object):
         self._responses = responses
         self._requested = []
         self._deleted_buckets = []
+        self._batches = []
+        self._batch_deleted = []
+        self._batch_patched = []
+        self._batch_errors = {}
 
     @staticmethod
     def _is_bucket_path(path):
@@ -955,6 +1373,80 @@ class _Connection(object):
         else:
             return response
 
+    def _make_request(self, method, url, data=None, content_type=None,
+                      headers=None):
+        # Answer a batch request, one part per deferred DELETE or PATCH.
+        import json
+        import re
+        data = data.decode('utf-8')
+        self._batches.append((method, url, data))
+        parts = []
+        for path in re.findall(r'DELETE \S+(/b/\S+) HTTP/1.1', data):
+            self._batch_deleted.append(path)
+            if path in self._batch_errors:
+                status, body = self._batch_errors[path]
+            elif self._responses:
+                self._responses = self._responses[1:]
+                status, body = '204 No Content', None
+            else:
+                status, body = '404 Not Found', '{"error": {"message": "x"}}'
+            parts.append(self._batch_part(status, body))
+        # Answer PATCH parts by echoing the request body.
+        for path, body in re.findall(
+                r'PATCH \S+(/b/[^?\s]+)\S* HTTP/1.1\r\n.*?\r\n\r\n(.*?)\r\n',
+                data, re.S):
+            self._batch_patched.append((path, json.loads(body)))
+            status = '200 OK'
+            if path in self._batch_errors:
+                status, body = self._batch_errors[path]
+            parts.append(self._batch_part(status, body))
+        content = ''.join(parts) + '--BOUNDARY--'
+        response = _Response(
+            {'content-type': 'multipart/mixed; boundary="BOUNDARY"'})
+        return response, content
+
+    @staticmethod
+    def _batch_part(status, body):
+        part = ('--BOUNDARY\nContent-Type: application/http\n\n'
+                'HTTP/1.1 %s\n' % (status,))
+        if body is None:
+            part += 'Content-Length: 0\n\n'
+        else:
+            part += 'Content-Type: application/json\n\n%s\n' % (body,)
+        return part
+
+
+class _Response(dict):
+    status = 200
+
+
+class _ListingConnection(object):
+    """Answer listings by range, page token and delimiter;  thread-safe."""
+
+    def __init__(self, responses):
+        import threading
+        self._responses = responses
+        self._requested = []
+        self._lock = threading.Lock()
+
+    def api_request(self, **kw):
+        from gcloud.exceptions import NotFound
+        with self._lock:
+            self._requested.append(kw)
+        params = kw['query_params']
+        key = (params.get('startOffset'), params.get('endOffset'),
+               params.get('pageToken'), params.get('delimiter'))
+        try:
+            return self._responses[key]
+        except KeyError:
+            raise NotFound('miss')
+
+
+class _Blob(object):
+
+    def __init__(self, name):
+        self.name = name
+
 
 class _Bucket(object):
     path = '/b/name'
@@ -964,8 +1456,21 @@ class _Bucket(object):
         self.client = client
 
 
+class _RenamedBlob(object):
+
+    def __init__(self, name, bucket_name):
+        self.name = name
+        self.path = '/b/%s/o/%s' % (bucket_name, name)
+        self._deleted = []
+
+    def delete(self, client=None):
+        self._deleted.append(client)
+
+
 class _Client(object):
 
+    current_batch = None
+
     def __init__(self, connection, project=None):
-        self.connection = connection
+        self.connection = self._connection = connection
         self.project = project
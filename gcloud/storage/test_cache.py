@@ -0,0 +1,234 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2
+
+
+def _resource(name, generation=1, metageneration=1, **kw):
+    resource = {'name': name, 'generation': str(generation),
+                'metageneration': str(metageneration)}
+    resource.update(kw)
+    return resource
+
+
+class TestBlobMetadataCache(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.cache import BlobMetadataCache
+        return BlobMetadataCache
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _fetch(self, cache, connection, name='blob', when=1000.0):
+        from gcloud._testing import _Monkey
+        from gcloud.storage import cache as MUT
+        with _Monkey(MUT, _now=lambda: when):
+            return cache.fetch(_Blob(name), _Client(connection))
+
+    def test_ctor_defaults(self):
+        cache = self._makeOne()
+        self.assertEqual(cache.max_entries, 1024)
+        self.assertEqual(cache.ttl, 60.0)
+        self.assertEqual(len(cache), 0)
+
+    def test_ctor_invalid(self):
+        with self.assertRaises(ValueError):
+            self._makeOne(max_entries=0)
+        with self.assertRaises(ValueError):
+            self._makeOne(ttl=-1)
+
+    def test_fetch_miss_then_hit(self):
+        cache = self._makeOne(ttl=10)
+        connection = _Connection(_resource('blob', metadata={'a': 'b'}))
+        first = self._fetch(cache, connection)
+        self.assertEqual(first['metadata'], {'a': 'b'})
+        first['metadata']['a'] = 'changed'  # Callers get a copy.
+        second = self._fetch(cache, connection, when=1009.0)
+        self.assertEqual(second['metadata'], {'a': 'b'})
+        kw, = connection._requested
+        self.assertEqual(kw['method'], 'GET')
+        self.assertEqual(kw['path'], '/b/bucket/o/blob')
+        self.assertEqual(kw['query_params'], {'projection': 'noAcl'})
+        self.assertEqual((cache.misses, cache.hits, cache.revalidations),
+                         (1, 1, 0))
+
+    def test_fetch_stale_not_modified(self):
+        from gcloud.exceptions import NotModified
+        cache = self._makeOne(ttl=10)
+        connection = _Connection(_resource('blob', 3, 5), NotModified(''))
+        self._fetch(cache, connection)
+        resource = self._fetch(cache, connection, when=1010.0)
+        self.assertEqual(resource['generation'], '3')
+        self.assertEqual(connection._requested[1]['query_params'], {
+            'projection': 'noAcl',
+            'ifGenerationMatch': '3',
+            'ifMetagenerationNotMatch': '5',
+        })
+        # Revalidated:  fresh again.
+        self._fetch(cache, connection, when=1019.0)
+        self.assertEqual(len(connection._requested), 2)
+        self.assertEqual(cache.revalidations, 1)
+
+    def test_fetch_stale_metadata_changed(self):
+        cache = self._makeOne(ttl=10)
+        connection = _Connection(_resource('blob', 3, 5),
+                                 _resource('blob', 3, 6))
+        self._fetch(cache, connection)
+        resource = self._fetch(cache, connection, when=1010.0)
+        self.assertEqual(resource['metageneration'], '6')
+        self.assertEqual(len(connection._requested), 2)
+
+    def test_fetch_stale_overwritten(self):
+        from gcloud.exceptions import PreconditionFailed
+        cache = self._makeOne(ttl=10)
+        connection = _Connection(_resource('blob', 3),
+                                 PreconditionFailed('generation'),
+                                 _resource('blob', 4))
+        self._fetch(cache, connection)
+        resource = self._fetch(cache, connection, when=1010.0)
+        self.assertEqual(resource['generation'], '4')
+        self.assertEqual(connection._requested[2]['query_params'],
+                         {'projection': 'noAcl'})
+
+    def test_fetch_not_found_invalidates(self):
+        from gcloud.exceptions import NotFound
+        cache = self._makeOne(ttl=10)
+        connection = _Connection(_resource('blob'), NotFound('gone'))
+        self._fetch(cache, connection)
+        self.assertTrue(('bucket', 'blob') in cache)
+        with self.assertRaises(NotFound):
+            self._fetch(cache, connection, when=1010.0)
+        self.assertFalse(('bucket', 'blob') in cache)
+
+    def test_lru_eviction(self):
+        cache = self._makeOne(max_entries=2)
+        connection = _Connection(_resource('a'), _resource('b'),
+                                 _resource('c'))
+        self._fetch(cache, connection, 'a')
+        self._fetch(cache, connection, 'b')
+        self._fetch(cache, connection, 'a')  # Hit:  'b' is now the oldest.
+        self._fetch(cache, connection, 'c')
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(('bucket', 'a') in cache)
+        self.assertFalse(('bucket', 'b') in cache)
+
+    def test_lru_eviction_after_repeated_hits(self):
+        cache = self._makeOne(max_entries=2)
+        connection = _Connection(_resource('a'), _resource('b'),
+                                 _resource('c'))
+        self._fetch(cache, connection, 'a')
+        self._fetch(cache, connection, 'b')
+        for _ in range(100):
+            self._fetch(cache, connection, 'a')
+        # The use order stays bounded however often entries are hit.
+        self.assertTrue(len(cache._used) <= 2 * 2 + 16 + 1)
+        self._fetch(cache, connection, 'c')
+        self.assertEqual(sorted(cache._entries),
+                         [('bucket', 'a'), ('bucket', 'c')])
+        self.assertEqual(cache.hits, 100)
+
+    def test_counters_w_threads(self):
+        import threading
+        from gcloud._testing import _Monkey
+        from gcloud.storage import cache as MUT
+        cache = self._makeOne(ttl=10)
+        connection = _Connection(_resource('blob'))
+        self._fetch(cache, connection)
+
+        def _hit():
+            for _ in range(200):
+                cache.fetch(_Blob('blob'), _Client(connection))
+
+        with _Monkey(MUT, _now=lambda: 1000.0):
+            threads = [threading.Thread(target=_hit) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual((cache.misses, cache.hits), (1, 800))
+
+    def test_update_and_invalidate(self):
+        cache = self._makeOne()
+        blob = _Blob('blob')
+        blob._properties = _resource('blob', 7)
+        cache.update(blob)
+        self.assertTrue(('bucket', 'blob') in cache)
+        blob._properties = {'name': 'blob'}  # E.g. a pending batch response.
+        cache.update(blob)
+        self.assertFalse(('bucket', 'blob') in cache)
+        blob._properties = _resource('blob', 7)
+        cache.update(blob)
+        cache.invalidate('bucket', 'blob')
+        self.assertEqual(len(cache), 0)
+        cache.update(blob)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class Test__active_cache(unittest2.TestCase):
+
+    def _callFUT(self, client):
+        from gcloud.storage.cache import _active_cache
+        return _active_cache(client)
+
+    def test_wo_cache(self):
+        self.assertEqual(self._callFUT(_Client(None)), None)
+
+    def test_w_cache(self):
+        client = _Client(None)
+        client.metadata_cache = cache = object()
+        self.assertTrue(self._callFUT(client) is cache)
+
+    def test_w_cache_in_batch(self):
+        client = _Client(None)
+        client.metadata_cache = object()
+        client.current_batch = object()
+        self.assertEqual(self._callFUT(client), None)
+
+
+class _Connection(object):
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._requested = []
+
+    def api_request(self, **kw):
+        self._requested.append(kw)
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class _Bucket(object):
+    name = 'bucket'
+
+
+class _Blob(object):
+
+    bucket = _Bucket()
+
+    def __init__(self, name):
+        self.name = name
+        self.path = '/b/bucket/o/' + name
+        self._properties = {}
+
+
+class _Client(object):
+
+    current_batch = None
+
+    def __init__(self, connection):
+        self.connection = connection
@@ -36,6 +36,15 @@ class TestClient(unittest2.TestCase):
         self.assertTrue(client.connection.credentials is CREDENTIALS)
         self.assertTrue(client.current_batch is None)
         self.assertEqual(list(client._batch_stack), [])
+        self.assertEqual(client.metadata_cache, None)
+        self.assertEqual(client.transfer_stats.transfers, 0)
+
+    def test_ctor_w_metadata_cache(self):
+        from gcloud.storage.cache import BlobMetadataCache
+        cache = BlobMetadataCache()
+        client = self._makeOne(project='PROJECT', credentials=_Credentials(),
+                               metadata_cache=cache)
+        self.assertTrue(client.metadata_cache is cache)
 
     def test__push_batch_and__pop_batch(self):
         from gcloud.storage.batch import Batch
@@ -113,6 +122,16 @@ class TestClient(unittest2.TestCase):
         batch = client.batch()
         self.assertTrue(isinstance(batch, Batch))
         self.assertTrue(batch._client is client)
+        self.assertFalse(batch._auto_flush)
+
+    def test_batch_w_auto_flush(self):
+        PROJECT = 'PROJECT'
+        CREDENTIALS = _Credentials()
+
+        client = self._makeOne(project=PROJECT, credentials=CREDENTIALS)
+        batch = client.batch(auto_flush=True, max_workers=2)
+        self.assertTrue(batch._client is client)
+        self.assertTrue(batch._auto_flush)
 
     def test_get_bucket_miss(self):
         from gcloud.exceptions import NotFound
@@ -0,0 +1,244 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2
+
+
+def _resource(name, size=1, generation=1, metageneration=1,
+              updated='2015-01-01T00:00:00.000Z'):
+    return {
+        'name': name,
+        'size': str(size),
+        'md5Hash': 'MD5-' + name,
+        'crc32c': 'CRC-' + name,
+        'generation': str(generation),
+        'metageneration': str(metageneration),
+        'updated': updated,
+    }
+
+
+class TestBucketIndex(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.index import BucketIndex
+        return BucketIndex
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def _refresh(self, index, items, prefix='', **kw):
+        from gcloud._testing import _Monkey
+        from gcloud.storage import index as MUT
+        connection = _Connection(items)
+        index.client = _Client(connection)
+        with _Monkey(MUT, _REFRESH_CHUNK_SIZE=2):
+            stats = index.refresh(prefix=prefix, max_workers=1, **kw)
+        return stats, connection
+
+    def test_ctor_new(self):
+        bucket = _Bucket()
+        index = self._makeOne(bucket, ':memory:')
+        self.assertTrue(index.bucket is bucket)
+        self.assertEqual(index.path, ':memory:')
+        self.assertEqual(index.client, None)
+        self.assertEqual(index.count(), 0)
+        self.assertEqual(index.total_size(), 0)
+
+    def test_ctor_reopen_and_wrong_bucket(self):
+        import os
+        import shutil
+        import tempfile
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        path = os.path.join(temp_dir, 'index.db')
+        with self._makeOne(_Bucket(), path) as index:
+            self._refresh(index, [_resource('a', size=5)])
+        with self._makeOne(_Bucket(), path) as index:
+            self.assertEqual(index.total_size(), 5)
+        with self.assertRaises(ValueError):
+            self._makeOne(_Bucket('other'), path)
+
+    def test_refresh_initial(self):
+        index = self._makeOne(_Bucket(), ':memory:')
+        items = [_resource('a', 1), _resource('b/1', 2),
+                 _resource('b/2', 3), _resource('c', 4)]
+        stats, connection = self._refresh(index, items)
+        self.assertEqual(stats, (4, 0, 0, 0))
+        kw = connection._requested[0]
+        self.assertEqual(kw['method'], 'GET')
+        self.assertEqual(kw['path'], '/b/name/o')
+        self.assertTrue('generation' in kw['query_params']['fields'])
+        self.assertEqual(index.count(), 4)
+        self.assertEqual(index.total_size(), 10)
+        self.assertEqual(index.count('b/'), 2)
+        self.assertEqual(index.total_size('b/'), 5)
+        summaries = list(index.list_blobs('b/'))
+        self.assertEqual([summary.name for summary in summaries],
+                         ['b/1', 'b/2'])
+        self.assertEqual(summaries[0].size, 2)
+        self.assertEqual(summaries[0].md5_hash, 'MD5-b/1')
+        self.assertEqual(summaries[0].crc32c, 'CRC-b/1')
+        self.assertEqual(summaries[0].updated_raw,
+                         '2015-01-01T00:00:00.000Z')
+
+    def test_refresh_incremental(self):
+        index = self._makeOne(_Bucket(), ':memory:')
+        self._refresh(index, [_resource('a'), _resource('b'),
+                              _resource('c'), _resource('d'),
+                              _resource('e')])
+        stats, _ = self._refresh(index, [
+            _resource('a'),
+            _resource('b', size=7, generation=2),  # Rewritten.
+            _resource('bb'),  # New.
+            _resource('d', metageneration=2),  # Patched.
+            # 'c' and 'e' deleted.
+        ])
+        self.assertEqual(stats, (1, 2, 2, 1))
+        self.assertEqual([summary.name for summary in index.list_blobs()],
+                         ['a', 'b', 'bb', 'd'])
+        self.assertEqual(index.total_size(), 10)
+
+    def test_refresh_prefix_leaves_other_rows(self):
+        index = self._makeOne(_Bucket(), ':memory:')
+        self._refresh(index, [_resource('a/1'), _resource('b/1'),
+                              _resource('b/2'), _resource('c/1')])
+        stats, connection = self._refresh(index, [_resource('b/2')],
+                                          prefix='b/')
+        self.assertEqual(stats, (0, 0, 1, 1))
+        self.assertEqual(connection._requested[0]['query_params']['prefix'],
+                         'b/')
+        self.assertEqual([summary.name for summary in index.list_blobs()],
+                         ['a/1', 'b/2', 'c/1'])
+
+    def test_refresh_empty_listing_deletes_prefix(self):
+        index = self._makeOne(_Bucket(), ':memory:')
+        self._refresh(index, [_resource('a'), _resource('b')])
+        stats, _ = self._refresh(index, [])
+        self.assertEqual(stats, (0, 0, 2, 0))
+        self.assertEqual(index.count(), 0)
+
+    def test_refresh_failure_rolls_back(self):
+        from gcloud._testing import _Monkey
+        from gcloud.storage import index as MUT
+        index = self._makeOne(_Bucket(), ':memory:')
+        self._refresh(index, [_resource('a'), _resource('b')])
+        connection = _Connection([_resource('a', generation=2),
+                                  _resource('c'), _resource('d')],
+                                 fail_after=1)
+        index.client = _Client(connection)
+        with _Monkey(MUT, _REFRESH_CHUNK_SIZE=2):
+            with self.assertRaises(ValueError):
+                index.refresh(max_workers=1)
+        self.assertEqual([summary.name for summary in index.list_blobs()],
+                         ['a', 'b'])
+        stats, _ = self._refresh(index, [_resource('a'), _resource('b')])
+        self.assertEqual(stats, (0, 0, 0, 2))
+
+    def test_refresh_parallel(self):
+        index = self._makeOne(_Bucket(), ':memory:')
+        connection = _Connection([_resource('a/1'), _resource('a/2'),
+                                  _resource('b/1')])
+        index.client = _Client(connection)
+        stats = index.refresh(max_workers=4)
+        self.assertEqual(stats, (3, 0, 0, 0))
+        self.assertEqual([summary.name for summary in index.list_blobs()],
+                         ['a/1', 'a/2', 'b/1'])
+
+    def test_changed_since(self):
+        import datetime
+        from gcloud._helpers import UTC
+        index = self._makeOne(_Bucket(), ':memory:')
+        self._refresh(index, [
+            _resource('a', updated='2015-01-01T00:00:00.000Z'),
+            _resource('b', updated='2015-02-01T00:00:00.000Z'),
+            _resource('c/1', updated='2015-03-01T00:00:00.000Z'),
+            _resource('c/2', updated='2015-01-01T00:00:00.000Z'),
+        ])
+        when = datetime.datetime(2015, 1, 15)
+        self.assertEqual(
+            [summary.name for summary in index.changed_since(when)],
+            ['b', 'c/1'])
+        when = datetime.datetime(2015, 2, 1, tzinfo=UTC)
+        self.assertEqual(
+            [summary.name for summary in index.changed_since(when, 'c/')],
+            ['c/1'])
+
+
+class Test__prefix_end(unittest2.TestCase):
+
+    def _callFUT(self, prefix):
+        from gcloud.storage.index import _prefix_end
+        return _prefix_end(prefix)
+
+    def test_simple(self):
+        self.assertEqual(self._callFUT('abc/'), 'abc0')
+
+    def test_max_code_point(self):
+        import six
+        self.assertEqual(self._callFUT(u'ab' + six.unichr(0x10FFFF)), u'ac')
+        self.assertEqual(self._callFUT(six.unichr(0x10FFFF)), None)
+
+
+class _Connection(object):
+    """Serve a sorted listing, one page per two items;  thread-safe."""
+
+    def __init__(self, items, fail_after=None):
+        import threading
+        self._items = sorted(items, key=lambda item: item['name'])
+        self._fail_after = fail_after
+        self._requested = []
+        self._lock = threading.Lock()
+
+    def api_request(self, **kw):
+        with self._lock:
+            self._requested.append(kw)
+        params = kw['query_params']
+        prefix = params.get('prefix', '')
+        start = params.get('startOffset')
+        end = params.get('endOffset')
+        if params.get('delimiter'):
+            found = set()
+            for item in self._items:
+                name = item['name']
+                if name.startswith(prefix):
+                    rest = name[len(prefix):]
+                    if params['delimiter'] in rest:
+                        head = rest.split(params['delimiter'], 1)[0]
+                        found.add(prefix + head + params['delimiter'])
+            return {'prefixes': sorted(found)}
+        matching = [item for item in self._items
+                    if item['name'].startswith(prefix) and
+                    (start is None or item['name'] >= start) and
+                    (end is None or item['name'] < end)]
+        offset = int(params.get('pageToken', 0))
+        if self._fail_after is not None and offset >= self._fail_after:
+            raise ValueError('listing failed')
+        response = {'items': matching[offset:offset + 2]}
+        if offset + 2 < len(matching):
+            response['nextPageToken'] = str(offset + 2)
+        return response
+
+
+class _Bucket(object):
+
+    def __init__(self, name='name'):
+        self.name = name
+        self.path = '/b/' + name
+        self.client = None
+
+
+class _Client(object):
+
+    def __init__(self, connection):
+        self.connection = connection
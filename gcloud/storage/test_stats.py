@@ -0,0 +1,308 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2
+
+
+class TestTransferProgress(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.stats import TransferProgress
+        return TransferProgress
+
+    def _makeOne(self, chunk_seconds=2.0, elapsed=4.0):
+        return self._getTargetClass()('blob', 'upload', 100, 200, 50,
+                                      chunk_seconds, elapsed, 0)
+
+    def test_throughput(self):
+        progress = self._makeOne()
+        self.assertEqual(progress.throughput, 25.0)
+        self.assertEqual(progress.average_throughput, 25.0)
+
+    def test_throughput_unmeasurable(self):
+        progress = self._makeOne(chunk_seconds=0.0, elapsed=0.0)
+        self.assertEqual(progress.throughput, None)
+        self.assertEqual(progress.average_throughput, None)
+
+
+class TestTransferStats(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.stats import TransferStats
+        return TransferStats
+
+    def _makeOne(self):
+        return self._getTargetClass()()
+
+    def test_ctor(self):
+        stats = self._makeOne()
+        self.assertEqual((stats.transfers, stats.bytes_uploaded,
+                          stats.bytes_downloaded, stats.chunks,
+                          stats.retries), (0, 0, 0, 0, 0))
+        self.assertEqual(stats.average_throughput, None)
+        self.assertEqual(stats.average_request_seconds, None)
+
+    def test_record_and_reset(self):
+        from gcloud.storage.stats import DOWNLOAD
+        from gcloud.storage.stats import UPLOAD
+        stats = self._makeOne()
+        stats.record_chunk(UPLOAD, 100, 1.0)
+        stats.record_chunk(DOWNLOAD, 300, 2.0)
+        stats.record_retry(1.0)
+        stats.record_transfer()
+        self.assertEqual(stats.bytes_uploaded, 100)
+        self.assertEqual(stats.bytes_downloaded, 300)
+        self.assertEqual(stats.max_chunk_seconds, 2.0)
+        self.assertEqual(stats.average_throughput, 100.0)
+        self.assertEqual(stats.average_request_seconds, 4.0 / 3)
+        self.assertEqual(stats.transfers, 1)
+        stats.reset()
+        self.assertEqual((stats.chunks, stats.retries, stats.busy_seconds),
+                         (0, 0, 0.0))
+
+
+class TestAdaptiveChunkSize(unittest2.TestCase):
+
+    KB = 1024
+    MB = 1024 * 1024
+
+    def _getTargetClass(self):
+        from gcloud.storage.stats import AdaptiveChunkSize
+        return AdaptiveChunkSize
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        sizer = self._makeOne()
+        self.assertEqual(sizer.chunk_size, self.MB)
+        self.assertEqual((sizer.minimum, sizer.maximum),
+                         (256 * self.KB, 64 * self.MB))
+        self.assertEqual(sizer.target_seconds, 2.0)
+        self.assertEqual(sizer.throughput, None)
+
+    def test_ctor_invalid(self):
+        with self.assertRaises(ValueError):
+            self._makeOne(initial=1000)
+        with self.assertRaises(ValueError):
+            self._makeOne(minimum=0)
+        with self.assertRaises(ValueError):
+            self._makeOne(initial=self.MB, maximum=512 * self.KB)
+        with self.assertRaises(ValueError):
+            self._makeOne(target_seconds=0)
+
+    def test_record_chunk_grows_at_most_twofold(self):
+        sizer = self._makeOne()
+        sizer.record_chunk(self.MB, 0.01)  # 100 MB/s:  wants 200 MB.
+        self.assertEqual(sizer.chunk_size, 2 * self.MB)
+        sizer.record_chunk(2 * self.MB, 0.0)
+        self.assertEqual(sizer.chunk_size, 4 * self.MB)
+
+    def test_record_chunk_converges(self):
+        sizer = self._makeOne(initial=8 * self.MB)
+        for _ in range(10):
+            # A 2 MB/s link:  2 seconds carry 4 MB.
+            sizer.record_chunk(sizer.chunk_size, sizer.chunk_size / 2.0e6)
+        self.assertEqual(sizer.chunk_size, 3840 * self.KB)
+        self.assertEqual(sizer.throughput, 2.0e6)
+
+    def test_record_chunk_smoothed(self):
+        sizer = self._makeOne(initial=4 * self.MB, target_seconds=1.0)
+        sizer.record_chunk(4 * self.MB, 1.0)
+        sizer.record_chunk(4 * self.MB, 4.0)
+        self.assertEqual(sizer.throughput, 2.5 * self.MB)
+        self.assertEqual(sizer.chunk_size, 2.5 * self.MB)
+
+    def test_record_chunk_ignores_short(self):
+        sizer = self._makeOne()
+        sizer.record_chunk(1, 10.0)
+        self.assertEqual(sizer.chunk_size, self.MB)
+        self.assertEqual(sizer.throughput, None)
+
+    def test_record_chunk_bounds(self):
+        sizer = self._makeOne(initial=self.MB, maximum=self.MB)
+        sizer.record_chunk(self.MB, 0.001)
+        self.assertEqual(sizer.chunk_size, self.MB)
+        sizer = self._makeOne(initial=self.MB, minimum=self.MB)
+        sizer.record_chunk(self.MB, 1000.0)
+        self.assertEqual(sizer.chunk_size, self.MB)
+
+    def test_record_error_halves(self):
+        sizer = self._makeOne(initial=self.MB)
+        sizer.record_error()
+        self.assertEqual(sizer.chunk_size, 512 * self.KB)
+        sizer.record_error()
+        sizer.record_error()
+        self.assertEqual(sizer.chunk_size, 256 * self.KB)
+
+
+class Test_TransferMonitor(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.stats import _TransferMonitor
+        return _TransferMonitor
+
+    def _makeOne(self, *args, **kw):
+        from gcloud._testing import _Monkey
+        from gcloud.storage import stats as MUT
+        with _Monkey(MUT, _now=lambda: 100.0):
+            return self._getTargetClass()(*args, **kw)
+
+    def _record(self, monitor, status, nbytes, seconds=1.0, when=102.0):
+        from gcloud._testing import _Monkey
+        from gcloud.storage import stats as MUT
+        with _Monkey(MUT, _now=lambda: when):
+            monitor.record(status, nbytes, seconds)
+
+    def test_record_chunks(self):
+        from gcloud.storage.stats import TransferStats
+        stats = TransferStats()
+        updates = []
+        monitor = self._makeOne('blob', 'download', 10,
+                                callback=updates.append, stats=stats)
+        self._record(monitor, 206, 4)
+        self._record(monitor, 200, 6, seconds=2.0, when=104.0)
+        first, second = updates
+        self.assertEqual((first.bytes_done, first.chunk_bytes,
+                          first.elapsed), (4, 4, 2.0))
+        self.assertEqual(second.throughput, 3.0)
+        self.assertEqual(second.average_throughput, 2.5)
+        self.assertEqual(second.total_bytes, 10)
+        monitor.finish()
+        self.assertEqual((stats.transfers, stats.chunks,
+                          stats.bytes_downloaded), (1, 2, 10))
+
+    def test_record_retries(self):
+        from gcloud.storage.stats import TransferStats
+        stats = TransferStats()
+        updates = []
+        monitor = self._makeOne('blob', 'upload', callback=updates.append,
+                                stats=stats)
+        self._record(monitor, None, 4)
+        self._record(monitor, 503, 4)
+        self._record(monitor, 429, 4)
+        self._record(monitor, 308, 4)
+        self.assertEqual(monitor.retries, 3)
+        self.assertEqual(stats.retries, 3)
+        update, = updates
+        self.assertEqual(update.retries, 3)
+        self.assertEqual(update.bytes_done, 4)
+
+    def test_record_w_sizer(self):
+        from gcloud.storage.stats import AdaptiveChunkSize
+        sizer = AdaptiveChunkSize(initial=1024 * 1024)
+        sizes = []
+        monitor = self._makeOne('blob', 'upload', sizer=sizer,
+                                resize=sizes.append)
+        self._record(monitor, 308, 1024 * 1024, seconds=0.01)
+        self._record(monitor, 503, 0)
+        self.assertEqual(sizes, [2 * 1024 * 1024, 1024 * 1024])
+
+    def test_record_ignored(self):
+        updates = []
+        monitor = self._makeOne('blob', 'upload', callback=updates.append)
+        self._record(monitor, 404, 4)
+        self._record(monitor, 200, 0)
+        monitor.finish()  # No stats:  nothing to count.
+        self.assertEqual(updates, [])
+        self.assertEqual((monitor.bytes_done, monitor.retries), (0, 0))
+
+
+class Test_MonitoredHttp(unittest2.TestCase):
+
+    def _makeOne(self, http, direction):
+        from gcloud.storage.stats import _TransferMonitor
+        monitor = _TransferMonitor('blob', direction)
+        return monitor.http(http), monitor
+
+    def test_download(self):
+        http = _HTTP(({'status': '200'}, b'abc'))
+        wrapped, monitor = self._makeOne(http, 'download')
+        response, content = wrapped.request('http://example.com/',
+                                            headers={'range': 'bytes=0-2'})
+        self.assertEqual(content, b'abc')
+        self.assertEqual(monitor.bytes_done, 3)
+        self.assertEqual(http._requested[0]['method'], 'GET')
+        self.assertEqual(wrapped.connections, {})
+
+    def test_upload(self):
+        http = _HTTP(({'status': '200'}, b'{}'))
+        wrapped, monitor = self._makeOne(http, 'upload')
+        wrapped.request('http://example.com/', 'PUT', body=b'abcd',
+                        headers={'content-length': '4'})
+        self.assertEqual(monitor.bytes_done, 4)
+
+    def test_error(self):
+        from six.moves import http_client
+        http = _HTTP(http_client.HTTPException('reset'))
+        wrapped, monitor = self._makeOne(http, 'download')
+        with self.assertRaises(http_client.HTTPException):
+            wrapped.request('http://example.com/')
+        self.assertEqual(monitor.retries, 1)
+
+
+class Test__transfer_monitor(unittest2.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from gcloud.storage.stats import _transfer_monitor
+        return _transfer_monitor(*args, **kw)
+
+    def test_w_client_stats(self):
+        from gcloud.storage.stats import TransferStats
+        client = _Client()
+        client.transfer_stats = TransferStats()
+        monitor = self._callFUT(_Blob(), client, 'upload', 10)
+        self.assertEqual(monitor.blob_name, 'blob')
+        self.assertEqual(monitor.total_bytes, 10)
+        self.assertTrue(monitor._stats is client.transfer_stats)
+
+    def test_wo_client_stats(self):
+        monitor = self._callFUT(_Blob(), _Client(), 'upload')
+        self.assertEqual(monitor._stats, None)
+        self.assertEqual(monitor._sizer, None)
+
+    def test_w_adaptive_chunk_size(self):
+        blob = _Blob()
+        blob.adaptive_chunk_size = sizer = object()
+        monitor = self._callFUT(blob, _Client(), 'upload')
+        self.assertEqual(monitor._sizer, None)  # Nothing to resize.
+        resize = object()
+        monitor = self._callFUT(blob, _Client(), 'upload', resize=resize)
+        self.assertTrue(monitor._sizer is sizer)
+        self.assertTrue(monitor._resize is resize)
+
+
+class _HTTP(object):
+
+    connections = {}
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._requested = []
+
+    def request(self, uri, method, body, headers, **kw):
+        self._requested.append({'uri': uri, 'method': method, 'body': body,
+                                'headers': headers})
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class _Blob(object):
+    name = 'blob'
+
+
+class _Client(object):
+    pass
@@ -0,0 +1,341 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest2
+
+
+MD5_ABC = 'kAFQmDzST7DWlj99KOF/cg=='
+MD5_ABCDEF = '6AtQFwmJUPxYqtg8jBSXjg=='
+
+
+def _temp_dir(test_case):
+    import shutil
+    import tempfile
+    path = tempfile.mkdtemp()
+    test_case.addCleanup(shutil.rmtree, path)
+    return path
+
+
+def _write(root, relpath, data, mtime=None):
+    import os
+    filename = os.path.join(root, *relpath.split('/'))
+    dirname = os.path.dirname(filename)
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    with open(filename, 'wb') as file_obj:
+        file_obj.write(data)
+    if mtime is not None:
+        os.utime(filename, (mtime, mtime))
+    return filename
+
+
+class Test__Manifest(unittest2.TestCase):
+
+    def _getTargetClass(self):
+        from gcloud.storage.sync import _Manifest
+        return _Manifest
+
+    def _makeOne(self, *args, **kw):
+        return self._getTargetClass()(*args, **kw)
+
+    def test_md5_hash_computes_and_caches(self):
+        import os
+        root = _temp_dir(self)
+        filename = _write(root, 'file', b'abc')
+        stat = os.stat(filename)
+        manifest = self._makeOne()
+        self.assertEqual(manifest.md5_hash('file', filename, stat), MD5_ABC)
+        # Cached by size and mtime, so the content is not re-read.
+        _write(root, 'file', b'xyz', mtime=stat.st_mtime)
+        self.assertEqual(manifest.md5_hash('file', filename, stat), MD5_ABC)
+
+    def test_md5_hash_recomputes_when_stat_changes(self):
+        import os
+        root = _temp_dir(self)
+        filename = _write(root, 'file', b'abc', mtime=1000)
+        manifest = self._makeOne()
+        manifest.md5_hash('file', filename, os.stat(filename))
+        _write(root, 'file', b'abcdef', mtime=2000)
+        self.assertEqual(
+            manifest.md5_hash('file', filename, os.stat(filename)),
+            MD5_ABCDEF)
+
+    def test_save_and_reload(self):
+        import os
+        root = _temp_dir(self)
+        path = os.path.join(root, 'manifest.json')
+        filename = _write(root, 'file', b'abc', mtime=1000)
+        stat = os.stat(filename)
+        manifest = self._makeOne(path)
+        manifest.record('file', stat, 'HASH')
+        manifest.record('gone', stat, 'HASH')
+        manifest.retain(['file'])
+        manifest.save()
+        self.assertFalse(os.path.exists(path + '.tmp'))
+        reloaded = self._makeOne(path)
+        self.assertEqual(reloaded.md5_hash('file', filename, stat), 'HASH')
+        self.assertEqual(list(reloaded._entries), ['file'])
+
+    def test_record_none_forgets(self):
+        import os
+        root = _temp_dir(self)
+        filename = _write(root, 'file', b'abc')
+        stat = os.stat(filename)
+        manifest = self._makeOne()
+        manifest.record('file', stat, 'HASH')
+        manifest.record('file', stat, None)
+        self.assertEqual(manifest._entries, {})
+
+    def test_corrupt_file_ignored(self):
+        import os
+        root = _temp_dir(self)
+        path = _write(root, 'manifest.json', b'{not json')
+        manifest = self._makeOne(path)
+        self.assertEqual(manifest._entries, {})
+        manifest.save()
+        with open(path) as file_obj:
+            self.assertEqual(file_obj.read(), '{}')
+        self.assertTrue(os.path.exists(path))
+
+
+class Test_sync_to_bucket(unittest2.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from gcloud.storage.sync import sync_to_bucket
+        return sync_to_bucket(*args, **kw)
+
+    def test_uploads_new_and_changed(self):
+        root = _temp_dir(self)
+        _write(root, 'same', b'abc')
+        _write(root, 'changed', b'abcdef')
+        _write(root, 'sub/new', b'abc')
+        bucket = _Bucket([
+            _Blob('pre/same', b'abc'),
+            _Blob('pre/changed', b'xyzxyz'),
+            _Blob('pre/extra', b'abc'),
+            _Blob('pre/dir/', b''),
+        ])
+        client = object()
+        result = self._callFUT(root, bucket, prefix='pre/', client=client)
+        self.assertEqual(result.transferred, ['changed', 'sub/new'])
+        self.assertEqual(result.unchanged, ['same'])
+        self.assertEqual(result.deleted, [])
+        self.assertEqual(sorted(bucket._uploaded),
+                         [('pre/changed', b'abcdef', client),
+                          ('pre/sub/new', b'abc', client)])
+        self.assertEqual(bucket._list_kw['prefix'], 'pre/')
+        self.assertTrue('md5Hash' in bucket._list_kw['fields'])
+        self.assertTrue(bucket._list_kw['client'] is client)
+        self.assertEqual(bucket._deleted, [])
+
+    def test_w_delete(self):
+        root = _temp_dir(self)
+        _write(root, 'same', b'abc')
+        extra = _Blob('extra', b'abc')
+        bucket = _Bucket([_Blob('same', b'abc'), extra])
+        result = self._callFUT(root, bucket, delete=True)
+        self.assertEqual(result.transferred, [])
+        self.assertEqual(result.deleted, ['extra'])
+        self.assertEqual(len(bucket._deleted), 1)
+        blobs, on_error, client = bucket._deleted[0]
+        self.assertEqual(blobs, [extra])
+        self.assertTrue(on_error is not None)
+        self.assertEqual(client, None)
+        self.assertEqual(bucket._list_kw['prefix'], None)
+
+    def test_wo_md5_compares_times(self):
+        root = _temp_dir(self)
+        _write(root, 'older', b'abc', mtime=1000)
+        _write(root, 'newer', b'abc', mtime=3000)
+        bucket = _Bucket([
+            _Blob('older', b'abc', md5_hash=None, mtime=2000),
+            _Blob('newer', b'abc', md5_hash=None, mtime=2000),
+        ])
+        result = self._callFUT(root, bucket)
+        self.assertEqual(result.transferred, ['newer'])
+        self.assertEqual(result.unchanged, ['older'])
+
+    def test_w_manifest_skips_hashing(self):
+        import os
+        root = _temp_dir(self)
+        manifest_path = os.path.join(_temp_dir(self), 'manifest.json')
+        _write(root, 'file', b'abc', mtime=1000)
+        bucket = _Bucket([])
+        result = self._callFUT(root, bucket, manifest_path=manifest_path,
+                               max_workers=1)
+        self.assertEqual(result.transferred, ['file'])
+        # Same size and mtime, different content:  the cached hash wins.
+        _write(root, 'file', b'xyz', mtime=1000)
+        bucket = _Bucket([_Blob('file', b'abc')])
+        result = self._callFUT(root, bucket, manifest_path=manifest_path)
+        self.assertEqual(result.unchanged, ['file'])
+        self.assertEqual(bucket._uploaded, [])
+
+    def test_upload_failure_saves_manifest(self):
+        import os
+        root = _temp_dir(self)
+        manifest_path = os.path.join(_temp_dir(self), 'manifest.json')
+        _write(root, 'file', b'abc')
+        bucket = _Bucket([], fail_uploads=True)
+        with self.assertRaises(ValueError):
+            self._callFUT(root, bucket, manifest_path=manifest_path)
+        self.assertTrue(os.path.exists(manifest_path))
+
+
+class Test_sync_from_bucket(unittest2.TestCase):
+
+    def _callFUT(self, *args, **kw):
+        from gcloud.storage.sync import sync_from_bucket
+        return sync_from_bucket(*args, **kw)
+
+    def test_downloads_new_and_changed(self):
+        import os
+        root = os.path.join(_temp_dir(self), 'target')
+        bucket = _Bucket([
+            _Blob('pre/same', b'abc'),
+            _Blob('pre/changed', b'abcdef'),
+            _Blob('pre/sub/new', b'abc', mtime=2000),
+            _Blob('pre/../escape', b'abc'),
+            _Blob('pre/dir/', b''),
+        ])
+        self._callFUT(bucket, root, prefix='pre/')  # Creates ``root``.
+        _write(root, 'same', b'abc')
+        _write(root, 'changed', b'xyzxyz')
+        os.remove(os.path.join(root, 'sub', 'new'))
+        client = object()
+        result = self._callFUT(bucket, root, prefix='pre/', client=client)
+        self.assertEqual(result.transferred, ['changed', 'sub/new'])
+        self.assertEqual(result.unchanged, ['same'])
+        self.assertEqual(result.deleted, [])
+        with open(os.path.join(root, 'sub', 'new'), 'rb') as file_obj:
+            self.assertEqual(file_obj.read(), b'abc')
+        self.assertEqual(os.stat(os.path.join(root, 'sub', 'new')).st_mtime,
+                         2000)
+        self.assertFalse(os.path.exists(os.path.join(root, '..', 'escape')))
+        self.assertTrue(bucket._list_kw['client'] is client)
+
+    def test_w_delete(self):
+        import os
+        root = _temp_dir(self)
+        _write(root, 'keep', b'abc')
+        _write(root, 'gone/extra', b'abc')
+        bucket = _Bucket([_Blob('keep', b'abc')])
+        result = self._callFUT(bucket, root, delete=True)
+        self.assertEqual(result.deleted, ['gone/extra'])
+        self.assertEqual(os.listdir(root), ['keep'])
+
+    def test_wo_md5_compares_times(self):
+        root = _temp_dir(self)
+        _write(root, 'same', b'abc', mtime=2000)
+        _write(root, 'older', b'abc', mtime=1000)
+        bucket = _Bucket([
+            _Blob('same', b'abc', md5_hash=None, mtime=2000),
+            _Blob('older', b'xyz', md5_hash=None, mtime=2000),
+        ])
+        result = self._callFUT(bucket, root)
+        self.assertEqual(result.transferred, ['older'])
+        self.assertEqual(result.unchanged, ['same'])
+
+    def test_w_manifest_records_downloads(self):
+        import json
+        import os
+        root = _temp_dir(self)
+        manifest_path = os.path.join(_temp_dir(self), 'manifest.json')
+        bucket = _Bucket([_Blob('file', b'abc', mtime=2000)])
+        self._callFUT(bucket, root, manifest_path=manifest_path)
+        with open(manifest_path) as file_obj:
+            self.assertEqual(json.load(file_obj),
+                             {'file': [3, 2000, MD5_ABC]})
+
+
+class Test__updated_timestamp(unittest2.TestCase):
+
+    def _callFUT(self, blob):
+        from gcloud.storage.sync import _updated_timestamp
+        return _updated_timestamp(blob)
+
+    def test_wo_updated(self):
+        self.assertEqual(self._callFUT(_Blob('blob', b'')), None)
+
+    def test_w_updated(self):
+        import datetime
+        from gcloud._helpers import UTC
+        blob = _Blob('blob', b'')
+        # Whatever the local timezone.
+        blob.updated = datetime.datetime(1970, 1, 1, 0, 16, 40, tzinfo=UTC)
+        self.assertEqual(self._callFUT(blob), 1000)
+
+
+class _Blob(object):
+
+    def __init__(self, name, data, md5_hash=True, mtime=None):
+        import base64
+        import datetime
+        import hashlib
+        from gcloud._helpers import UTC
+        self.name = name
+        self._data = data
+        self.size = len(data)
+        if md5_hash is True:
+            md5_hash = base64.b64encode(
+                hashlib.md5(data).digest()).decode('ascii')
+        self.md5_hash = md5_hash
+        if mtime is None:
+            self.updated = None
+        else:
+            self.updated = datetime.datetime.utcfromtimestamp(
+                mtime).replace(tzinfo=UTC)
+        self._mtime = mtime
+        self.bucket = None
+
+    def upload_from_filename(self, filename, client=None):
+        if self.bucket._fail_uploads:
+            raise ValueError('upload failed')
+        with open(filename, 'rb') as file_obj:
+            data = file_obj.read()
+        self.bucket._uploaded.append((self.name, data, client))
+        bucket, self.bucket = self.bucket, None
+        self.__init__(self.name, data)
+        self.bucket = bucket
+
+    def download_to_filename(self, filename, client=None):
+        import os
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(self._data)
+        if self._mtime is not None:
+            os.utime(filename, (self._mtime, self._mtime))
+
+
+class _Bucket(object):
+
+    def __init__(self, blobs, fail_uploads=False):
+        self._blobs = blobs
+        self._fail_uploads = fail_uploads
+        self._uploaded = []
+        self._deleted = []
+        self._list_kw = None
+
+    def blob(self, name):
+        blob = _Blob(name, b'')
+        blob.bucket = self
+        return blob
+
+    def list_blobs(self, **kw):
+        self._list_kw = kw
+        prefix = kw['prefix'] or ''
+        return iter([blob for blob in self._blobs
+                     if blob.name.startswith(prefix)])
+
+    def delete_blobs(self, blobs, on_error=None, client=None):
+        self._deleted.append((list(blobs), on_error, client))
@@ -43,6 +43,51 @@ class Test__LocalStack(unittest2.TestCase):
         self.assertEqual(list(batches), [])
 
 
+class Test__imap_unordered(unittest2.TestCase):
+
+    def _callFUT(self, func, iterable, max_workers):
+        from gcloud._helpers import _imap_unordered
+        return _imap_unordered(func, iterable, max_workers)
+
+    def test_serial(self):
+        import threading
+        threads = []
+
+        def _func(item):
+            threads.append(threading.current_thread())
+            return item * 2
+
+        results = list(self._callFUT(_func, [1, 2, 3], 1))
+        self.assertEqual(results, [2, 4, 6])
+        self.assertEqual(set(threads), set([threading.current_thread()]))
+
+    def test_concurrent(self):
+        results = self._callFUT(lambda item: item * 2, range(100), 4)
+        self.assertEqual(sorted(results), [item * 2 for item in range(100)])
+
+    def test_consumes_lazily(self):
+        consumed = []
+
+        def _items():
+            for item in range(100):
+                consumed.append(item)
+                yield item
+
+        results = self._callFUT(lambda item: item, _items(), 2)
+        next(results)
+        self.assertTrue(len(consumed) <= 4)
+        results.close()
+
+    def test_error(self):
+        def _func(item):
+            if item == 3:
+                raise ValueError(item)
+            return item
+
+        results = self._callFUT(_func, range(10), 3)
+        self.assertRaises(ValueError, list, results)
+
+
 class Test__UTC(unittest2.TestCase):
 
     def _getTargetClass(self):
@@ -64,6 +64,17 @@ class TestConnection(unittest2.TestCase):
         self.assertTrue(conn.http is authorized)
         self.assertTrue(isinstance(creds._called_with, httplib2.Http))
 
+    def test_http_per_thread(self):
+        import threading
+        conn = self._makeOne()
+        http = conn.http
+        self.assertTrue(conn.http is http)
+        found = []
+        thread = threading.Thread(target=lambda: found.append(conn.http))
+        thread.start()
+        thread.join()
+        self.assertFalse(found[0] is http)
+
     def test_user_agent_format(self):
         from pkg_resources import get_distribution
         expected_ua = 'gcloud-python/{0}'.format(
@@ -61,6 +61,12 @@ class Test_make_exception(unittest2.TestCase):
         self.assertEqual(exception.message, 'Not Found')
         self.assertEqual(list(exception.errors), [])
 
+    def test_hit_w_empty_content(self):
+        from gcloud.exceptions import NotModified
+        exception = self._callFUT(_Response(304), b'')
+        self.assertTrue(isinstance(exception, NotModified))
+        self.assertEqual(exception.message, '')
+
     def test_miss_w_content_as_dict(self):
         from gcloud.exceptions import GCloudError
         ERROR = {
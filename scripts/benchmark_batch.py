@@ -0,0 +1,187 @@
+# Copyright 2015 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the storage batch multipart codec against the email package.
+
+Times encoding a full batch request and decoding a full batch response
+with :mod:`gcloud.storage.batch`, and with the :mod:`email`-based
+implementation it replaced (reproduced below).  No requests are sent.
+
+Usage::
+
+  $ python scripts/benchmark_batch.py [--parts 1000] [--repeat 5]
+"""
+
+from __future__ import print_function
+
+import argparse
+from email.encoders import encode_noop
+from email.generator import Generator
+from email.mime.application import MIMEApplication
+from email.mime.multipart import MIMEMultipart
+from email.parser import Parser
+import io
+import json
+import timeit
+
+import httplib2
+import six
+
+from gcloud.storage.batch import _encode_batch_body
+from gcloud.storage.batch import _unpack_batch_response
+
+
+class MIMEApplicationHTTP(MIMEApplication):
+    """MIME type for ``application/http``, as ``Batch`` used to build.
+
+    Constructs payload from headers and body
+
+    :type method: string
+    :param method: HTTP method
+
+    :type uri: string
+    :param uri: URI for HTTP request
+
+    :type headers:  dict
+    :param headers: HTTP headers
+
+    :type body: text or None
+    :param body: HTTP payload
+    """
+    def __init__(self, method, uri, headers, body):
+        if isinstance(body, dict):
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+            headers['Content-Length'] = len(body)
+        if body is None:
+            body = ''
+        lines = ['%s %s HTTP/1.1' % (method, uri)]
+        lines.extend(['%s: %s' % (key, value)
+                      for key, value in sorted(headers.items())])
+        lines.append('')
+        lines.append(body)
+        payload = '\r\n'.join(lines)
+        if six.PY2:
+            # Sigh.  email.message.Message is an old-style class, so we
+            #        cannot use 'super()'.
+            MIMEApplication.__init__(self, payload, 'http', encode_noop)
+        else:
+            super_init = super(MIMEApplicationHTTP, self).__init__
+            super_init(payload, 'http', encode_noop)
+
+
+def email_encode(requests):
+    """Encode a batch request as ``Batch`` did with :mod:`email`."""
+    multi = MIMEMultipart()
+    for method, uri, headers, body in requests:
+        multi.attach(MIMEApplicationHTTP(method, uri, dict(headers), body))
+    if six.PY3:
+        buf = io.StringIO()
+    else:
+        buf = io.BytesIO()
+    Generator(buf, False, 0).flatten(multi)
+    _, body = buf.getvalue().split('\n\n', 1)
+    return dict(multi._headers), body
+
+
+def email_decode(response, content):
+    """Decode a batch response as ``Batch`` did with :mod:`email`."""
+    parser = Parser()
+    if not isinstance(content, six.binary_type):
+        content = content.encode('utf-8')
+    faux_message = b''.join([
+        b'Content-Type: ',
+        response['content-type'].encode('utf-8'),
+        b'\nMIME-Version: 1.0\n\n',
+        content,
+    ])
+    message = parser.parsestr(faux_message.decode('utf-8'))
+    results = []
+    for subrequest in message._payload:
+        status_line, rest = subrequest._payload.split('\n', 1)
+        _, status, _ = status_line.split(' ', 2)
+        sub_message = parser.parsestr(rest)
+        payload = sub_message._payload
+        ctype = sub_message['Content-Type']
+        msg_headers = dict(sub_message._headers)
+        msg_headers['status'] = status
+        if ctype and ctype.startswith('application/json'):
+            payload = json.loads(payload)
+        results.append((httplib2.Response(msg_headers), payload))
+    return results
+
+
+def make_requests(count):
+    """Build ``count`` PATCH requests like those of a bulk ACL update."""
+    uri = 'https://www.googleapis.com/storage/v1/b/bucket/o/object-%06d'
+    return [('PATCH', uri % (index,), {},
+             {'acl': [{'entity': 'allUsers', 'role': 'READER'}]})
+            for index in range(count)]
+
+
+def make_response(count):
+    """Build a batch response holding ``count`` JSON resources."""
+    parts = []
+    for index in range(count):
+        body = json.dumps({'kind': 'storage#object',
+                           'name': 'object-%06d' % (index,),
+                           'bucket': 'bucket', 'size': str(index)})
+        parts.append(
+            '--batch_boundary\r\n'
+            'Content-Type: application/http\r\n'
+            'Content-ID: <response-%d>\r\n\r\n'
+            'HTTP/1.1 200 OK\r\n'
+            'Content-Type: application/json; charset=UTF-8\r\n'
+            'Content-Length: %d\r\n\r\n'
+            '%s\r\n' % (index, len(body), body))
+    parts.append('--batch_boundary--\r\n')
+    response = {'content-type': 'multipart/mixed; boundary=batch_boundary'}
+    return response, ''.join(parts).encode('utf-8')
+
+
+def best_of(func, repeat):
+    """Return the fastest of ``repeat`` runs of ``func``, in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parts', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    requests = make_requests(args.parts)
+    response, content = make_response(args.parts)
+    assert ([payload for _, payload in email_decode(response, content)] ==
+            [payload for _, payload in
+             _unpack_batch_response(response, content)])
+
+    rows = [
+        ('encode', lambda: email_encode(requests),
+         lambda: _encode_batch_body(requests, 'batch_boundary')),
+        ('decode', lambda: email_decode(response, content),
+         lambda: list(_unpack_batch_response(response, content))),
+    ]
+    print('%d parts, best of %d' % (args.parts, args.repeat))
+    print('%-8s %12s %12s %8s' % ('', 'email (ms)', 'codec (ms)', 'speedup'))
+    for name, old, new in rows:
+        old_time = best_of(old, args.repeat)
+        new_time = best_of(new, args.repeat)
+        print('%-8s %12.2f %12.2f %7.1fx' % (
+            name, old_time * 1000, new_time * 1000, old_time / new_time))
+
+
+if __name__ == '__main__':
+    main()